@@ -74,6 +74,7 @@ from autocrud.resource_manager.pydantic_converter import (
     is_pydantic_model,
     pydantic_to_struct,
 )
+from autocrud.resource_manager.resource_cache import ResourceCache
 from autocrud.resource_manager.storage_factory import (
     DiskStorageFactory,
     IStorageFactory,
@@ -190,15 +191,30 @@ class _RefIntegrityHandler(IEventHandler):
     # IEventHandler interface
     # ------------------------------------------------------------------
 
+    def supported_events(self) -> list[tuple[ResourceAction, str]]:
+        return [
+            (ResourceAction.delete, "on_success"),
+            (ResourceAction.delete_many, "on_success"),
+        ]
+
     def is_supported(self, context: EventContext) -> bool:
-        return isinstance(context, HasResourceId) and (
-            context.phase == "on_success" and context.action is ResourceAction.delete
+        if context.phase != "on_success":
+            return False
+        if context.action is ResourceAction.delete_many:
+            return True
+        return (
+            isinstance(context, HasResourceId)
+            and context.action is ResourceAction.delete
         )
 
     def handle_event(self, context: EventContext) -> None:
-        if not isinstance(context, HasResourceId):
-            return
-        deleted_resource_id: str = context.resource_id
+        if context.action is ResourceAction.delete_many:
+            for meta in context.metas:
+                self._apply_on_delete(meta.resource_id)
+        elif isinstance(context, HasResourceId):
+            self._apply_on_delete(context.resource_id)
+
+    def _apply_on_delete(self, deleted_resource_id: str) -> None:
         for ref_info in self._refs:
             source_rm = self._resource_managers.get(ref_info.source)
             if source_rm is None:
@@ -612,6 +628,17 @@ class AutoCRUD:
             )
         return self.resource_managers[model_name]
 
+    def close(self) -> None:
+        """Release the worker threads held by the registered resource managers.
+
+        Call it when shutting the application down (e.g. from a FastAPI
+        lifespan handler).
+        """
+        for resource_manager in self.resource_managers.values():
+            close = getattr(resource_manager, "close", None)
+            if close is not None:
+                close()
+
     def _is_job_subclass(self, model: type) -> bool:
         """Check if a model is a subclass of Job.
 
@@ -816,6 +843,7 @@ class AutoCRUD:
         | None = None,
         validator: "Callable[[T], None] | IValidator | type | None" = None,
         constraint_checkers: "Sequence[IConstraintChecker | Callable[[ResourceManager], IConstraintChecker]] | None" = None,
+        resource_cache: ResourceCache | None = None,
     ) -> None:
         """Register a resource model (or `Schema`) and create its `ResourceManager`.
 
@@ -880,6 +908,10 @@ class AutoCRUD:
             constraint_checkers:
                 Extra constraint checkers for this resource. Each element can be an instance or a
                 factory callable that receives the `ResourceManager` and returns a checker.
+            resource_cache:
+                Cache of decoded stable revisions for this resource. Cached objects are shared
+                between readers and must not be mutated. Not supported for Job models with a
+                message queue.
 
         Behavior:
             - If `model` is a `Schema`, it must declare `resource_type`; schema-level migration/validator
@@ -1026,6 +1058,8 @@ class AutoCRUD:
             other_options["default_now"] = default_now
         elif self.default_now is not UNSET:
             other_options["default_now"] = self.default_now
+        if resource_cache is not None:
+            other_options["resource_cache"] = resource_cache
         # Auto-detect Job subclass and create message queue
         if self._is_job_subclass(model) and (
             job_handler is not None or job_handler_factory is not None
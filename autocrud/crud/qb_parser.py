@@ -88,6 +88,7 @@ class SafeQBParser:
         "limit",
         "offset",
         "page",
+        "after",
         "first",
         # 日期時間
         "today",
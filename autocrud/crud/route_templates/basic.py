@@ -283,6 +283,10 @@ class QueryInputs(BaseModel):
     )
     limit: int = Query(10, description="Maximum number of results")
     offset: int = Query(0, description="Number of results to skip")
+    after: Optional[str] = Query(
+        None,
+        description="Keyset cursor: return results after this cursor (the `X-Next-Cursor` header of the previous page). Must be used with the same `sorts`.",
+    )
     partial: Optional[list[str]] = Query(
         None,
         description="List of fields to retrieve (e.g. '/field1', '/nested/field2')",
@@ -350,6 +354,8 @@ def build_query(q: QueryInputs) -> ResourceMetaSearchQuery:
             # 覆寫 limit 和 offset（如果 QB 表達式中有設置，URL 參數會覆蓋它）
             if q.limit != 10 or q.offset != 0:  # 檢查是否有設置非默認值
                 query = msgspec.structs.replace(query, limit=q.limit, offset=q.offset)
+            if q.after:
+                query = msgspec.structs.replace(query, after=q.after)
 
             return query
         except Exception as e:
@@ -361,6 +367,7 @@ def build_query(q: QueryInputs) -> ResourceMetaSearchQuery:
     query_kwargs = {
         "limit": q.limit,
         "offset": q.offset,
+        "after": q.after if q.after else msgspec.UNSET,
     }
 
     if q.is_deleted is not None:
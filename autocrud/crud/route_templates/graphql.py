@@ -624,24 +624,48 @@ class GraphQLRouteTemplate(BaseRouteTemplate, Generic[T]):
 
                                 fetch_info = bool(info_field)
 
-                                for meta in metas:
+                                # 一次批次讀取所有資料；get_many 不讀已刪除的資源，
+                                # 這些資源之後逐筆讀取
+                                prefetched = [None] * len(metas)
+                                batch = [
+                                    i for i, m in enumerate(metas) if not m.is_deleted
+                                ]
+                                if batch and (fetch_full_data or partial_fields):
+                                    fetched_many = rm.get_many(
+                                        [metas[i].resource_id for i in batch],
+                                        partial=None
+                                        if fetch_full_data
+                                        else partial_fields,
+                                    )
+                                    for i, fetched in zip(
+                                        batch, fetched_many, strict=True
+                                    ):
+                                        prefetched[i] = fetched
+
+                                for meta, fetched in zip(
+                                    metas, prefetched, strict=True
+                                ):
                                     try:
                                         data_obj = None
                                         info_obj = None
 
                                         if fetch_full_data:
-                                            resource = rm.get_resource_revision(
-                                                meta.resource_id,
-                                                meta.current_revision_id,
-                                            )
+                                            resource = fetched
+                                            if resource is None:
+                                                resource = rm.get_resource_revision(
+                                                    meta.resource_id,
+                                                    meta.current_revision_id,
+                                                )
                                             data_obj = resource.data
                                             info_obj = resource.info
                                         elif partial_fields:
-                                            data_obj = rm.get_partial(
-                                                meta.resource_id,
-                                                meta.current_revision_id,
-                                                partial_fields,
-                                            )
+                                            data_obj = fetched
+                                            if data_obj is None:
+                                                data_obj = rm.get_partial(
+                                                    meta.resource_id,
+                                                    meta.current_revision_id,
+                                                    partial_fields,
+                                                )
 
                                         if fetch_info and info_obj is None:
                                             info_obj = rm.get_revision_info(
@@ -19,11 +19,29 @@ from autocrud.crud.route_templates.exception_handlers import to_http_exception
 from autocrud.types import (
     IResourceManager,
     ResourceMeta,
+    ResourceMetaSearchQuery,
     RevisionInfo,
+    SearchedResource,
 )
 
 T = TypeVar("T")
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _list_page(
+    resource_manager: IResourceManager[T],
+    query: ResourceMetaSearchQuery,
+    returns: list[str],
+    partial: list[str] | None,
+) -> tuple[list[SearchedResource[T]], dict[str, str] | None]:
+    """Run ``list_resources_page`` and build the ``X-Next-Cursor`` header."""
+    results, next_cursor = resource_manager.list_resources_page(
+        query, returns=returns, partial=partial
+    )
+    headers = None if next_cursor is None else {NEXT_CURSOR_HEADER: next_cursor}
+    return results, headers
+
 
 class ListRouteTemplate(BaseRouteTemplate):
     """列出所有資源的路由模板
@@ -100,6 +118,7 @@ class ListRouteTemplate(BaseRouteTemplate):
                 **Pagination:**
                 - `limit`: Maximum number of results to return (default: 10)
                 - `offset`: Number of results to skip for pagination (default: 0)
+                - `after`: Keyset cursor from the `X-Next-Cursor` header of the previous page; cost stays O(limit) at any depth
 
                 **Partial Response:**
                 - `partial`: List of fields to retrieve (e.g. '/field1', '/nested/field2')
@@ -132,12 +151,13 @@ class ListRouteTemplate(BaseRouteTemplate):
                 fields = get_partial_fields(request, query_params)
 
                 with resource_manager.meta_provide(current_user, current_time):
-                    results = resource_manager.list_resources(
+                    results, headers = _list_page(
+                        resource_manager,
                         query,
                         returns=["data"],
                         partial=fields,
                     )
-                return MsgspecResponse([item.data for item in results])
+                return MsgspecResponse([item.data for item in results], headers=headers)
             except Exception as e:
                 raise to_http_exception(e)
 
@@ -200,6 +220,7 @@ class ListRouteTemplate(BaseRouteTemplate):
                 **Pagination:**
                 - `limit`: Maximum number of results to return (default: 10)
                 - `offset`: Number of results to skip for pagination (default: 0)
+                - `after`: Keyset cursor from the `X-Next-Cursor` header of the previous page; cost stays O(limit) at any depth
 
                 **Use Cases:**
                 - Resource management and administration
@@ -237,12 +258,13 @@ class ListRouteTemplate(BaseRouteTemplate):
                             meta_partial.append(f)
 
                 with resource_manager.meta_provide(current_user, current_time):
-                    results = resource_manager.list_resources(
+                    results, headers = _list_page(
+                        resource_manager,
                         query,
                         returns=["meta"],
                         partial=meta_partial,
                     )
-                return MsgspecResponse([item.meta for item in results])
+                return MsgspecResponse([item.meta for item in results], headers=headers)
             except Exception as e:
                 raise to_http_exception(e)
 
@@ -296,6 +318,7 @@ class ListRouteTemplate(BaseRouteTemplate):
                 **Pagination:**
                 - `limit`: Maximum number of results to return (default: 10)
                 - `offset`: Number of results to skip for pagination (default: 0)
+                - `after`: Keyset cursor from the `X-Next-Cursor` header of the previous page; cost stays O(limit) at any depth
 
                 **Use Cases:**
                 - Version control system integration
@@ -333,12 +356,13 @@ class ListRouteTemplate(BaseRouteTemplate):
                             info_partial.append(f)
 
                 with resource_manager.meta_provide(current_user, current_time):
-                    results = resource_manager.list_resources(
+                    results, headers = _list_page(
+                        resource_manager,
                         query,
                         returns=["info"],
                         partial=info_partial,
                     )
-                return MsgspecResponse([item.info for item in results])
+                return MsgspecResponse([item.info for item in results], headers=headers)
             except Exception as e:
                 raise to_http_exception(e)
 
@@ -357,7 +381,8 @@ class ListRouteTemplate(BaseRouteTemplate):
                 fields = get_partial_fields(request, query_params)
 
                 with resource_manager.meta_provide(current_user, current_time):
-                    results = resource_manager.list_resources(
+                    results, headers = _list_page(
+                        resource_manager,
                         query,
                         returns=returns,
                         partial=fields,
@@ -373,7 +398,7 @@ class ListRouteTemplate(BaseRouteTemplate):
                             meta=item.meta,
                         )
                     )
-                return MsgspecResponse(responses)
+                return MsgspecResponse(responses, headers=headers)
             except Exception as e:
                 raise to_http_exception(e)
 
@@ -456,8 +481,10 @@ class ListRouteTemplate(BaseRouteTemplate):
             try:
                 # 構建查詢對象
                 query = build_query(query_params)
-                # count 不應受 limit/offset 影響，移除分頁限制以回傳真實總數
-                query = msgspec.structs.replace(query, limit=2**63 - 1, offset=0)
+                # count 不應受 limit/offset/after 影響，移除分頁限制以回傳真實總數
+                query = msgspec.structs.replace(
+                    query, limit=2**63 - 1, offset=0, after=msgspec.UNSET
+                )
                 with resource_manager.meta_provide(current_user, current_time):
                     count = resource_manager.count_resources(query)
                 return count
@@ -483,6 +510,7 @@ class ListRouteTemplate(BaseRouteTemplate):
                 - `returns` (default `"data,revision_info,meta"`): Comma-separated list of sections to include.
                   Allowed values: `data`, `revision_info`, `meta`.
                 - `limit` / `offset`: Pagination controls.
+                - `after`: Keyset cursor from the `X-Next-Cursor` response header of the previous page.
                 - `partial` / `partial[]`: Partial field selection.
                 - All standard filtering and sorting parameters.
 
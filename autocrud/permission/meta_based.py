@@ -30,18 +30,21 @@ class ResourceOwnershipChecker(IPermissionChecker):
         if context.action not in self.allowed_actions:
             return PermissionResult.not_applicable
 
-        # 需要有 resource_id
-        if context.resource_id is UNSET:
-            return PermissionResult.not_applicable
+        # 批次操作 (get_many / delete_many) 逐一檢查每個 resource_id
+        resource_ids = getattr(context, "resource_ids", UNSET)
+        if resource_ids is UNSET:
+            # 需要有 resource_id
+            if context.resource_id is UNSET:
+                return PermissionResult.not_applicable
+            resource_ids = [context.resource_id]
 
         try:
-            # 獲取資源元資料
-            meta = self.resource_manager.get_meta(context.resource_id)
-
-            # 檢查創建者
-            if meta.created_by == context.user:
-                return PermissionResult.allow
-            return PermissionResult.deny
+            for resource_id in resource_ids:
+                # 獲取資源元資料並檢查創建者
+                meta = self.resource_manager.get_meta(resource_id)
+                if meta.created_by != context.user:
+                    return PermissionResult.deny
+            return PermissionResult.allow
 
         except Exception:
             return PermissionResult.deny
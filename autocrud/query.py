@@ -2,6 +2,7 @@ from typing import Any, Self
 
 from msgspec import UNSET
 
+from autocrud.resource_manager.basic import encode_search_cursor
 from autocrud.types import (
     DataSearchCondition,
     DataSearchFilter,
@@ -10,6 +11,7 @@ from autocrud.types import (
     DataSearchOperator,
     FieldTransform,
     ResourceDataSearchSort,
+    ResourceMeta,
     ResourceMetaSearchQuery,
     ResourceMetaSearchSort,
     ResourceMetaSortDirection,
@@ -24,6 +26,7 @@ class Query:
         self._condition = condition
         self._limit: int = 10
         self._offset: int = 0
+        self._after: str | ResourceMeta | None = None
         self._sorts: list[ResourceMetaSearchSort | ResourceDataSearchSort] = []
 
     def limit(self, limit: int) -> Self:
@@ -34,6 +37,26 @@ class Query:
         self._offset = offset
         return self
 
+    def after(self, cursor: str | ResourceMeta) -> Self:
+        """Continue after a previous page (keyset pagination).
+
+        Args:
+            cursor: The ``next_cursor`` of the previous page, or the last
+                ``ResourceMeta`` of that page (its cursor is derived from the
+                query sorts when the query is built).
+
+        Returns:
+            Self for chaining
+
+        Example:
+            metas = rm.search_resources(QB.age().gt(18).sort("-age").limit(50))
+            more = rm.search_resources(
+                QB.age().gt(18).sort("-age").limit(50).after(metas[-1])
+            )
+        """
+        self._after = cursor
+        return self
+
     def sort(
         self, *sorts: ResourceMetaSearchSort | ResourceDataSearchSort | str
     ) -> Self:
@@ -97,12 +120,17 @@ class Query:
         """
         return self.sort(*sorts)
 
-    def page(self, page: int, size: int = 20) -> Self:
+    def page(
+        self, page: int, size: int = 20, *, after: str | ResourceMeta | None = None
+    ) -> Self:
         """Set pagination parameters.
 
         Args:
             page: Page number (1-based, first page is 1)
             size: Number of items per page (default: 20)
+            after: (Optional) Keyset cursor, see :meth:`after`.  Pages are
+                then counted from the cursor, so ``page(1, size, after=...)``
+                is the page right after it and costs O(size) at any depth.
 
         Returns:
             Self for chaining
@@ -119,6 +147,8 @@ class Query:
 
         self._offset = (page - 1) * size
         self._limit = size
+        if after is not None:
+            self._after = after
         return self
 
     def first(self) -> Self:
@@ -135,11 +165,16 @@ class Query:
 
     def build(self) -> ResourceMetaSearchQuery:
         conditions = [self._condition] if self._condition else UNSET
+        sorts = self._sorts if self._sorts else UNSET
+        after = self._after
+        if isinstance(after, ResourceMeta):
+            after = encode_search_cursor(after, sorts)
         return ResourceMetaSearchQuery(
             conditions=conditions,
             limit=self._limit,
             offset=self._offset,
-            sorts=self._sorts if self._sorts else UNSET,
+            sorts=sorts,
+            after=UNSET if after is None else after,
         )
 
 
@@ -1,10 +1,22 @@
+import base64
+import datetime as dt
 import functools
+import heapq
+import io
+import itertools
+import operator
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Generator, Iterable, MutableMapping
+from collections.abc import (
+    Callable,
+    Collection,
+    Generator,
+    Iterable,
+    MutableMapping,
+)
 from contextlib import AbstractContextManager, contextmanager
 from contextvars import ContextVar, Token
-from enum import Flag, StrEnum
+from enum import Enum, Flag, StrEnum
 from typing import IO, Any, Generic, TypeVar
 
 import msgspec
@@ -16,6 +28,8 @@ from autocrud.types import (
     DataSearchGroup,
     DataSearchLogicOperator,
     DataSearchOperator,
+    FieldTransform,
+    IndexableField,
     ResourceDataSearchSort,
     ResourceMeta,
     ResourceMetaSearchQuery,
@@ -74,274 +88,785 @@ class Encoding(StrEnum):
     msgpack = "msgpack"
 
 
+class MetaLayout(StrEnum):
+    """Row layout of the SQL meta stores."""
+
+    blob = "blob"
+    """Serialized meta in ``data``, with the searchable fields copied to columns."""
+    columns = "columns"
+    """Every meta field in its own column; ``data`` is left empty."""
+
+
+MetaPredicate = Callable[[ResourceMeta], bool]
+# 條件求值結果：True / False / None (Unknown)
+_Trivalent = Callable[[Any], bool | None]
+
+_MISSING = object()
+# length transform 套用在不支援 len() 的值上：整個條件為 Unknown
+_UNSIZED = object()
+
+
 def is_match_query(meta: ResourceMeta, query: ResourceMetaSearchQuery) -> bool:
-    if query.is_deleted is not UNSET and meta.is_deleted != query.is_deleted:
-        return False
+    """Whether *meta* satisfies the filters of *query* (see :func:`compile_query`)."""
+    return compile_query(query)(meta)
 
-    if (
-        query.created_time_start is not UNSET
-        and meta.created_time < query.created_time_start
-    ):
-        return False
-    if (
-        query.created_time_end is not UNSET
-        and meta.created_time > query.created_time_end
-    ):
-        return False
-    if (
-        query.updated_time_start is not UNSET
-        and meta.updated_time < query.updated_time_start
-    ):
-        return False
-    if (
-        query.updated_time_end is not UNSET
-        and meta.updated_time > query.updated_time_end
-    ):
-        return False
 
-    if query.created_bys is not UNSET and meta.created_by not in query.created_bys:
-        return False
-    if query.updated_bys is not UNSET and meta.updated_by not in query.updated_bys:
-        return False
+def compile_query(query: ResourceMetaSearchQuery) -> MetaPredicate:
+    """Compile the filters of *query* into a single predicate.
+
+    Condition trees are turned into nested closures once: field lookups,
+    Enum normalization, regexes and ``in_list`` sets are resolved up front and
+    AND / OR / NOT groups short-circuit.  Sorting and pagination fields are
+    ignored.  Compiled predicates are cached, so stores should call this once
+    per search and apply the result to every row.
+    """
+    try:
+        key = _freeze(
+            [
+                query.is_deleted,
+                query.created_time_start,
+                query.created_time_end,
+                query.updated_time_start,
+                query.updated_time_end,
+                query.created_bys,
+                query.updated_bys,
+                query.conditions,
+                query.data_conditions,
+            ]
+        )
+        hash(key)
+    except TypeError:
+        return _compile_query(query)
+    return _compile_query_cached(_FrozenQuery(key, query))
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Struct):
+        return (
+            type(value),
+            *(_freeze(getattr(value, f)) for f in value.__struct_fields__),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), *(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, *((k, _freeze(v)) for k, v in value.items()))
+    # Enum 與其 value 相等但語意不同 (contains 對 Flag 有特殊處理)，需區分型別
+    return (type(value), value)
+
+
+class _FrozenQuery:
+    """Cache key of :func:`_compile_query_cached`: hashed and compared by the
+    frozen filters, carrying the query to compile on a miss."""
+
+    __slots__ = ("key", "query")
+
+    def __init__(self, key: Any, query: ResourceMetaSearchQuery):
+        self.key = key
+        self.query = query
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _FrozenQuery) and self.key == other.key
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_query_cached(frozen: _FrozenQuery) -> MetaPredicate:
+    return _compile_query(frozen.query)
+
+
+def _compile_query(query: ResourceMetaSearchQuery) -> MetaPredicate:
+    checks: list[MetaPredicate] = []
+
+    if query.is_deleted is not UNSET:
+        is_deleted = query.is_deleted
+        checks.append(lambda m: m.is_deleted == is_deleted)
+    if query.created_time_start is not UNSET:
+        cts = query.created_time_start
+        checks.append(lambda m: not m.created_time < cts)
+    if query.created_time_end is not UNSET:
+        cte = query.created_time_end
+        checks.append(lambda m: not m.created_time > cte)
+    if query.updated_time_start is not UNSET:
+        uts = query.updated_time_start
+        checks.append(lambda m: not m.updated_time < uts)
+    if query.updated_time_end is not UNSET:
+        ute = query.updated_time_end
+        checks.append(lambda m: not m.updated_time > ute)
+    if query.created_bys is not UNSET:
+        created_bys = _as_container(query.created_bys)
+        checks.append(lambda m: m.created_by in created_bys)
+    if query.updated_bys is not UNSET:
+        updated_bys = _as_container(query.updated_bys)
+        checks.append(lambda m: m.updated_by in updated_bys)
 
     if query.conditions is not UNSET:
         for condition in query.conditions:
-            if not _match_condition(meta, condition):
-                return False
+            evaluate = compile_condition(condition, on_meta=True)
+            checks.append(lambda m, evaluate=evaluate: evaluate(m) is True)
 
-    if query.data_conditions is not UNSET and meta.indexed_data is not UNSET:
+    if query.data_conditions is not UNSET:
+        # 如果有 data 條件但沒有索引資料，不匹配
+        checks.append(lambda m: m.indexed_data is not UNSET)
         for condition in query.data_conditions:
-            if not _match_data_condition(meta.indexed_data, condition):
+            evaluate = compile_condition(condition, on_meta=False)
+            checks.append(lambda m, evaluate=evaluate: evaluate(m.indexed_data) is True)
+
+    if not checks:
+        return lambda meta: True
+    if len(checks) == 1:
+        return checks[0]
+    checks_t = tuple(checks)
+
+    def predicate(meta: ResourceMeta) -> bool:
+        for check in checks_t:
+            if not check(meta):
                 return False
-    elif query.data_conditions is not UNSET:
-        # 如果有 data 條件但沒有索引資料，不匹配
-        return False
+        return True
 
-    return True
+    return predicate
 
 
-def _match_condition(
-    meta: ResourceMeta,
-    condition: DataSearchCondition | DataSearchGroup,
-) -> bool:
-    """檢查 meta 是否匹配條件"""
-    result = _evaluate_trivalent(meta, condition)
-    return result is True
+def _as_container(values: Iterable[Any]) -> Any:
+    try:
+        return frozenset(values)
+    except TypeError:
+        return tuple(values)
 
 
-def _match_data_condition(
-    indexed_data: dict[str, Any],
-    condition: DataSearchCondition | DataSearchGroup,
-) -> bool:
-    """檢查索引資料是否匹配 data 條件"""
-    result = _evaluate_trivalent(indexed_data, condition)
-    return result is True
+def _field_getter(field_path: str, on_meta: bool) -> Callable[[Any], Any]:
+    """Return a getter yielding the field value or ``_MISSING``."""
+    if not on_meta:
+        return lambda data: data.get(field_path, _MISSING)
+    if field_path != "indexed_data" and hasattr(ResourceMeta, field_path):
+        get_attr = operator.attrgetter(field_path)
+        return get_attr
 
+    def get_indexed(meta: ResourceMeta) -> Any:
+        if meta.indexed_data is UNSET:
+            return _MISSING
+        return meta.indexed_data.get(field_path, _MISSING)
 
-def _evaluate_trivalent(
-    data: dict[str, Any] | ResourceMeta,
-    condition: DataSearchCondition | DataSearchGroup,
-) -> bool | None:
+    return get_indexed
+
+
+def normalize_search_value(value: Any) -> Any:
+    """Normalize a condition value the way indexed data stores it."""
+    # Normalize Enum to value for comparison (indexed data stores Enum as value string/int)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set)):
+        # Handle Enum in lists (for in_list/not_in_list operators)
+        return type(value)(v.value if isinstance(v, Enum) else v for v in value)
+    return value
+
+
+def compile_condition(
+    condition: DataSearchCondition | DataSearchGroup, *, on_meta: bool
+) -> _Trivalent:
     """
-    Evaluate condition using SQL-like trivalent logic (True, False, Unknown/None).
+    Compile a condition using SQL-like trivalent logic (True, False, Unknown/None).
     Unknown is returned for operations on missing keys or NULL values (except is_null/exists/isna).
+
+    With ``on_meta`` the result takes a :class:`ResourceMeta` (meta attributes,
+    falling back to ``indexed_data``); otherwise it takes the indexed data dict.
     """
     if isinstance(condition, DataSearchGroup):
-        results = [
-            _evaluate_trivalent(data, sub_cond) for sub_cond in condition.conditions
-        ]
+        subs = tuple(
+            compile_condition(c, on_meta=on_meta) for c in condition.conditions
+        )
 
         if condition.operator == DataSearchLogicOperator.and_op:
             # AND: False if any False. Unknown if any Unknown (and no False). True if all True.
-            if any(r is False for r in results):
-                return False
-            if any(r is None for r in results):
-                return None
-            return True
+            def and_op(data: Any) -> bool | None:
+                unknown = False
+                for sub in subs:
+                    r = sub(data)
+                    if r is False:
+                        return False
+                    if r is None:
+                        unknown = True
+                return None if unknown else True
+
+            return and_op
 
         if condition.operator == DataSearchLogicOperator.or_op:
             # OR: True if any True. Unknown if any Unknown (and no True). False if all False.
-            if any(r is True for r in results):
-                return True
-            if any(r is None for r in results):
-                return None
-            return False
+            def or_op(data: Any) -> bool | None:
+                unknown = False
+                for sub in subs:
+                    r = sub(data)
+                    if r is True:
+                        return True
+                    if r is None:
+                        unknown = True
+                return None if unknown else False
+
+            return or_op
 
         if condition.operator == DataSearchLogicOperator.not_op:
             # NOT: True->False, False->True, Unknown->Unknown
             # Implicitly ANDs the conditions if multiple
-            if any(r is False for r in results):
-                return True
-            if any(r is None for r in results):
-                return None
-            return False
+            def not_op(data: Any) -> bool | None:
+                unknown = False
+                for sub in subs:
+                    r = sub(data)
+                    if r is False:
+                        return True
+                    if r is None:
+                        unknown = True
+                return None if unknown else False
 
-        return None
+            return not_op
+
+        return lambda data: None
 
     # Leaf Condition
+    get = _field_getter(condition.field_path, on_meta)
+    if condition.transform == FieldTransform.length:
+        get = _length_getter(get)
+    op = condition.operator
+    cv = condition.value
 
-    # Helper to check existence and get value
-    val = UNSET
-    has_key = False
-    actual_field_path = condition.field_path
-
-    if isinstance(data, dict):
-        if actual_field_path in data:
-            has_key = True
-            val = data[actual_field_path]
-    elif isinstance(data, ResourceMeta):
-        if hasattr(data, actual_field_path) and actual_field_path != "indexed_data":
-            has_key = True
-            val = getattr(data, actual_field_path)
-        elif data.indexed_data is not UNSET and actual_field_path in data.indexed_data:
-            has_key = True
-            val = data.indexed_data[actual_field_path]
-
-    # Apply field transformation if specified
-    field_value = val
-    if has_key and val is not None and condition.transform is not None:
-        from autocrud.types import FieldTransform
-
-        if condition.transform == FieldTransform.length:
+    # 1. Handle operators that work on missing keys or don't care about value
+    if op == DataSearchOperator.exists:
+        if cv:
+            return lambda data: (
+                None if (v := get(data)) is _UNSIZED else v is not _MISSING
+            )
+        return lambda data: None if (v := get(data)) is _UNSIZED else v is _MISSING
+
+    if op == DataSearchOperator.isna:
+        # isna = not exist or is null
+        def isna(data: Any) -> bool | None:
+            val = get(data)
+            if val is _MISSING:
+                return cv  # True if checking isna=True
+            if val is _UNSIZED:
+                return None
+            return (val is None) == cv
+
+        return isna
+
+    compare = _compile_comparison(condition)
+    is_null = op == DataSearchOperator.is_null
+
+    def leaf(data: Any) -> bool | None:
+        val = get(data)
+        # 2. Handle missing keys for other operators -> Unknown
+        if val is _MISSING or val is _UNSIZED:
+            return None
+        # 3. Handle NULL values: is_null is the only operator that handles them
+        if val is None:
+            return cv if is_null else None
+        return compare(val)
+
+    return leaf
+
+
+def _length_getter(get: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def get_length(data: Any) -> Any:
+        val = get(data)
+        if val is _MISSING or val is None:
+            return val
+        try:
+            return len(val)
+        except TypeError:
+            # Value doesn't support len(), treat as Unknown
+            return _UNSIZED
+
+    return get_length
+
+
+def _compile_comparison(condition: DataSearchCondition) -> _Trivalent:
+    """Compile the comparison of a present, non-null (transformed) value."""
+    op = condition.operator
+    cv = condition.value
+
+    if op == DataSearchOperator.is_null:
+        # Value is not None, so is_null is False
+        result = not cv
+        return lambda val: result
+
+    compare_value = normalize_search_value(cv)
+
+    if op == DataSearchOperator.equals:
+        return lambda val: val == compare_value
+    if op == DataSearchOperator.not_equals:
+        return lambda val: val != compare_value
+    if op == DataSearchOperator.greater_than:
+        return lambda val: val > compare_value
+    if op == DataSearchOperator.greater_than_or_equal:
+        return lambda val: val >= compare_value
+    if op == DataSearchOperator.less_than:
+        return lambda val: val < compare_value
+    if op == DataSearchOperator.less_than_or_equal:
+        return lambda val: val <= compare_value
+    if op == DataSearchOperator.contains:
+        compare_str = str(compare_value)
+        flag_value = cv.value if isinstance(cv, Flag) else None
+
+        def contains(val: Any) -> bool:
+            # 特殊處理：如果 field_value 是列表，檢查 condition.value 是否在列表中
+            if isinstance(val, list):
+                return compare_value in val
+            if flag_value is not None and isinstance(val, int):
+                return (flag_value & val) == flag_value
+            # 標準字符串包含檢查
+            return compare_str in str(val)
+
+        return contains
+    if op == DataSearchOperator.starts_with:
+        prefix = str(compare_value)
+        return lambda val: str(val).startswith(prefix)
+    if op == DataSearchOperator.ends_with:
+        suffix = str(compare_value)
+        return lambda val: str(val).endswith(suffix)
+    if op == DataSearchOperator.regex:
+        search = re.compile(str(compare_value)).search
+        return lambda val: search(str(val)) is not None
+    if op in (DataSearchOperator.in_list, DataSearchOperator.not_in_list):
+        negate = op == DataSearchOperator.not_in_list
+        if not isinstance(compare_value, (list, tuple, set)):
+            return lambda val: negate
+        members = _as_container(compare_value)
+        fallback = tuple(compare_value)
+
+        def in_list(val: Any) -> bool:
             try:
-                field_value = len(val)
+                found = val in members
             except TypeError:
-                # Value doesn't support len(), treat as Unknown
-                return None
-    elif has_key:
-        field_value = val
-    else:
-        field_value = UNSET
+                # 不可 hash 的值 (list / dict) 只能逐一比對
+                found = val in fallback
+            return found is not negate
 
-    # 1. Handle operators that work on missing keys or don't care about value
-    if condition.operator == DataSearchOperator.exists:
-        return has_key if condition.value else not has_key
+        return in_list
 
-    if condition.operator == DataSearchOperator.isna:
-        # isna = not exist or is null
-        if not has_key:
-            return condition.value  # True if checking isna=True
-        is_na = val is None
-        return is_na == condition.value
+    return lambda val: None
 
-    # 2. Handle missing keys for other operators -> Unknown
-    if not has_key:
-        return None
 
-    # 3. Handle NULL values for other operators
-    if field_value is None:
-        # is_null is the only operator that handles NULL value gracefully (besides exists/isna)
-        if condition.operator == DataSearchOperator.is_null:
-            return condition.value  # True if checking is_null=True
+def _evaluate_trivalent(
+    data: dict[str, Any] | ResourceMeta,
+    condition: DataSearchCondition | DataSearchGroup,
+) -> bool | None:
+    """Evaluate one condition on *data* (see :func:`compile_condition`)."""
+    return compile_condition(condition, on_meta=isinstance(data, ResourceMeta))(data)
+
+
+# ---------------------------------------------------------------------------
+# Keyset (cursor) pagination
+# ---------------------------------------------------------------------------
+
+SearchSort = ResourceMetaSearchSort | ResourceDataSearchSort
 
-        # All other comparisons with NULL return Unknown
+
+def get_keyset_sorts(
+    qsorts: list[SearchSort] | UnsetType,
+) -> list[SearchSort]:
+    """Return the total order used for keyset pagination.
+
+    ``resource_id`` is appended as a tie-breaker (in the direction of the last
+    sort) so that every row has a unique position.  Sorts after an explicit
+    ``resource_id`` sort are dropped since they can never break a tie.
+    """
+    sorts = [] if qsorts is UNSET else list(qsorts)
+    for i, sort in enumerate(sorts):
+        if (
+            isinstance(sort, ResourceMetaSearchSort)
+            and sort.key == ResourceMetaSortKey.resource_id
+        ):
+            return sorts[: i + 1]
+    direction = sorts[-1].direction if sorts else ResourceMetaSortDirection.ascending
+    return [
+        *sorts,
+        ResourceMetaSearchSort(
+            key=ResourceMetaSortKey.resource_id, direction=direction
+        ),
+    ]
+
+
+def get_search_sorts(query: ResourceMetaSearchQuery) -> list[SearchSort]:
+    """Return the order a search's results are returned in.
+
+    Only ``after`` (cursor) pages need the total order of
+    :func:`get_keyset_sorts`; other searches use the requested sorts as is, so
+    rows that tie keep their insertion order.
+    """
+    if query.after is not UNSET:
+        return get_keyset_sorts(query.sorts)
+    return [] if query.sorts is UNSET else list(query.sorts)
+
+
+def get_sort_value(meta: ResourceMeta, sort: SearchSort) -> Any:
+    if isinstance(sort, ResourceMetaSearchSort):
+        return getattr(meta, sort.key.value)
+    if meta.indexed_data is UNSET:
         return None
+    return meta.indexed_data.get(sort.field_path)
 
-    # 4. Handle standard operators on present, non-null values
-    if condition.operator == DataSearchOperator.is_null:
-        # Value is not None, so is_null is False
-        return not condition.value
 
-    # Normalize Enum to value for comparison (indexed data stores Enum as value string/int)
-    from enum import Enum as EnumType
+def _keyset_signature(sorts: list[SearchSort]) -> str:
+    parts = []
+    for sort in sorts:
+        if isinstance(sort, ResourceMetaSearchSort):
+            parts.append(f"{sort.direction}{sort.key.value}")
+        else:
+            parts.append(f"{sort.direction}data:{sort.field_path}")
+    return ",".join(parts)
 
-    if isinstance(condition.value, EnumType):
-        compare_value = condition.value.value
-    elif isinstance(condition.value, (list, tuple, set)):
-        # Handle Enum in lists (for in_list/not_in_list operators)
-        compare_value = type(condition.value)(
-            v.value if isinstance(v, EnumType) else v for v in condition.value
-        )
-    else:
-        compare_value = condition.value
-
-    if condition.operator == DataSearchOperator.equals:
-        return field_value == compare_value
-    if condition.operator == DataSearchOperator.not_equals:
-        return field_value != compare_value
-    if condition.operator == DataSearchOperator.greater_than:
-        return field_value > compare_value
-    if condition.operator == DataSearchOperator.greater_than_or_equal:
-        return field_value >= compare_value
-    if condition.operator == DataSearchOperator.less_than:
-        return field_value < compare_value
-    if condition.operator == DataSearchOperator.less_than_or_equal:
-        return field_value <= compare_value
-    if condition.operator == DataSearchOperator.contains:
-        # 特殊處理：如果 field_value 是列表，檢查 condition.value 是否在列表中
-        if isinstance(field_value, list):
-            return compare_value in field_value
-        if isinstance(condition.value, Flag) and isinstance(field_value, int):
-            return (condition.value.value & field_value) == condition.value.value
-        # 標準字符串包含檢查
-        return str(compare_value) in str(field_value)
-    if condition.operator == DataSearchOperator.starts_with:
-        return str(field_value).startswith(
-            str(compare_value),
-        )
-    if condition.operator == DataSearchOperator.ends_with:
-        return str(field_value).endswith(
-            str(compare_value),
-        )
-    if condition.operator == DataSearchOperator.regex:
-        return re.search(str(compare_value), str(field_value)) is not None
-    if condition.operator == DataSearchOperator.in_list:
-        return (
-            field_value in compare_value
-            if isinstance(compare_value, (list, tuple, set))
-            else False
-        )
-    if condition.operator == DataSearchOperator.not_in_list:
-        return (
-            field_value not in compare_value
-            if isinstance(compare_value, (list, tuple, set))
-            else True
+
+def encode_search_cursor(
+    meta: ResourceMeta, qsorts: list[SearchSort] | UnsetType
+) -> str:
+    """Build the opaque ``after`` cursor that points just past *meta*."""
+    sorts = get_keyset_sorts(qsorts)
+    payload = [_keyset_signature(sorts), *(get_sort_value(meta, s) for s in sorts)]
+    return base64.urlsafe_b64encode(msgspec.json.encode(payload)).decode().rstrip("=")
+
+
+def decode_search_cursor(
+    cursor: str, qsorts: list[SearchSort] | UnsetType
+) -> list[Any]:
+    """Decode an ``after`` cursor into one value per :func:`get_keyset_sorts` key.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for other sorts.
+    """
+    sorts = get_keyset_sorts(qsorts)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = msgspec.json.decode(raw, type=list)
+    except (ValueError, msgspec.DecodeError) as e:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+    if len(payload) != len(sorts) + 1 or payload[0] != _keyset_signature(sorts):
+        raise ValueError("Search cursor does not match the query sorts")
+    values = payload[1:]
+    for i, sort in enumerate(sorts):
+        if isinstance(sort, ResourceMetaSearchSort) and sort.key in (
+            ResourceMetaSortKey.created_time,
+            ResourceMetaSortKey.updated_time,
+        ):
+            try:
+                values[i] = msgspec.convert(values[i], dt.datetime)
+            except msgspec.ValidationError as e:
+                raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+    return values
+
+
+class _KeysetValue:
+    """Sort-key wrapper: applies the sort direction and orders ``None`` first
+    (ascending) / last (descending), matching the SQL meta stores."""
+
+    __slots__ = ("descending", "value")
+
+    def __init__(self, value: Any, descending: bool):
+        self.value = value
+        self.descending = descending
+
+    def __eq__(self, other: "_KeysetValue") -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: "_KeysetValue") -> bool:
+        a, b = self.value, other.value
+        if self.descending:
+            a, b = b, a
+        if a is None:
+            return b is not None
+        if b is None:
+            return False
+        return a < b
+
+
+def get_keyset_sort_fn(
+    qsorts: list[SearchSort] | UnsetType,
+) -> Callable[[ResourceMeta], tuple[_KeysetValue, ...]]:
+    """Sort key for in-memory stores, consistent with :func:`get_keyset_sorts`."""
+    return _sort_fn(get_keyset_sorts(qsorts))
+
+
+def _sort_fn(
+    sorts: list[SearchSort],
+) -> Callable[[ResourceMeta], tuple[_KeysetValue, ...]]:
+    descending = [s.direction == ResourceMetaSortDirection.descending for s in sorts]
+
+    def key(meta: ResourceMeta) -> tuple[_KeysetValue, ...]:
+        return tuple(
+            _KeysetValue(get_sort_value(meta, s), d)
+            for s, d in zip(sorts, descending, strict=True)
         )
 
-    return None
-
-
-def bool_to_sign(b: bool) -> int:
-    return 1 if b else -1
-
-
-def get_sort_fn(qsorts: list[ResourceMetaSearchSort | ResourceDataSearchSort]):
-    def compare(meta1: ResourceMeta, meta2: ResourceMeta) -> int:
-        for sort in qsorts:
-            if isinstance(sort, ResourceMetaSearchSort):
-                if sort.key == ResourceMetaSortKey.created_time:
-                    if meta1.created_time != meta2.created_time:
-                        return bool_to_sign(meta1.created_time > meta2.created_time) * (
-                            1
-                            if sort.direction == ResourceMetaSortDirection.ascending
-                            else -1
-                        )
-                elif sort.key == ResourceMetaSortKey.updated_time:
-                    if meta1.updated_time != meta2.updated_time:
-                        return bool_to_sign(meta1.updated_time > meta2.updated_time) * (
-                            1
-                            if sort.direction == ResourceMetaSortDirection.ascending
-                            else -1
-                        )
-                elif sort.key == ResourceMetaSortKey.resource_id:
-                    if meta1.resource_id != meta2.resource_id:
-                        return bool_to_sign(meta1.resource_id > meta2.resource_id) * (
-                            1
-                            if sort.direction == ResourceMetaSortDirection.ascending
-                            else -1
-                        )
+    return key
+
+
+def get_cursor_sort_key(
+    cursor: str, qsorts: list[SearchSort] | UnsetType
+) -> tuple[_KeysetValue, ...]:
+    """The :func:`get_keyset_sort_fn` key of the row an ``after`` cursor points at."""
+    sorts = get_keyset_sorts(qsorts)
+    return tuple(
+        _KeysetValue(v, s.direction == ResourceMetaSortDirection.descending)
+        for v, s in zip(decode_search_cursor(cursor, qsorts), sorts, strict=True)
+    )
+
+
+def _get_indexed_value(meta: ResourceMeta, field_path: str) -> Any:
+    if meta.indexed_data is UNSET:
+        return None
+    return meta.indexed_data.get(field_path)
+
+
+def _native_sort_key(
+    sorts: list[SearchSort],
+) -> Callable[[ResourceMeta], tuple[tuple[bool, Any], ...]]:
+    """Ascending sort key built from plain tuples (``None`` first).
+
+    Unlike :func:`get_keyset_sort_fn` it ignores the sort directions, so it is
+    only valid when every key sorts in the same direction; tuple comparisons
+    then run in C instead of calling ``_KeysetValue.__lt__`` per pair.
+    """
+    getters = [
+        operator.attrgetter(s.key.value)
+        if isinstance(s, ResourceMetaSearchSort)
+        else functools.partial(_get_indexed_value, field_path=s.field_path)
+        for s in sorts
+    ]
+
+    def key(meta: ResourceMeta) -> tuple[tuple[bool, Any], ...]:
+        return tuple((v is not None, v) for v in (g(meta) for g in getters))
+
+    return key
+
+
+def sort_and_paginate(
+    metas: Iterable[ResourceMeta], query: ResourceMetaSearchQuery
+) -> list[ResourceMeta]:
+    """Select the ``after`` / ``offset`` / ``limit`` page of matched metas.
+
+    Only the first ``offset + limit`` rows are kept, using a bounded heap
+    instead of sorting every match, and each row's sort key is computed once.
+    Rows at or before the ``after`` cursor are skipped before selection.
+    Rows that tie keep the order of *metas*.
+    """
+    sorts = get_search_sorts(query)
+    k = query.offset + query.limit
+    if not sorts:
+        return list(itertools.islice(metas, query.offset, max(k, query.offset)))
+    directions = {s.direction for s in sorts}
+    if len(directions) == 1:
+        descending = directions.pop() == ResourceMetaSortDirection.descending
+        sort_key = _native_sort_key(sorts)
+        keyed = ((sort_key(m), m) for m in metas)
+        if query.after is not UNSET:
+            after_key = tuple(
+                (v is not None, v)
+                for v in decode_search_cursor(query.after, query.sorts)
+            )
+            if descending:
+                keyed = (km for km in keyed if km[0] < after_key)
             else:
-                v1 = meta1.indexed_data.get(sort.field_path)
-                v2 = meta2.indexed_data.get(sort.field_path)
-                if v1 != v2:
-                    return bool_to_sign(v1 > v2) * (
-                        1
-                        if sort.direction == ResourceMetaSortDirection.ascending
-                        else -1
-                    )
-        return 0
+                keyed = (km for km in keyed if after_key < km[0])
+        select = heapq.nlargest if descending else heapq.nsmallest
+    else:
+        sort_key = _sort_fn(sorts)
+        keyed = ((sort_key(m), m) for m in metas)
+        if query.after is not UNSET:
+            after_key = get_cursor_sort_key(query.after, query.sorts)
+            keyed = (km for km in keyed if after_key < km[0])
+        select = heapq.nsmallest
+    page = select(k, keyed, key=operator.itemgetter(0))
+    return [m for _, m in page[query.offset :]]
+
+
+def paginate_by_resource_id(
+    pks: Iterable[str],
+    load: Callable[[str], ResourceMeta | None],
+    query: ResourceMetaSearchQuery,
+    *,
+    load_many: Callable[[list[str]], dict[str, ResourceMeta]] | None = None,
+    chunk_size: int = 1000,
+) -> list[ResourceMeta] | None:
+    """Page through metas in ``resource_id`` order, stopping early.
+
+    For queries ordered by ``resource_id`` alone (including cursor pages
+    without sorts, see :func:`get_search_sorts`) the order is known from the keys, so metas are loaded lazily in key
+    order and the scan stops once ``offset + limit`` matches are found.
+
+    Arguments:
+        pks: Every resource ID in the store.
+        load: Returns the meta of a resource ID (``None`` if it vanished).
+        query: The search query.
+        load_many: Loads several resource IDs in one call (missing ones left
+            out).  When given, keys are loaded in chunks of at most
+            *chunk_size* instead of one :func:`load` call per key.
+        chunk_size: Most keys passed to one *load_many* call.
+
+    Returns:
+        list[ResourceMeta] | None: The page, or ``None`` when the query is
+            ordered by anything else (use :func:`sort_and_paginate` then).
+    """
+    sorts = get_search_sorts(query)
+    if len(sorts) != 1 or not isinstance(sorts[0], ResourceMetaSearchSort):
+        return None
+    if sorts[0].key != ResourceMetaSortKey.resource_id:
+        return None
+    descending = sorts[0].direction == ResourceMetaSortDirection.descending
+    ordered: Iterable[str] = sorted(pks, reverse=descending)
+    if query.after is not UNSET:
+        after_id = decode_search_cursor(query.after, query.sorts)[-1]
+        if descending:
+            ordered = (pk for pk in ordered if pk < after_id)
+        else:
+            ordered = (pk for pk in ordered if pk > after_id)
+    results: list[ResourceMeta] = []
+    skip = query.offset
+    if query.limit <= 0:
+        return results
+    match = compile_query(query)
+    for metas in _load_in_order(ordered, load, load_many, query, chunk_size):
+        for meta in metas:
+            if meta is None or not match(meta):
+                continue
+            if skip:
+                skip -= 1
+                continue
+            results.append(meta)
+            if len(results) >= query.limit:
+                return results
+    return results
+
+
+def _load_in_order(
+    ordered: Iterable[str],
+    load: Callable[[str], ResourceMeta | None],
+    load_many: Callable[[list[str]], dict[str, ResourceMeta]] | None,
+    query: ResourceMetaSearchQuery,
+    chunk_size: int,
+) -> Generator[list[ResourceMeta | None]]:
+    if load_many is None:
+        for pk in ordered:
+            yield [load(pk)]
+        return
+    # 第一批只取一頁所需的筆數，沒有過濾條件時一次就夠
+    size = max(1, min(query.offset + query.limit, chunk_size))
+    ordered = iter(ordered)
+    while chunk := list(itertools.islice(ordered, size)):
+        loaded = load_many(chunk)
+        yield [loaded.get(pk) for pk in chunk]
+        size = chunk_size
+
+
+def has_search_filters(query: ResourceMetaSearchQuery) -> bool:
+    """Whether *query* narrows the result set (ignoring limit / offset / sorts)."""
+    return (
+        query.is_deleted is not UNSET
+        or query.created_time_start is not UNSET
+        or query.created_time_end is not UNSET
+        or query.updated_time_start is not UNSET
+        or query.updated_time_end is not UNSET
+        or query.created_bys is not UNSET
+        or query.updated_bys is not UNSET
+        or bool(query.data_conditions)
+        or bool(query.conditions)
+        or query.after is not UNSET
+    )
+
+
+def utc_offset_seconds(value: dt.datetime) -> int | None:
+    """UTC offset of *value* in seconds, ``None`` for a naive datetime."""
+    offset = value.utcoffset()
+    return None if offset is None else int(offset.total_seconds())
+
+
+def restore_utc_offset(value: dt.datetime, offset: int | None) -> dt.datetime:
+    """Undo :func:`utc_offset_seconds` for an aware datetime read from a column.
+
+    ``None`` makes the wall-clock time of *value* naive again.
+    """
+    if offset is None:
+        return value.replace(tzinfo=None)
+    return value.astimezone(dt.timezone(dt.timedelta(seconds=offset)))
+
+
+def clamp_count(total: int, query: ResourceMetaSearchQuery) -> int:
+    """Apply ``offset`` / ``limit`` to a total match count."""
+    return max(0, min(total - query.offset, query.limit))
 
-    return functools.cmp_to_key(compare)
+
+def count_matches(metas: Iterable[ResourceMeta], query: ResourceMetaSearchQuery) -> int:
+    """Count what :func:`sort_and_paginate` would return, without sorting.
+
+    Only metas past the ``after`` cursor are counted when one is given.
+    """
+    match = compile_query(query)
+    if query.after is not UNSET:
+        sort_key = get_keyset_sort_fn(query.sorts)
+        after_key = get_cursor_sort_key(query.after, query.sorts)
+        total = sum(1 for m in metas if match(m) and after_key < sort_key(m))
+    else:
+        total = sum(1 for m in metas if match(m))
+    return clamp_count(total, query)
+
+
+def build_keyset_sql(
+    columns: list[tuple[str, str, bool, bool]], values: list[Any]
+) -> tuple[str, list[Any]]:
+    """Build a seek predicate selecting rows strictly after a cursor.
+
+    Arguments:
+        columns: one ``(sql_expr, placeholder, descending, nullable)`` entry per
+            :func:`get_keyset_sorts` key.  ``NULL`` sorts first when ascending
+            and last when descending.
+        values: the decoded cursor values (see :func:`decode_search_cursor`).
+
+    Returns:
+        tuple[str, list]: The SQL predicate and its parameters.
+    """
+    if all(not nullable for _, _, _, nullable in columns) and (
+        len({desc for _, _, desc, _ in columns}) == 1
+    ):
+        # Uniform direction without NULLs: a row-value comparison can use a
+        # composite index directly.
+        op = "<" if columns[0][2] else ">"
+        exprs = ", ".join(c[0] for c in columns)
+        placeholders = ", ".join(c[1] for c in columns)
+        return f"({exprs}) {op} ({placeholders})", list(values)
+
+    disjuncts: list[str] = []
+    params: list[Any] = []
+    for i, (expr, placeholder, descending, nullable) in enumerate(columns):
+        value = values[i]
+        if value is None:
+            if descending:
+                continue  # NULLs sort last: nothing comes after them
+            after = f"{expr} IS NOT NULL"
+            after_params = []
+        elif descending and nullable:
+            after = f"({expr} < {placeholder} OR {expr} IS NULL)"
+            after_params = [value]
+        else:
+            after = f"{expr} {'<' if descending else '>'} {placeholder}"
+            after_params = [value]
+
+        conj: list[str] = []
+        conj_params: list[Any] = []
+        for (prev_expr, prev_placeholder, _, _), prev_value in zip(
+            columns[:i], values[:i], strict=True
+        ):
+            if prev_value is None:
+                conj.append(f"{prev_expr} IS NULL")
+            else:
+                conj.append(f"{prev_expr} = {prev_placeholder}")
+                conj_params.append(prev_value)
+        conj.append(after)
+        disjuncts.append("(" + " AND ".join(conj) + ")")
+        params.extend(conj_params)
+        params.extend(after_params)
+    if not disjuncts:
+        return "1 = 0", []
+    return "(" + " OR ".join(disjuncts) + ")", params
 
 
 class MsgspecSerializer(Generic[T]):
@@ -471,6 +996,81 @@ class IMetaStore(MutableMapping[str, ResourceMeta]):
         limited by the pagination parameters.
         """
 
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        """Get metadata for many resource IDs at once.
+
+        Arguments:
+            pks (Iterable[str]): The resource IDs to retrieve.
+
+        Returns:
+            dict[str, ResourceMeta]: Mapping of resource ID to metadata.  IDs
+                that do not exist in the store are omitted.
+
+        ---
+        The base implementation calls :meth:`__getitem__` for each ID.
+        Backends that can fetch many rows in one round trip (e.g. a SQL
+        ``WHERE resource_id IN (...)`` query) should override this method.
+        """
+        result: dict[str, ResourceMeta] = {}
+        for pk in pks:
+            try:
+                result[pk] = self[pk]
+            except KeyError:
+                continue
+        return result
+
+    def iter_search_fields(
+        self, query: ResourceMetaSearchQuery, fields: Collection[str]
+    ) -> Generator[ResourceMeta]:
+        """Search like :meth:`iter_search` for a caller that reads only some fields.
+
+        Arguments:
+            query (ResourceMetaSearchQuery): The search criteria.
+            fields (Collection[str]): ``ResourceMeta`` field names the caller
+                uses.
+
+        Returns:
+            Generator[ResourceMeta]: The metas :meth:`iter_search` would yield.
+
+        ---
+        ``indexed_data`` may be left ``UNSET`` when it is not in *fields*;
+        every other field is always filled in.  The base implementation
+        calls :meth:`iter_search`; stores that keep meta fields in columns
+        override it to skip reading ``indexed_data``.
+        """
+        return self.iter_search(query)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        """Count the resource metadata matching the query criteria.
+
+        Arguments:
+            query (ResourceMetaSearchQuery): The search criteria.
+
+        Returns:
+            int: The number of items :meth:`iter_search` would yield for the
+                same query, i.e. after ``after`` / ``offset`` / ``limit``.
+
+        ---
+        The base implementation consumes :meth:`iter_search`.  Backends
+        should override it to count without loading, decoding or sorting the
+        matching metadata (e.g. a SQL ``SELECT COUNT(*)``).
+        """
+        return sum(1 for _ in self.iter_search(query))
+
+    def ensure_indexes(self, indexed_fields: Iterable[IndexableField]) -> None:
+        """Prepare the store for searches on the given ``indexed_data`` fields.
+
+        Arguments:
+            indexed_fields (Iterable[IndexableField]): Every indexed field of
+                the resource, as configured on the resource manager.
+
+        ---
+        Called when the resource manager is created and again whenever a field
+        is added.  The base implementation does nothing; backends that can
+        index ``indexed_data`` paths (e.g. database expression indexes) should
+        override it.
+        """
+
 
 class IFastMetaStore(IMetaStore):
     """Interface for a fast, temporary metadata store with bulk operations.
@@ -773,6 +1373,56 @@ class IResourceStore(ABC):
         - Data integrity hashes
         """
 
+    def get_data_bytes_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[bytes]:
+        """Retrieve raw data bytes for many revisions at once.
+
+        Arguments:
+            keys (Iterable[tuple[str, str, str | None]]): ``(resource_id,
+                revision_id, schema_version)`` triples to fetch.
+
+        Returns:
+            list[bytes]: The raw encoded data, in the same order as *keys*.
+
+        Raises:
+            KeyError: If any of the requested revisions does not exist.
+
+        ---
+        The base implementation calls :meth:`get_data_bytes` for each key.
+        Backends with a cheaper batch path should override this method.
+        """
+        result: list[bytes] = []
+        for resource_id, revision_id, schema_version in keys:
+            with self.get_data_bytes(resource_id, revision_id, schema_version) as f:
+                result.append(f.read())
+        return result
+
+    def get_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[tuple[RevisionInfo, bytes]]:
+        """Retrieve revision info and raw data bytes for many revisions at once.
+
+        Arguments:
+            keys (Iterable[tuple[str, str, str | None]]): ``(resource_id,
+                revision_id, schema_version)`` triples to fetch.
+
+        Returns:
+            list[tuple[RevisionInfo, bytes]]: ``(info, raw_data)`` pairs, in
+                the same order as *keys*.
+
+        Raises:
+            KeyError: If any of the requested revisions does not exist.
+
+        ---
+        The base implementation calls :meth:`get_revision_info` for each key
+        and then :meth:`get_data_bytes_many`.  Backends with a cheaper batch
+        path (e.g. concurrent S3 GETs) should override this method.
+        """
+        keys = list(keys)
+        infos = [self.get_revision_info(*key) for key in keys]
+        return list(zip(infos, self.get_data_bytes_many(keys), strict=True))
+
     @abstractmethod
     def save(self, info: RevisionInfo, data: IO[bytes]) -> None:
         """Save a new revision."""
@@ -1073,6 +1723,105 @@ class IStorage(ABC):
             "Override this method to support permanent deletion."
         )
 
+    def ensure_indexes(self, indexed_fields: Iterable[IndexableField]) -> None:
+        """Prepare the metadata storage for searches on indexed data fields.
+
+        The base implementation does nothing.  Backends built on an
+        :class:`IMetaStore` should delegate to
+        :meth:`IMetaStore.ensure_indexes`.
+
+        Arguments:
+            indexed_fields (Iterable[IndexableField]): Every indexed field of
+                the resource.
+        """
+
+    def get_meta_many(self, resource_ids: Iterable[str]) -> dict[str, ResourceMeta]:
+        """Retrieve metadata for many resources at once.
+
+        The base implementation calls :meth:`get_meta` for each existing ID.
+        Backends backed by a meta store should delegate to
+        :meth:`IMetaStore.get_many`.
+
+        Arguments:
+            resource_ids (Iterable[str]): The resource IDs to retrieve.
+
+        Returns:
+            dict[str, ResourceMeta]: Mapping of resource ID to metadata.  IDs
+                that do not exist are omitted.
+        """
+        return {
+            resource_id: self.get_meta(resource_id)
+            for resource_id in resource_ids
+            if self.exists(resource_id)
+        }
+
+    def get_data_bytes_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[bytes]:
+        """Retrieve raw data bytes for many revisions at once.
+
+        The base implementation calls :meth:`get_data_bytes` for each key.
+
+        Arguments:
+            keys (Iterable[tuple[str, str, str | None]]): ``(resource_id,
+                revision_id, schema_version)`` triples to fetch.
+
+        Returns:
+            list[bytes]: The raw encoded data, in the same order as *keys*.
+        """
+        result: list[bytes] = []
+        for resource_id, revision_id, schema_version in keys:
+            with self.get_data_bytes(resource_id, revision_id, schema_version) as f:
+                result.append(f.read())
+        return result
+
+    def get_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[tuple[RevisionInfo, bytes]]:
+        """Retrieve revision info and raw data bytes for many revisions at once.
+
+        The base implementation calls :meth:`get_resource_revision_info` for
+        each key and then :meth:`get_data_bytes_many`.
+
+        Arguments:
+            keys (Iterable[tuple[str, str, str | None]]): ``(resource_id,
+                revision_id, schema_version)`` triples to fetch.
+
+        Returns:
+            list[tuple[RevisionInfo, bytes]]: ``(info, raw_data)`` pairs, in
+                the same order as *keys*.
+        """
+        keys = list(keys)
+        infos = [self.get_resource_revision_info(*key) for key in keys]
+        return list(zip(infos, self.get_data_bytes_many(keys), strict=True))
+
+    def save_metas_bulk(self, metas: list[ResourceMeta]) -> None:
+        """Store or update metadata for many resources at once.
+
+        The base implementation calls :meth:`save_meta` for each item.
+        Backends with a native batch path (e.g. a meta store ``save_many``)
+        should override this method.
+
+        Arguments:
+            metas (list[ResourceMeta]): The metadata objects to store.
+        """
+        for meta in metas:
+            self.save_meta(meta)
+
+    def save_revisions_bulk(self, items: list[tuple[RevisionInfo, bytes]]) -> None:
+        """Store many revisions at once.
+
+        The base implementation calls :meth:`save_revision` for each item.
+        Backends with a native batch path (e.g. concurrent S3 PUTs) should
+        override this method.
+
+        Arguments:
+            items (list[tuple[RevisionInfo, bytes]]): ``(info, raw_data)``
+                pairs to store.
+        """
+        for info, raw in items:
+            self.save_revision(info, io.BytesIO(raw))
+
     @abstractmethod
     def search(self, query: ResourceMetaSearchQuery) -> list[ResourceMeta]:
         """Search for resources based on metadata and data criteria.
@@ -1096,6 +1845,17 @@ class IStorage(ABC):
         requiring full data loading for each resource.
         """
 
+    def search_fields(
+        self, query: ResourceMetaSearchQuery, fields: Collection[str]
+    ) -> list[ResourceMeta]:
+        """:meth:`search` for a caller that reads only the given meta *fields*.
+
+        ``indexed_data`` may be left ``UNSET`` when it is not in *fields* (see
+        :meth:`IMetaStore.iter_search_fields`).  The default implementation
+        calls :meth:`search`.
+        """
+        return self.search(query)
+
     def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
         """Streaming variant of :meth:`search`.
 
@@ -54,6 +54,7 @@ class _PhaseState:
         "current_data",
         "data",
         "resource_id",
+        "prev_metas",
     )
 
     needs_post_check: bool
@@ -62,14 +63,10 @@ class _PhaseState:
     current_data: Any
     data: Any
     resource_id: str | None
+    prev_metas: list[ResourceMeta] | None
 
     def __init__(self) -> None:
-        self.needs_post_check = False
-        self.prev_meta = None
-        self.prev_info = None
-        self.current_data = None
-        self.data = None
-        self.resource_id = None
+        self.reset()
 
     def reset(self) -> None:
         self.needs_post_check = False
@@ -78,6 +75,7 @@ class _PhaseState:
         self.current_data = None
         self.data = None
         self.resource_id = None
+        self.prev_metas = None
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +89,8 @@ _SUPPORTED_ACTIONS: frozenset[ResourceAction] = frozenset(
         ResourceAction.modify,
         ResourceAction.switch,
         ResourceAction.restore,
+        ResourceAction.create_many,
+        ResourceAction.update_many,
     }
 )
 
@@ -143,6 +143,13 @@ class ConstraintEventHandler(IEventHandler):
 
     # -- IEventHandler -------------------------------------------------------
 
+    def supported_events(self) -> list[tuple[ResourceAction, str]]:
+        return [
+            (action, phase)
+            for action in _SUPPORTED_ACTIONS
+            for phase in _SUPPORTED_PHASES
+        ]
+
     def is_supported(self, context: EventContext) -> bool:
         if not self.checkers:
             return False
@@ -182,6 +189,10 @@ class ConstraintEventHandler(IEventHandler):
             self._before_switch(context, state)  # type: ignore[arg-type]
         elif action == ResourceAction.restore:
             self._before_restore(context, state)  # type: ignore[arg-type]
+        elif action == ResourceAction.create_many:
+            self._before_create_many(context, state)  # type: ignore[arg-type]
+        elif action == ResourceAction.update_many:
+            self._before_update_many(context, state)  # type: ignore[arg-type]
 
     # -- create --------------------------------------------------------------
 
@@ -263,6 +274,26 @@ class ConstraintEventHandler(IEventHandler):
         state.resource_id = resource_id
         state.prev_meta = meta
 
+    # -- create_many / update_many -------------------------------------------
+
+    def _before_create_many(self, ctx: EventContextProto, state: _PhaseState) -> None:
+        data_list = list(ctx.data)  # type: ignore[attr-defined]
+        for data in data_list:
+            self._run_checks(data)
+        state.needs_post_check = True
+        state.data = data_list
+
+    def _before_update_many(self, ctx: EventContextProto, state: _PhaseState) -> None:
+        items = list(ctx.items)  # type: ignore[attr-defined]
+        for resource_id, data in items:
+            self._run_checks(data, exclude_resource_id=resource_id)
+        state.needs_post_check = True
+        state.data = items
+        state.prev_metas = [
+            self.rm._get_meta_no_check_is_deleted(resource_id)
+            for resource_id, _ in items
+        ]
+
     # ======================================================================
     # On-success phase (post-check + compensate)
     # ======================================================================
@@ -284,6 +315,10 @@ class ConstraintEventHandler(IEventHandler):
                 self._post_check_switch(state)
             elif action == ResourceAction.restore:
                 self._post_check_restore(state)
+            elif action == ResourceAction.create_many:
+                self._post_check_create_many(context, state)  # type: ignore[arg-type]
+            elif action == ResourceAction.update_many:
+                self._post_check_update_many(state)
         finally:
             state.reset()
 
@@ -333,6 +368,30 @@ class ConstraintEventHandler(IEventHandler):
             self._compensate_re_delete(state)
             raise
 
+    # -- create_many / update_many -------------------------------------------
+
+    def _post_check_create_many(
+        self, ctx: EventContextProto, state: _PhaseState
+    ) -> None:
+        infos: list[RevisionInfo] = ctx.infos  # type: ignore[attr-defined]
+        try:
+            # Also catches duplicates *within* the batch: only the earliest
+            # owner of a value passes the ``exclude_resource_id`` check.
+            for data, info in zip(state.data, infos):
+                self._run_checks(data, exclude_resource_id=info.resource_id)
+        except Exception:
+            for info in infos:
+                self._compensate_create(info.resource_id)
+            raise
+
+    def _post_check_update_many(self, state: _PhaseState) -> None:
+        try:
+            for resource_id, data in state.data:
+                self._run_checks(data, exclude_resource_id=resource_id)
+        except Exception:
+            self.rm.storage.save_metas_bulk(state.prev_metas)
+            raise
+
     # ======================================================================
     # Compensation helpers (shared by all constraint checkers)
     # ======================================================================
@@ -1,10 +1,19 @@
 import concurrent.futures
+import contextvars
 import datetime as dt
 import inspect
 import io
 import threading
 import traceback
-from collections.abc import Callable, Generator, Iterable, Sequence
+from collections import deque
+from collections.abc import (
+    Callable,
+    Collection,
+    Generator,
+    Iterable,
+    Mapping,
+    Sequence,
+)
 from contextlib import contextmanager, suppress
 from functools import cached_property, wraps
 from typing import (
@@ -18,7 +27,6 @@ from typing import (
 )
 from uuid import uuid4
 
-import more_itertools as mit
 import msgspec
 from jsonpatch import JsonPatch
 from jsonpointer import JsonPointer
@@ -26,20 +34,24 @@ from msgspec import UNSET, Struct, UnsetType
 from xxhash import xxh3_128_hexdigest
 
 from autocrud.resource_manager.partial import (
+    PartialFieldsSpec,
     classify_partial_fields,
-    create_partial_type,
     filter_struct_partial,
-    prune_object,
+    get_partial_plan,
 )
 from autocrud.resource_manager.pydantic_converter import (  # noqa: E402
     build_validator,
     pydantic_to_dict,
 )
+from autocrud.resource_manager.resource_cache import ResourceCache
 from autocrud.types import (
     AfterCreate,
+    AfterCreateMany,
     AfterDelete,
+    AfterDeleteMany,
     AfterDump,
     AfterGet,
+    AfterGetMany,
     AfterGetMeta,
     AfterGetResourceRevision,
     AfterListRevisions,
@@ -52,10 +64,14 @@ from autocrud.types import (
     AfterSearchResources,
     AfterSwitch,
     AfterUpdate,
+    AfterUpdateMany,
     BeforeCreate,
+    BeforeCreateMany,
     BeforeDelete,
+    BeforeDeleteMany,
     BeforeDump,
     BeforeGet,
+    BeforeGetMany,
     BeforeGetMeta,
     BeforeGetResourceRevision,
     BeforeListRevisions,
@@ -68,6 +84,7 @@ from autocrud.types import (
     BeforeSearchResources,
     BeforeSwitch,
     BeforeUpdate,
+    BeforeUpdateMany,
     Binary,
     CannotModifyResourceError,
     DuplicateResourceError,
@@ -81,9 +98,12 @@ from autocrud.types import (
     IValidator,
     OnDuplicate,
     OnFailureCreate,
+    OnFailureCreateMany,
     OnFailureDelete,
+    OnFailureDeleteMany,
     OnFailureDump,
     OnFailureGet,
+    OnFailureGetMany,
     OnFailureGetMeta,
     OnFailureGetResourceRevision,
     OnFailureListRevisions,
@@ -96,10 +116,14 @@ from autocrud.types import (
     OnFailureSearchResources,
     OnFailureSwitch,
     OnFailureUpdate,
+    OnFailureUpdateMany,
     OnSuccessCreate,
+    OnSuccessCreateMany,
     OnSuccessDelete,
+    OnSuccessDeleteMany,
     OnSuccessDump,
     OnSuccessGet,
+    OnSuccessGetMany,
     OnSuccessGetMeta,
     OnSuccessGetResourceRevision,
     OnSuccessListRevisions,
@@ -112,6 +136,7 @@ from autocrud.types import (
     OnSuccessSearchResources,
     OnSuccessSwitch,
     OnSuccessUpdate,
+    OnSuccessUpdateMany,
     PermissionDeniedError,
     RawResource,
     Resource,
@@ -120,6 +145,7 @@ from autocrud.types import (
     ResourceIsDeletedError,
     ResourceMeta,
     ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
     RevisionIDNotFoundError,
     RevisionInfo,
     RevisionNotMigratedError,
@@ -142,6 +168,8 @@ from autocrud.resource_manager.basic import (
     IResourceStore,
     IStorage,
     MsgspecSerializer,
+    encode_search_cursor,
+    get_keyset_sorts,
 )
 from autocrud.resource_manager.binary_processor import BinaryProcessor
 from autocrud.resource_manager.data_converter import DataConverter
@@ -296,14 +324,35 @@ class SimpleStorage(IStorage):
     def save_revision(self, info: RevisionInfo, data: IO[bytes]) -> None:
         self._resource_store.save(info, data)
 
+    def get_meta_many(self, resource_ids: Iterable[str]) -> dict[str, ResourceMeta]:
+        return self._meta_store.get_many(resource_ids)
+
+    def ensure_indexes(self, indexed_fields: Iterable[IndexableField]) -> None:
+        self._meta_store.ensure_indexes(indexed_fields)
+
+    def get_data_bytes_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[bytes]:
+        return self._resource_store.get_data_bytes_many(keys)
+
+    def get_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[tuple[RevisionInfo, bytes]]:
+        return self._resource_store.get_many(keys)
+
     def search(self, query: ResourceMetaSearchQuery) -> list[ResourceMeta]:
         return list(self._meta_store.iter_search(query))
 
+    def search_fields(
+        self, query: ResourceMetaSearchQuery, fields: Collection[str]
+    ) -> list[ResourceMeta]:
+        return list(self._meta_store.iter_search_fields(query, fields))
+
     def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
         yield from self._meta_store.iter_search(query)
 
     def count(self, query: ResourceMetaSearchQuery) -> int:
-        return mit.ilen(self._meta_store.iter_search(query))
+        return self._meta_store.count(query)
 
     def purge_meta(self, resource_id: str) -> None:
         """Hard-delete metadata for a resource (no soft-delete, no event hooks).
@@ -407,20 +456,20 @@ class _BlobEntry(Struct, kw_only=True):
 
 
 class _BuildRevInfoCreate(Struct):
-    data: T
+    data_hash: str
     status: RevisionStatus = RevisionStatus.stable
 
 
 class _BuildRevInfoUpdate(Struct):
     prev_res_meta: ResourceMeta
-    data: T
+    data_hash: str
     status: RevisionStatus = RevisionStatus.stable
 
 
 class _BuildRevInfoModify(Struct):
     prev_res_meta: ResourceMeta
     prev_info: RevisionInfo
-    data: T | UnsetType
+    data_hash: str | UnsetType
     status: RevisionStatus | UnsetType = RevisionStatus.stable
 
 
@@ -452,6 +501,9 @@ class PermissionEventHandler(IEventHandler):
     def __init__(self, permission_checker: "IPermissionChecker"):
         self.permission_checker = permission_checker
 
+    def supported_events(self) -> list[tuple[ResourceAction, str]]:
+        return [(action, "before") for action in ResourceAction]
+
     def is_supported(self, context: EventContext) -> bool:
         with suppress(AttributeError):
             return context.action in ResourceAction and context.phase == "before"
@@ -488,6 +540,145 @@ def coerce_data_to_resource_type(func):
     return wrapper
 
 
+def coerce_batch_args(func):
+    """Batch counterpart of :func:`coerce_data_to_resource_type`.
+
+    Materialises the ``data`` / ``items`` / ``resource_ids`` (and, when
+    given, ``revision_ids`` / ``partial``) arguments of a ``*_many`` method
+    into lists (so event contexts see a stable value) and coerces every data
+    item to the resource Struct type.  ``items`` may be
+    given as a mapping ``{resource_id: data}`` or as ``(resource_id, data)``
+    pairs.
+    """
+
+    sig = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(self: "ResourceManager", *args, **kwargs):
+        bound = sig.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        if "data" in arguments:
+            arguments["data"] = [self._coerce_data(d) for d in arguments["data"]]
+        if "items" in arguments:
+            items = arguments["items"]
+            if isinstance(items, Mapping):
+                items = items.items()
+            arguments["items"] = [(rid, self._coerce_data(d)) for rid, d in items]
+        if "resource_ids" in arguments:
+            arguments["resource_ids"] = list(arguments["resource_ids"])
+        for name in ("revision_ids", "partial"):
+            if arguments.get(name) is not None:
+                arguments[name] = list(arguments[name])
+        new_args = tuple(bound.args[1:])  # strip self
+        return func(self, *new_args, **bound.kwargs)
+
+    return wrapper
+
+
+def _event_key(context_type: type) -> tuple[ResourceAction, str]:
+    """``(action, phase)`` of a ``defstruct`` event context class."""
+    defaults = {f.name: f.default for f in msgspec.structs.fields(context_type)}
+    return defaults["action"], defaults["phase"]
+
+
+def _may_handle(handler: IEventHandler, key: tuple[ResourceAction, str]) -> bool:
+    # 只相信 class 上真的有定義 supported_events 的 handler (Mock 之類一律視為 any)
+    if getattr(type(handler), "supported_events", None) is None:
+        return True
+    events = handler.supported_events()
+    return events is None or key in set(events)
+
+
+class _EventHandlerList(list):
+    """``list`` of event handlers that reports every mutation.
+
+    Handlers are registered by mutating ``ResourceManager.event_handlers``
+    directly, so each mutation has to drop the precomputed dispatch table.
+    """
+
+    def __init__(self, iterable: Iterable[IEventHandler], on_change: Callable):
+        super().__init__(iterable)
+        self._on_change = on_change
+
+
+def _notify_after(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self: _EventHandlerList, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._on_change()
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(_EventHandlerList, _name, _notify_after(_name))
+
+
+def _compile_binder(func: Callable) -> Callable[[tuple, dict], dict[str, Any]]:
+    """Precompiled ``sig.bind(self, ...)`` + ``apply_defaults()`` for a method.
+
+    Returns the bound arguments without ``self``.  Anything unusual (too many
+    positionals, unknown or duplicated keywords, missing arguments) falls back
+    to :meth:`inspect.Signature.bind` so the error stays the same.
+    """
+    sig = inspect.signature(func)
+    self_name, *params = sig.parameters.values()
+
+    def slow(args: tuple, kwargs: dict) -> dict[str, Any]:
+        bound_args = sig.bind(None, *args, **kwargs)
+        bound_args.apply_defaults()  # 應用默認值
+        arguments = dict(bound_args.arguments)
+        del arguments[self_name.name]
+        return arguments
+
+    if any(
+        p.kind
+        in (p.POSITIONAL_ONLY, p.VAR_POSITIONAL, p.VAR_KEYWORD)  # 少見，直接走 slow
+        for p in params
+    ):
+        return slow
+
+    positional = tuple(p.name for p in params if p.kind is p.POSITIONAL_OR_KEYWORD)
+    names = frozenset(p.name for p in params)
+    defaults = tuple((p.name, p.default) for p in params if p.default is not p.empty)
+    required = tuple(p.name for p in params if p.default is p.empty)
+
+    def fast(args: tuple, kwargs: dict) -> dict[str, Any]:
+        if len(args) > len(positional):
+            return slow(args, kwargs)
+        arguments = dict(zip(positional, args))
+        for k, v in kwargs.items():
+            if k in arguments or k not in names:
+                return slow(args, kwargs)
+            arguments[k] = v
+        for name, default in defaults:
+            if name not in arguments:
+                arguments[name] = default
+        for name in required:
+            if name not in arguments:
+                return slow(args, kwargs)
+        return arguments
+
+    return fast
+
+
 def execute_with_events(
     contexts: _Contexts,
     result: str | Callable[[Any], dict[str, Any]],
@@ -495,6 +686,7 @@ def execute_with_events(
     inputs: dict[str, str | UnsetType] | None = None,
 ):
     contexts = _Contexts(*contexts)
+    keys = _Contexts(*(_event_key(c) for c in contexts))
     if isinstance(result, str):
 
         def _build_result(x):
@@ -503,56 +695,72 @@ def execute_with_events(
     else:
         _build_result = result
 
-    def wrapper(func):
-        sig = inspect.signature(func)
+    input_paths = {
+        k: v if v is UNSET else tuple(v.split(".")) for k, v in (inputs or {}).items()
+    }
 
-        @wraps(func)
-        def wrapped(self: "ResourceManager", *args, **kwargs):
-            bound_args = sig.bind(self, *args, **kwargs)
-            bound_args.apply_defaults()  # 應用默認值
+    def get_from_path(d, path: tuple[str, ...]):
+        current = d
+        for part in path:
+            if hasattr(current, part):
+                current = getattr(current, part)
+            else:
+                current = current[part]
+        return current
 
-            func_inputs = dict(bound_args.arguments)
-            del func_inputs["self"]
+    def wrapper(func):
+        bind = _compile_binder(func)
 
+        def build_inputs(self: "ResourceManager", args, kwargs) -> dict[str, Any]:
+            func_inputs = bind(args, kwargs)
             inputs_ = func_inputs | {
                 "user": self.user_or_unset,
                 "now": self.now_or_unset,
                 "resource_name": self.resource_name,
             }
-            if inputs:
-
-                def get_from_path(d, path: str):
-                    parts = path.split(".")
-                    current = d
-                    for part in parts:
-                        if hasattr(current, part):
-                            current = getattr(current, part)
-                        else:
-                            current = current[part]
-                    return current
-
-                for k, v in inputs.items():
-                    if v is UNSET:
-                        del inputs_[k]
-                    else:
-                        inputs_[k] = get_from_path(func_inputs, v)
-            self._handle_event(contexts.before(**inputs_))
+            for k, path in input_paths.items():
+                if path is UNSET:
+                    del inputs_[k]
+                else:
+                    inputs_[k] = get_from_path(func_inputs, path)
+            return inputs_
+
+        @wraps(func)
+        def wrapped(self: "ResourceManager", *args, **kwargs):
+            candidates = self._event_candidates
+            before = candidates(keys.before)
+            on_success = candidates(keys.on_success)
+            on_failure = candidates(keys.on_failure)
+            after = candidates(keys.after)
+            if not (before or on_success or on_failure or after):
+                # 沒有任何 handler 關心這個 action: 不 bind、不建 context
+                return func(self, *args, **kwargs)
+
+            inputs_ = build_inputs(self, args, kwargs)
+            if before:
+                self._dispatch_event(before, contexts.before(**inputs_))
             try:
                 result = func(self, *args, **kwargs)
-                built_result = _build_result(result)
-                self._handle_event(contexts.on_success(**inputs_, **built_result))
+                if on_success:
+                    self._dispatch_event(
+                        on_success,
+                        contexts.on_success(**inputs_, **_build_result(result)),
+                    )
                 return result
             except Exception as e:
-                self._handle_event(
-                    contexts.on_failure(
-                        **inputs_,
-                        error=str(e),
-                        stack_trace=traceback.format_exc(),
+                if on_failure:
+                    self._dispatch_event(
+                        on_failure,
+                        contexts.on_failure(
+                            **inputs_,
+                            error=str(e),
+                            stack_trace=traceback.format_exc(),
+                        ),
                     )
-                )
                 raise
             finally:
-                self._handle_event(contexts.after(**inputs_))
+                if after:
+                    self._dispatch_event(after, contexts.after(**inputs_))
 
         return wrapped
 
@@ -580,8 +788,17 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         validator: "Callable[[T], None] | IValidator | type | None" = None,
         pydantic_type: type | None = None,
         constraint_checkers: "Sequence[IConstraintChecker | Callable[[ResourceManager], IConstraintChecker]] | None" = None,
+        trust_struct_input: bool = False,
+        fetch_workers: int = 16,
+        resource_cache: ResourceCache | None = None,
     ):
         self._pydantic_type = pydantic_type
+        # Long-lived pool shared by every iter_list_resources call (lazy)
+        self._fetch_workers = fetch_workers
+        self._fetch_pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._fetch_pool_lock = threading.Lock()
+        # Skip the decode round-trip on write for data that is already a Struct
+        self._trust_struct_input = trust_struct_input
 
         # ── Resolve Schema vs legacy migration/validator ──────────────
         from autocrud.schema import Schema as _Schema
@@ -640,6 +857,8 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         self._schema_version = schema_version
         self._indexed_fields = indexed_fields or []
         self._indexed_value_extractor = IndexedValueExtractor(self._indexed_fields)
+        if self._indexed_fields:
+            self.storage.ensure_indexes(self._indexed_fields)
         self._migration = self._schema if self._schema is not None else migration_obj
         self._encoding = encoding
         # Sync encoding to Schema so multi-step migrations re-encode
@@ -658,6 +877,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         self.id_generator = (
             default_id_generator if id_generator is None else id_generator
         )
+        self._event_table: dict[tuple[ResourceAction, str], tuple[IEventHandler, ...]]
         self.event_handlers = list(event_handlers) if event_handlers else []
         # 設定權限檢查器
         if permission_checker is not None:
@@ -697,9 +917,16 @@ class ResourceManager(IResourceManager[T], Generic[T]):
 
         # Message queue is provided as a factory callable
         if message_queue is not None:
+            # Job 會被 queue 取出後就地修改，不能與共享物件的快取並存
+            if resource_cache is not None:
+                raise ValueError(
+                    "resource_cache cannot be used together with message_queue"
+                )
             self.message_queue = message_queue(self)
         else:
             self.message_queue = None
+        # 已解碼 stable revision 的快取（物件共享，呼叫端不可修改）
+        self.resource_cache = resource_cache
 
         # Reverse mapping filled by AutoCRUD._register_async_job_models().
         # Maps job resource name → job ResourceManager for async create actions
@@ -779,6 +1006,21 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             self.event_handlers.append(handler)
             self._constraint_handler = handler
 
+    def _save_revision(self, info: RevisionInfo, data: IO[bytes]) -> None:
+        self.storage.save_revision(info, data)
+        if self.resource_cache is not None:
+            self.resource_cache.invalidate(
+                info.resource_id, info.revision_id, info.schema_version
+            )
+
+    def _save_revisions_bulk(self, items: list[tuple[RevisionInfo, bytes]]) -> None:
+        self.storage.save_revisions_bulk(items)
+        if self.resource_cache is not None:
+            for info, _ in items:
+                self.resource_cache.invalidate(
+                    info.resource_id, info.revision_id, info.schema_version
+                )
+
     def encode(self, data: T) -> bytes:
         return self._data_serializer.encode(data)
 
@@ -940,7 +1182,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             meta.indexed_data = self._extract_indexed_values(migrated_data)
             self.storage.save_meta(meta)
 
-        self.storage.save_revision(info, io.BytesIO(self.encode(migrated_data)))
+        self._save_revision(info, io.BytesIO(self.encode(migrated_data)))
 
         return meta
 
@@ -962,6 +1204,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         if field.field_path not in existing:
             self._indexed_fields.append(field)
             self._indexed_value_extractor = IndexedValueExtractor(self._indexed_fields)
+            self.storage.ensure_indexes(self._indexed_fields)
 
     def _extract_indexed_values(self, data: T) -> dict[str, Any]:
         """從 data 中提取需要索引的值（保留原始類型，Enum 會在序列化時轉換）"""
@@ -1044,11 +1287,28 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         )
 
     def get_data_hash(self, data: T) -> str:
+        b, data_hash = self._encode_data(data)
+        self._validate_encoded(data, b)
+        return data_hash
+
+    def _encode_data(self, data: T) -> tuple[bytes, str]:
+        """Encode *data* once and hash the bytes.
+
+        The returned bytes are what gets saved, so callers must not encode
+        the same data again.
+        """
         b = self.encode(data)
-        self._decode_and_validate(b)  # 確保可解碼
+        return b, f"xxh3_128:{xxh3_128_hexdigest(b)}"
+
+    def _validate_encoded(self, data: T, b: bytes) -> None:
+        """Validate already-encoded *data* before it is written.
+
+        The decode round-trip is skipped for Struct input when the manager
+        was created with ``trust_struct_input=True``.
+        """
+        if not (self._trust_struct_input and isinstance(data, Struct)):
+            self._decode_and_validate(b)  # 確保可解碼
         self._run_validator(data)  # 執行自訂驗證
-        data_hash = f"xxh3_128:{xxh3_128_hexdigest(b)}"
-        return data_hash
 
     def _process_binary_fields(self, data: Any) -> Any:
         return self._binary_processor.process(data, self.blob_store)
@@ -1076,7 +1336,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             created_time = self.now_ctx.get()
             created_by = self.user_ctx.get()
             status = mode.status
-            data_hash = self.get_data_hash(mode.data)
+            data_hash = mode.data_hash
 
         elif isinstance(mode, _BuildRevInfoUpdate):
             prev_res_meta = mode.prev_res_meta
@@ -1086,7 +1346,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             created_time = self.now_ctx.get()
             created_by = self.user_ctx.get()
             status = mode.status
-            data_hash = self.get_data_hash(mode.data)
+            data_hash = mode.data_hash
 
         elif isinstance(mode, _BuildRevInfoModify):
             prev_info = mode.prev_info
@@ -1101,10 +1361,10 @@ class ResourceManager(IResourceManager[T], Generic[T]):
                 status = prev_info.status
             else:
                 status = mode.status
-            if mode.data is UNSET:
+            if mode.data_hash is UNSET:
                 data_hash = prev_info.data_hash
             else:
-                data_hash = self.get_data_hash(mode.data)
+                data_hash = mode.data_hash
 
         info = RevisionInfo(
             uid=uid,
@@ -1121,11 +1381,42 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         )
         return info
 
-    def _handle_event(self, context: EventContext) -> None:
-        for eh in self.event_handlers:
+    @property
+    def event_handlers(self) -> list[IEventHandler]:
+        return self._event_handlers
+
+    @event_handlers.setter
+    def event_handlers(self, handlers: Iterable[IEventHandler]) -> None:
+        self._event_handlers = _EventHandlerList(handlers, self._reset_event_table)
+        self._reset_event_table()
+
+    def _reset_event_table(self) -> None:
+        self._event_table = {}
+
+    def _event_candidates(
+        self, key: tuple[ResourceAction, str]
+    ) -> tuple[IEventHandler, ...]:
+        """Handlers that may support events of ``(action, phase)``, cached."""
+        table = self._event_table
+        handlers = table.get(key)
+        if handlers is None:
+            handlers = table[key] = tuple(
+                h for h in self._event_handlers if _may_handle(h, key)
+            )
+        return handlers
+
+    def _dispatch_event(
+        self, handlers: tuple[IEventHandler, ...], context: EventContext
+    ) -> None:
+        for eh in handlers:
             if eh.is_supported(context):
                 eh.handle_event(context)
 
+    def _handle_event(self, context: EventContext) -> None:
+        self._dispatch_event(
+            self._event_candidates((context.action, context.phase)), context
+        )
+
     def _get_meta_no_check_is_deleted(self, resource_id: str) -> ResourceMeta:
         if not self.storage.exists(resource_id):
             raise ResourceIDNotFoundError(resource_id)
@@ -1290,28 +1581,59 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             OnFailureSearchResources,
         ),
         "results",
+        inputs={"fields": UNSET},
     )
     def search_resources(
-        self, query: ResourceMetaSearchQuery | Query
+        self,
+        query: ResourceMetaSearchQuery | Query,
+        *,
+        fields: Collection[str] | None = None,
     ) -> list[ResourceMeta]:
         """
         Search resources based on the provided query.
 
         Arguments:
             query (ResourceMetaSearchQuery | Query): The search query object or Query builder.
+            fields: ``ResourceMeta`` fields the caller reads.  When given and
+                ``"indexed_data"`` is not among them, stores that keep meta in
+                columns may return metas with ``indexed_data`` unset.
 
         Returns:
             results (list[ResourceMeta]): A list of ResourceMeta objects matching the query.
         """
         if isinstance(query, Query):
             query = query.build()
+        if fields is not None:
+            return self.storage.search_fields(query, fields)
         return self.storage.search(query)
 
     def _default_worker_num(self, nr_work: int) -> int:
-        """Calculate the number of worker threads for parallel fetch."""
+        """Calculate the number of in-flight fetches for parallel fetch."""
         if nr_work <= 10:
             return 1
-        return max(1, min(16, nr_work // 3))
+        return max(1, min(self._fetch_workers, nr_work // 3))
+
+    def _get_fetch_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the manager-wide fetch pool, creating it on first use."""
+        if self._fetch_pool is None:
+            with self._fetch_pool_lock:
+                if self._fetch_pool is None:
+                    self._fetch_pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self._fetch_workers,
+                        thread_name_prefix=f"{self.resource_name}-fetch",
+                    )
+        return self._fetch_pool
+
+    def close(self) -> None:
+        """Shut down the thread pool used to fetch listed resources.
+
+        Call it when the manager is no longer needed; using the manager
+        afterwards starts a new pool.
+        """
+        with self._fetch_pool_lock:
+            pool, self._fetch_pool = self._fetch_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
 
     def list_resources(
         self,
@@ -1338,19 +1660,127 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         Returns:
             resources (list[SearchedResource[T]]): one item per matched resource.
         """
-        # 1. Search — triggers SearchResources events
-        metas = self.search_resources(query)
-        if not metas:
-            return []
+        return list(self.iter_list_resources(query, returns=returns, partial=partial))
+
+    @staticmethod
+    def _list_meta_fields(
+        returns: list[str], meta_fields: list[str] | None
+    ) -> set[str] | None:
+        """Meta fields :meth:`iter_list_resources` reads, ``None`` for all."""
+        if "meta" in returns and not meta_fields:
+            return None
+        # 讀取 data / info 只需要這幾個欄位
+        fields = {"resource_id", "current_revision_id", "schema_version"}
+        if "meta" in returns:
+            fields.update(
+                path.lstrip("/").split("/")[0].split(".")[0] for path in meta_fields
+            )
+        return fields
+
+    def iter_list_resources(
+        self,
+        query: ResourceMetaSearchQuery | Query,
+        *,
+        returns: list[str] | None = None,
+        partial: list[str] | None = None,
+    ) -> Generator[SearchedResource[T]]:
+        """Streaming variant of :meth:`list_resources`.
 
-        # 2. Normalise returns
+        Items are yielded in search order.  Fetches run on a thread pool
+        shared by the whole manager (see ``fetch_workers``), with at most
+        :meth:`_default_worker_num` fetches in flight per call, so only a
+        bounded window of decoded resources is held in memory at a time.
+
+        The search itself (and its events) runs when the generator is first
+        advanced.
+
+        Arguments:
+            query (ResourceMetaSearchQuery | Query): The search query.
+            returns: sections to include per item (see :meth:`list_resources`).
+            partial: optional list of field paths to retrieve
+                (see :meth:`list_resources`).
+
+        Yields:
+            resource (SearchedResource[T]): one item per matched resource.
+        """
+        # 1. Normalise returns
         if returns is None:
             returns = ["data", "info", "meta"]
 
-        # 3. Classify partial fields
+        # 2. Classify partial fields
+        spec = classify_partial_fields(partial, default_category="data")
+
+        # 3. Search — triggers SearchResources events
+        metas = self._search_listed(query, returns, spec.meta_fields)
+
+        # 4. Fetch the requested sections
+        yield from self._iter_fetched(metas, returns, spec)
+
+    def list_resources_page(
+        self,
+        query: ResourceMetaSearchQuery | Query,
+        *,
+        returns: list[str] | None = None,
+        partial: list[str] | None = None,
+    ) -> tuple[list[SearchedResource[T]], str | None]:
+        """:meth:`list_resources` plus the keyset cursor of the next page.
+
+        The cursor is built from the last *searched* meta, so a page whose
+        items failed to load still links to the pages after it.  It is
+        ``None`` when the search returned fewer than ``query.limit`` metas.
+
+        Returns:
+            (resources, next_cursor): the page and the ``after`` value for the
+                next one.
+        """
+        if isinstance(query, Query):
+            query = query.build()
+        # 第一頁也依 cursor 的完整順序排序，才能與之後的頁面銜接
+        query = msgspec.structs.replace(query, sorts=get_keyset_sorts(query.sorts))
+        if returns is None:
+            returns = ["data", "info", "meta"]
         spec = classify_partial_fields(partial, default_category="data")
+        metas = self._search_listed(query, returns, spec.meta_fields, cursor=True)
+        next_cursor = None
+        if metas and len(metas) >= query.limit:
+            next_cursor = encode_search_cursor(metas[-1], query.sorts)
+        return list(self._iter_fetched(metas, returns, spec)), next_cursor
+
+    def _search_listed(
+        self,
+        query: ResourceMetaSearchQuery | Query,
+        returns: list[str],
+        meta_fields: list[str] | None,
+        *,
+        cursor: bool = False,
+    ) -> list[ResourceMeta]:
+        """Search for :meth:`iter_list_resources`, reading only needed fields.
 
-        # 4. Define per-item fetch function
+        With *cursor*, the fields :func:`encode_search_cursor` reads are
+        included as well.
+        """
+        fields = self._list_meta_fields(returns, meta_fields)
+        if fields is None:
+            return self.search_resources(query)
+        if cursor:
+            for sort in get_keyset_sorts(query.sorts):
+                if isinstance(sort, ResourceMetaSearchSort):
+                    fields.add(sort.key.value)
+                else:
+                    fields.add("indexed_data")
+        return self.search_resources(query, fields=fields)
+
+    def _iter_fetched(
+        self,
+        metas: list[ResourceMeta],
+        returns: list[str],
+        spec: PartialFieldsSpec,
+    ) -> Generator[SearchedResource[T]]:
+        """Fetch the *returns* sections of *metas*, in order."""
+        if not metas:
+            return
+
+        # Per-item fetch function
         def _fetch_one(meta: ResourceMeta) -> SearchedResource[T] | None:
             try:
                 data = UNSET
@@ -1396,26 +1826,36 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             except Exception:
                 return None
 
-        # 5. Execute — single-threaded or parallel
+        # Execute — single-threaded or on the shared pool, keeping order
         worker_num = self._default_worker_num(len(metas))
-        results: list[SearchedResource[T]] = []
 
         if worker_num <= 1:
             for meta in metas:
                 item = _fetch_one(meta)
                 if item is not None:
-                    results.append(item)
-        else:
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=worker_num,
-            ) as executor:
-                futures = [executor.submit(_fetch_one, meta) for meta in metas]
-                for future in futures:
-                    item = future.result()
-                    if item is not None:
-                        results.append(item)
+                    yield item
+            return
 
-        return results
+        pool = self._get_fetch_pool()
+        pending: deque[concurrent.futures.Future] = deque()
+        try:
+            for meta in metas:
+                # Each task runs in a copy of the caller's context so that
+                # meta_provide() values are visible inside the worker.
+                ctx = contextvars.copy_context()
+                pending.append(pool.submit(ctx.run, _fetch_one, meta))
+                if len(pending) >= worker_num:
+                    item = pending.popleft().result()
+                    if item is not None:
+                        yield item
+            while pending:
+                item = pending.popleft().result()
+                if item is not None:
+                    yield item
+        finally:
+            # Generator closed early: drop fetches that have not started yet
+            for future in pending:
+                future.cancel()
 
     @coerce_data_to_resource_type
     @execute_with_events(
@@ -1441,8 +1881,10 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         """
         status = self.default_status if status is UNSET else status
         data = self._process_binary_fields(data)
-        info = self._rev_info(_BuildRevInfoCreate(data, status))
-        self.storage.save_revision(info, io.BytesIO(self.encode(data)))
+        raw, data_hash = self._encode_data(data)
+        self._validate_encoded(data, raw)
+        info = self._rev_info(_BuildRevInfoCreate(data_hash, status))
+        self._save_revision(info, io.BytesIO(raw))
         self.storage.save_meta(self._res_meta(_BuildResMetaCreate(info, data)))
         if self.message_queue is not None:
             self.message_queue.put(info.resource_id)
@@ -1506,13 +1948,90 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         with self.storage.get_data_bytes(
             resource_id, revision_id, schema_version=schema_version
         ) as data_io:
-            PartialType = create_partial_type(self._resource_type, partial)
-            s = MsgspecSerializer(
-                encoding=self._encoding,
-                resource_type=PartialType,
-            )
-            decoded = s.decode(data_io.read())
-            return prune_object(decoded, partial)
+            plan = get_partial_plan(self._resource_type, partial, self._encoding)
+            return plan.decode(data_io.read())
+
+    @coerce_batch_args
+    @execute_with_events(
+        (BeforeGetMany, AfterGetMany, OnSuccessGetMany, OnFailureGetMany),
+        "resources",
+    )
+    def get_many(
+        self,
+        resource_ids: Iterable[str],
+        revision_ids: Iterable[str] | None = None,
+        partial: Iterable[str | JsonPointer] | None = None,
+    ) -> list[Resource[T]] | list[Struct]:
+        """
+        Get many resources in one call.
+
+        Metadata is loaded with a single :meth:`IStorage.get_meta_many` call and
+        revision data with a single :meth:`IStorage.get_many` (or
+        :meth:`IStorage.get_data_bytes_many` when *partial* is given), so
+        backends can serve the whole batch with one query / concurrent fetches.
+
+        Arguments:
+            resource_ids (Iterable[str]): The IDs of the resources to retrieve.
+            revision_ids (Iterable[str] | None): (Optional) The revision ID to
+                retrieve for each resource, aligned with *resource_ids*. If not
+                set, retrieves the current revision of every resource.
+            partial (Iterable[str | JsonPointer] | None): (Optional) A list of
+                fields or JSON pointers to retrieve. When set, only the partial
+                data structs are returned (see :meth:`get_partial`).
+
+        Returns:
+            resources (list[Resource[T]] | list[Struct]): One item per requested
+                ID, in the same order as *resource_ids*.
+
+        Raises:
+            ValueError: If *revision_ids* does not have the same length as
+                *resource_ids*.
+            ResourceIDNotFoundError: If any resource ID does not exist.
+            ResourceIsDeletedError: If any resource has been soft-deleted.
+            RevisionIDNotFoundError: If any of *revision_ids* does not exist.
+        """
+        if revision_ids is not None and len(revision_ids) != len(resource_ids):
+            raise ValueError("revision_ids must have the same length as resource_ids")
+        metas = self.storage.get_meta_many(resource_ids)
+        keys: list[tuple[str, str, str | None]] = []
+        for i, resource_id in enumerate(resource_ids):
+            meta = metas.get(resource_id)
+            if meta is None:
+                raise ResourceIDNotFoundError(resource_id)
+            if meta.is_deleted:
+                raise ResourceIsDeletedError(resource_id)
+            schema_version = meta.schema_version
+            if revision_ids is None or revision_ids[i] == meta.current_revision_id:
+                revision_id = meta.current_revision_id
+            else:
+                # 舊版本可能以不同的 schema_version 存放
+                revision_id = revision_ids[i]
+                schema_version = self.storage.find_revision_schema_version(
+                    resource_id, revision_id
+                )
+                if schema_version is UNSET:
+                    raise RevisionIDNotFoundError(resource_id, revision_id)
+            keys.append((resource_id, revision_id, schema_version))
+
+        if partial is not None:
+            plan = get_partial_plan(self._resource_type, partial, self._encoding)
+            return [plan.decode(raw) for raw in self.storage.get_data_bytes_many(keys)]
+        cache = self.resource_cache
+        if cache is None:
+            return [
+                Resource(info=info, data=self.decode(raw))
+                for info, raw in self.storage.get_many(keys)
+            ]
+        resources: list[Resource[T] | None] = [cache.get(key) for key in keys]
+        missing = [i for i, resource in enumerate(resources) if resource is None]
+        if missing:
+            fetched = self.storage.get_many([keys[i] for i in missing])
+            for i, (info, raw) in zip(missing, fetched):
+                resource = Resource(info=info, data=self.decode(raw))
+                if info.status == RevisionStatus.stable:
+                    cache.put(keys[i], resource, len(raw))
+                resources[i] = resource
+        return resources
 
     def get_revision_info(
         self,
@@ -1566,14 +2085,27 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         Returns:
             resource (Resource[T]): The resource object.
         """
+        cache = self.resource_cache
+        if cache is not None and schema_version is not UNSET:
+            key = (resource_id, revision_id, schema_version)
+            resource = cache.get(key)
+            if resource is not None:
+                return resource
         info = self.storage.get_resource_revision_info(
             resource_id, revision_id, schema_version
         )
         with self.storage.get_data_bytes(
             resource_id, revision_id, schema_version
         ) as data_io:
-            data = self.decode(data_io.read())
-        return Resource(info=info, data=data)
+            raw = data_io.read()
+        resource = Resource(info=info, data=self.decode(raw))
+        if (
+            cache is not None
+            and schema_version is not UNSET
+            and info.status == RevisionStatus.stable
+        ):
+            cache.put(key, resource, len(raw))
+        return resource
 
     @execute_with_events(
         (
@@ -1625,11 +2157,13 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             resource_id,
             prev_res_meta.current_revision_id,
         )
-        rev_info = self._rev_info(_BuildRevInfoUpdate(prev_res_meta, data, status))
-        if prev_info.data_hash == rev_info.data_hash:
+        raw, data_hash = self._encode_data(data)
+        if prev_info.data_hash == data_hash:
             return prev_info
+        self._validate_encoded(data, raw)
+        rev_info = self._rev_info(_BuildRevInfoUpdate(prev_res_meta, data_hash, status))
         res_meta = self._res_meta(_BuildResMetaUpdate(prev_res_meta, rev_info, data))
-        self.storage.save_revision(rev_info, io.BytesIO(self.encode(data)))
+        self._save_revision(rev_info, io.BytesIO(raw))
         self.storage.save_meta(res_meta)
         return rev_info
 
@@ -1652,6 +2186,129 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         except ResourceIDNotFoundError:
             return self.create(data, status=status)
 
+    @coerce_batch_args
+    @execute_with_events(
+        (BeforeCreateMany, AfterCreateMany, OnSuccessCreateMany, OnFailureCreateMany),
+        "infos",
+    )
+    def create_many(
+        self, data: Iterable[T], *, status: RevisionStatus | UnsetType = UNSET
+    ) -> list[RevisionInfo]:
+        """
+        Create many resources in one batch.
+
+        All revision infos and metas are built (and validated) up front, then
+        written through :meth:`IStorage.save_revisions_bulk` and
+        :meth:`IStorage.save_metas_bulk`.  If any item fails validation
+        nothing is written.  Events fire once for the whole batch.
+
+        Arguments:
+            data (Iterable[T]): The resource data objects.
+            status (RevisionStatus | UnsetType): The initial status of every
+                resource (default: stable).
+
+        Returns:
+            infos (list[RevisionInfo]): One revision info per item, in input order.
+
+        Raises:
+            ValueError: If a fixed resource id was provided via
+                :meth:`meta_provide`, since every item would share it.
+            UniqueConstraintError: If a field annotated with :class:`Unique`
+                collides with an existing resource or another batch item.
+        """
+        if data and self.id_ctx.get() is not UNSET:
+            raise ValueError("create_many does not support a fixed resource_id")
+        status = self.default_status if status is UNSET else status
+        infos: list[RevisionInfo] = []
+        revisions: list[tuple[RevisionInfo, bytes]] = []
+        metas: list[ResourceMeta] = []
+        for item in data:
+            item = self._process_binary_fields(item)
+            raw, data_hash = self._encode_data(item)
+            self._validate_encoded(item, raw)
+            info = self._rev_info(_BuildRevInfoCreate(data_hash, status))
+            infos.append(info)
+            revisions.append((info, raw))
+            metas.append(self._res_meta(_BuildResMetaCreate(info, item)))
+        self._save_revisions_bulk(revisions)
+        self.storage.save_metas_bulk(metas)
+        if self.message_queue is not None:
+            for info in infos:
+                self.message_queue.put(info.resource_id)
+        return infos
+
+    @coerce_batch_args
+    @execute_with_events(
+        (BeforeUpdateMany, AfterUpdateMany, OnSuccessUpdateMany, OnFailureUpdateMany),
+        "revision_infos",
+    )
+    def update_many(
+        self,
+        items: Mapping[str, T] | Iterable[tuple[str, T]],
+        *,
+        status: RevisionStatus | UnsetType = UNSET,
+    ) -> list[RevisionInfo]:
+        """
+        Update many resources in one batch (one new revision each).
+
+        Like :meth:`update`, an item whose data hash equals the current
+        revision is not written and its current revision info is returned.
+        The remaining revisions and metas are written in bulk after every
+        item has been validated.  Events fire once for the whole batch.
+
+        Arguments:
+            items (Mapping[str, T] | Iterable[tuple[str, T]]): ``resource_id``
+                to new data, as a mapping or as ``(resource_id, data)`` pairs.
+            status (RevisionStatus | UnsetType): The status of the new
+                revisions (default: stable).
+
+        Returns:
+            infos (list[RevisionInfo]): One revision info per item, in input order.
+
+        Raises:
+            ValueError: If the same resource id appears more than once.
+            ResourceIDNotFoundError: If a resource ID does not exist.
+            ResourceIsDeletedError: If a resource has been soft-deleted.
+        """
+        status = self.default_status if status is UNSET else status
+        seen: set[str] = set()
+        results: list[RevisionInfo] = []
+        revisions: list[tuple[RevisionInfo, bytes]] = []
+        metas: list[ResourceMeta] = []
+        # 一次取回所有 meta，而不是每筆各查一次
+        prev_metas = self.storage.get_meta_many([rid for rid, _ in items])
+        for resource_id, item in items:
+            if resource_id in seen:
+                raise ValueError(f"Duplicate resource_id in batch: {resource_id}")
+            seen.add(resource_id)
+            item = self._process_binary_fields(item)
+            prev_res_meta = prev_metas.get(resource_id)
+            if prev_res_meta is None:
+                raise ResourceIDNotFoundError(resource_id)
+            if prev_res_meta.is_deleted:
+                raise ResourceIsDeletedError(resource_id)
+            prev_info = self.storage.get_resource_revision_info(
+                resource_id,
+                prev_res_meta.current_revision_id,
+                prev_res_meta.schema_version,
+            )
+            raw, data_hash = self._encode_data(item)
+            if prev_info.data_hash == data_hash:
+                results.append(prev_info)
+                continue
+            self._validate_encoded(item, raw)
+            rev_info = self._rev_info(
+                _BuildRevInfoUpdate(prev_res_meta, data_hash, status)
+            )
+            results.append(rev_info)
+            revisions.append((rev_info, raw))
+            metas.append(
+                self._res_meta(_BuildResMetaUpdate(prev_res_meta, rev_info, item))
+            )
+        self._save_revisions_bulk(revisions)
+        self.storage.save_metas_bulk(metas)
+        return results
+
     @coerce_data_to_resource_type
     @execute_with_events(
         (BeforeModify, AfterModify, OnSuccessModify, OnFailureModify),
@@ -1698,13 +2355,15 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         if data is not UNSET:
             data = self._process_binary_fields(data)
 
+        raw, data_hash = self._encode_data(data)
+        if prev_info.data_hash == data_hash:
+            return prev_info
+        self._validate_encoded(data, raw)
         rev_info = self._rev_info(
-            _BuildRevInfoModify(prev_res_meta, prev_info, data, status=status)
+            _BuildRevInfoModify(prev_res_meta, prev_info, data_hash, status=status)
         )
-        if prev_info.data_hash == rev_info.data_hash:
-            return prev_info
         res_meta = self._res_meta(_BuildResMetaModify(prev_res_meta, rev_info, data))
-        self.storage.save_revision(rev_info, io.BytesIO(self.encode(data)))
+        self._save_revision(rev_info, io.BytesIO(raw))
         self.storage.save_meta(res_meta)
         return rev_info
 
@@ -1723,7 +2382,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         with self.storage.get_data_bytes(
             resource_id, prev_res_meta.current_revision_id
         ) as data_io:
-            self.storage.save_revision(rev_info, data_io)
+            self._save_revision(rev_info, data_io)
         self.storage.save_meta(res_meta)
         return rev_info
 
@@ -1834,6 +2493,45 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         self.storage.save_meta(meta)
         return meta
 
+    @coerce_batch_args
+    @execute_with_events(
+        (BeforeDeleteMany, AfterDeleteMany, OnSuccessDeleteMany, OnFailureDeleteMany),
+        "metas",
+    )
+    def delete_many(self, resource_ids: Iterable[str]) -> list[ResourceMeta]:
+        """
+        Soft delete many resources in one batch.
+
+        All metas are loaded and checked first, then saved with a single
+        :meth:`IStorage.save_metas_bulk` call.  Events fire once for the
+        whole batch.
+
+        Arguments:
+            resource_ids (Iterable[str]): The IDs of the resources to delete.
+
+        Returns:
+            metas (list[ResourceMeta]): The updated metadata (is_deleted=True),
+                in input order.
+
+        Raises:
+            ResourceIDNotFoundError: If a resource ID does not exist.
+            ResourceIsDeletedError: If a resource has already been soft-deleted.
+        """
+        metas: list[ResourceMeta] = []
+        found = self.storage.get_meta_many(resource_ids)
+        for resource_id in resource_ids:
+            meta = found.get(resource_id)
+            if meta is None:
+                raise ResourceIDNotFoundError(resource_id)
+            if meta.is_deleted:
+                raise ResourceIsDeletedError(resource_id)
+            meta.is_deleted = True
+            meta.updated_by = self.user_ctx.get()
+            meta.updated_time = self.now_ctx.get()
+            metas.append(meta)
+        self.storage.save_metas_bulk(metas)
+        return metas
+
     @execute_with_events(
         (BeforeRestore, AfterRestore, OnSuccessRestore, OnFailureRestore),
         "meta",
@@ -1886,6 +2584,8 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         """
         meta = self._get_meta_no_check_is_deleted(resource_id)
         self.storage.purge_resource(resource_id)
+        if self.resource_cache is not None:
+            self.resource_cache.invalidate_resource(resource_id)
         return meta
 
     @execute_with_events(
@@ -1927,7 +2627,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
         if query is not None:
             if isinstance(query, Query):
                 query = query.build()
-            q = msgspec.structs.replace(query, limit=2**31 - 1, offset=0)
+            q = msgspec.structs.replace(query, limit=2**31 - 1, offset=0, after=UNSET)
             metas = self.storage.iter_search(q)
         else:
             metas = self.storage.dump_meta(None)
@@ -2009,7 +2709,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
             self.storage.save_meta(self.meta_serializer.decode(bio.read()))
         elif record_type.startswith("data/"):
             raw_res = self.resource_serializer.decode(bio.read())
-            self.storage.save_revision(raw_res.info, io.BytesIO(raw_res.raw_data))
+            self._save_revision(raw_res.info, io.BytesIO(raw_res.raw_data))
         elif record_type.startswith("blob/"):
             blob_entry = self._blob_serializer.decode(bio.read())
             if self.blob_store is not None:
@@ -2084,7 +2784,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
 
         if isinstance(record, RevisionRecord):
             raw_res = self.resource_serializer.decode(record.data)
-            self.storage.save_revision(raw_res.info, io.BytesIO(raw_res.raw_data))
+            self._save_revision(raw_res.info, io.BytesIO(raw_res.raw_data))
             return True
 
         if isinstance(record, BlobRecord):
@@ -2172,7 +2872,7 @@ class ResourceManager(IResourceManager[T], Generic[T]):
                     continue
                 revisions_to_save.append((raw_res.info, raw_res.raw_data))
 
-            self.storage.save_revisions_bulk(revisions_to_save)
+            self._save_revisions_bulk(revisions_to_save)
 
             # --- 3. blob records (sequential — usually few) ---------------
             if self.blob_store is not None:
@@ -16,6 +16,9 @@ class SimpleEventHandler(IEventHandler):
         self.phase = phase
         self.action = action
 
+    def supported_events(self) -> list[tuple[ResourceAction, str]]:
+        return [(action, self.phase) for action in self.action]
+
     def is_supported(self, context: EventContext) -> bool:
         return context.phase == self.phase and context.action in self.action
 
@@ -0,0 +1,245 @@
+"""Read-through ResourceMeta cache.
+
+:class:`CachedMetaStore` wraps any :class:`IMetaStore` and answers
+``__getitem__`` / ``__contains__`` / ``get_many`` from memory, so hot lookups
+such as ``ResourceManager.get`` no longer need a round trip to the backing
+store just to learn ``current_revision_id``.  Writes go straight through to the
+wrapped store and then update the cached entry; searches are always delegated.
+
+Missing IDs are remembered as negative entries, so repeated ``exists`` checks
+for unknown resources are cheap as well.
+
+Other processes writing to the same backing store are not seen by this cache.
+Either bound staleness with ``ttl``, or wire ``on_write`` to a broadcast
+channel (e.g. Redis pub/sub) and call :meth:`CachedMetaStore.invalidate` from
+the subscriber on every other process.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Generator, Iterable
+from typing import NamedTuple
+
+from autocrud.resource_manager.basic import Encoding, IMetaStore, MsgspecSerializer
+from autocrud.types import IndexableField, ResourceMeta, ResourceMetaSearchQuery
+
+# 負向快取項目：此 resource_id 不存在
+_MISSING = b""
+
+
+class MetaCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class CachedMetaStore(IMetaStore):
+    """Cache :class:`ResourceMeta` lookups in front of another meta store.
+
+    Arguments:
+        store: The meta store to wrap.
+        maxsize: Maximum number of cached IDs, including negative entries
+            (``None`` for no limit).  Least-recently-used entries are evicted
+            first.
+        ttl: Seconds an entry stays valid (``None`` to keep entries until they
+            are evicted or invalidated).
+        on_write: Called with the IDs written or deleted through this store,
+            after the write has reached the wrapped store.  Use it to publish
+            cross-process invalidations.
+
+    Entries are kept encoded and decoded on every hit, so callers receive their
+    own :class:`ResourceMeta` instance and may mutate it freely.
+    """
+
+    def __init__(
+        self,
+        store: IMetaStore,
+        *,
+        maxsize: int | None = 4096,
+        ttl: float | None = None,
+        on_write: Callable[[list[str]], None] | None = None,
+    ):
+        self._store = store
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_write = on_write
+        self.hits = 0
+        self.misses = 0
+        self._serializer = MsgspecSerializer(
+            encoding=Encoding.msgpack, resource_type=ResourceMeta
+        )
+        # pk -> (encoded meta 或 _MISSING, 寫入時間)
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> IMetaStore:
+        """The wrapped meta store."""
+        return self._store
+
+    # ------------------------------------------------------------------
+    # cache bookkeeping
+    # ------------------------------------------------------------------
+
+    def _lookup(self, pk: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(pk)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry[1] < self.ttl
+            ):
+                self._entries.move_to_end(pk)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[pk]
+            self.misses += 1
+            return None
+
+    def _remember(
+        self, items: Iterable[tuple[str, bytes]], *, overwrite: bool = False
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for pk, value in items:
+                # 讀取填入時不覆蓋：期間若有寫入，寫入端的值才是新的
+                if not overwrite and pk in self._entries:
+                    continue
+                self._entries[pk] = (value, now)
+                self._entries.move_to_end(pk)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def _notify(self, pks: list[str]) -> None:
+        if self.on_write is not None and pks:
+            self.on_write(pks)
+
+    def invalidate(self, pk: str) -> None:
+        """Forget the cached entry for *pk* (e.g. on a remote write)."""
+        with self._lock:
+            self._entries.pop(pk, None)
+
+    def clear(self) -> None:
+        """Forget every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> MetaCacheInfo:
+        with self._lock:
+            return MetaCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._entries)
+            )
+
+    # ------------------------------------------------------------------
+    # IMetaStore
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, pk: str) -> ResourceMeta:
+        cached = self._lookup(pk)
+        if cached is None:
+            try:
+                meta = self._store[pk]
+            except KeyError:
+                self._remember([(pk, _MISSING)])
+                raise
+            self._remember([(pk, self._serializer.encode(meta))])
+            return meta
+        if cached == _MISSING:
+            raise KeyError(pk)
+        return self._serializer.decode(cached)
+
+    def __contains__(self, pk: object) -> bool:
+        if not isinstance(pk, str):
+            return False
+        cached = self._lookup(pk)
+        if cached is not None:
+            return cached != _MISSING
+        # 通常緊接著會讀取，直接載入整筆資料一併快取
+        try:
+            meta = self._store[pk]
+        except KeyError:
+            self._remember([(pk, _MISSING)])
+            return False
+        self._remember([(pk, self._serializer.encode(meta))])
+        return True
+
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        result: dict[str, ResourceMeta] = {}
+        missing: list[str] = []
+        for pk in pks:
+            cached = self._lookup(pk)
+            if cached is None:
+                missing.append(pk)
+            elif cached != _MISSING:
+                result[pk] = self._serializer.decode(cached)
+        if missing:
+            fetched = self._store.get_many(missing)
+            self._remember(
+                (
+                    pk,
+                    self._serializer.encode(fetched[pk]) if pk in fetched else _MISSING,
+                )
+                for pk in missing
+            )
+            result.update(fetched)
+        return result
+
+    def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
+        try:
+            self._store[pk] = meta
+        except BaseException:
+            self.invalidate(pk)
+            raise
+        self._remember([(pk, self._serializer.encode(meta))], overwrite=True)
+        self._notify([pk])
+
+    def save_many(self, metas: Iterable[ResourceMeta]) -> None:
+        metas = list(metas)
+        pks = [meta.resource_id for meta in metas]
+        try:
+            if hasattr(self._store, "save_many"):
+                self._store.save_many(metas)
+            else:
+                for meta in metas:
+                    self._store[meta.resource_id] = meta
+        except BaseException:
+            for pk in pks:
+                self.invalidate(pk)
+            raise
+        self._remember(
+            ((meta.resource_id, self._serializer.encode(meta)) for meta in metas),
+            overwrite=True,
+        )
+        self._notify(pks)
+
+    def __delitem__(self, pk: str) -> None:
+        try:
+            del self._store[pk]
+        finally:
+            self.invalidate(pk)
+        self._remember([(pk, _MISSING)], overwrite=True)
+        self._notify([pk])
+
+    def __iter__(self) -> Generator[str]:
+        yield from self._store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+        return self._store.iter_search(query)
+
+    def iter_search_fields(
+        self, query: ResourceMetaSearchQuery, fields: Collection[str]
+    ) -> Generator[ResourceMeta]:
+        return self._store.iter_search_fields(query, fields)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        return self._store.count(query)
+
+    def ensure_indexes(self, indexed_fields: Iterable[IndexableField]) -> None:
+        self._store.ensure_indexes(indexed_fields)
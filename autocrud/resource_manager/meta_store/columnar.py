@@ -0,0 +1,779 @@
+"""Columnar in-memory meta store.
+
+:class:`ColumnarMemoryMetaStore` keeps the searchable parts of every
+:class:`ResourceMeta` in NumPy arrays instead of decoding each stored meta per
+search:
+
+- the meta fields and every ``indexed_data`` path get a typed column
+  (bool / int64 / float64 / datetime as int64 microseconds), with masks for
+  "key present" and "value is not null";
+- strings are dictionary-encoded, so string operators run once per distinct
+  value and are gathered back with the codes;
+- condition trees are evaluated as whole arrays with the same trivalent
+  (True / False / Unknown) logic as :func:`compile_condition`;
+- sorting uses ``np.lexsort`` on the rows that can still reach the requested
+  page, and only that page is decoded.
+
+Values that do not fit a typed column (lists, dicts, mixed types) are kept in
+an ``"obj"`` column whose conditions are evaluated on decoded rows, so results
+always match the other in-memory stores.
+"""
+
+import bisect
+import datetime as dt
+import sys
+import threading
+from collections.abc import Generator, Iterable
+from typing import Any
+
+from msgspec import UNSET
+
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchGroup,
+    DataSearchLogicOperator,
+    DataSearchOperator,
+    ResourceDataSearchSort,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSortDirection,
+    ResourceMetaSortKey,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    print(
+        "NumPy is required to use ColumnarMemoryMetaStore. "
+        "Install it with: pip install autocrud[columnar]",
+        file=sys.stderr,
+    )
+    raise
+
+from autocrud.resource_manager.basic import (
+    Encoding,
+    ISlowMetaStore,
+    MsgspecSerializer,
+    SearchSort,
+    clamp_count,
+    compile_condition,
+    count_matches,
+    decode_search_cursor,
+    get_keyset_sorts,
+    get_search_sorts,
+    normalize_search_value,
+    sort_and_paginate,
+)
+
+_ABSENT = object()
+
+_EPOCH = dt.datetime(1970, 1, 1)
+_EPOCH_TZ = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_MICROSECOND = dt.timedelta(microseconds=1)
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+# float64 可精確表示的整數範圍
+_FLOAT_EXACT = 2**53
+
+_DTYPES = {
+    "bool": np.bool_,
+    "int": np.int64,
+    "float": np.float64,
+    "str": np.int32,
+    "time": np.int64,
+    "timetz": np.int64,
+}
+_NUMERIC_KINDS = ("bool", "int", "float")
+_TIME_KINDS = ("time", "timetz")
+
+# 以 column 保存的 meta 欄位；resource_id / current_revision_id 逐筆解碼求值
+_META_COLUMNS = (
+    "created_time",
+    "updated_time",
+    "created_by",
+    "updated_by",
+    "schema_version",
+    "is_deleted",
+    "total_revision_count",
+)
+
+_COMPARISONS = {
+    DataSearchOperator.equals: np.equal,
+    DataSearchOperator.not_equals: np.not_equal,
+    DataSearchOperator.greater_than: np.greater,
+    DataSearchOperator.greater_than_or_equal: np.greater_equal,
+    DataSearchOperator.less_than: np.less,
+    DataSearchOperator.less_than_or_equal: np.less_equal,
+}
+_MEMBERSHIP = (DataSearchOperator.in_list, DataSearchOperator.not_in_list)
+
+# (True mask, False mask)；兩者皆否即為 Unknown
+_Masks = tuple[np.ndarray, np.ndarray]
+
+
+def _kind_of(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if _INT64_MIN <= value <= _INT64_MAX else "obj"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, dt.datetime):
+        return "time" if value.utcoffset() is None else "timetz"
+    return "obj"
+
+
+def _to_micros(value: dt.datetime) -> int:
+    epoch = _EPOCH if value.utcoffset() is None else _EPOCH_TZ
+    return (value - epoch) // _MICROSECOND
+
+
+def _is_number(value: Any) -> bool:
+    return _kind_of(value) in _NUMERIC_KINDS
+
+
+def _resize(array: np.ndarray, capacity: int) -> np.ndarray:
+    resized = np.zeros(capacity, array.dtype)
+    resized[: len(array)] = array
+    return resized
+
+
+def _constant(n: int, result: bool | None) -> _Masks:
+    return np.full(n, result is True), np.full(n, result is False)
+
+
+def _gather(results: list[bool | None], index: np.ndarray) -> _Masks:
+    t = np.array([r is True for r in results], dtype=bool)
+    f = np.array([r is False for r in results], dtype=bool)
+    return t[index], f[index]
+
+
+class _Column:
+    """One typed column plus "present" / "not null" masks.
+
+    The first non-null value fixes ``kind``; ints and floats may share a
+    float column while exactly representable.  Any other mix turns the column
+    into ``"obj"``, which keeps only the masks.
+    """
+
+    def __init__(self, capacity: int):
+        self.kind: str | None = None
+        self.present = np.zeros(capacity, dtype=bool)
+        self.notnull = np.zeros(capacity, dtype=bool)
+        self.values: np.ndarray | None = None
+        # False 表示 float 欄位混入過 int，值的型別已無法還原
+        self.exact = True
+        self.words: list[str] = []
+        self.codes: dict[str, int] = {}
+        self._ranks: tuple[int, np.ndarray, np.ndarray] | None = None
+
+    def grow(self, capacity: int) -> None:
+        self.present = _resize(self.present, capacity)
+        self.notnull = _resize(self.notnull, capacity)
+        if self.values is not None:
+            self.values = _resize(self.values, capacity)
+
+    def set(self, row: int, value: Any = _ABSENT) -> None:
+        if value is _ABSENT:
+            self.present[row] = False
+            self.notnull[row] = False
+            return
+        self.present[row] = True
+        if value is None:
+            self.notnull[row] = False
+            return
+        kind = _kind_of(value)
+        if kind != self.kind:
+            kind = self._convert(kind, value)
+        self.notnull[row] = True
+        if kind == "str":
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.words)
+                self.words.append(value)
+            self.values[row] = code
+        elif kind in _TIME_KINDS:
+            self.values[row] = _to_micros(value)
+        elif kind != "obj":
+            self.values[row] = value
+
+    def _convert(self, kind: str, value: Any) -> str:
+        if self.kind is None:
+            self.kind = kind
+            if kind != "obj":
+                self.values = np.zeros(len(self.present), dtype=_DTYPES[kind])
+            return kind
+        if self.kind == "obj":
+            return "obj"
+        if {self.kind, kind} == {"int", "float"}:
+            if kind == "int":
+                fits = abs(value) <= _FLOAT_EXACT
+            else:
+                stored = self.values[self.notnull]
+                fits = not len(stored) or int(np.abs(stored).max()) <= _FLOAT_EXACT
+            if fits:
+                self.values = self.values.astype(np.float64)
+                self.kind = "float"
+                self.exact = False
+                return "float"
+        self.kind = "obj"
+        self.values = None
+        self.words = []
+        self.codes = {}
+        self._ranks = None
+        return "obj"
+
+    def word_ranks(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sorted dictionary and the sort rank of every code."""
+        if self._ranks is None or self._ranks[0] != len(self.words):
+            words = np.array(self.words, dtype=object)
+            order = np.argsort(words, kind="stable")
+            ranks = np.empty(len(words), dtype=np.int64)
+            ranks[order] = np.arange(len(words))
+            self._ranks = (len(words), words[order], ranks)
+        return self._ranks[1], self._ranks[2]
+
+
+def _doubled_rank(ordered: np.ndarray, value: str) -> int:
+    """Position of *value* among ``2 * rank`` keys (odd when absent)."""
+    i = bisect.bisect_left(ordered, value)
+    if i < len(ordered) and ordered[i] == value:
+        return 2 * i
+    return 2 * i - 1
+
+
+class _Decoded:
+    """Per-search cache of decoded rows for conditions evaluated in Python."""
+
+    def __init__(self, store: "ColumnarMemoryMetaStore"):
+        self._store = store
+        self._metas: dict[int, ResourceMeta] = {}
+
+    def __call__(self, row: int) -> ResourceMeta:
+        meta = self._metas.get(row)
+        if meta is None:
+            meta = self._metas[row] = self._store._decode_row(row)
+        return meta
+
+
+class ColumnarMemoryMetaStore(ISlowMetaStore):
+    """In-memory meta store searching NumPy columns instead of decoded metas.
+
+    Suited to large, read-mostly collections held by one process: filters and
+    sorts cost a few array passes, and a search decodes only the metas it
+    returns.  Writes are O(number of indexed paths).
+
+    Arguments:
+        encoding: Encoding of the stored metas.
+    """
+
+    def __init__(self, encoding: Encoding = Encoding.json):
+        self._serializer = MsgspecSerializer(
+            encoding=encoding,
+            resource_type=ResourceMeta,
+        )
+        self._lock = threading.RLock()
+        self._rows: dict[str, int] = {}
+        self._blobs: list[bytes | None] = []
+        self._free: list[int] = []
+        self._capacity = 0
+        self._alive = np.zeros(0, dtype=bool)
+        self._has_data = np.zeros(0, dtype=bool)
+        self._ids = np.zeros(0, dtype=object)
+        self._meta_cols = {name: _Column(0) for name in _META_COLUMNS}
+        self._data_cols: dict[str, _Column] = {}
+        # (排序後的 resource_id, 每列的 rank)；新增 / 刪除時失效
+        self._id_ranks: tuple[np.ndarray, np.ndarray] | None = None
+
+    # ------------------------------------------------------------------
+    # storage
+    # ------------------------------------------------------------------
+
+    def _decode_row(self, row: int) -> ResourceMeta:
+        return self._serializer.decode(self._blobs[row])
+
+    def _grow(self) -> None:
+        self._capacity = max(64, self._capacity * 2)
+        self._alive = _resize(self._alive, self._capacity)
+        self._has_data = _resize(self._has_data, self._capacity)
+        self._ids = _resize(self._ids, self._capacity)
+        for col in (*self._meta_cols.values(), *self._data_cols.values()):
+            col.grow(self._capacity)
+
+    def _allocate(self, pk: str) -> int:
+        if self._free:
+            row = self._free.pop()
+        else:
+            if len(self._blobs) == self._capacity:
+                self._grow()
+            row = len(self._blobs)
+            self._blobs.append(None)
+        self._rows[pk] = row
+        self._ids[row] = pk
+        self._alive[row] = True
+        self._id_ranks = None
+        return row
+
+    def _write(self, pk: str, meta: ResourceMeta) -> None:
+        blob = self._serializer.encode(meta)
+        # 欄位以解碼後的值建立，與逐筆解碼的 store 看到的值一致
+        stored = self._serializer.decode(blob)
+        row = self._rows.get(pk)
+        if row is None:
+            row = self._allocate(pk)
+        self._blobs[row] = blob
+        for name, col in self._meta_cols.items():
+            col.set(row, getattr(stored, name))
+        data = stored.indexed_data
+        self._has_data[row] = data is not UNSET
+        if data is UNSET:
+            data = {}
+        for path, col in self._data_cols.items():
+            col.set(row, data.get(path, _ABSENT))
+        for path, value in data.items():
+            if path not in self._data_cols:
+                col = self._data_cols[path] = _Column(self._capacity)
+                col.set(row, value)
+
+    def __getitem__(self, pk: str) -> ResourceMeta:
+        with self._lock:
+            blob = self._blobs[self._rows[pk]]
+        return self._serializer.decode(blob)
+
+    def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
+        with self._lock:
+            self._write(pk, meta)
+
+    def save_many(self, metas: Iterable[ResourceMeta]) -> None:
+        with self._lock:
+            for meta in metas:
+                self._write(meta.resource_id, meta)
+
+    def __delitem__(self, pk: str) -> None:
+        with self._lock:
+            row = self._rows.pop(pk)
+            self._blobs[row] = None
+            self._alive[row] = False
+            self._ids[row] = None
+            self._free.append(row)
+            self._id_ranks = None
+
+    def __iter__(self) -> Generator[str]:
+        with self._lock:
+            pks = list(self._rows)
+        yield from pks
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # ------------------------------------------------------------------
+    # filtering
+    # ------------------------------------------------------------------
+
+    def _filter(self, query: ResourceMetaSearchQuery, decoded: _Decoded) -> np.ndarray:
+        """Rows matching every filter of *query* (ignoring the cursor)."""
+        rows = np.flatnonzero(self._alive[: len(self._blobs)])
+        meta_filters: list[DataSearchCondition | DataSearchGroup] = []
+        op = DataSearchOperator
+        for path, operator, value in (
+            ("is_deleted", op.equals, query.is_deleted),
+            ("created_time", op.greater_than_or_equal, query.created_time_start),
+            ("created_time", op.less_than_or_equal, query.created_time_end),
+            ("updated_time", op.greater_than_or_equal, query.updated_time_start),
+            ("updated_time", op.less_than_or_equal, query.updated_time_end),
+            ("created_by", op.in_list, query.created_bys),
+            ("updated_by", op.in_list, query.updated_bys),
+        ):
+            if value is not UNSET:
+                if operator == op.in_list:
+                    value = list(value)
+                meta_filters.append(
+                    DataSearchCondition(field_path=path, operator=operator, value=value)
+                )
+        if query.conditions is not UNSET:
+            meta_filters.extend(query.conditions)
+        for condition in meta_filters:
+            if not len(rows):
+                return rows
+            rows = rows[self._evaluate(condition, True, rows, decoded)[0]]
+        if query.data_conditions is not UNSET:
+            # 如果有 data 條件但沒有索引資料，不匹配
+            rows = rows[self._has_data[rows]]
+            for condition in query.data_conditions:
+                if not len(rows):
+                    return rows
+                rows = rows[self._evaluate(condition, False, rows, decoded)[0]]
+        return rows
+
+    def _evaluate(
+        self,
+        condition: DataSearchCondition | DataSearchGroup,
+        on_meta: bool,
+        rows: np.ndarray,
+        decoded: _Decoded,
+    ) -> _Masks:
+        if isinstance(condition, DataSearchGroup):
+            return self._evaluate_group(condition, on_meta, rows, decoded)
+        path = condition.field_path
+        if on_meta and path != "indexed_data" and hasattr(ResourceMeta, path):
+            col = self._meta_cols.get(path)
+            if col is None:
+                return self._evaluate_rows(condition, True, rows, decoded)
+        else:
+            col = self._data_cols.get(path)
+        return self._evaluate_column(condition, on_meta, col, rows, decoded)
+
+    def _evaluate_group(
+        self,
+        group: DataSearchGroup,
+        on_meta: bool,
+        rows: np.ndarray,
+        decoded: _Decoded,
+    ) -> _Masks:
+        n = len(rows)
+        if group.operator == DataSearchLogicOperator.and_op:
+            t, f = np.ones(n, dtype=bool), np.zeros(n, dtype=bool)
+            for sub in group.conditions:
+                # 已為 False 的列不再求值
+                live = np.flatnonzero(~f)
+                if not len(live):
+                    break
+                st, sf = self._evaluate(sub, on_meta, rows[live], decoded)
+                t[live] &= st
+                f[live] |= sf
+            return t, f
+        if group.operator == DataSearchLogicOperator.or_op:
+            t, f = np.zeros(n, dtype=bool), np.ones(n, dtype=bool)
+            for sub in group.conditions:
+                live = np.flatnonzero(~t)
+                if not len(live):
+                    break
+                st, sf = self._evaluate(sub, on_meta, rows[live], decoded)
+                t[live] |= st
+                f[live] &= sf
+            return t, f
+        if group.operator == DataSearchLogicOperator.not_op:
+            # NOT 隱含 AND：任一 False 即為 True
+            any_false, any_unknown = np.zeros(n, dtype=bool), np.zeros(n, dtype=bool)
+            for sub in group.conditions:
+                live = np.flatnonzero(~any_false)
+                if not len(live):
+                    break
+                st, sf = self._evaluate(sub, on_meta, rows[live], decoded)
+                any_false[live] |= sf
+                any_unknown[live] |= ~st & ~sf
+            return any_false, ~any_false & ~any_unknown
+        return _constant(n, None)
+
+    def _evaluate_rows(
+        self,
+        condition: DataSearchCondition,
+        on_meta: bool,
+        rows: np.ndarray,
+        decoded: _Decoded,
+    ) -> _Masks:
+        evaluate = compile_condition(condition, on_meta=on_meta)
+        if on_meta:
+            results = [evaluate(decoded(row)) for row in rows.tolist()]
+        else:
+            results = []
+            for row in rows.tolist():
+                data = decoded(row).indexed_data
+                results.append(evaluate({} if data is UNSET else data))
+        return _gather(results, np.arange(len(results)))
+
+    def _evaluate_column(
+        self,
+        condition: DataSearchCondition,
+        on_meta: bool,
+        col: _Column | None,
+        rows: np.ndarray,
+        decoded: _Decoded,
+    ) -> _Masks:
+        path = condition.field_path
+        leaf = compile_condition(condition, on_meta=False)
+        if col is None:
+            return _constant(len(rows), leaf({}))
+        present = col.present[rows]
+        notnull = col.notnull[rows]
+        t, f = np.zeros(len(rows), dtype=bool), np.zeros(len(rows), dtype=bool)
+        # 缺少欄位 / null 的結果與值無關，各求一次
+        for mask, result in (
+            (~present, leaf({})),
+            (present & ~notnull, leaf({path: None})),
+        ):
+            if result is True:
+                t |= mask
+            elif result is False:
+                f |= mask
+        idx = np.flatnonzero(notnull)
+        if len(idx):
+            vt, vf = self._evaluate_values(
+                condition, leaf, on_meta, col, rows[idx], decoded
+            )
+            t[idx] = vt
+            f[idx] = vf
+        return t, f
+
+    def _evaluate_values(
+        self,
+        condition: DataSearchCondition,
+        leaf: Any,
+        on_meta: bool,
+        col: _Column,
+        rows: np.ndarray,
+        decoded: _Decoded,
+    ) -> _Masks:
+        """Evaluate *condition* on rows whose value is present and not null."""
+        path, op, kind = condition.field_path, condition.operator, col.kind
+        if kind == "obj" or (condition.transform is not None and kind != "str"):
+            if kind in _NUMERIC_KINDS or kind in _TIME_KINDS:
+                # len() 對數值 / 時間皆不適用，結果與值無關
+                return _constant(len(rows), leaf({path: 0}))
+            return self._evaluate_rows(condition, on_meta, rows, decoded)
+
+        values = col.values[rows]
+        cv = normalize_search_value(condition.value)
+        members = cv if isinstance(cv, (list, tuple, set)) else None
+        compare = _COMPARISONS.get(op) if condition.transform is None else None
+
+        if kind == "str":
+            if compare is not None and op in (
+                DataSearchOperator.equals,
+                DataSearchOperator.not_equals,
+            ):
+                if isinstance(cv, str):
+                    t = compare(values, col.codes.get(cv, -1))
+                    return t, ~t
+            elif (
+                op in _MEMBERSHIP
+                and condition.transform is None
+                and members is not None
+                and all(isinstance(v, str) for v in members)
+            ):
+                codes = [col.codes[v] for v in members if v in col.codes]
+                t = np.isin(values, codes)
+                if op == DataSearchOperator.not_in_list:
+                    t = ~t
+                return t, ~t
+            return self._evaluate_distinct(leaf, path, values, col.words)
+
+        if kind in _NUMERIC_KINDS:
+            if compare is not None and _is_number(cv):
+                t = compare(values, cv)
+                return t, ~t
+            if op in _MEMBERSHIP and members is not None:
+                numbers = [v for v in members if _is_number(v)]
+                if all(_kind_of(v) != "obj" for v in members):
+                    t = np.isin(values, numbers)
+                    if op == DataSearchOperator.not_in_list:
+                        t = ~t
+                    return t, ~t
+            if col.exact:
+                return self._evaluate_distinct(leaf, path, values, None)
+            return self._evaluate_rows(condition, on_meta, rows, decoded)
+
+        # datetime 欄位
+        if compare is not None and _kind_of(cv) == kind:
+            t = compare(values, _to_micros(cv))
+            return t, ~t
+        return self._evaluate_rows(condition, on_meta, rows, decoded)
+
+    def _evaluate_distinct(
+        self,
+        leaf: Any,
+        path: str,
+        values: np.ndarray,
+        words: list[str] | None,
+    ) -> _Masks:
+        """Evaluate *leaf* once per distinct value and gather the results."""
+        if words is not None and len(values) >= len(words):
+            return _gather([leaf({path: w}) for w in words], values)
+        distinct, inverse = np.unique(values, return_inverse=True)
+        if words is None:
+            keys = distinct.tolist()
+        else:
+            keys = [words[c] for c in distinct.tolist()]
+        return _gather([leaf({path: v}) for v in keys], inverse.reshape(-1))
+
+    # ------------------------------------------------------------------
+    # sorting
+    # ------------------------------------------------------------------
+
+    def _row_ranks(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sorted resource IDs and the ``resource_id`` rank of every row."""
+        if self._id_ranks is None:
+            alive = np.flatnonzero(self._alive[: len(self._blobs)])
+            ids = self._ids[alive]
+            order = np.argsort(ids, kind="stable")
+            ranks = np.zeros(len(self._blobs), dtype=np.int64)
+            ranks[alive[order]] = np.arange(len(alive))
+            self._id_ranks = (ids[order], ranks)
+        return self._id_ranks
+
+    def _sort_column(self, sort: SearchSort) -> tuple[_Column | None, bool]:
+        if isinstance(sort, ResourceDataSearchSort):
+            return self._data_cols.get(sort.field_path), True
+        return self._meta_cols[sort.key.value], False
+
+    def _sort_keys(
+        self, sorts: list[SearchSort], rows: np.ndarray
+    ) -> list[tuple[np.ndarray, np.ndarray]] | None:
+        """``(null flag, value)`` arrays per sort, ascending in every key.
+
+        Returns ``None`` when a key cannot be ordered in NumPy.
+        """
+        keys = []
+        for sort in sorts:
+            if (
+                not isinstance(sort, ResourceDataSearchSort)
+                and sort.key == ResourceMetaSortKey.resource_id
+            ):
+                notnull = np.ones(len(rows), dtype=bool)
+                values = 2 * self._row_ranks()[1][rows]
+            else:
+                col, _ = self._sort_column(sort)
+                if col is None or col.kind is None:
+                    notnull = np.zeros(len(rows), dtype=bool)
+                    values = np.zeros(len(rows), dtype=np.int64)
+                elif col.kind == "obj":
+                    return None
+                else:
+                    notnull = col.notnull[rows]
+                    values = col.values[rows]
+                    if col.kind == "str":
+                        values = 2 * col.word_ranks()[1][values]
+                    elif col.kind == "bool":
+                        values = values.astype(np.int8)
+                    values = np.where(notnull, values, 0)
+            if sort.direction == ResourceMetaSortDirection.descending:
+                # None 在降冪時排最後
+                keys.append((notnull.astype(np.int8) ^ 1, -values))
+            else:
+                keys.append((notnull.astype(np.int8), values))
+        return keys
+
+    def _cursor_keys(
+        self, query: ResourceMetaSearchQuery, sorts: list[SearchSort]
+    ) -> list[tuple[int, Any]] | None:
+        """The ``after`` cursor in the key space of :meth:`_sort_keys`."""
+        keys = []
+        for sort, value in zip(
+            sorts, decode_search_cursor(query.after, query.sorts), strict=True
+        ):
+            if value is None:
+                notnull, key = False, 0
+            elif (
+                not isinstance(sort, ResourceDataSearchSort)
+                and sort.key == ResourceMetaSortKey.resource_id
+            ):
+                if not isinstance(value, str):
+                    return None
+                notnull, key = True, _doubled_rank(self._row_ranks()[0], value)
+            else:
+                col, _ = self._sort_column(sort)
+                kind = None if col is None else col.kind
+                value_kind = _kind_of(value)
+                notnull = True
+                if kind is None:
+                    key = 0
+                elif kind == "str" and value_kind == "str":
+                    key = _doubled_rank(col.word_ranks()[0], value)
+                elif kind in _NUMERIC_KINDS and value_kind in _NUMERIC_KINDS:
+                    key = value
+                elif kind in _TIME_KINDS and value_kind == kind:
+                    key = _to_micros(value)
+                else:
+                    return None
+            if sort.direction == ResourceMetaSortDirection.descending:
+                keys.append((int(not notnull), -key))
+            else:
+                keys.append((int(notnull), key))
+        return keys
+
+    def _after_cursor(
+        self,
+        query: ResourceMetaSearchQuery,
+        sorts: list[SearchSort],
+        keys: list[tuple[np.ndarray, np.ndarray]],
+    ) -> np.ndarray | None:
+        """Mask of the rows strictly after the ``after`` cursor."""
+        cursor = self._cursor_keys(query, sorts)
+        if cursor is None:
+            return None
+        n = len(keys[0][0])
+        after, tied = np.zeros(n, dtype=bool), np.ones(n, dtype=bool)
+        for (flags, values), (cflag, cvalue) in zip(keys, cursor, strict=True):
+            for array, bound in ((flags, cflag), (values, cvalue)):
+                after |= tied & (array > bound)
+                tied &= array == bound
+        return after
+
+    def _page(
+        self, query: ResourceMetaSearchQuery, rows: np.ndarray
+    ) -> np.ndarray | None:
+        """Rows of the requested page, or ``None`` to sort decoded metas."""
+        sorts = get_search_sorts(query)
+        if not sorts:
+            return rows[query.offset : query.offset + max(query.limit, 0)]
+        keys = self._sort_keys(sorts, rows)
+        if keys is None:
+            return None
+        if query.after is not UNSET:
+            after = self._after_cursor(query, sorts, keys)
+            if after is None:
+                return None
+            rows = rows[after]
+            keys = [(flags[after], values[after]) for flags, values in keys]
+        k = query.offset + query.limit
+        if k <= query.offset or query.offset >= len(rows):
+            return rows[:0]
+        selected = np.arange(len(rows))
+        if k < len(rows):
+            selected = self._top_candidates(keys[0], k)
+        columns = [a[selected] for key in keys for a in key]
+        order = np.lexsort(columns[::-1])
+        return rows[selected[order][query.offset : k]]
+
+    @staticmethod
+    def _top_candidates(key: tuple[np.ndarray, np.ndarray], k: int) -> np.ndarray:
+        """A superset of the first *k* positions, using only the first key."""
+        flags, values = key
+        first = np.flatnonzero(flags == 0)
+        if k <= len(first):
+            segment, need, keep = first, k, None
+        else:
+            segment, need, keep = np.flatnonzero(flags != 0), k - len(first), first
+        if need < len(segment):
+            kth = np.partition(values[segment], need - 1)[need - 1]
+            segment = segment[values[segment] <= kth]
+        return segment if keep is None else np.concatenate([keep, segment])
+
+    # ------------------------------------------------------------------
+    # search
+    # ------------------------------------------------------------------
+
+    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+        with self._lock:
+            decoded = _Decoded(self)
+            rows = self._filter(query, decoded)
+            page = self._page(query, rows)
+            if page is None:
+                results = sort_and_paginate(map(decoded, rows.tolist()), query)
+            else:
+                results = [decoded(row) for row in page.tolist()]
+        yield from results
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        with self._lock:
+            decoded = _Decoded(self)
+            rows = self._filter(query, decoded)
+            if query.after is not UNSET and len(rows):
+                sorts = get_keyset_sorts(query.sorts)
+                keys = self._sort_keys(sorts, rows)
+                after = None if keys is None else self._after_cursor(query, sorts, keys)
+                if after is None:
+                    return count_matches(map(decoded, rows.tolist()), query)
+                rows = rows[after]
+            return clamp_count(len(rows), query)
@@ -15,8 +15,11 @@ from autocrud.resource_manager.basic import (
     Encoding,
     ISlowMetaStore,
     MsgspecSerializer,
-    get_sort_fn,
-    is_match_query,
+    clamp_count,
+    compile_query,
+    count_matches,
+    paginate_by_resource_id,
+    sort_and_paginate,
 )
 
 
@@ -89,7 +92,7 @@ class DFMemoryMetaStore(ISlowMetaStore):
     def __len__(self) -> int:
         return len(self._store)
 
-    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+    def _candidates(self, query: ResourceMetaSearchQuery) -> pd.Index:
         self._update_df()
         exps: list[str] = []
         if query.is_deleted is not UNSET:
@@ -107,12 +110,30 @@ class DFMemoryMetaStore(ISlowMetaStore):
         if query.updated_bys is not UNSET:
             exps.append("updated_by.isin(@query.updated_bys)")
         query_str = " and ".join(exps)
-        candidates_index = self._df.query(query_str).index if exps else self._df.index
+        return self._df.query(query_str).index if exps else self._df.index
+
+    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+        candidates = self._candidates(query)
+        page = paginate_by_resource_id(
+            candidates, lambda pk: self._serializer.decode(self._store[pk]), query
+        )
+        if page is not None:
+            yield from page
+            return
         results: list[ResourceMeta] = []
-        for pk in candidates_index:
+        match = compile_query(query)
+        for pk in candidates:
             meta_b = self._store[pk]
             meta = self._serializer.decode(meta_b)
-            if is_match_query(meta, query):
+            if match(meta):
                 results.append(meta)
-        results.sort(key=get_sort_fn([] if query.sorts is UNSET else query.sorts))
-        yield from results[query.offset : query.offset + query.limit]
+        yield from sort_and_paginate(results, query)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        candidates = self._candidates(query)
+        if not query.conditions and not query.data_conditions and query.after is UNSET:
+            # DataFrame 已處理完所有條件，不需逐筆解碼
+            return clamp_count(len(candidates), query)
+        return count_matches(
+            (self._serializer.decode(self._store[pk]) for pk in candidates), query
+        )
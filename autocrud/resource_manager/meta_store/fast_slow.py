@@ -1,26 +1,92 @@
+import sys
 import threading
-from collections.abc import Generator
+import time
+from collections.abc import Generator, Iterable
+from typing import NamedTuple
+
+import msgspec
+from msgspec import UNSET
 
 from autocrud.resource_manager.basic import (
     IFastMetaStore,
     IMetaStore,
     ISlowMetaStore,
+    clamp_count,
+    sort_and_paginate,
+)
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    IndexableField,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
 )
-from autocrud.types import ResourceMeta, ResourceMetaSearchQuery
+
+# 向慢速存儲查詢「全部」時使用的 limit
+_UNLIMITED = sys.maxsize >> 1
+# 以 resource_id IN (...) 查詢慢速存儲時，每次最多帶的 ID 數
+_ID_CHUNK = 500
+
+
+class SyncInfo(NamedTuple):
+    pending: int
+    """Writes buffered in the fast store since the last sync (this process)."""
+    lag: float
+    """Seconds since the oldest buffered write (``0.0`` when none)."""
+    syncs: int
+    """Completed syncs."""
+    synced: int
+    """Metas written to the slow store so far."""
+    forced_syncs: int
+    """Syncs run by writers because ``max_pending`` was reached."""
+    last_duration: float
+    """Seconds taken by the last sync."""
 
 
 class FastSlowMetaStore(IMetaStore):
+    """Buffer meta writes in a fast store and sync them to a slow store.
+
+    Arguments:
+        fast_store: Write buffer (e.g. Redis).
+        slow_store: Durable store the buffer is synced into.
+        sync_interval: Seconds between background syncs.
+        sync_batch_size: Most metas passed to one ``slow_store.save_many``;
+            repeated writes of a resource within a batch are coalesced.
+        max_pending: When this many writes are buffered, the writer runs the
+            sync itself (backpressure).  ``None`` disables the limit.
+
+    Reads and searches look at both stores and let the fast store's copy of a
+    resource win, so they never wait for buffered writes to be synced.
+    """
+
     def __init__(
         self,
         fast_store: IFastMetaStore,
         slow_store: ISlowMetaStore,
         sync_interval: int = 1,
+        *,
+        sync_batch_size: int = 1000,
+        max_pending: int | None = 10000,
     ):
         self._fast_store = fast_store
         self._slow_store = slow_store
         self._sync_interval = sync_interval
+        self.sync_batch_size = sync_batch_size
+        self.max_pending = max_pending
         self._sync_thread = None
         self._stop_sync = threading.Event()
+        # 同一時間只有一個同步在跑
+        self._sync_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self._oldest_pending: float | None = None
+        # 同步進行中時，同步開始後的第一筆寫入時間
+        self._syncing = False
+        self._oldest_after_start: float | None = None
+        self._syncs = 0
+        self._synced = 0
+        self._forced_syncs = 0
+        self._last_duration = 0.0
 
         # 启动后台同步线程
         self._start_background_sync()
@@ -46,15 +112,71 @@ class FastSlowMetaStore(IMetaStore):
 
     def _sync_fast_to_slow(self):
         """从快速存储同步到慢速存储"""
-        with self._fast_store.get_then_delete() as metas:
-            if not metas:
-                return
-            self._slow_store.save_many(metas)
+        with self._sync_lock:
+            start = time.monotonic()
+            with self._stats_lock:
+                # 之後的寫入算在下一次同步
+                pending = self._pending
+                self._syncing = True
+                self._oldest_after_start = None
+            synced = 0
+            try:
+                with self._fast_store.get_then_delete() as metas:
+                    batch: dict[str, ResourceMeta] = {}
+                    for meta in metas:
+                        batch[meta.resource_id] = meta
+                        if len(batch) >= self.sync_batch_size:
+                            self._slow_store.save_many(batch.values())
+                            synced += len(batch)
+                            batch = {}
+                    if batch:
+                        self._slow_store.save_many(batch.values())
+                        synced += len(batch)
+            except BaseException:
+                with self._stats_lock:
+                    self._syncing = False
+                raise
+            with self._stats_lock:
+                self._syncing = False
+                self._pending -= pending
+                self._oldest_pending = self._oldest_after_start
+                self._syncs += 1
+                self._synced += synced
+                self._last_duration = time.monotonic() - start
 
     def force_sync(self):
         """手动触发同步，主要用于测试"""
         self._sync_fast_to_slow()
 
+    def sync_info(self) -> SyncInfo:
+        """Sync lag and throughput counters."""
+        with self._stats_lock:
+            return SyncInfo(
+                pending=self._pending,
+                lag=0.0
+                if self._oldest_pending is None
+                else time.monotonic() - self._oldest_pending,
+                syncs=self._syncs,
+                synced=self._synced,
+                forced_syncs=self._forced_syncs,
+                last_duration=self._last_duration,
+            )
+
+    def _record_writes(self, count: int) -> None:
+        with self._stats_lock:
+            self._pending += count
+            now = time.monotonic()
+            if self._oldest_pending is None:
+                self._oldest_pending = now
+            if self._syncing and self._oldest_after_start is None:
+                self._oldest_after_start = now
+            full = self.max_pending is not None and self._pending >= self.max_pending
+            if full:
+                self._forced_syncs += 1
+        if full:
+            # 背壓：寫入端自己同步（或等待進行中的同步）
+            self._sync_fast_to_slow()
+
     def __getitem__(self, pk: str) -> ResourceMeta:
         # 先檢查 Fast 存儲
         try:
@@ -63,28 +185,119 @@ class FastSlowMetaStore(IMetaStore):
             # 如果 Fast 存儲 中沒有，從慢速存儲查詢
             return self._slow_store[pk]
 
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        pks = list(pks)
+        # 先查 Fast 存儲，缺少的再一次從慢速存儲查詢
+        result = self._fast_store.get_many(pks)
+        missing = [pk for pk in pks if pk not in result]
+        if missing:
+            result.update(self._slow_store.get_many(missing))
+        return result
+
     def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
         # 只寫入 Fast 存儲
         self._fast_store[pk] = meta
+        self._record_writes(1)
+
+    def save_many(self, metas: Iterable[ResourceMeta]) -> None:
+        metas = list(metas)
+        if hasattr(self._fast_store, "save_many"):
+            self._fast_store.save_many(metas)
+        else:
+            for meta in metas:
+                self._fast_store[meta.resource_id] = meta
+        self._record_writes(len(metas))
 
     def __delitem__(self, pk: str) -> None:
-        # 先尝试从 Fast 存储删除
+        # 兩邊都要刪除，否則 Fast 存儲的刪除會讓慢速存儲的舊值重新出現
         try:
             del self._fast_store[pk]
         except KeyError:
             # 如果 Fast 存儲 中沒有，從慢速存儲刪除
             del self._slow_store[pk]
+        else:
+            try:
+                del self._slow_store[pk]
+            except KeyError:
+                pass
+
+    def _fast_keys(self) -> list[str]:
+        return list(self._fast_store)
+
+    @staticmethod
+    def _with_condition(
+        query: ResourceMetaSearchQuery, operator: DataSearchOperator, pks: list[str]
+    ) -> ResourceMetaSearchQuery:
+        conditions = [] if query.conditions is UNSET else list(query.conditions)
+        conditions.append(
+            DataSearchCondition(field_path="resource_id", operator=operator, value=pks)
+        )
+        return msgspec.structs.replace(query, conditions=conditions)
 
     def __iter__(self) -> Generator[str]:
-        # 不再主动同步，依赖后台同步线程
-        # 直接从 slow 存储获取迭代器
-        yield from self._slow_store
+        fast = self._fast_keys()
+        yield from fast
+        fast = set(fast)
+        for pk in self._slow_store:
+            if pk not in fast:
+                yield pk
+
+    def _count_in_slow(self, query: ResourceMetaSearchQuery, pks: list[str]) -> int:
+        """How many of *pks* match *query* in the slow store.
+
+        The IDs are sent in chunks so no single query carries more than
+        ``_ID_CHUNK`` parameters.
+        """
+        return sum(
+            self._slow_store.count(
+                self._with_condition(
+                    query, DataSearchOperator.in_list, pks[i : i + _ID_CHUNK]
+                )
+            )
+            for i in range(0, len(pks), _ID_CHUNK)
+        )
 
     def __len__(self) -> int:
-        # 不再主动同步，依赖后台同步线程
-        # 直接从 slow 存储获取长度
-        return len(self._slow_store)
+        fast = self._fast_keys()
+        if not fast:
+            return len(self._slow_store)
+        in_slow = self._count_in_slow(ResourceMetaSearchQuery(limit=_UNLIMITED), fast)
+        return len(self._slow_store) + len(fast) - in_slow
 
     def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
-        self._sync_fast_to_slow()
-        return self._slow_store.iter_search(query)
+        # Fast 存儲自己搜尋，只取到本頁為止；同步完成前資料不會離開 Fast 存儲，
+        # 先搜 Fast 再列出 key，同步中的資源最多兩邊各出現一次 (下面去重)
+        window = msgspec.structs.replace(
+            query, offset=0, limit=query.offset + query.limit
+        )
+        found = list(self._fast_store.iter_search(window))
+        fast = self._fast_keys()
+        if not fast and not found:
+            yield from self._slow_store.iter_search(query)
+            return
+        # Fast 存儲中的資源以 Fast 的版本為準：慢速存儲多取 len(fast) 筆，
+        # 被覆蓋的在這裡略過，而不是把所有 ID 塞進 NOT IN 條件
+        slow_query = msgspec.structs.replace(window, limit=window.limit + len(fast))
+        seen = {meta.resource_id for meta in found}
+        seen.update(fast)
+        merged = found + [
+            meta
+            for meta in self._slow_store.iter_search(slow_query)
+            if meta.resource_id not in seen
+        ]
+        yield from sort_and_paginate(merged, query)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        total_query = msgspec.structs.replace(query, offset=0, limit=_UNLIMITED)
+        in_fast = self._fast_store.count(total_query)
+        fast = self._fast_keys()
+        in_slow = self._slow_store.count(total_query)
+        if fast:
+            # 扣掉被 Fast 存儲覆蓋的資源
+            in_slow -= self._count_in_slow(total_query, fast)
+        return clamp_count(in_slow + in_fast, query)
+
+    def ensure_indexes(self, indexed_fields: Iterable[IndexableField]) -> None:
+        indexed_fields = list(indexed_fields)
+        self._fast_store.ensure_indexes(indexed_fields)
+        self._slow_store.ensure_indexes(indexed_fields)
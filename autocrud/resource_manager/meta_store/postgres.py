@@ -1,17 +1,35 @@
+import datetime as dt
+import functools
+import hashlib
+import io
+import struct
+import threading
 import time
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Collection, Generator, Iterable
 from contextlib import contextmanager, suppress
 from enum import Enum as EnumType
+from typing import NamedTuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import msgspec
 import psycopg2 as pg
 import psycopg2.pool
 from msgspec import UNSET
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
 from psycopg2.extras import DictCursor, execute_batch
 
 from autocrud.resource_manager.basic import (
     Encoding,
     ISlowMetaStore,
+    MetaLayout,
     MsgspecSerializer,
+    build_keyset_sql,
+    clamp_count,
+    decode_search_cursor,
+    get_search_sorts,
+    has_search_filters,
+    restore_utc_offset,
+    utc_offset_seconds,
 )
 from autocrud.types import (
     DataSearchFilter,
@@ -19,36 +37,401 @@ from autocrud.types import (
     DataSearchLogicOperator,
     DataSearchOperator,
     FieldTransform,
+    IndexableField,
     ResourceMeta,
     ResourceMetaSearchQuery,
     ResourceMetaSearchSort,
     ResourceMetaSortDirection,
 )
 
+# ensure_indexes 建立的索引都加上這個註解，用來辨識自動管理的索引
+_MANAGED_INDEX_COMMENT = "autocrud:indexed_data"
+
+_COLUMNS = (
+    "resource_id, data, created_time, updated_time, created_by, updated_by, "
+    "is_deleted, schema_version, indexed_data"
+)
+_UPSERT_SET = """
+    data = EXCLUDED.data,
+    created_time = EXCLUDED.created_time,
+    updated_time = EXCLUDED.updated_time,
+    created_by = EXCLUDED.created_by,
+    updated_by = EXCLUDED.updated_by,
+    is_deleted = EXCLUDED.is_deleted,
+    schema_version = EXCLUDED.schema_version,
+    indexed_data = EXCLUDED.indexed_data
+"""
+# MetaLayout.columns 額外的欄位；時間欄位的 UTC 偏移（秒），NULL 表示 naive
+_NATIVE_COLUMNS = (
+    "current_revision_id, total_revision_count, "
+    "created_time_offset, updated_time_offset"
+)
+_NATIVE_UPSERT_SET = """,
+    current_revision_id = EXCLUDED.current_revision_id,
+    total_revision_count = EXCLUDED.total_revision_count,
+    created_time_offset = EXCLUDED.created_time_offset,
+    updated_time_offset = EXCLUDED.updated_time_offset
+"""
+# MetaLayout.columns 讀取的欄位（順序與 _meta_from_row 一致）
+_NATIVE_SELECT = (
+    "resource_id, current_revision_id, total_revision_count, created_time, "
+    "updated_time, created_by, updated_by, is_deleted, schema_version, "
+    "created_time_offset, updated_time_offset, data"
+)
+# 遷移到 MetaLayout.columns 時每個交易處理的筆數
+_MIGRATE_BATCH_SIZE = 1000
+
+# save_many 以 COPY 寫入的暫存表（每條連線一份，交易結束時清空）
+_LOAD_TABLE = "autocrud_meta_load"
+
+# COPY ... (FORMAT binary) 的檔頭與結尾
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_TRAILER = struct.pack("!h", -1)
+_COPY_NULL = struct.pack("!i", -1)
+# COPY 輸入每次編碼 / 送出的位元組數上限
+_COPY_CHUNK_SIZE = 1 << 16
+_PG_EPOCH = dt.datetime(2000, 1, 1)
+
+
+def _indexed_data_json(meta: ResourceMeta) -> bytes | None:
+    if meta.indexed_data is UNSET:
+        return None
+    return msgspec.json.encode(meta.indexed_data)
+
+
+def _indexed_data_text(meta: ResourceMeta) -> str | None:
+    indexed_data = _indexed_data_json(meta)
+    return None if indexed_data is None else indexed_data.decode("utf-8")
+
+
+def _copy_field(value: bytes | None) -> bytes:
+    if value is None:
+        return _COPY_NULL
+    return struct.pack("!i", len(value)) + value
+
+
+def _utc_wall(value: dt.datetime) -> dt.datetime:
+    """Aware times as naive UTC; naive times are kept as they are."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+
+
+def _copy_timestamp(value: dt.datetime, tz: dt.tzinfo) -> bytes:
+    # 與一般 INSERT 相同：有時區的時間以 session 時區轉成 timestamp
+    if value.tzinfo is not None:
+        value = value.astimezone(tz).replace(tzinfo=None)
+    delta = value - _PG_EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack("!iq", 8, micros)
+
+
+class _IndexedPath(NamedTuple):
+    expression: str
+    """Indexed SQL expression; queries must use the same text to hit the index."""
+    numeric: bool
+    sortable: bool
+    """Whether sorts on the path may use ``expression`` instead of the JSONB value."""
+
+
+def _indexed_path(field: IndexableField) -> _IndexedPath:
+    """Choose the typed expression indexed for *field* from its ``field_type``."""
+    key = field.field_path.replace("'", "''")
+    field_type = field.field_type
+    if (
+        isinstance(field_type, type)
+        and issubclass(field_type, (int, float))
+        and not issubclass(field_type, bool)
+    ):
+        # 非數字的 JSON 值視為 NULL，避免 ::numeric 轉型失敗讓寫入出錯
+        expression = (
+            f"(CASE WHEN jsonb_typeof(indexed_data->'{key}') = 'number' "
+            f"THEN (indexed_data->>'{key}')::numeric END)"
+        )
+        return _IndexedPath(expression, numeric=True, sortable=True)
+    # 其他型別以文字比較（等於、IN、LIKE 'x%' 都用 ->> 文字值）
+    sortable = isinstance(field_type, type) and issubclass(field_type, str)
+    return _IndexedPath(f"(indexed_data->>'{key}')", numeric=False, sortable=sortable)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _copy_text(value: str | None) -> bytes:
+    return _copy_field(None if value is None else value.encode("utf-8"))
+
+
+def _copy_int(value: int | None) -> bytes:
+    if value is None:
+        return _COPY_NULL
+    return struct.pack("!ii", 4, value)
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only file over an iterator of byte chunks.
+
+    ``copy_expert`` reads its input lazily, so rows are encoded as they are
+    sent instead of building the whole ``COPY`` payload first.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+class PoolStats(NamedTuple):
+    size: int
+    """Open connections."""
+    in_use: int
+    """Connections currently checked out."""
+    checkouts: int
+    waits: int
+    """Checkouts that had to wait for a connection to be returned."""
+    wait_time: float
+    """Total seconds spent waiting for a connection."""
+    timeouts: int
+    """Checkouts that gave up after the pool timeout."""
+    discarded: int
+    """Connections closed because they were broken or failed a liveness check."""
+
+
+class _Connection(pg.extensions.connection):
+    """Connection that remembers the statements prepared on it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: set[str] = set()
+
+
+class _ConnectionPool:
+    """Thread-safe connection pool with a bounded wait for free connections.
+
+    Connections are handed out most-recently-used first.  Only a connection
+    that sat idle for longer than *idle_check* seconds is probed with
+    ``SELECT 1`` before being returned; connections that come back closed or
+    in a failed state are discarded instead of being reused.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], _Connection],
+        *,
+        maxconn: int,
+        timeout: float,
+        idle_check: float,
+    ):
+        self._connect = connect
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.idle_check = idle_check
+        self._cond = threading.Condition()
+        # (連線, 歸還時間)；後進先出
+        self._idle: list[tuple[_Connection, float]] = []
+        self._size = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+        self._discarded = 0
+        self._closed = False
+
+    def getconn(self) -> _Connection:
+        while True:
+            conn, idle_for = self._checkout()
+            if conn is None:
+                # 取得了新連線的名額
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    self._release(discarded=False)
+                    raise
+            elif idle_for > self.idle_check and not self._alive(conn):
+                self._close(conn)
+                self._release(discarded=True)
+                continue
+            with self._cond:
+                self._checkouts += 1
+            return conn
+
+    def _checkout(self) -> tuple[_Connection | None, float]:
+        start = time.monotonic()
+        with self._cond:
+            waited = False
+            while not self._idle and self._size >= self.maxconn:
+                remaining = start + self.timeout - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise psycopg2.pool.PoolError("connection pool exhausted")
+                waited = True
+                self._cond.wait(remaining)
+            if waited:
+                self._waits += 1
+                self._wait_time += time.monotonic() - start
+            self._in_use += 1
+            if self._idle:
+                conn, returned = self._idle.pop()
+                return conn, time.monotonic() - returned
+            self._size += 1
+            return None, 0.0
+
+    def _release(self, *, discarded: bool) -> None:
+        with self._cond:
+            self._size -= 1
+            self._in_use -= 1
+            self._discarded += discarded
+            self._cond.notify()
+
+    @staticmethod
+    def _alive(conn: _Connection) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+        except pg.Error:
+            return False
+        return True
+
+    @staticmethod
+    def _close(conn: _Connection) -> None:
+        with suppress(pg.Error):
+            conn.close()
+
+    def putconn(self, conn: _Connection, close: bool = False) -> None:
+        if not close and not conn.closed:
+            if conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except pg.Error:
+                    close = True
+        if close or conn.closed or self._closed:
+            self._close(conn)
+            self._release(discarded=not self._closed)
+            return
+        with self._cond:
+            self._in_use -= 1
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn, _ in idle:
+            self._close(conn)
+
+    def stats(self) -> PoolStats:
+        with self._cond:
+            return PoolStats(
+                size=self._size,
+                in_use=self._in_use,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                wait_time=self._wait_time,
+                timeouts=self._timeouts,
+                discarded=self._discarded,
+            )
+
 
 class PostgresMetaStore(ISlowMetaStore):
+    """PostgreSQL meta store.
+
+    Arguments:
+        pg_dsn: Connection string.
+        encoding: Encoding of the stored :class:`ResourceMeta` blobs.
+        table_name: Table holding the metas.
+        estimate_count: Answer unfiltered counts from planner statistics.
+        indexed_fields: Indexed data fields to create expression indexes for
+            (see :meth:`ensure_indexes`).  The resource manager passes its
+            fields on its own, so this is only needed for a standalone store.
+        drop_unused_indexes: Let :meth:`ensure_indexes` drop the indexes it
+            created earlier for fields that are no longer indexed.
+        pool_size: Most connections the store opens.
+        pool_timeout: Seconds a caller waits for a free connection before
+            ``psycopg2.pool.PoolError`` is raised.
+        idle_check: Connections idle for longer than this many seconds are
+            checked with ``SELECT 1`` before reuse; others are used as is.
+        layout: ``MetaLayout.columns`` stores every meta field in its own
+            column and builds metas from the columns instead of decoding the
+            ``data`` blob.  Opening an existing blob table in this layout
+            migrates its rows in place, one short transaction per batch, so
+            the table stays readable and writable meanwhile.  The switch is
+            one way.  Aware times are stored as UTC in this layout rather
+            than in the session time zone.
+
+    Single-row reads and writes run as statements prepared once per
+    connection.  :meth:`pool_stats` reports pool usage.
+
+    In the columns layout ``indexed_data`` is read back from its JSONB
+    column, so its values come back as JSON types (as with
+    ``Encoding.json``).
+    """
+
     def __init__(
         self,
         pg_dsn: str,
         encoding: Encoding = Encoding.json,
         *,
         table_name: str = "resource_meta",
+        estimate_count: bool = False,
+        indexed_fields: Iterable[IndexableField] | None = None,
+        drop_unused_indexes: bool = False,
+        pool_size: int = 10,
+        pool_timeout: float = 30.0,
+        idle_check: float = 30.0,
+        layout: MetaLayout = MetaLayout.blob,
     ):
         self._serializer = MsgspecSerializer(
             encoding=encoding,
             resource_type=ResourceMeta,
         )
+        # 未帶條件的 count 改用 planner 統計值 (pg_class.reltuples)，不掃表
+        self.estimate_count = estimate_count
+        self.drop_unused_indexes = drop_unused_indexes
+        self.layout = MetaLayout(layout)
+        self._columns = _COLUMNS
+        self._upsert_set = _UPSERT_SET
+        if self.layout == MetaLayout.columns:
+            self._columns += ", " + _NATIVE_COLUMNS
+            self._upsert_set += _NATIVE_UPSERT_SET
+        # field_path -> 有 B-tree 運算式索引的型別化運算式
+        self._indexed_paths: dict[str, _IndexedPath] = {}
 
         # 建立連線池
-        self._conn_pool = psycopg2.pool.SimpleConnectionPool(
-            minconn=1,
-            maxconn=10,
-            dsn=pg_dsn,
+        self._conn_pool = _ConnectionPool(
+            functools.partial(pg.connect, pg_dsn, connection_factory=_Connection),
+            maxconn=pool_size,
+            timeout=pool_timeout,
+            idle_check=idle_check,
         )
         self.table_name = table_name
+        # prepared statement 名稱以表名區分
+        self._statement_prefix = (
+            f"autocrud_{hashlib.sha1(table_name.encode()).hexdigest()[:10]}"
+        )
 
         # 初始化 PostgreSQL 表
         self._init_postgres_table()
+        if self.layout == MetaLayout.columns:
+            self._migrate_to_columns()
+        if indexed_fields is not None:
+            self.ensure_indexes(indexed_fields)
 
     def __del__(self):
         # 物件被回收時自動清理
@@ -56,58 +439,30 @@ class PostgresMetaStore(ISlowMetaStore):
             self._cleanup()
 
     def _cleanup(self):
-        # 額外嘗試把所有連線都回收一遍，防止池中連線還被占用
-        conns = []
-        while True:
-            try:
-                conn = self._conn_pool.getconn(timeout=1)
-                conns.append(conn)
-            except Exception:
-                break
-        for conn in conns:
-            with suppress(Exception):
-                conn.close()
-        with suppress(Exception):
-            self._conn_pool.closeall()
+        self._conn_pool.closeall()
 
     def get_conn(self) -> pg.extensions.connection:
-        retry = 5
-        last_error: Exception | None = None
-        for attempt in range(retry):
-            try:
-                conn = self._conn_pool.getconn()
-            except psycopg2.pool.PoolError:
-                # Pool 耗盡，等待後重試（其他 thread 可能會歸還連線）
-                last_error = psycopg2.pool.PoolError("connection pool exhausted")
-                time.sleep(min(0.5 * (attempt + 1), 3))
-                continue
-
+        # 不再每次都 SELECT 1：只有閒置過久的連線才由 pool 檢查
+        conn = self._conn_pool.getconn()
+        if conn.autocommit:
             conn.autocommit = False
-            if self.test_query(conn):
-                return conn
-
-            # test_query 失敗：歸還壞連線並標記關閉，避免洩漏
-            try:
-                self._conn_pool.putconn(conn, close=True)
-            except Exception:
-                pass
-            last_error = ConnectionError("Failed to get a valid PostgreSQL connection.")
-            time.sleep(1)
-
-        if isinstance(last_error, psycopg2.pool.PoolError):
-            raise last_error
-        raise ConnectionError("Failed to get a valid PostgreSQL connection.")
+        return conn
 
     def put_conn(self, conn):
         self._conn_pool.putconn(conn)
 
-    def test_query(self, conn) -> bool:
-        try:
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
-                return cur.fetchone()[0] == 1
-        except Exception:
-            return False
+    def pool_stats(self) -> PoolStats:
+        """Connection pool usage counters."""
+        return self._conn_pool.stats()
+
+    def _execute_prepared(self, cur, name: str, sql: str, params: tuple) -> None:
+        """Run *sql* (``$n`` placeholders) as a statement prepared per connection."""
+        name = f"{self._statement_prefix}_{name}"
+        prepared = cur.connection.prepared
+        if name not in prepared:
+            cur.execute(f"PREPARE {name} AS {sql}")
+            prepared.add(name)
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
 
     @contextmanager
     def transaction(self):
@@ -117,7 +472,9 @@ class PostgresMetaStore(ISlowMetaStore):
                 yield cur
             conn.commit()
         except Exception:
-            conn.rollback()
+            # 連線已斷時 rollback 也會失敗；put_conn 會丟棄這條連線
+            with suppress(pg.Error):
+                conn.rollback()
             raise
         finally:
             self.put_conn(conn)
@@ -134,7 +491,8 @@ class PostgresMetaStore(ISlowMetaStore):
                 yield cur
             conn.commit()
         except Exception:
-            conn.rollback()
+            with suppress(pg.Error):
+                conn.rollback()
             raise
         finally:
             self.put_conn(conn)
@@ -197,26 +555,115 @@ class PostgresMetaStore(ISlowMetaStore):
                 f'CREATE INDEX IF NOT EXISTS idx_indexed_data_gin ON "{self.table_name}" USING GIN (indexed_data)',
             )
 
+            if self.layout == MetaLayout.columns:
+                cur.execute(
+                    """
+                    SELECT column_name FROM information_schema.columns
+                    WHERE table_name = %s AND column_name = 'current_revision_id'
+                    """,
+                    (self.table_name,),
+                )
+                if not cur.fetchone():
+                    # 只新增可為 NULL 的欄位，不需重寫整張表
+                    cur.execute(f"""
+                        ALTER TABLE "{self.table_name}"
+                        ADD COLUMN IF NOT EXISTS current_revision_id TEXT,
+                        ADD COLUMN IF NOT EXISTS total_revision_count INTEGER,
+                        ADD COLUMN IF NOT EXISTS created_time_offset INTEGER,
+                        ADD COLUMN IF NOT EXISTS updated_time_offset INTEGER
+                    """)
+
+            if self.layout == MetaLayout.blob:
+                self._check_blob_layout(cur)
             # 遷移已存在的記錄，填充 indexed_data
             self._migrate_existing_data(cur)
 
+    def _index_name(self, field_path: str, indexed: _IndexedPath) -> str:
+        kind = "numeric" if indexed.numeric else "text"
+        digest = hashlib.sha1(
+            f"{self.table_name}\0{field_path}\0{kind}".encode()
+        ).hexdigest()[:10]
+        # PostgreSQL 識別字最長 63 bytes
+        return f"idx_{self.table_name[:40]}_data_{digest}"
+
+    def ensure_indexes(self, indexed_fields: Iterable[IndexableField]) -> None:
+        """Create a typed B-tree expression index for every indexed data field.
+
+        ``int`` / ``float`` fields are indexed as ``numeric`` and other fields
+        as the ``->>`` text value; searches and sorts on those paths use the
+        same expressions so the planner can pick the indexes.  Indexes are
+        built with ``CREATE INDEX CONCURRENTLY`` and do not block writes.
+        """
+        paths = {field.field_path: _indexed_path(field) for field in indexed_fields}
+        wanted = {
+            self._index_name(path, indexed): indexed.expression
+            for path, indexed in paths.items()
+        }
+        conn = self.get_conn()
+        try:
+            # CONCURRENTLY 不能在交易中執行（get_conn 的測試查詢已開啟交易）
+            conn.rollback()
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT c.relname, i.indisvalid FROM pg_index i
+                    JOIN pg_class c ON c.oid = i.indexrelid
+                    WHERE i.indrelid = to_regclass(%s) AND (
+                        c.relname = ANY(%s)
+                        OR obj_description(i.indexrelid, 'pg_class') = %s
+                    )
+                    """,
+                    (f'"{self.table_name}"', list(wanted), _MANAGED_INDEX_COMMENT),
+                )
+                existing = dict(cur.fetchall())
+                for name, valid in existing.items():
+                    # 中斷的 CONCURRENTLY 建立會留下 invalid 索引，需重建
+                    if not valid or (self.drop_unused_indexes and name not in wanted):
+                        cur.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+                for name, expression in wanted.items():
+                    if existing.get(name):
+                        continue
+                    # NULLS FIRST 對應排序時的 ASC NULLS FIRST / DESC NULLS LAST
+                    cur.execute(
+                        f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" '
+                        f'ON "{self.table_name}" ({expression} NULLS FIRST)'
+                    )
+                    cur.execute(
+                        f'COMMENT ON INDEX "{name}" IS %s', (_MANAGED_INDEX_COMMENT,)
+                    )
+        finally:
+            conn.autocommit = False
+            self.put_conn(conn)
+        self._indexed_paths = paths
+
+    def _check_blob_layout(self, cur) -> None:
+        """Refuse a table already migrated to ``MetaLayout.columns``.
+
+        Migrated rows keep an empty ``data`` blob, which the blob layout
+        cannot decode.
+        """
+        cur.execute(
+            f'SELECT 1 FROM "{self.table_name}" WHERE octet_length(data) = 0 LIMIT 1'
+        )
+        if cur.fetchone() is not None:
+            raise ValueError(
+                f"{self.table_name} was migrated to MetaLayout.columns; "
+                "open it with layout=MetaLayout.columns"
+            )
+
     def _migrate_existing_data(self, cur):
         """為已存在但沒有 indexed_data 的記錄填充索引數據"""
-        import json
-
+        # data 為空的是 MetaLayout.columns 的資料，indexed_data 本來就是 NULL
         cur.execute(f"""
             SELECT resource_id, data FROM "{self.table_name}" 
-            WHERE indexed_data IS NULL
+            WHERE indexed_data IS NULL AND octet_length(data) > 0
         """)
 
         for resource_id, data_blob in cur.fetchall():
             try:
                 data = self._serializer.decode(data_blob)
-                indexed_data_json = (
-                    json.dumps(data.indexed_data, ensure_ascii=False)
-                    if data.indexed_data is not UNSET
-                    else None
-                )
+                indexed_data_json = _indexed_data_text(data)
                 cur.execute(
                     f"""
                     UPDATE "{self.table_name}" SET indexed_data = %s WHERE resource_id = %s
@@ -232,108 +679,275 @@ class PostgresMetaStore(ISlowMetaStore):
                     ("{}", resource_id),
                 )
 
-    def save_many(self, metas: Iterable[ResourceMeta]) -> None:
-        """批量保存元数据到 PostgreSQL（ISlowMetaStore 接口方法）"""
-        import json
+    def _migrate_to_columns(self) -> None:
+        """Move blob-layout rows into the ``MetaLayout.columns`` columns.
 
-        metas_list = list(metas)
-        if not metas_list:
-            return
+        Rows are visited in ``resource_id`` order, a batch per transaction;
+        only the rows of the current batch are locked.
+        """
+        last = ""
+        while True:
+            with self.transaction() as cur:
+                cur.execute(
+                    f"""
+                    SELECT resource_id, data FROM "{self.table_name}"
+                    WHERE resource_id > %s AND octet_length(data) > 0
+                    ORDER BY resource_id LIMIT %s
+                    FOR UPDATE
+                    """,
+                    (last, _MIGRATE_BATCH_SIZE),
+                )
+                rows = cur.fetchall()
+                if not rows:
+                    return
+                updates = []
+                for resource_id, data in rows:
+                    meta = self._serializer.decode(data)
+                    updates.append(
+                        (
+                            meta.current_revision_id,
+                            meta.total_revision_count,
+                            _utc_wall(meta.created_time),
+                            _utc_wall(meta.updated_time),
+                            utc_offset_seconds(meta.created_time),
+                            utc_offset_seconds(meta.updated_time),
+                            _indexed_data_text(meta),
+                            resource_id,
+                        )
+                    )
+                # 時間欄位也要改寫：blob 格式以 session 時區存放有時區的時間；
+                # indexed_data 以 blob 為準
+                execute_batch(
+                    cur,
+                    f"""
+                    UPDATE "{self.table_name}" SET current_revision_id = %s,
+                        total_revision_count = %s, created_time = %s,
+                        updated_time = %s, created_time_offset = %s,
+                        updated_time_offset = %s, indexed_data = %s,
+                        data = ''::bytea
+                    WHERE resource_id = %s
+                    """,
+                    updates,
+                )
+                last = rows[-1][0]
+
+    def _select(self, indexed_data: bool = True) -> str:
+        """Columns read for a meta, in the order :meth:`_meta_from_row` expects."""
+        if self.layout == MetaLayout.blob:
+            return "data"
+        return _NATIVE_SELECT + (", indexed_data::text" if indexed_data else ", NULL")
+
+    def _meta_from_row(self, row) -> ResourceMeta:
+        if self.layout == MetaLayout.blob:
+            return self._serializer.decode(row[0])
+        (
+            resource_id,
+            current_revision_id,
+            total_revision_count,
+            created_time,
+            updated_time,
+            created_by,
+            updated_by,
+            is_deleted,
+            schema_version,
+            created_time_offset,
+            updated_time_offset,
+            data,
+            indexed_data,
+        ) = row
+        if data:
+            # 尚未遷移的資料
+            return self._serializer.decode(data)
+        return ResourceMeta(
+            current_revision_id=current_revision_id,
+            resource_id=resource_id,
+            schema_version=schema_version,
+            total_revision_count=total_revision_count,
+            created_time=restore_utc_offset(
+                created_time.replace(tzinfo=dt.timezone.utc), created_time_offset
+            ),
+            updated_time=restore_utc_offset(
+                updated_time.replace(tzinfo=dt.timezone.utc), updated_time_offset
+            ),
+            created_by=created_by,
+            updated_by=updated_by,
+            is_deleted=is_deleted,
+            indexed_data=UNSET
+            if indexed_data is None
+            else msgspec.json.decode(indexed_data),
+        )
+
+    def save_many(self, metas: Iterable[ResourceMeta]) -> None:
+        """批量保存元数据到 PostgreSQL（ISlowMetaStore 接口方法）
 
-        sql = f"""
-        INSERT INTO "{self.table_name}" (resource_id, data, created_time, updated_time, created_by, updated_by, is_deleted, schema_version, indexed_data)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (resource_id) DO UPDATE SET
-            data = EXCLUDED.data,
-            created_time = EXCLUDED.created_time,
-            updated_time = EXCLUDED.updated_time,
-            created_by = EXCLUDED.created_by,
-            updated_by = EXCLUDED.updated_by,
-            is_deleted = EXCLUDED.is_deleted,
-            schema_version = EXCLUDED.schema_version,
-            indexed_data = EXCLUDED.indexed_data
+        Rows are streamed with ``COPY ... FROM STDIN (FORMAT binary)`` into a
+        temporary table and upserted with a single ``INSERT ... SELECT``.
         """
+        # 同一批次內重複的 resource_id 以最後一筆為準（ON CONFLICT 不能更新同一列兩次）
+        metas_by_id = {meta.resource_id: meta for meta in metas}
+        if not metas_by_id:
+            return
 
         with self.transaction() as cur:
-            execute_batch(
-                cur,
-                sql,
-                [
-                    (
-                        meta.resource_id,
-                        self._serializer.encode(meta),
-                        meta.created_time,
-                        meta.updated_time,
-                        meta.created_by,
-                        meta.updated_by,
-                        meta.is_deleted,
-                        meta.schema_version,
-                        (
-                            json.dumps(meta.indexed_data, ensure_ascii=False)
-                            if meta.indexed_data is not UNSET
-                            else None
-                        ),
-                    )
-                    for meta in metas_list
-                ],
+            if self.layout == MetaLayout.columns:
+                tz = dt.timezone.utc
+            else:
+                tz = self._session_timezone(cur)
+            if tz is None:
+                # session 時區無法在 Python 端轉換，改用逐列參數綁定
+                self._save_many_batch(cur, metas_by_id.values())
+                return
+            cur.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {_LOAD_TABLE} (
+                    resource_id TEXT,
+                    data BYTEA,
+                    created_time TIMESTAMP,
+                    updated_time TIMESTAMP,
+                    created_by TEXT,
+                    updated_by TEXT,
+                    is_deleted BOOLEAN,
+                    schema_version TEXT,
+                    indexed_data JSONB,
+                    current_revision_id TEXT,
+                    total_revision_count INTEGER,
+                    created_time_offset INTEGER,
+                    updated_time_offset INTEGER
+                ) ON COMMIT DELETE ROWS
+            """)
+            cur.copy_expert(
+                f"COPY {_LOAD_TABLE} ({self._columns}) FROM STDIN (FORMAT binary)",
+                _ChunkReader(self._copy_rows(metas_by_id.values(), tz)),
+                size=_COPY_CHUNK_SIZE,
+            )
+            cur.execute(f"""
+                INSERT INTO "{self.table_name}" ({self._columns})
+                SELECT {self._columns} FROM {_LOAD_TABLE}
+                ON CONFLICT (resource_id) DO UPDATE SET {self._upsert_set}
+            """)
+
+    def _session_timezone(self, cur) -> dt.tzinfo | None:
+        cur.execute("SHOW TimeZone")
+        name = cur.fetchone()[0]
+        if name.upper() == "UTC":
+            return dt.timezone.utc
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            return None
+
+    def _copy_rows(
+        self, metas: Iterable[ResourceMeta], tz: dt.tzinfo
+    ) -> Generator[bytes]:
+        """Encode *metas* in the ``COPY`` binary format, in bounded chunks."""
+        encode = self._serializer.encode
+        native = self.layout == MetaLayout.columns
+        field_count = struct.pack("!h", 13 if native else 9)
+        buf = bytearray(_COPY_HEADER)
+        for meta in metas:
+            indexed_data = _indexed_data_json(meta)
+            buf += field_count
+            buf += _copy_text(meta.resource_id)
+            buf += _copy_field(b"" if native else encode(meta))
+            buf += _copy_timestamp(meta.created_time, tz)
+            buf += _copy_timestamp(meta.updated_time, tz)
+            buf += _copy_text(meta.created_by)
+            buf += _copy_text(meta.updated_by)
+            buf += _copy_field(b"\x01" if meta.is_deleted else b"\x00")
+            buf += _copy_text(meta.schema_version)
+            # jsonb 二進位格式：版本號 1 + JSON 文字
+            buf += _copy_field(None if indexed_data is None else b"\x01" + indexed_data)
+            if native:
+                buf += _copy_text(meta.current_revision_id)
+                buf += _copy_int(meta.total_revision_count)
+                buf += _copy_int(utc_offset_seconds(meta.created_time))
+                buf += _copy_int(utc_offset_seconds(meta.updated_time))
+            if len(buf) >= _COPY_CHUNK_SIZE:
+                yield bytes(buf)
+                buf.clear()
+        buf += _COPY_TRAILER
+        yield bytes(buf)
+
+    def _save_many_batch(self, cur, metas: Iterable[ResourceMeta]) -> None:
+        rows = [self._row(meta) for meta in metas]
+        execute_batch(
+            cur,
+            f"""
+            INSERT INTO "{self.table_name}" ({self._columns})
+            VALUES ({", ".join(["%s"] * len(rows[0]))})
+            ON CONFLICT (resource_id) DO UPDATE SET {self._upsert_set}
+            """,
+            rows,
+        )
+
+    def _row(self, meta: ResourceMeta) -> tuple:
+        native = self.layout == MetaLayout.columns
+        row = (
+            meta.resource_id,
+            b"" if native else self._serializer.encode(meta),
+            _utc_wall(meta.created_time) if native else meta.created_time,
+            _utc_wall(meta.updated_time) if native else meta.updated_time,
+            meta.created_by,
+            meta.updated_by,
+            meta.is_deleted,
+            meta.schema_version,
+            _indexed_data_text(meta),
+        )
+        if native:
+            row += (
+                meta.current_revision_id,
+                meta.total_revision_count,
+                utc_offset_seconds(meta.created_time),
+                utc_offset_seconds(meta.updated_time),
             )
+        return row
 
     def values(self):
         """Streaming bulk read — single ``SELECT data`` instead of N+1 queries."""
         with self.stream_cursor() as cur:
-            cur.execute(f'SELECT data FROM "{self.table_name}"')
+            cur.execute(f'SELECT {self._select()} FROM "{self.table_name}"')
             for row in cur:
-                yield self._serializer.decode(row["data"])
+                yield self._meta_from_row(row)
 
     def __getitem__(self, pk: str) -> ResourceMeta:
         # 直接從 PostgreSQL 查詢
+        with self.transaction() as cur:
+            self._execute_prepared(
+                cur,
+                "get",
+                f'SELECT {self._select()} FROM "{self.table_name}" WHERE resource_id = $1',
+                (pk,),
+            )
+            row = cur.fetchone()
+        if row is None:
+            raise KeyError(pk)
+        return self._meta_from_row(row)
+
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        pks = list(dict.fromkeys(pks))
+        if not pks:
+            return {}
         with self.stream_cursor() as cur:
             cur.execute(
-                f'SELECT data FROM "{self.table_name}" WHERE resource_id = %s', (pk,)
+                f'SELECT {self._select()} FROM "{self.table_name}" '
+                "WHERE resource_id = ANY(%s)",
+                (pks,),
             )
-            row = cur.fetchone()
-            if row is None:
-                raise KeyError(pk)
-            return self._serializer.decode(row["data"])
+            metas = (self._meta_from_row(row) for row in cur)
+            return {meta.resource_id: meta for meta in metas}
 
     def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
         # 直接寫入 PostgreSQL
-        import json
-
-        sql = f"""
-        INSERT INTO "{self.table_name}" (resource_id, data, created_time, updated_time, created_by, updated_by, is_deleted, schema_version, indexed_data)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (resource_id) DO UPDATE SET
-            data = EXCLUDED.data,
-            created_time = EXCLUDED.created_time,
-            updated_time = EXCLUDED.updated_time,
-            created_by = EXCLUDED.created_by,
-            updated_by = EXCLUDED.updated_by,
-            is_deleted = EXCLUDED.is_deleted,
-            schema_version = EXCLUDED.schema_version,
-            indexed_data = EXCLUDED.indexed_data
-        """
-
-        indexed_data_json = (
-            json.dumps(meta.indexed_data, ensure_ascii=False)
-            if meta.indexed_data is not UNSET
-            else None
-        )
-
+        row = (pk, *self._row(meta)[1:])
         with self.transaction() as cur:
-            cur.execute(
-                sql,
-                (
-                    pk,
-                    self._serializer.encode(meta),
-                    meta.created_time,
-                    meta.updated_time,
-                    meta.created_by,
-                    meta.updated_by,
-                    meta.is_deleted,
-                    meta.schema_version,
-                    indexed_data_json,
-                ),
+            self._execute_prepared(
+                cur,
+                "set",
+                f"""
+                INSERT INTO "{self.table_name}" ({self._columns})
+                VALUES ({", ".join(f"${i}" for i in range(1, len(row) + 1))})
+                ON CONFLICT (resource_id) DO UPDATE SET {self._upsert_set}
+                """,
+                row,
             )
 
     def __delitem__(self, pk: str) -> None:
@@ -358,10 +972,18 @@ class PostgresMetaStore(ISlowMetaStore):
             cur.execute(f'SELECT COUNT(*) FROM "{self.table_name}"')
             return cur.fetchone()[0]
 
-    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
-        # 直接从 PostgreSQL 查询
-
-        # 构建查询条件
+    def _time_param(self, value):
+        """Bind *value* (or list of values) like the time columns store it."""
+        if self.layout == MetaLayout.blob:
+            return value
+        if isinstance(value, dt.datetime):
+            return _utc_wall(value)
+        if isinstance(value, (list, tuple, set)):
+            return [_utc_wall(v) if isinstance(v, dt.datetime) else v for v in value]
+        return value
+
+    def _build_search(self, query: ResourceMetaSearchQuery) -> tuple[str, list, str]:
+        """构建搜索用的 WHERE 子句、参数与 ORDER BY 子句"""
         conditions = []
         params = []
 
@@ -371,19 +993,19 @@ class PostgresMetaStore(ISlowMetaStore):
 
         if query.created_time_start is not UNSET:
             conditions.append("created_time >= %s")
-            params.append(query.created_time_start)
+            params.append(self._time_param(query.created_time_start))
 
         if query.created_time_end is not UNSET:
             conditions.append("created_time <= %s")
-            params.append(query.created_time_end)
+            params.append(self._time_param(query.created_time_end))
 
         if query.updated_time_start is not UNSET:
             conditions.append("updated_time >= %s")
-            params.append(query.updated_time_start)
+            params.append(self._time_param(query.updated_time_start))
 
         if query.updated_time_end is not UNSET:
             conditions.append("updated_time <= %s")
-            params.append(query.updated_time_end)
+            params.append(self._time_param(query.updated_time_end))
 
         if query.created_bys is not UNSET:
             placeholders = ",".join(["%s"] * len(query.created_bys))
@@ -411,45 +1033,97 @@ class PostgresMetaStore(ISlowMetaStore):
                     conditions.append(json_condition)
                     params.extend(json_params)
 
+        # 构建排序子句（cursor 分页时附加 resource_id 作为 tie-breaker）
+        keyset_sorts = get_search_sorts(query)
+        keyset_columns: list[tuple[str, str, bool, bool]] = []
+        for sort in keyset_sorts:
+            descending = sort.direction == ResourceMetaSortDirection.descending
+            if isinstance(sort, ResourceMetaSearchSort):
+                keyset_columns.append((sort.key.value, "%s", descending, False))
+            else:
+                indexed = self._indexed_paths.get(sort.field_path)
+                if indexed is not None and indexed.sortable:
+                    # 依型別化運算式排序才能用上 ensure_indexes 建立的索引
+                    keyset_columns.append((indexed.expression, "%s", descending, True))
+                    continue
+                # ResourceDataSearchSort - 處理 indexed_data 欄位排序
+                # 使用 -> 操作符保持原始類型，讓 PostgreSQL 自動處理不同數據類型的排序；
+                # JSON null 與缺少的欄位都視為 SQL NULL，與 SQLite 行為一致
+                jsonb_extract = (
+                    f"NULLIF(indexed_data->'{sort.field_path}', 'null'::jsonb)"
+                )
+                keyset_columns.append((jsonb_extract, "%s::jsonb", descending, True))
+        order_parts = []
+        for expr, _, descending, nullable in keyset_columns:
+            if not nullable:
+                order_parts.append(f"{expr} {'DESC' if descending else 'ASC'}")
+            elif descending:
+                order_parts.append(f"{expr} DESC NULLS LAST")
+            else:
+                order_parts.append(f"{expr} ASC NULLS FIRST")
+        order_clause = "ORDER BY " + ", ".join(order_parts) if order_parts else ""
+
+        # Keyset 分頁：只取 cursor 之後的資料
+        if query.after is not UNSET:
+            import json
+
+            values = decode_search_cursor(query.after, query.sorts)
+            values = [
+                json.dumps(v)
+                if placeholder == "%s::jsonb" and v is not None
+                else self._time_param(v)
+                for v, (_, placeholder, _, _) in zip(
+                    values, keyset_columns, strict=True
+                )
+            ]
+            seek_condition, seek_params = build_keyset_sql(keyset_columns, values)
+            conditions.append(seek_condition)
+            params.extend(seek_params)
+
         # 构建 WHERE 子句
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
+        return where_clause, params, order_clause
 
-        # 构建排序子句
-        order_clause = ""
-        if query.sorts is not UNSET and query.sorts:
-            order_parts = []
-            for sort in query.sorts:
-                if isinstance(sort, ResourceMetaSearchSort):
-                    direction = (
-                        "ASC"
-                        if sort.direction == ResourceMetaSortDirection.ascending
-                        else "DESC"
-                    )
-                    order_parts.append(f"{sort.key} {direction}")
-                else:
-                    # ResourceDataSearchSort - 處理 indexed_data 欄位排序
-                    direction = (
-                        "ASC"
-                        if sort.direction == ResourceMetaSortDirection.ascending
-                        else "DESC"
-                    )
-                    # 使用 JSONB 提取語法對 indexed_data 中的欄位進行排序
-                    # PostgreSQL 可以根據 JSON 值的類型自動選擇排序方式
-                    # 使用 -> 操作符保持原始類型，讓 PostgreSQL 自動處理不同數據類型的排序
-                    jsonb_extract = f"indexed_data->'{sort.field_path}'"
-                    order_parts.append(f"{jsonb_extract} {direction}")
-            order_clause = "ORDER BY " + ", ".join(order_parts)
-
-        sql = f'SELECT data FROM "{self.table_name}" {where_clause} {order_clause} LIMIT %s OFFSET %s'
+    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+        return self._search(query, self._select())
+
+    def iter_search_fields(
+        self, query: ResourceMetaSearchQuery, fields: Collection[str]
+    ) -> Generator[ResourceMeta]:
+        return self._search(query, self._select("indexed_data" in fields))
+
+    def _search(
+        self, query: ResourceMetaSearchQuery, select: str
+    ) -> Generator[ResourceMeta]:
+        # 直接从 PostgreSQL 查询
+        where_clause, params, order_clause = self._build_search(query)
+        sql = f'SELECT {select} FROM "{self.table_name}" {where_clause} {order_clause} LIMIT %s OFFSET %s'
         params.append(query.limit)
         params.append(query.offset)
 
         with self.stream_cursor() as cur:
             cur.execute(sql, params)
             for row in cur:
-                yield self._serializer.decode(row["data"])
+                yield self._meta_from_row(row)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        with self.transaction() as cur:
+            if self.estimate_count and not has_search_filters(query):
+                cur.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                    (f'"{self.table_name}"',),
+                )
+                row = cur.fetchone()
+                # reltuples 為 -1 表示尚未 ANALYZE，退回精確計數
+                if row is not None and row[0] >= 0:
+                    return clamp_count(row[0], query)
+            where_clause, params, _ = self._build_search(query)
+            cur.execute(
+                f'SELECT COUNT(*) FROM "{self.table_name}" {where_clause}', params
+            )
+            return clamp_count(cur.fetchone()[0], query)
 
     def _build_condition(self, condition: DataSearchFilter) -> tuple[str, list]:
         """構建 PostgreSQL 查詢條件 (支援 Meta 欄位與 JSONB 欄位)"""
@@ -498,6 +1172,8 @@ class PostgresMetaStore(ISlowMetaStore):
 
         if field_path in meta_fields:
             column_name = field_path
+            if field_path in ("created_time", "updated_time"):
+                value = self._time_param(value)
 
             # Special handling for boolean fields (is_deleted)
             is_boolean_field = field_path == "is_deleted"
@@ -577,6 +1253,26 @@ class PostgresMetaStore(ISlowMetaStore):
         jsonb_text_extract = f"indexed_data->>'{field_path}'"
         jsonb_numeric_extract = f"(indexed_data->>'{field_path}')::numeric"
 
+        indexed = self._indexed_paths.get(field_path)
+        if indexed is not None and indexed.numeric and condition.transform is None:
+            # 數值欄位改用索引的運算式；數字的等於 / IN 也以數值比較
+            jsonb_numeric_extract = indexed.expression
+            if operator in (
+                DataSearchOperator.equals,
+                DataSearchOperator.not_equals,
+            ) and _is_number(value):
+                op = "=" if operator == DataSearchOperator.equals else "!="
+                return f"{jsonb_numeric_extract} {op} %s", [value]
+            if (
+                operator in (DataSearchOperator.in_list, DataSearchOperator.not_in_list)
+                and isinstance(value, (list, tuple, set))
+                and value
+                and all(_is_number(v) for v in value)
+            ):
+                op = "IN" if operator == DataSearchOperator.in_list else "NOT IN"
+                placeholders = ",".join(["%s"] * len(value))
+                return f"{jsonb_numeric_extract} {op} ({placeholders})", list(value)
+
         # Apply field transformation if specified
         if condition.transform is not None:
             if condition.transform == FieldTransform.length:
@@ -2,19 +2,63 @@ from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 
 import redis
-from msgspec import UNSET
 
 from autocrud.resource_manager.basic import (
     Encoding,
     IFastMetaStore,
     MsgspecSerializer,
-    get_sort_fn,
-    is_match_query,
+    clamp_count,
+    compile_query,
+    count_matches,
+    has_search_filters,
+    paginate_by_resource_id,
+    sort_and_paginate,
 )
 from autocrud.types import ResourceMeta, ResourceMetaSearchQuery
 
+# HSCAN / 批次刪除每次處理的筆數
+_BATCH_SIZE = 1000
+
+# 把寫入緩衝區整個移到 draining hash；上次未完成的 drain 會留下 draining hash，
+# 此時把緩衝區合併進去（較新的寫入覆蓋舊值），一起重新同步
+_DRAIN_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    local values = redis.call('HGETALL', KEYS[1])
+    for i = 1, #values, 2 do
+        redis.call('HSET', KEYS[2], values[i], values[i + 1])
+    end
+    redis.call('DEL', KEYS[1])
+elseif redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HLEN', KEYS[2])
+"""
+
+# 只刪除值未被改寫的欄位：drain 期間另一個 drain 合併進來的新值要保留
+_DELETE_UNCHANGED_SCRIPT = """
+local deleted = 0
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        deleted = deleted + redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return deleted
+"""
+
 
 class RedisMetaStore(IFastMetaStore):
+    """Redis meta store used as the fast tier of :class:`FastSlowMetaStore`.
+
+    Metas live in one Redis hash (``<prefix>resource_meta``), so ``len()`` is
+    ``HLEN`` and bulk reads are ``HMGET`` / ``HSCAN`` batches instead of one
+    ``GET`` per key.  :meth:`get_then_delete` renames the hash atomically; writes
+    made while the drained metas are being synced go to a fresh hash and are
+    never lost.  Until the drain completes the renamed hash is still read.
+
+    Per-key string entries written by earlier versions are moved into the hash
+    when the store is created.
+    """
+
     def __init__(
         self,
         redis_url: str,
@@ -26,71 +70,148 @@ class RedisMetaStore(IFastMetaStore):
             resource_type=ResourceMeta,
         )
         self._redis = redis.Redis.from_url(redis_url)
-        self._key_prefix = f"{prefix}resource_meta:"
+        self._key = f"{prefix}resource_meta"
+        self._draining_key = f"{prefix}resource_meta:draining"
+        self._drain = self._redis.register_script(_DRAIN_SCRIPT)
+        self._delete_unchanged = self._redis.register_script(_DELETE_UNCHANGED_SCRIPT)
+        self._migrate_legacy_keys(f"{prefix}resource_meta:")
+
+    def _migrate_legacy_keys(self, key_prefix: str) -> None:
+        """Move ``<prefix>resource_meta:<pk>`` string keys into the hash."""
+        keys = [
+            key
+            for key in self._redis.scan_iter(
+                match=f"{key_prefix}*", count=_BATCH_SIZE, _type="string"
+            )
+        ]
+        for start in range(0, len(keys), _BATCH_SIZE):
+            chunk = keys[start : start + _BATCH_SIZE]
+            values = self._redis.mget(chunk)
+            pipe = self._redis.pipeline()
+            for key, value in zip(chunk, values, strict=True):
+                if value is not None:
+                    pk = key.decode("utf-8")[len(key_prefix) :]
+                    # 不覆蓋已寫入 hash 的新值
+                    pipe.hsetnx(self._key, pk, value)
+            pipe.delete(*chunk)
+            pipe.execute()
 
-    def _get_key(self, pk: str) -> str:
-        return f"{self._key_prefix}{pk}"
+    def _fetch(self, pks: list[str]) -> list[bytes | None]:
+        """Values of *pks*, from the write buffer or a drain in progress."""
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hmget(self._key, pks)
+        pipe.hmget(self._draining_key, pks)
+        current, draining = pipe.execute()
+        return [
+            value if value is not None else old
+            for value, old in zip(current, draining, strict=True)
+        ]
+
+    def _scan(self) -> Generator[bytes]:
+        """Every stored value, in ``HSCAN`` batches."""
+        seen: set[bytes] = set()
+        for field, value in self._redis.hscan_iter(self._key, count=_BATCH_SIZE):
+            seen.add(field)
+            yield value
+        for field, value in self._redis.hscan_iter(
+            self._draining_key, count=_BATCH_SIZE
+        ):
+            if field not in seen:
+                yield value
 
     def __getitem__(self, pk: str) -> ResourceMeta:
-        key = self._get_key(pk)
-        data = self._redis.get(key)
+        [data] = self._fetch([pk])
         if data is None:
             raise KeyError(pk)
         return self._serializer.decode(data)
 
+    def __contains__(self, pk: object) -> bool:
+        if not isinstance(pk, str):
+            return False
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hexists(self._key, pk)
+        pipe.hexists(self._draining_key, pk)
+        return any(pipe.execute())
+
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        pks = list(dict.fromkeys(pks))
+        if not pks:
+            return {}
+        return {
+            pk: self._serializer.decode(data)
+            for pk, data in zip(pks, self._fetch(pks), strict=True)
+            if data is not None
+        }
+
     def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
-        key = self._get_key(pk)
-        data = self._serializer.encode(meta)
-        self._redis.set(key, data)
+        self._redis.hset(self._key, pk, self._serializer.encode(meta))
+
+    def save_many(self, metas: Iterable[ResourceMeta]) -> None:
+        encode = self._serializer.encode
+        mapping = {meta.resource_id: encode(meta) for meta in metas}
+        if mapping:
+            self._redis.hset(self._key, mapping=mapping)
 
     def __delitem__(self, pk: str) -> None:
-        key = self._get_key(pk)
-        result = self._redis.delete(key)
-        if result == 0:
+        pipe = self._redis.pipeline()
+        pipe.hdel(self._key, pk)
+        pipe.hdel(self._draining_key, pk)
+        if not any(pipe.execute()):
             raise KeyError(pk)
 
     def __iter__(self) -> Generator[str]:
-        pattern = f"{self._key_prefix}*"
-        for key in self._redis.scan_iter(match=pattern):
-            key_str = key.decode("utf-8") if isinstance(key, bytes) else key
-            yield key_str[len(self._key_prefix) :]
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hkeys(self._key)
+        pipe.hkeys(self._draining_key)
+        current, draining = pipe.execute()
+        for field in dict.fromkeys(current + draining):
+            yield field.decode("utf-8")
 
     def __len__(self) -> int:
-        pattern = f"{self._key_prefix}*"
-        return len(list(self._redis.scan_iter(match=pattern)))
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hlen(self._key)
+        pipe.exists(self._draining_key)
+        size, draining = pipe.execute()
+        if not draining:
+            return size
+        # drain 進行中：兩個 hash 可能有相同的 pk
+        return sum(1 for _ in self)
 
     @contextmanager
     def get_then_delete(self) -> Generator[Iterable[ResourceMeta]]:
         """获取所有元数据然后删除，用于快速存储的批量同步"""
-        metas = []
-        pattern = f"{self._key_prefix}*"
-
-        # 收集所有数据
-        for key in self._redis.scan_iter(match=pattern):
-            data = self._redis.get(key)
-            if data:
-                meta = self._serializer.decode(data)
-                metas.append(meta)
-
-        try:
-            yield metas
-            # 如果成功，清空所有数据
-            if metas:
-                keys = list(self._redis.scan_iter(match=pattern))
-                if keys:
-                    self._redis.delete(*keys)
-        except Exception:
-            # 如果出现异常，不删除数据
-            raise
+        if not self._drain(keys=[self._key, self._draining_key]):
+            yield []
+            return
+        # HSCAN 可能重複回傳同一欄位
+        entries = list(
+            dict(self._redis.hscan_iter(self._draining_key, count=_BATCH_SIZE)).items()
+        )
+        # 出现异常时不删除，留在 draining hash 中等下次同步
+        yield [self._serializer.decode(value) for _, value in entries]
+        for start in range(0, len(entries), _BATCH_SIZE):
+            args = [
+                item for entry in entries[start : start + _BATCH_SIZE] for item in entry
+            ]
+            self._delete_unchanged(keys=[self._draining_key], args=args)
 
     def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
-        results: list[ResourceMeta] = []
-        pattern = f"{self._key_prefix}*"
-        for key in self._redis.scan_iter(match=pattern):
-            data = self._redis.get(key)
-            if data:
-                meta = self._serializer.decode(data)
-                if is_match_query(meta, query):
-                    results.append(meta)
-        results.sort(key=get_sort_fn([] if query.sorts is UNSET else query.sorts))
-        yield from results[query.offset : query.offset + query.limit]
+        # 依 resource_id 分頁時逐批 HMGET，而不是每個 key 一次往返
+        page = paginate_by_resource_id(
+            list(self),
+            self.get,
+            query,
+            load_many=self.get_many,
+            chunk_size=_BATCH_SIZE,
+        )
+        if page is not None:
+            yield from page
+            return
+        match = compile_query(query)
+        decode = self._serializer.decode
+        yield from sort_and_paginate(filter(match, map(decode, self._scan())), query)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        if not has_search_filters(query):
+            return clamp_count(len(self), query)
+        return count_matches(map(self._serializer.decode, self._scan()), query)
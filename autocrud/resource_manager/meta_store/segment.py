@@ -0,0 +1,502 @@
+"""Log-structured disk meta store.
+
+:class:`SegmentDiskMetaStore` appends every write to the active segment file
+instead of keeping one file per resource:
+
+- a record is ``crc32 | key length | value length | key | value``; deletes
+  append a tombstone (value length ``0xFFFFFFFF``);
+- an in-memory index maps each live resource ID to the segment, offset and size
+  of its latest value, so lookups are one ``pread`` and ``len()`` / iteration
+  never touch the disk;
+- the index is checkpointed to a single ``index`` file.  Startup loads it and
+  replays only the records appended after the checkpoint; a torn record at the
+  end of the log is truncated;
+- once the live records of a sealed segment drop below ``compact_ratio`` of
+  its size, a background thread copies them to the active segment and removes
+  the old file.
+
+Searches read each segment sequentially and decode the live values only, so
+they scale with the live set rather than with the number of files.
+"""
+
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import defaultdict
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal
+
+import msgspec
+
+from autocrud.resource_manager.basic import (
+    Encoding,
+    IFastMetaStore,
+    MsgspecSerializer,
+    clamp_count,
+    compile_query,
+    count_matches,
+    has_search_filters,
+    paginate_by_resource_id,
+    sort_and_paginate,
+)
+from autocrud.types import ResourceMeta, ResourceMetaSearchQuery
+
+logger = logging.getLogger(__name__)
+
+FsyncPolicy = Literal["always", "interval", "never"]
+
+# crc32, key 長度, value 長度
+_HEADER = struct.Struct("<III")
+_TOMBSTONE = 0xFFFFFFFF
+_SEGMENT_SUFFIX = ".seg"
+_INDEX_NAME = "index"
+
+
+class _Checkpoint(msgspec.Struct, array_like=True):
+    # 從此 segment 的此位置之後重播
+    segment: int
+    position: int
+    # pk -> (segment, value offset, value size)
+    entries: dict[str, tuple[int, int, int]]
+
+
+def _record(key: bytes, value: bytes | None) -> bytes:
+    size = _TOMBSTONE if value is None else len(value)
+    body = _HEADER.pack(0, len(key), size)[4:] + key + (value or b"")
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+def _parse(
+    data: bytes | memoryview, start: int = 0
+) -> Generator[tuple[int, str, int, int | None]]:
+    """Yield ``(record offset, key, value offset, value size)`` of whole records.
+
+    Tombstones have a value size of ``None``.  Parsing stops at the first
+    truncated or corrupt record; the caller can compare the offsets with the
+    data length to find a torn tail.
+    """
+    view = memoryview(data)
+    end = len(view)
+    pos = start
+    while pos + _HEADER.size <= end:
+        crc, key_size, value_size = _HEADER.unpack_from(view, pos)
+        body_end = pos + _HEADER.size + key_size
+        if value_size != _TOMBSTONE:
+            body_end += value_size
+        if body_end > end or zlib.crc32(view[pos + 4 : body_end]) != crc:
+            return
+        key_end = pos + _HEADER.size + key_size
+        key = bytes(view[pos + _HEADER.size : key_end]).decode()
+        yield pos, key, key_end, None if value_size == _TOMBSTONE else value_size
+        pos = body_end
+
+
+class SegmentDiskMetaStore(IFastMetaStore):
+    """Append-only, segment-based disk meta store.
+
+    Arguments:
+        encoding: Encoding of the stored metas.
+        rootdir: Directory holding the segment and index files.
+        segment_size: Bytes after which the active segment is sealed and a new
+            one is started.
+        compact_ratio: Sealed segments whose live records take less than this
+            fraction of the file are compacted.
+        checkpoint_bytes: Bytes appended after the last checkpoint that trigger
+            a new one (bounds the replay at startup).
+        fsync: ``"always"`` syncs after every write; ``"interval"`` syncs
+            on a write when ``fsync_interval`` seconds have passed since the
+            last sync; ``"never"`` leaves flushing to the OS.  Segments are
+            always synced before a checkpoint refers to them.
+        fsync_interval: Seconds between syncs for the ``"interval"`` policy.
+        background: Run compaction and checkpoints in a background thread when
+            the thresholds are crossed.  Without it, call :meth:`compact` and
+            :meth:`checkpoint` yourself.
+
+    Call :meth:`close` to write a final checkpoint; otherwise the next start
+    replays the records written since the last one.
+    """
+
+    def __init__(
+        self,
+        *,
+        encoding: Encoding = Encoding.json,
+        rootdir: Path | str,
+        segment_size: int = 64 * 2**20,
+        compact_ratio: float = 0.5,
+        checkpoint_bytes: int = 16 * 2**20,
+        fsync: FsyncPolicy = "interval",
+        fsync_interval: float = 1.0,
+        background: bool = True,
+    ):
+        self._serializer = MsgspecSerializer(
+            encoding=encoding,
+            resource_type=ResourceMeta,
+        )
+        self._rootdir = Path(rootdir)
+        self._rootdir.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.compact_ratio = compact_ratio
+        self.checkpoint_bytes = checkpoint_bytes
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.background = background
+
+        self._lock = threading.RLock()
+        self._worker: threading.Thread | None = None
+        # pk -> (segment, value offset, value size)
+        self._index: dict[str, tuple[int, int, int]] = {}
+        self._fds: dict[int, int] = {}
+        self._sizes: dict[int, int] = {}
+        # 每個 segment 中仍有效的 record 位元組數
+        self._live: dict[int, int] = defaultdict(int)
+        # 尚未 fsync 的 segment
+        self._dirty: set[int] = set()
+        self._active = 0
+        self._unindexed = 0
+        self._last_sync = time.monotonic()
+        self._recover()
+
+    # ------------------------------------------------------------------
+    # files
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._rootdir / f"{segment:08d}{_SEGMENT_SUFFIX}"
+
+    def _open(self, segment: int) -> None:
+        fd = os.open(
+            self._segment_path(segment), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        self._fds[segment] = fd
+        self._sizes[segment] = os.fstat(fd).st_size
+
+    @staticmethod
+    def _record_size(pk: str, value_size: int) -> int:
+        return _HEADER.size + len(pk.encode()) + value_size
+
+    def _recover(self) -> None:
+        segments = sorted(
+            int(path.stem) for path in self._rootdir.glob(f"*{_SEGMENT_SUFFIX}")
+        )
+        for segment in segments:
+            self._open(segment)
+        start_segment, start_position = (segments[0] if segments else 0), 0
+        index_path = self._rootdir / _INDEX_NAME
+        if index_path.exists():
+            checkpoint = msgspec.msgpack.decode(
+                index_path.read_bytes(), type=_Checkpoint
+            )
+            self._index = checkpoint.entries
+            start_segment, start_position = checkpoint.segment, checkpoint.position
+            for pk, (segment, _, size) in self._index.items():
+                self._live[segment] += self._record_size(pk, size)
+
+        for segment in segments:
+            if segment < start_segment:
+                continue
+            position = start_position if segment == start_segment else 0
+            data = os.pread(self._fds[segment], self._sizes[segment], 0)
+            end = position
+            for offset, pk, value_offset, size in _parse(data, position):
+                end = value_offset + (size or 0)
+                self._unindexed += end - offset
+                self._forget(pk)
+                if size is not None:
+                    self._index[pk] = (segment, value_offset, size)
+                    self._live[segment] += end - offset
+            if end < len(data):
+                # 寫到一半的 record：截斷，之後從這裡繼續追加
+                os.ftruncate(self._fds[segment], end)
+                self._sizes[segment] = end
+
+        if segments:
+            self._active = segments[-1]
+        else:
+            self._open(self._active)
+
+    def _forget(self, pk: str) -> None:
+        old = self._index.pop(pk, None)
+        if old is not None:
+            self._live[old[0]] -= self._record_size(pk, old[2])
+
+    def _sync(self, segment: int) -> None:
+        os.fsync(self._fds[segment])
+        self._dirty.discard(segment)
+        if segment == self._active:
+            self._last_sync = time.monotonic()
+
+    def _append(self, items: Iterable[tuple[str, bytes | None]]) -> None:
+        """Append puts (``bytes``) and tombstones (``None``) in one write."""
+        chunks: list[bytes] = []
+        placed: list[tuple[str, int, int | None, int]] = []
+        with self._lock:
+            if self._sizes[self._active] >= self.segment_size:
+                self._rotate()
+            position = self._sizes[self._active]
+            for pk, value in items:
+                key = pk.encode()
+                record = _record(key, value)
+                chunks.append(record)
+                value_size = None if value is None else len(value)
+                placed.append(
+                    (pk, position + _HEADER.size + len(key), value_size, len(record))
+                )
+                position += len(record)
+            if not chunks:
+                return
+            buffer = memoryview(b"".join(chunks))
+            fd = self._fds[self._active]
+            while buffer:
+                buffer = buffer[os.write(fd, buffer) :]
+            self._sizes[self._active] = position
+            self._dirty.add(self._active)
+            self._unindexed += sum(len(chunk) for chunk in chunks)
+            for pk, value_offset, value_size, record_size in placed:
+                self._forget(pk)
+                if value_size is not None:
+                    self._index[pk] = (self._active, value_offset, value_size)
+                    self._live[self._active] += record_size
+
+            if self.fsync == "always" or (
+                self.fsync == "interval"
+                and time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync(self._active)
+        if self.background and self._needs_maintenance():
+            self._kick()
+
+    def _rotate(self) -> None:
+        if self.fsync != "never":
+            self._sync(self._active)
+        self._active += 1
+        self._open(self._active)
+
+    def _drop(self, segment: int) -> None:
+        self._dirty.discard(segment)
+        os.close(self._fds.pop(segment))
+        self._sizes.pop(segment)
+        self._live.pop(segment, None)
+        self._segment_path(segment).unlink()
+
+    # ------------------------------------------------------------------
+    # maintenance
+    # ------------------------------------------------------------------
+
+    def _compactable(self) -> list[int]:
+        return [
+            segment
+            for segment, size in sorted(self._sizes.items())
+            if segment != self._active
+            and self._live[segment] < self.compact_ratio * size
+        ]
+
+    def _needs_maintenance(self) -> bool:
+        with self._lock:
+            return self._unindexed >= self.checkpoint_bytes or bool(self._compactable())
+
+    def _kick(self) -> None:
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._maintain, name="segment-meta-store", daemon=True
+            )
+            self._worker.start()
+
+    def _maintain(self) -> None:
+        try:
+            if not self.compact():
+                self.checkpoint()
+        except Exception:
+            # 记录错误但不中断写入，下次写入会再触发
+            logger.exception("Segment meta store maintenance error")
+
+    def checkpoint(self) -> None:
+        """Write the in-memory index so the next start does not replay the log."""
+        with self._lock:
+            # checkpoint 指向的資料必須先落盤
+            for segment in sorted(self._dirty):
+                self._sync(segment)
+            checkpoint = _Checkpoint(
+                segment=self._active,
+                position=self._sizes[self._active],
+                entries=self._index,
+            )
+            tmp = self._rootdir / f"{_INDEX_NAME}.tmp"
+            with tmp.open("wb") as f:
+                f.write(msgspec.msgpack.encode(checkpoint))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._rootdir / _INDEX_NAME)
+            self._unindexed = 0
+
+    def compact(self) -> bool:
+        """Rewrite sealed segments that are mostly garbage; return whether any were."""
+        with self._lock:
+            segments = self._compactable()
+        if not segments:
+            return False
+        for segment in segments:
+            with self._lock:
+                if segment not in self._fds:
+                    continue
+                data = os.pread(self._fds[segment], self._sizes[segment], 0)
+                older = any(s < segment for s in self._fds)
+                keep: list[tuple[str, bytes | None]] = []
+                for _, pk, value_offset, size in _parse(data):
+                    if size is None:
+                        # 較舊的 segment 可能還有此 pk 的舊值，墓碑需保留
+                        if older and pk not in self._index:
+                            keep.append((pk, None))
+                    elif self._index.get(pk) == (segment, value_offset, size):
+                        keep.append((pk, data[value_offset : value_offset + size]))
+                self._append(keep)
+        with self._lock:
+            # 先寫入指向新位置的 checkpoint，再刪除舊檔
+            self.checkpoint()
+            for segment in segments:
+                if segment in self._fds and segment != self._active:
+                    self._drop(segment)
+        return True
+
+    def close(self) -> None:
+        """Wait for background maintenance, checkpoint, and close the files."""
+        worker = self._worker
+        if worker is not None:
+            worker.join()
+        with self._lock:
+            if not self._fds:
+                return
+            self.checkpoint()
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+    # ------------------------------------------------------------------
+    # reads
+    # ------------------------------------------------------------------
+
+    def _read(self, pk: str) -> bytes | None:
+        with self._lock:
+            location = self._index.get(pk)
+            if location is None:
+                return None
+            segment, offset, size = location
+            return os.pread(self._fds[segment], size, offset)
+
+    def _load(self, pk: str) -> ResourceMeta | None:
+        value = self._read(pk)
+        return None if value is None else self._serializer.decode(value)
+
+    def _scan(
+        self, entries: dict[str, tuple[int, int, int]] | None = None
+    ) -> Generator[ResourceMeta]:
+        """Decode the given (default: every live) meta, one read per segment."""
+        by_segment: dict[int, list[tuple[str, int, int]]] = defaultdict(list)
+        with self._lock:
+            if entries is None:
+                entries = self._index
+            for pk, (segment, offset, size) in entries.items():
+                by_segment[segment].append((pk, offset, size))
+        decode = self._serializer.decode
+        for segment, located in sorted(by_segment.items()):
+            start = min(offset for _, offset, _ in located)
+            end = max(offset + size for _, offset, size in located)
+            with self._lock:
+                fd = self._fds.get(segment)
+                chunk = None if fd is None else os.pread(fd, end - start, start)
+            if chunk is None:
+                # segment 已被壓縮，改依新位置逐筆讀取
+                for pk, _, _ in located:
+                    meta = self._load(pk)
+                    if meta is not None:
+                        yield meta
+                continue
+            view = memoryview(chunk)
+            for _, offset, size in located:
+                yield decode(view[offset - start : offset - start + size])
+
+    # ------------------------------------------------------------------
+    # IMetaStore
+    # ------------------------------------------------------------------
+
+    def __contains__(self, pk: object) -> bool:
+        return pk in self._index
+
+    def __getitem__(self, pk: str) -> ResourceMeta:
+        meta = self._load(pk)
+        if meta is None:
+            raise KeyError(pk)
+        return meta
+
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        result: dict[str, ResourceMeta] = {}
+        for pk in pks:
+            meta = self._load(pk)
+            if meta is not None:
+                result[pk] = meta
+        return result
+
+    def __setitem__(self, pk: str, b: ResourceMeta) -> None:
+        self._append([(pk, self._serializer.encode(b))])
+
+    def save_many(self, metas: Iterable[ResourceMeta]) -> None:
+        encode = self._serializer.encode
+        self._append([(meta.resource_id, encode(meta)) for meta in metas])
+
+    def __delitem__(self, pk: str) -> None:
+        with self._lock:
+            if pk not in self._index:
+                raise KeyError(pk)
+            self._append([(pk, None)])
+
+    def __iter__(self) -> Generator[str]:
+        with self._lock:
+            pks = list(self._index)
+        yield from pks
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+        page = paginate_by_resource_id(list(self), self._load, query)
+        if page is not None:
+            yield from page
+            return
+        yield from sort_and_paginate(filter(compile_query(query), self._scan()), query)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        if not has_search_filters(query):
+            return clamp_count(len(self), query)
+        return count_matches(self._scan(), query)
+
+    @contextmanager
+    def get_then_delete(self) -> Generator[Iterable[ResourceMeta]]:
+        """获取所有元数据然后删除，用于快速存储的批量同步"""
+        with self._lock:
+            snapshot = dict(self._index)
+        yield self._scan(snapshot)
+        with self._lock:
+            # 期間被改寫的資源保留，下次再同步
+            drained = [pk for pk, loc in snapshot.items() if self._index.get(pk) == loc]
+            if len(drained) == len(self._index):
+                self._reset()
+            else:
+                self._append([(pk, None) for pk in drained])
+
+    def _reset(self) -> None:
+        """Drop every segment and start an empty log (all entries drained)."""
+        segments = list(self._fds)
+        self._index.clear()
+        self._live.clear()
+        self._active += 1
+        self._open(self._active)
+        # 與 compact() 相同：先寫入空的 checkpoint，再刪除舊檔
+        self.checkpoint()
+        for segment in segments:
+            self._drop(segment)
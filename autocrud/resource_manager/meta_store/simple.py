@@ -1,7 +1,13 @@
+import bisect
+import copy
+import datetime as dt
+import math
+from collections import Counter
 from collections.abc import Generator, Iterable
 from contextlib import contextmanager, suppress
+from itertools import chain, count
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from msgspec import UNSET
 
@@ -9,30 +15,247 @@ from autocrud.resource_manager.basic import (
     Encoding,
     IFastMetaStore,
     MsgspecSerializer,
-    get_sort_fn,
-    is_match_query,
+    clamp_count,
+    compile_query,
+    count_matches,
+    has_search_filters,
+    normalize_search_value,
+    paginate_by_resource_id,
+    sort_and_paginate,
+)
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    ResourceDataSearchSort,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSortDirection,
 )
-from autocrud.types import ResourceMeta, ResourceMetaSearchQuery
 
 T = TypeVar("T")
 
+_UNHASHABLE = object()
+# 解碼後型別不變的值，建立索引時不必重新解碼
+_ROUND_TRIP_TYPES = (str, int, float, bool, type(None))
+_ORDERED_CLASSES = ("num", "str", "time", "timetz")
+
+
+def _key_class(value: Any) -> str:
+    """Values of the same class can be ordered against each other."""
+    if isinstance(value, (bool, int)):
+        return "num"
+    if isinstance(value, float):
+        return "nan" if math.isnan(value) else "num"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, dt.datetime):
+        return "time" if value.utcoffset() is None else "timetz"
+    return "other"
+
+
+class _PathIndex:
+    """Hash index (plus lazily sorted keys) of the non-null values of one path.
+
+    Equal values share a bucket (``1``, ``1.0`` and ``True`` included), so a
+    lookup always returns a superset of the rows a condition can match; the
+    caller still applies the full predicate.
+    """
+
+    def __init__(self):
+        self.buckets: dict[Any, set[str]] = {}
+        self.unhashable: set[str] = set()
+        self.classes: Counter[str] = Counter()
+        self._sorted: list[Any] | None = None
+
+    def add(self, pk: str, value: Any) -> Any:
+        try:
+            bucket = self.buckets.get(value)
+        except TypeError:
+            self.unhashable.add(pk)
+            return _UNHASHABLE
+        if bucket is None:
+            bucket = self.buckets[value] = set()
+            self.classes[_key_class(value)] += 1
+            self._sorted = None
+        bucket.add(pk)
+        return value
+
+    def remove(self, pk: str, key: Any) -> None:
+        if key is _UNHASHABLE:
+            self.unhashable.discard(pk)
+            return
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            return
+        bucket.discard(pk)
+        if not bucket:
+            del self.buckets[key]
+            self.classes[_key_class(key)] -= 1
+            if not self.classes[_key_class(key)]:
+                del self.classes[_key_class(key)]
+            self._sorted = None
+
+    def ordered(self) -> list[Any] | None:
+        """Distinct keys in ascending order, if they are mutually comparable."""
+        if self.unhashable or len(self.classes) > 1:
+            return None
+        if self.classes and next(iter(self.classes)) not in _ORDERED_CLASSES:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self.buckets)
+        return self._sorted
+
+    def lookup(self, operator: DataSearchOperator, value: Any) -> list[set[str]] | None:
+        """Buckets holding every row that may satisfy the condition.
+
+        Returns ``None`` when the index cannot answer the operator.
+        """
+        value = normalize_search_value(value)
+        if operator == DataSearchOperator.equals:
+            try:
+                bucket = self.buckets.get(value)
+            except TypeError:
+                return [self.unhashable]
+            return [] if bucket is None else [bucket]
+        if operator == DataSearchOperator.in_list:
+            if not isinstance(value, (list, tuple, set)):
+                return []
+            found: dict[int, set[str]] = {}
+            for member in value:
+                try:
+                    bucket = self.buckets.get(member)
+                except TypeError:
+                    bucket = self.unhashable
+                if bucket is not None:
+                    found[id(bucket)] = bucket
+            return list(found.values())
+        if operator in _RANGE_BISECT:
+            if not self.buckets and not self.unhashable:
+                return []
+            keys = self.ordered()
+            if keys is None or _key_class(value) != next(iter(self.classes)):
+                return None
+            i = _RANGE_BISECT[operator](keys, value)
+            if operator in (
+                DataSearchOperator.greater_than,
+                DataSearchOperator.greater_than_or_equal,
+            ):
+                return [self.buckets[key] for key in keys[i:]]
+            return [self.buckets[key] for key in keys[:i]]
+        return None
+
+
+_RANGE_BISECT = {
+    DataSearchOperator.greater_than: bisect.bisect_right,
+    DataSearchOperator.greater_than_or_equal: bisect.bisect_left,
+    DataSearchOperator.less_than: bisect.bisect_left,
+    DataSearchOperator.less_than_or_equal: bisect.bisect_right,
+}
+
+
+def copy_meta(meta: ResourceMeta) -> ResourceMeta:
+    """Shallow copy of *meta* that also copies its ``indexed_data`` dict."""
+    copied = copy.copy(meta)
+    if copied.indexed_data is not UNSET:
+        copied.indexed_data = dict(copied.indexed_data)
+    return copied
+
 
 class MemoryMetaStore(IFastMetaStore):
-    def __init__(self, encoding: Encoding = Encoding.json):
+    """In-memory meta store.
+
+    Arguments:
+        encoding: Encoding of the stored metas.
+        store_objects: Keep :class:`ResourceMeta` objects instead of encoded
+            bytes.  Gets and searches then skip decoding: conditions run on
+            the stored objects and only returned metas are copied (see
+            :func:`copy_meta`), so callers may still mutate what they get.
+            Values are kept as given instead of as the encoding would
+            round-trip them.
+
+    Every ``indexed_data`` path gets a secondary index: a hash index for
+    ``equals`` / ``in_list`` and sorted keys for range conditions and sorts.
+    Searches start from the most selective index that applies to a top-level
+    condition and only decode those candidates.
+    """
+
+    def __init__(
+        self, encoding: Encoding = Encoding.json, *, store_objects: bool = False
+    ):
         self._serializer = MsgspecSerializer(
             encoding=encoding,
             resource_type=ResourceMeta,
         )
-        self._store: dict[str, bytes] = {}
+        self.store_objects = store_objects
+        self._store: dict[str, bytes | ResourceMeta] = {}
+        self._indexes: dict[str, _PathIndex] = {}
+        # pk -> {path: 索引中的 key}，更新 / 刪除時用來移除舊項目
+        self._row_keys: dict[str, dict[str, Any]] = {}
+        # pk -> 寫入順序；索引的 bucket 是 set，取出後依此還原插入順序
+        self._seq: dict[str, int] = {}
+        self._next_seq = count()
+
+    def _encode(self, meta: ResourceMeta) -> bytes | ResourceMeta:
+        if self.store_objects:
+            return copy_meta(meta)
+        return self._serializer.encode(meta)
+
+    def _decode(self, stored: bytes | ResourceMeta) -> ResourceMeta:
+        """A meta owned by the caller."""
+        if self.store_objects:
+            return copy_meta(stored)
+        return self._serializer.decode(stored)
+
+    def _view(self, stored: bytes | ResourceMeta) -> ResourceMeta:
+        """A meta to evaluate conditions on; pass results through ``_export``."""
+        if self.store_objects:
+            return stored
+        return self._serializer.decode(stored)
+
+    def _export(self, meta: ResourceMeta) -> ResourceMeta:
+        return copy_meta(meta) if self.store_objects else meta
 
     def __getitem__(self, pk: str) -> ResourceMeta:
-        return self._serializer.decode(self._store[pk])
+        return self._decode(self._store[pk])
 
     def __setitem__(self, pk: str, b: ResourceMeta) -> None:
-        self._store[pk] = self._serializer.encode(b)
+        meta_b = self._encode(b)
+        if pk not in self._store:
+            self._seq[pk] = next(self._next_seq)
+        self._store[pk] = meta_b
+        if self.store_objects:
+            data = meta_b.indexed_data
+        else:
+            data = b.indexed_data
+            if data and not all(type(v) in _ROUND_TRIP_TYPES for v in data.values()):
+                # 索引需與搜尋時解碼出的值一致 (e.g. datetime 在 JSON 中為字串)
+                data = self._view(meta_b).indexed_data
+        self._reindex(pk, data)
 
     def __delitem__(self, pk: str) -> None:
         del self._store[pk]
+        del self._seq[pk]
+        self._reindex(pk, UNSET)
+
+    def _reindex(self, pk: str, data: dict[str, Any] | Any) -> None:
+        old = self._row_keys.pop(pk, None)
+        if old:
+            for path, key in old.items():
+                index = self._indexes.get(path)
+                if index is not None:
+                    index.remove(pk, key)
+        if not data:
+            return
+        keys = {}
+        for path, value in data.items():
+            if value is None:
+                continue
+            index = self._indexes.get(path)
+            if index is None:
+                index = self._indexes[path] = _PathIndex()
+            keys[path] = index.add(pk, value)
+        if keys:
+            self._row_keys[pk] = keys
 
     def __iter__(self) -> Generator[str]:
         yield from self._store.keys()
@@ -40,20 +263,137 @@ class MemoryMetaStore(IFastMetaStore):
     def __len__(self) -> int:
         return len(self._store)
 
+    def _load(self, pk: str) -> ResourceMeta | None:
+        """The meta to evaluate conditions on; pass results through ``_export``."""
+        meta_b = self._store.get(pk)
+        return None if meta_b is None else self._view(meta_b)
+
+    def _plan(self, query: ResourceMetaSearchQuery) -> list[str] | None:
+        """Candidate IDs from the most selective usable index (``None``: scan)."""
+        conditions: list[Any] = []
+        if query.data_conditions is not UNSET:
+            conditions.extend(query.data_conditions)
+        if query.conditions is not UNSET:
+            # meta 條件中非 ResourceMeta 欄位者查的是 indexed_data
+            conditions.extend(
+                c
+                for c in query.conditions
+                if isinstance(c, DataSearchCondition)
+                and (
+                    c.field_path == "indexed_data"
+                    or not hasattr(ResourceMeta, c.field_path)
+                )
+            )
+        best: list[set[str]] | None = None
+        best_size = 0
+        for condition in conditions:
+            if not isinstance(condition, DataSearchCondition) or condition.transform:
+                continue
+            index = self._indexes.get(condition.field_path)
+            buckets = (index or _PathIndex()).lookup(
+                condition.operator, condition.value
+            )
+            if buckets is None:
+                continue
+            size = sum(map(len, buckets))
+            if best is None or size < best_size:
+                best, best_size = buckets, size
+        if best is None:
+            return None
+        return sorted(chain.from_iterable(best), key=self._seq.__getitem__)
+
+    def _walk_sorted(
+        self, query: ResourceMetaSearchQuery, match: Any
+    ) -> list[ResourceMeta] | None:
+        """Page through the sorted keys of the first sort field, stopping early.
+
+        Rows are collected one key at a time; once ``offset + limit`` matches
+        are in, every remaining row sorts after them.
+        """
+        k = query.offset + query.limit
+        if query.after is not UNSET or not query.sorts or k >= len(self._store):
+            return None
+        first = query.sorts[0]
+        if not isinstance(first, ResourceDataSearchSort):
+            return None
+        index = self._indexes.get(first.field_path)
+        keys = None if index is None else index.ordered()
+        if keys is None:
+            return None
+        path = first.field_path
+
+        def nulls() -> list[str]:
+            # 缺少欄位或值為 None 者排序值皆為 None
+            return [
+                pk for pk in list(self._store) if path not in self._row_keys.get(pk, ())
+            ]
+
+        buckets = index.buckets
+        if first.direction == ResourceMetaSortDirection.descending:
+            groups = chain((buckets.get(key, ()) for key in reversed(keys)), [nulls])
+        else:
+            groups = chain([nulls], (buckets.get(key, ()) for key in keys))
+        found: list[ResourceMeta] = []
+        for group in groups:
+            pks = (
+                group() if callable(group) else sorted(group, key=self._seq.__getitem__)
+            )
+            for meta in map(self._load, pks):
+                if meta is not None and match(meta):
+                    found.append(meta)
+            if len(found) >= k:
+                break
+        return sort_and_paginate(found, query)
+
     def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
-        results: list[ResourceMeta] = []
-        for meta_b in self._store.values():
-            meta = self._serializer.decode(meta_b)
-            if is_match_query(meta, query):
-                results.append(meta)
-        results.sort(key=get_sort_fn([] if query.sorts is UNSET else query.sorts))
-        yield from results[query.offset : query.offset + query.limit]
+        candidates = self._plan(query)
+        pks = list(self._store) if candidates is None else candidates
+        page = paginate_by_resource_id(pks, self._load, query)
+        if page is not None:
+            yield from map(self._export, page)
+            return
+        match = compile_query(query)
+        if candidates is None:
+            page = self._walk_sorted(query, match)
+            if page is None:
+                page = sort_and_paginate(
+                    filter(match, map(self._view, list(self._store.values()))),
+                    query,
+                )
+        else:
+            page = sort_and_paginate(
+                (m for m in map(self._load, candidates) if m is not None and match(m)),
+                query,
+            )
+        yield from map(self._export, page)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        if not has_search_filters(query):
+            return clamp_count(len(self._store), query)
+        candidates = self._plan(query)
+        if candidates is not None:
+            return count_matches(
+                (m for m in map(self._load, candidates) if m is not None), query
+            )
+        return count_matches(map(self._view, list(self._store.values())), query)
 
     @contextmanager
     def get_then_delete(self) -> Generator[Iterable[ResourceMeta]]:
         """获取所有元数据然后删除，用于快速存储的批量同步"""
-        yield (self._serializer.decode(v) for v in self._store.values())
-        self._store.clear()
+        snapshot = dict(self._store)
+        yield map(self._decode, snapshot.values())
+        # 同步期間被改寫的資源保留，下次再同步
+        drained = [
+            pk for pk, stored in snapshot.items() if self._store.get(pk) is stored
+        ]
+        if len(drained) == len(self._store):
+            self._store.clear()
+            self._indexes.clear()
+            self._row_keys.clear()
+            self._seq.clear()
+        else:
+            for pk in drained:
+                del self[pk]
 
 
 class DiskMetaStore(IFastMetaStore):
@@ -78,6 +418,14 @@ class DiskMetaStore(IFastMetaStore):
         with path.open("rb") as f:
             return self._serializer.decode(f.read())
 
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        result: dict[str, ResourceMeta] = {}
+        for pk in pks:
+            path = self._get_path(pk)
+            if path.exists():
+                result[pk] = self._serializer.decode(path.read_bytes())
+        return result
+
     def __setitem__(self, pk: str, b: ResourceMeta) -> None:
         path = self._get_path(pk)
         with path.open("wb") as f:
@@ -94,15 +442,37 @@ class DiskMetaStore(IFastMetaStore):
     def __len__(self) -> int:
         return len(list(self._rootdir.glob(f"*{self._suffix}")))
 
+    def _load(self, pk: str) -> ResourceMeta | None:
+        try:
+            return self._serializer.decode(self._get_path(pk).read_bytes())
+        except FileNotFoundError:
+            return None
+
     def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
-        results: list[ResourceMeta] = []
-        for file in self._rootdir.glob(f"*{self._suffix}"):
-            with file.open("rb") as f:
-                meta = self._serializer.decode(f.read())
-                if is_match_query(meta, query):
-                    results.append(meta)
-        results.sort(key=get_sort_fn([] if query.sorts is UNSET else query.sorts))
-        yield from results[query.offset : query.offset + query.limit]
+        page = paginate_by_resource_id(self, self._load, query)
+        if page is not None:
+            yield from page
+            return
+        match = compile_query(query)
+        yield from sort_and_paginate(
+            (
+                meta
+                for meta in map(self._load, list(self))
+                if meta is not None and match(meta)
+            ),
+            query,
+        )
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        if not has_search_filters(query):
+            return clamp_count(len(self), query)
+        return count_matches(
+            (
+                self._serializer.decode(file.read_bytes())
+                for file in self._rootdir.glob(f"*{self._suffix}")
+            ),
+            query,
+        )
 
     @contextmanager
     def get_then_delete(self) -> Generator[Iterable[ResourceMeta]]:
@@ -1,6 +1,6 @@
 import datetime as dt
 import json
-from collections.abc import Generator, Iterable
+from collections.abc import Collection, Generator, Iterable
 from contextlib import contextmanager
 from enum import Enum as EnumType
 
@@ -11,6 +11,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     Index,
+    Integer,
     LargeBinary,
     MetaData,
     Numeric,
@@ -18,16 +19,21 @@ from sqlalchemy import (
     Table,
     Text,
     and_,
+    bindparam,
     case,
     create_engine,
     delete,
+    false,
     func,
+    inspect,
+    literal,
     literal_column,
     not_,
     or_,
     select,
     text,
 )
+from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
@@ -36,7 +42,14 @@ from sqlalchemy.types import TypeDecorator
 from autocrud.resource_manager.basic import (
     Encoding,
     ISlowMetaStore,
+    MetaLayout,
     MsgspecSerializer,
+    clamp_count,
+    decode_search_cursor,
+    get_keyset_sorts,
+    get_search_sorts,
+    restore_utc_offset,
+    utc_offset_seconds,
 )
 from autocrud.types import (
     DataSearchFilter,
@@ -50,6 +63,11 @@ from autocrud.types import (
     ResourceMetaSortDirection,
 )
 
+# 分批查詢，避免超過部分資料庫的 IN 參數上限（例如 Oracle 的 1000）
+_GET_MANY_CHUNK_SIZE = 500
+# 遷移到 MetaLayout.columns 時每個交易處理的筆數
+_MIGRATE_BATCH_SIZE = 1000
+
 
 class DialectType(EnumType):
     """Helper Enum type for SQLAlchemy to store the database dialect name."""
@@ -80,23 +98,48 @@ class _JSONEncodedDict(TypeDecorator):
         return value
 
 
+def _native_columns() -> list[Column]:
+    """Extra columns of ``MetaLayout.columns``.
+
+    The ``*_offset`` columns keep the UTC offset (seconds) of the stored
+    times; ``NULL`` marks a naive datetime.
+    """
+    return [
+        Column("current_revision_id", String(255), nullable=True),
+        Column("total_revision_count", Integer, nullable=True),
+        Column("created_time_offset", Integer, nullable=True),
+        Column("updated_time_offset", Integer, nullable=True),
+    ]
+
+
 def _build_resource_meta_table(
-    table_name: str, metadata: MetaData, *, dialect: DialectType
+    table_name: str,
+    metadata: MetaData,
+    *,
+    dialect: DialectType,
+    layout: MetaLayout = MetaLayout.blob,
 ) -> Table:
     """Build the SQLAlchemy Table object for resource metadata."""
     indexed_data_type = JSONB if dialect == DialectType.postgresql else _JSONEncodedDict
+    time_type = DateTime(timezone=True)
+    extra = []
+    if layout == MetaLayout.columns:
+        # 時間直接從欄位讀回，MySQL 的 DATETIME 預設會捨去微秒
+        time_type = time_type.with_variant(mysql.DATETIME(fsp=6), "mysql", "mariadb")
+        extra = _native_columns()
     table = Table(
         table_name,
         metadata,
         Column("resource_id", String(255), primary_key=True),
         Column("data", LargeBinary, nullable=False),
-        Column("created_time", DateTime(timezone=True), nullable=False),
-        Column("updated_time", DateTime(timezone=True), nullable=False),
+        Column("created_time", time_type, nullable=False),
+        Column("updated_time", time_type, nullable=False),
         Column("created_by", String(255), nullable=False),
         Column("updated_by", String(255), nullable=False),
         Column("is_deleted", Boolean, nullable=False),
         Column("schema_version", String(100), nullable=True),
         Column("indexed_data", indexed_data_type, nullable=True),
+        *extra,
     )
     Index(f"ix_{table_name}_created_time", table.c.created_time)
     Index(f"ix_{table_name}_updated_time", table.c.updated_time)
@@ -111,6 +154,13 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
 
     This implementation uses SQLAlchemy Core expressions (no raw SQL text)
     so that it is portable across PostgreSQL, SQLite, MySQL, etc.
+
+    With ``layout=MetaLayout.columns`` every meta field is stored in its own
+    column and metas are built from the columns instead of decoding the
+    ``data`` blob.  Missing columns are added to an existing table and its
+    blob rows are migrated in place, a batch per transaction.  The switch is
+    one way.  ``indexed_data`` is read back from its JSON column, so its
+    values come back as JSON types (as with ``Encoding.json``).
     """
 
     def __init__(
@@ -121,12 +171,14 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
         table_name: str = "resource_meta",
         engine: Engine | None = None,
         engine_kwargs: dict | None = None,
+        layout: MetaLayout = MetaLayout.blob,
     ):
         self._serializer = MsgspecSerializer(
             encoding=encoding,
             resource_type=ResourceMeta,
         )
         self.table_name = table_name
+        self.layout = MetaLayout(layout)
 
         if engine is not None:
             self._engine = engine
@@ -138,15 +190,21 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
 
         self._metadata = MetaData()
         self._table = _build_resource_meta_table(
-            table_name, self._metadata, dialect=self._get_dialect()
+            table_name, self._metadata, dialect=self._get_dialect(), layout=self.layout
         )
         self._Session = sessionmaker(bind=self._engine)
 
         # Create tables
         self._metadata.create_all(self._engine)
+        if self.layout == MetaLayout.blob:
+            self._check_blob_layout()
+        if self.layout == MetaLayout.columns:
+            self._add_native_columns()
 
         # Migrate existing data
         self._migrate_existing_data()
+        if self.layout == MetaLayout.columns:
+            self._migrate_to_columns()
 
     # ------------------------------------------------------------------
     # Session helpers
@@ -166,11 +224,110 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
     # ------------------------------------------------------------------
     # Migration
     # ------------------------------------------------------------------
+    def _has_blob(self):
+        """Rows whose meta is still in the ``data`` blob."""
+        data = self._table.c.data
+        if self._get_dialect() == DialectType.oracle:
+            return func.dbms_lob.getlength(data) > 0
+        return func.length(data) > 0
+
+    def _check_blob_layout(self):
+        """Refuse a table already migrated to ``MetaLayout.columns``.
+
+        Migrated rows keep an empty ``data`` blob, which the blob layout
+        cannot decode.
+        """
+        t = self._table
+        stmt = (
+            select(t.c.resource_id)
+            .where(or_(t.c.data.is_(None), not_(self._has_blob())))
+            .limit(1)
+        )
+        with self._engine.connect() as conn:
+            migrated = conn.execute(stmt).first()
+        if migrated is not None:
+            raise ValueError(
+                f"{self.table_name} was migrated to MetaLayout.columns; "
+                "open it with layout=MetaLayout.columns"
+            )
+
+    def _add_native_columns(self):
+        """Add the ``MetaLayout.columns`` columns to a blob-layout table."""
+        existing = {
+            column["name"]
+            for column in inspect(self._engine).get_columns(self.table_name)
+        }
+        preparer = self._engine.dialect.identifier_preparer
+        with self._engine.begin() as conn:
+            for column in _native_columns():
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=self._engine.dialect)
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {preparer.quote(self.table_name)} "
+                        f"ADD {preparer.quote(column.name)} {column_type}"
+                    )
+                )
+
+    def _migrate_to_columns(self):
+        """Move blob-layout rows into the ``MetaLayout.columns`` columns."""
+        t = self._table
+        update = (
+            t.update()
+            .where(t.c.resource_id == bindparam("b_resource_id"))
+            .values(
+                current_revision_id=bindparam("b_current_revision_id"),
+                total_revision_count=bindparam("b_total_revision_count"),
+                created_time_offset=bindparam("b_created_time_offset"),
+                updated_time_offset=bindparam("b_updated_time_offset"),
+                # indexed_data 也以 blob 為準（_migrate_existing_data 可能填了 {}）
+                indexed_data=bindparam("b_indexed_data", type_=t.c.indexed_data.type),
+                data=b"",
+            )
+        )
+        last = ""
+        while True:
+            with self._session() as session:
+                rows = session.execute(
+                    select(t.c.resource_id, t.c.data)
+                    .where(t.c.resource_id > last, self._has_blob())
+                    .order_by(t.c.resource_id)
+                    .limit(_MIGRATE_BATCH_SIZE)
+                    .with_for_update()
+                ).fetchall()
+                if not rows:
+                    return
+                params = []
+                for resource_id, data in rows:
+                    meta = self._serializer.decode(data)
+                    params.append(
+                        {
+                            "b_resource_id": resource_id,
+                            "b_current_revision_id": meta.current_revision_id,
+                            "b_total_revision_count": meta.total_revision_count,
+                            "b_created_time_offset": utc_offset_seconds(
+                                meta.created_time
+                            ),
+                            "b_updated_time_offset": utc_offset_seconds(
+                                meta.updated_time
+                            ),
+                            "b_indexed_data": None
+                            if meta.indexed_data is UNSET
+                            else meta.indexed_data,
+                        }
+                    )
+                session.execute(update, params)
+                last = rows[-1][0]
+
     def _migrate_existing_data(self):
         """Fill indexed_data for rows that are missing it."""
         t = self._table
         with self._session() as session:
             stmt = select(t.c.resource_id, t.c.data).where(t.c.indexed_data.is_(None))
+            if self.layout == MetaLayout.columns:
+                # data 為空的是 MetaLayout.columns 的資料
+                stmt = stmt.where(self._has_blob())
             rows = session.execute(stmt).fetchall()
             for resource_id, data_blob in rows:
                 try:
@@ -228,9 +385,10 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
 
     def _meta_to_row(self, meta: ResourceMeta) -> dict:
         indexed = meta.indexed_data if meta.indexed_data is not UNSET else None
-        return {
+        native = self.layout == MetaLayout.columns
+        row = {
             "resource_id": meta.resource_id,
-            "data": self._serializer.encode(meta),
+            "data": b"" if native else self._serializer.encode(meta),
             "created_time": self._to_utc(meta.created_time),
             "updated_time": self._to_utc(meta.updated_time),
             "created_by": meta.created_by,
@@ -239,6 +397,60 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
             "schema_version": meta.schema_version,
             "indexed_data": indexed,
         }
+        if native:
+            row.update(
+                current_revision_id=meta.current_revision_id,
+                total_revision_count=meta.total_revision_count,
+                created_time_offset=utc_offset_seconds(meta.created_time),
+                updated_time_offset=utc_offset_seconds(meta.updated_time),
+            )
+        return row
+
+    def _select_columns(self, indexed_data: bool = True) -> list:
+        """Columns read for a meta by :meth:`_meta_from_row`."""
+        t = self._table
+        if self.layout == MetaLayout.blob:
+            return [t.c.resource_id, t.c.data]
+        columns = [
+            t.c.resource_id,
+            t.c.current_revision_id,
+            t.c.total_revision_count,
+            t.c.created_time,
+            t.c.updated_time,
+            t.c.created_by,
+            t.c.updated_by,
+            t.c.is_deleted,
+            t.c.schema_version,
+            t.c.created_time_offset,
+            t.c.updated_time_offset,
+            t.c.data,
+        ]
+        if indexed_data:
+            columns.append(t.c.indexed_data)
+        return columns
+
+    def _meta_from_row(self, row) -> ResourceMeta:
+        m = row._mapping
+        if m["data"]:
+            # blob layout，或尚未遷移的資料
+            return self._serializer.decode(m["data"])
+        indexed = m.get("indexed_data")
+        return ResourceMeta(
+            current_revision_id=m["current_revision_id"],
+            resource_id=m["resource_id"],
+            schema_version=m["schema_version"],
+            total_revision_count=m["total_revision_count"],
+            created_time=restore_utc_offset(
+                self._from_utc(m["created_time"]), m["created_time_offset"]
+            ),
+            updated_time=restore_utc_offset(
+                self._from_utc(m["updated_time"]), m["updated_time_offset"]
+            ),
+            created_by=m["created_by"],
+            updated_by=m["updated_by"],
+            is_deleted=bool(m["is_deleted"]),
+            indexed_data=UNSET if indexed is None else indexed,
+        )
 
     # ------------------------------------------------------------------
     # ISlowMetaStore interface: save_many
@@ -267,11 +479,25 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
         t = self._table
         with self._session() as session:
             row = session.execute(
-                select(t.c.data).where(t.c.resource_id == pk)
+                select(*self._select_columns()).where(t.c.resource_id == pk)
             ).fetchone()
             if row is None:
                 raise KeyError(pk)
-            return self._serializer.decode(row[0])
+            return self._meta_from_row(row)
+
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        pks = list(dict.fromkeys(pks))
+        t = self._table
+        result: dict[str, ResourceMeta] = {}
+        with self._session() as session:
+            for i in range(0, len(pks), _GET_MANY_CHUNK_SIZE):
+                chunk = pks[i : i + _GET_MANY_CHUNK_SIZE]
+                rows = session.execute(
+                    select(*self._select_columns()).where(t.c.resource_id.in_(chunk))
+                )
+                for row in rows:
+                    result[row.resource_id] = self._meta_from_row(row)
+        return result
 
     def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
         t = self._table
@@ -308,10 +534,8 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
     # ------------------------------------------------------------------
     # Search
     # ------------------------------------------------------------------
-    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+    def _search_filters(self, query: ResourceMetaSearchQuery) -> list:
         t = self._table
-        stmt = select(t.c.data)
-
         filters = []
 
         if query.is_deleted is not UNSET:
@@ -346,26 +570,47 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
                 if clause is not None:
                     filters.append(clause)
 
+        # Keyset pagination: only rows after the cursor
+        keyset_sorts = get_keyset_sorts(query.sorts)
+        if query.after is not UNSET:
+            filters.append(
+                self._keyset_clause(
+                    keyset_sorts, decode_search_cursor(query.after, query.sorts)
+                )
+            )
+
+        return filters
+
+    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+        return self._search(query, self._select_columns())
+
+    def iter_search_fields(
+        self, query: ResourceMetaSearchQuery, fields: Collection[str]
+    ) -> Generator[ResourceMeta]:
+        return self._search(query, self._select_columns("indexed_data" in fields))
+
+    def _search(
+        self, query: ResourceMetaSearchQuery, columns: list
+    ) -> Generator[ResourceMeta]:
+        stmt = select(*columns)
+        filters = self._search_filters(query)
         if filters:
             stmt = stmt.where(*filters)
 
-        # Sorting
-        if query.sorts is not UNSET and query.sorts:
-            order_clauses = []
-            for sort in query.sorts:
-                if isinstance(sort, ResourceMetaSearchSort):
-                    col = getattr(t.c, sort.key.value)
-                    if sort.direction == ResourceMetaSortDirection.ascending:
-                        order_clauses.append(col.asc())
-                    else:
-                        order_clauses.append(col.desc())
-                else:
-                    # ResourceDataSearchSort – sort on indexed_data field
-                    order_expr = self._jsonb_sort_expr(sort.field_path)
-                    if sort.direction == ResourceMetaSortDirection.ascending:
-                        order_clauses.append(order_expr.asc())
-                    else:
-                        order_clauses.append(order_expr.desc())
+        # Sorting (cursor pages append resource_id as a tie-breaker)
+        order_clauses = []
+        for sort in get_search_sorts(query):
+            expr, nullable = self._keyset_sort_expr(sort)
+            if sort.direction == ResourceMetaSortDirection.ascending:
+                clause = expr.asc()
+                if nullable and self._nulls_last_by_default():
+                    clause = clause.nulls_first()
+            else:
+                clause = expr.desc()
+                if nullable and self._nulls_last_by_default():
+                    clause = clause.nulls_last()
+            order_clauses.append(clause)
+        if order_clauses:
             stmt = stmt.order_by(*order_clauses)
 
         stmt = stmt.limit(query.limit).offset(query.offset)
@@ -373,7 +618,68 @@ class SQLAlchemyMetaStore(ISlowMetaStore):
         with self._session() as session:
             rows = session.execute(stmt).fetchall()
             for row in rows:
-                yield self._serializer.decode(row[0])
+                yield self._meta_from_row(row)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        stmt = select(func.count()).select_from(self._table)
+        filters = self._search_filters(query)
+        if filters:
+            stmt = stmt.where(*filters)
+        with self._session() as session:
+            return clamp_count(session.execute(stmt).scalar() or 0, query)
+
+    # ------------------------------------------------------------------
+    # Keyset pagination helpers
+    # ------------------------------------------------------------------
+    def _nulls_last_by_default(self) -> bool:
+        """PostgreSQL and Oracle sort NULLs last when ascending; SQLite and
+        MySQL sort them first.  Keyset pagination needs NULLs first."""
+        return self._get_dialect() in (DialectType.postgresql, DialectType.oracle)
+
+    def _keyset_sort_expr(self, sort):
+        """Return ``(expression, nullable)`` for one keyset sort key."""
+        if isinstance(sort, ResourceMetaSearchSort):
+            return getattr(self._table.c, sort.key.value), False
+        expr = self._jsonb_sort_expr(sort.field_path)
+        if self._get_dialect() == DialectType.postgresql:
+            # Treat JSON null like a missing key (SQL NULL)
+            expr = func.nullif(expr, literal_column("'null'::jsonb"))
+        return expr, True
+
+    def _keyset_clause(self, sorts, values):
+        """Seek predicate selecting rows strictly after the cursor *values*."""
+        keys = []
+        for sort, value in zip(sorts, values, strict=True):
+            expr, nullable = self._keyset_sort_expr(sort)
+            if isinstance(value, dt.datetime):
+                value = self._to_utc(value)
+            elif (
+                value is not None
+                and nullable
+                and self._get_dialect() == DialectType.postgresql
+            ):
+                value = literal(value, JSONB)
+            descending = sort.direction == ResourceMetaSortDirection.descending
+            keys.append((expr, value, descending, nullable))
+
+        disjuncts = []
+        for i, (expr, value, descending, nullable) in enumerate(keys):
+            if value is None:
+                if descending:
+                    continue  # NULLs sort last: nothing comes after them
+                after = expr.is_not(None)
+            elif descending and nullable:
+                after = or_(expr < value, expr.is_(None))
+            elif descending:
+                after = expr < value
+            else:
+                after = expr > value
+            equals = [
+                prev_expr.is_(None) if prev_value is None else prev_expr == prev_value
+                for prev_expr, prev_value, _, _ in keys[:i]
+            ]
+            disjuncts.append(and_(*equals, after))
+        return or_(*disjuncts) if disjuncts else false()
 
     # ------------------------------------------------------------------
     # Dialect-aware helpers for JSONB / JSON extraction
@@ -1,24 +1,38 @@
 import datetime as dt
 import functools
+import hashlib
 import json
 import pickle
+import queue
 import re
 import sqlite3
 import threading
+import time
 from collections import defaultdict
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Collection, Generator, Iterable
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import TypeVar
+from typing import NamedTuple, TypeVar
 
+import msgspec
 from msgspec import UNSET
 
 from autocrud.resource_manager.basic import (
     Encoding,
     ISlowMetaStore,
+    MetaLayout,
     MsgspecSerializer,
+    build_keyset_sql,
+    clamp_count,
+    decode_search_cursor,
+    get_search_sorts,
+    utc_offset_seconds,
 )
 from autocrud.types import (
     DataSearchFilter,
+    DataSearchOperator,
+    IndexableField,
     ResourceMeta,
     ResourceMetaSearchQuery,
     ResourceMetaSearchSort,
@@ -27,36 +41,291 @@ from autocrud.types import (
 
 T = TypeVar("T")
 
+_GET_MANY_CHUNK_SIZE = 500
+
+_COLUMNS = (
+    "resource_id, data, created_time, updated_time, created_by, updated_by, "
+    "is_deleted, schema_version, indexed_data"
+)
+# MetaLayout.columns 額外的欄位；時間欄位的 UTC 偏移（秒），NULL 表示 naive
+_NATIVE_COLUMNS = (
+    "current_revision_id, total_revision_count, "
+    "created_time_offset, updated_time_offset"
+)
+# MetaLayout.columns 讀取的欄位（順序與 _meta_from_row 一致）
+_NATIVE_SELECT = (
+    "resource_id, current_revision_id, total_revision_count, created_time, "
+    "updated_time, created_by, updated_by, is_deleted, schema_version, "
+    "created_time_offset, updated_time_offset, data"
+)
+# 遷移到 MetaLayout.columns 時每個交易處理的筆數
+_MIGRATE_BATCH_SIZE = 1000
+
+
+def _from_timestamp(value: float, offset: int | None) -> dt.datetime:
+    if offset is None:
+        # naive 時間以本地時區存成 timestamp
+        return dt.datetime.fromtimestamp(value)
+    return dt.datetime.fromtimestamp(value, dt.timezone(dt.timedelta(seconds=offset)))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern) -> re.Pattern | None:
+    # 無效的 pattern 也快取起來，不必每一列都重新編譯失敗
+    if not isinstance(pattern, str):
+        return None
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+def _regexp(pattern, item) -> bool:
+    if item is None:
+        return False
+    compiled = _compile_regex(pattern)
+    return compiled is not None and compiled.search(str(item)) is not None
+
+
+# _build_condition 中改用 generated column（及其索引）的運算子
+_INDEXED_OPERATORS = frozenset(
+    {
+        DataSearchOperator.equals,
+        DataSearchOperator.greater_than,
+        DataSearchOperator.greater_than_or_equal,
+        DataSearchOperator.less_than,
+        DataSearchOperator.less_than_or_equal,
+    }
+)
+
+
+class _IndexedColumns(NamedTuple):
+    value: str
+    """Generated column holding ``json_extract`` of the path."""
+    number: str | None
+    """Generated ``CAST(... AS REAL)`` column, for ``int`` / ``float`` fields."""
+
+
+def _is_numeric_field(field: IndexableField) -> bool:
+    field_type = field.field_type
+    return (
+        isinstance(field_type, type)
+        and issubclass(field_type, (int, float))
+        and not issubclass(field_type, bool)
+    )
+
+
+class _ConnectionPool:
+    """Bounded pool of connections shared by threads (tuned mode)."""
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        *,
+        maxconn: int,
+        timeout: float,
+    ):
+        self._connect = connect
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._idle: list[sqlite3.Connection] = []
+        self._size = 0
+        self._closed = False
+
+    def getconn(self) -> sqlite3.Connection:
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while not self._idle and self._size >= self.maxconn:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise sqlite3.OperationalError("connection pool exhausted")
+                self._cond.wait(remaining)
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+        try:
+            return self._connect()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def putconn(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            if not self._closed:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+            self._size -= 1
+        conn.close()
+
+    def closeall(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn in idle:
+            conn.close()
+
+
+class _GroupCommitter:
+    """Run the writes of concurrent callers in shared transactions (tuned mode).
+
+    Callers block until the transaction holding their write has committed.
+    A batch takes every write queued while the previous one was committing;
+    after a batch of several writes the next one may also wait up to
+    *window* seconds for more (like PostgreSQL's ``commit_delay``), so a
+    lone writer is never delayed.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, *, window: float, batch_size: int):
+        self._conn = conn
+        self.window = window
+        self.batch_size = batch_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, op: Callable[[sqlite3.Connection], T]) -> T:
+        future: Future[T] = Future()
+        self._queue.put((op, future))
+        return future.result()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self._conn.close()
+
+    def _run(self) -> None:
+        last_size = 0
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + (self.window if last_size > 1 else 0.0)
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+            last_size = len(batch)
+            if stop:
+                return
+
+    def _commit(self, batch: list) -> None:
+        try:
+            with self._conn:
+                results = [op(self._conn) for op, _ in batch]
+        except Exception:
+            # 整批已 rollback；逐筆重做，只讓失敗的那筆收到例外
+            for op, future in batch:
+                try:
+                    with self._conn:
+                        result = op(self._conn)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            future.set_result(result)
+
 
 class SqliteMetaStore(ISlowMetaStore):
+    """SQLite meta store.
+
+    Arguments:
+        get_conn: Opens a connection; one is kept per thread.
+        encoding: Encoding of the stored :class:`ResourceMeta` blobs.
+        layout: ``MetaLayout.columns`` stores every meta field in its own
+            column and builds metas from the columns instead of decoding the
+            ``data`` blob.  Existing blob rows are migrated in place, a batch
+            per transaction.  The switch is one way.
+        tuned: Profile for bursty writers on a database file (see below).
+            *get_conn* must then open the same file on every call, with
+            ``check_same_thread=False``.
+        pool_size: Most read connections opened in tuned mode.
+        pool_timeout: Seconds a reader waits for a free connection in tuned
+            mode before ``sqlite3.OperationalError`` is raised.
+        commit_window: Seconds the tuned-mode writer may hold a batch open
+            for more writes.  ``0`` commits the writes that queued up while
+            the previous batch was committing, without waiting; a window only
+            pays off when commits are slow.
+        commit_batch_size: Most writes committed in one tuned-mode transaction.
+
+    In the columns layout ``indexed_data`` is read back from its JSON column,
+    so its values come back as JSON types (as with ``Encoding.json``).
+
+    Tuned mode switches the database to WAL with ``synchronous=NORMAL`` so
+    readers and the writer do not block each other.  Reads borrow from a
+    bounded connection pool; writes go through one writer connection that
+    group-commits the writes of concurrent callers, each caller returning
+    once its write is committed.  :meth:`ensure_indexes` adds a virtual
+    generated column and an index per indexed field, and searches on those
+    fields use the columns.  Call :meth:`close` to release the connections.
+    """
+
     def __init__(
         self,
         *,
         get_conn: Callable[[], sqlite3.Connection],
         encoding: Encoding = Encoding.json,
+        layout: MetaLayout = MetaLayout.blob,
+        tuned: bool = False,
+        pool_size: int = 4,
+        pool_timeout: float = 30.0,
+        commit_window: float = 0.0,
+        commit_batch_size: int = 1000,
     ):
         self._serializer = MsgspecSerializer(
             encoding=encoding,
             resource_type=ResourceMeta,
         )
+        self.layout = MetaLayout(layout)
+        self._columns = _COLUMNS
+        if self.layout == MetaLayout.columns:
+            self._columns += ", " + _NATIVE_COLUMNS
+
+        self.tuned = tuned
+        # field_path -> 有索引的 generated column（僅 tuned mode）
+        self._indexed_columns: dict[str, _IndexedColumns] = {}
+        self._pool: _ConnectionPool | None = None
+        self._committer: _GroupCommitter | None = None
 
         def _get_conn_wrapper():
             conn = get_conn()
-
-            def regexp(expr, item):
-                if item is None:
-                    return False
-                try:
-                    return re.search(expr, str(item)) is not None
-                except Exception:
-                    return False
-
-            conn.create_function("REGEXP", 2, regexp)
+            conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+            if tuned:
+                # WAL 下 NORMAL 只在 checkpoint 時 fsync，commit 不再等磁碟
+                conn.execute("PRAGMA synchronous=NORMAL")
             return conn
 
         self._get_conn = _get_conn_wrapper
         self._conns: dict[int, sqlite3.Connection] = defaultdict(self._get_conn)
-        _conn = self._conns[threading.get_ident()]
+        if tuned:
+            # 這條連線之後交給 _GroupCommitter 專門寫入
+            _conn = self._get_conn()
+            # journal_mode 記錄在資料庫檔案中，其他連線也會使用 WAL
+            _conn.execute("PRAGMA journal_mode=WAL")
+            _conn.isolation_level = "IMMEDIATE"
+        else:
+            _conn = self._conns[threading.get_ident()]
         _conn.execute("""
             CREATE TABLE IF NOT EXISTS resource_meta (
                 resource_id TEXT PRIMARY KEY,
@@ -80,6 +349,18 @@ class SqliteMetaStore(ISlowMetaStore):
         if "schema_version" not in columns:
             _conn.execute("ALTER TABLE resource_meta ADD COLUMN schema_version TEXT")
             _conn.commit()
+        if self.layout == MetaLayout.columns:
+            for column, column_type in (
+                ("current_revision_id", "TEXT"),
+                ("total_revision_count", "INTEGER"),
+                ("created_time_offset", "INTEGER"),
+                ("updated_time_offset", "INTEGER"),
+            ):
+                if column not in columns:
+                    _conn.execute(
+                        f"ALTER TABLE resource_meta ADD COLUMN {column} {column_type}"
+                    )
+            _conn.commit()
 
         _conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_created_time ON resource_meta(created_time)
@@ -97,17 +378,43 @@ class SqliteMetaStore(ISlowMetaStore):
             CREATE INDEX IF NOT EXISTS idx_is_deleted ON resource_meta(is_deleted)
         """)
 
+        if self.layout == MetaLayout.blob:
+            self._check_blob_layout(_conn)
         # 遷移已存在的記錄，填充 indexed_data
-        self._migrate_existing_data()
+        self._migrate_existing_data(_conn)
 
         _conn.commit()
+        if self.layout == MetaLayout.columns:
+            self._migrate_to_columns(_conn)
+        if tuned:
+            self._pool = _ConnectionPool(
+                self._get_conn, maxconn=pool_size, timeout=pool_timeout
+            )
+            self._committer = _GroupCommitter(
+                _conn, window=commit_window, batch_size=commit_batch_size
+            )
+
+    def _check_blob_layout(self, _conn: sqlite3.Connection) -> None:
+        """Refuse a table already migrated to ``MetaLayout.columns``.
+
+        Migrated rows keep an empty ``data`` blob, which the blob layout
+        cannot decode.
+        """
+        migrated = _conn.execute(
+            "SELECT 1 FROM resource_meta WHERE length(data) = 0 LIMIT 1"
+        ).fetchone()
+        if migrated is not None:
+            raise ValueError(
+                "resource_meta was migrated to MetaLayout.columns; "
+                "open it with layout=MetaLayout.columns"
+            )
 
-    def _migrate_existing_data(self):
+    def _migrate_existing_data(self, _conn: sqlite3.Connection):
         """為已存在但沒有 indexed_data 的記錄填充索引數據"""
-        _conn = self._conns[threading.get_ident()]
+        # data 為空的是 MetaLayout.columns 的資料，indexed_data 本來就是 NULL
         cursor = _conn.execute("""
             SELECT resource_id, data FROM resource_meta 
-            WHERE indexed_data IS NULL OR indexed_data = ''
+            WHERE (indexed_data IS NULL OR indexed_data = '') AND length(data) > 0
         """)
 
         for resource_id, data_blob in cursor.fetchall():
@@ -131,103 +438,221 @@ class SqliteMetaStore(ISlowMetaStore):
                     (resource_id,),
                 )
 
-    def __getitem__(self, pk: str) -> ResourceMeta:
-        _conn = self._conns[threading.get_ident()]
-        cursor = _conn.execute(
-            "SELECT data FROM resource_meta WHERE resource_id = ?",
-            (pk,),
+    def _migrate_to_columns(self, _conn: sqlite3.Connection) -> None:
+        """Move blob-layout rows into the ``MetaLayout.columns`` columns."""
+        last = ""
+        while True:
+            with _conn:
+                rows = _conn.execute(
+                    """
+                    SELECT resource_id, data FROM resource_meta
+                    WHERE resource_id > ? AND length(data) > 0
+                    ORDER BY resource_id LIMIT ?
+                    """,
+                    (last, _MIGRATE_BATCH_SIZE),
+                ).fetchall()
+                if not rows:
+                    return
+                metas = [self._serializer.decode(data) for _, data in rows]
+                # indexed_data 也以 blob 為準（_migrate_existing_data 可能填了 '{}'）
+                _conn.executemany(
+                    """
+                    UPDATE resource_meta SET current_revision_id = ?,
+                        total_revision_count = ?, created_time_offset = ?,
+                        updated_time_offset = ?, indexed_data = ?, data = X''
+                    WHERE resource_id = ?
+                    """,
+                    [
+                        (
+                            meta.current_revision_id,
+                            meta.total_revision_count,
+                            utc_offset_seconds(meta.created_time),
+                            utc_offset_seconds(meta.updated_time),
+                            None
+                            if meta.indexed_data is UNSET
+                            else json.dumps(meta.indexed_data, ensure_ascii=False),
+                            resource_id,
+                        )
+                        for (resource_id, _), meta in zip(rows, metas, strict=True)
+                    ],
+                )
+                last = rows[-1][0]
+
+    def _select(self, indexed_data: bool = True) -> str:
+        """Columns read for a meta, in the order :meth:`_meta_from_row` expects."""
+        if self.layout == MetaLayout.blob:
+            return "data"
+        return _NATIVE_SELECT + (", indexed_data" if indexed_data else ", NULL")
+
+    def _meta_from_row(self, row) -> ResourceMeta:
+        if self.layout == MetaLayout.blob:
+            return self._serializer.decode(row[0])
+        (
+            resource_id,
+            current_revision_id,
+            total_revision_count,
+            created_time,
+            updated_time,
+            created_by,
+            updated_by,
+            is_deleted,
+            schema_version,
+            created_time_offset,
+            updated_time_offset,
+            data,
+            indexed_data,
+        ) = row
+        if data:
+            # 尚未遷移的資料
+            return self._serializer.decode(data)
+        return ResourceMeta(
+            current_revision_id=current_revision_id,
+            resource_id=resource_id,
+            schema_version=schema_version,
+            total_revision_count=total_revision_count,
+            created_time=_from_timestamp(created_time, created_time_offset),
+            updated_time=_from_timestamp(updated_time, updated_time_offset),
+            created_by=created_by,
+            updated_by=updated_by,
+            is_deleted=bool(is_deleted),
+            indexed_data=UNSET
+            if indexed_data is None
+            else msgspec.json.decode(indexed_data),
         )
-        row = cursor.fetchone()
-        if row is None:
-            raise KeyError(pk)
-        return self._serializer.decode(row[0])
 
-    def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
-        import json
-
-        data = self._serializer.encode(meta)
-        # 將 indexed_data 轉換為 JSON 字符串
-        indexed_data_json = (
-            json.dumps(meta.indexed_data, ensure_ascii=False)
-            if meta.indexed_data is not UNSET
-            else None
-        )
-        _conn = self._conns[threading.get_ident()]
-        _conn.execute(
-            """
-            INSERT OR REPLACE INTO resource_meta 
-            (resource_id, data, created_time, updated_time, created_by, updated_by, is_deleted, schema_version, indexed_data)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+    def _row(self, meta: ResourceMeta) -> tuple:
+        native = self.layout == MetaLayout.columns
+        row = (
+            meta.resource_id,
+            b"" if native else self._serializer.encode(meta),
+            meta.created_time.timestamp(),
+            meta.updated_time.timestamp(),
+            meta.created_by,
+            meta.updated_by,
+            1 if meta.is_deleted else 0,
+            meta.schema_version,
+            # 將 indexed_data 轉換為 JSON 字符串
             (
-                pk,
-                data,
-                meta.created_time.timestamp(),
-                meta.updated_time.timestamp(),
-                meta.created_by,
-                meta.updated_by,
-                1 if meta.is_deleted else 0,
-                meta.schema_version,
-                indexed_data_json,
+                json.dumps(meta.indexed_data, ensure_ascii=False)
+                if meta.indexed_data is not UNSET
+                else None
             ),
         )
-        _conn.commit()
+        if native:
+            row += (
+                meta.current_revision_id,
+                meta.total_revision_count,
+                utc_offset_seconds(meta.created_time),
+                utc_offset_seconds(meta.updated_time),
+            )
+        return row
+
+    def _insert_sql(self) -> str:
+        placeholders = ", ".join("?" * len(self._columns.split(", ")))
+        return (
+            f"INSERT OR REPLACE INTO resource_meta ({self._columns}) "
+            f"VALUES ({placeholders})"
+        )
+
+    @contextmanager
+    def _connection(self) -> Generator[sqlite3.Connection]:
+        """Connection for reads: pooled in tuned mode, else the thread's own."""
+        if self._pool is None:
+            yield self._conns[threading.get_ident()]
+            return
+        conn = self._pool.getconn()
+        try:
+            yield conn
+        finally:
+            self._pool.putconn(conn)
+
+    def _write(self, op: Callable[[sqlite3.Connection], T]) -> T:
+        """Run *op* in a committed write transaction."""
+        if self._committer is not None:
+            return self._committer.submit(op)
+        _conn = self._conns[threading.get_ident()]
+        with _conn:
+            return op(_conn)
+
+    def close(self) -> None:
+        """Close the connections the store opened."""
+        if self._committer is not None:
+            # SQLite 建議長時間使用的連線關閉前執行，更新查詢規劃用的統計
+            self._write(lambda _conn: _conn.execute("PRAGMA optimize"))
+            self._committer.close()
+        if self._pool is not None:
+            self._pool.closeall()
+        for conn in self._conns.values():
+            # 其他執行緒的連線不能在這裡關閉，交給 GC
+            with suppress(sqlite3.ProgrammingError):
+                conn.close()
+        self._conns.clear()
+
+    def __getitem__(self, pk: str) -> ResourceMeta:
+        with self._connection() as _conn:
+            row = _conn.execute(
+                f"SELECT {self._select()} FROM resource_meta WHERE resource_id = ?",
+                (pk,),
+            ).fetchone()
+        if row is None:
+            raise KeyError(pk)
+        return self._meta_from_row(row)
+
+    def get_many(self, pks: Iterable[str]) -> dict[str, ResourceMeta]:
+        pks = list(dict.fromkeys(pks))
+        result: dict[str, ResourceMeta] = {}
+        with self._connection() as _conn:
+            # SQLite 對單一語句的參數數量有上限，分批查詢
+            for i in range(0, len(pks), _GET_MANY_CHUNK_SIZE):
+                chunk = pks[i : i + _GET_MANY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = _conn.execute(
+                    f"SELECT {self._select()} FROM resource_meta "
+                    f"WHERE resource_id IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor:
+                    meta = self._meta_from_row(row)
+                    result[meta.resource_id] = meta
+        return result
+
+    def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
+        sql, row = self._insert_sql(), (pk, *self._row(meta)[1:])
+        self._write(lambda _conn: _conn.execute(sql, row))
 
     def save_many(self, metas):
         """批量保存元数据到 SQLite（ISlowMetaStore 接口方法）"""
-        import json
-
         if not metas:
             return
 
-        sql = """
-        INSERT OR REPLACE INTO resource_meta 
-        (resource_id, data, created_time, updated_time, created_by, updated_by, is_deleted, schema_version, indexed_data)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        _conn = self._conns[threading.get_ident()]
-        with _conn:
-            _conn.executemany(
-                sql,
-                [
-                    (
-                        meta.resource_id,
-                        self._serializer.encode(meta),
-                        meta.created_time.timestamp(),
-                        meta.updated_time.timestamp(),
-                        meta.created_by,
-                        meta.updated_by,
-                        1 if meta.is_deleted else 0,
-                        meta.schema_version,
-                        (
-                            json.dumps(meta.indexed_data, ensure_ascii=False)
-                            if meta.indexed_data is not UNSET
-                            else None
-                        ),
-                    )
-                    for meta in metas
-                ],
-            )
+        # 在呼叫端的執行緒編碼，寫入端只執行 SQL
+        sql, rows = self._insert_sql(), [self._row(meta) for meta in metas]
+        self._write(lambda _conn: _conn.executemany(sql, rows))
 
     def __delitem__(self, pk: str) -> None:
-        _conn = self._conns[threading.get_ident()]
-        cursor = _conn.execute("DELETE FROM resource_meta WHERE resource_id = ?", (pk,))
-        if cursor.rowcount == 0:
+        deleted = self._write(
+            lambda _conn: (
+                _conn.execute(
+                    "DELETE FROM resource_meta WHERE resource_id = ?", (pk,)
+                ).rowcount
+            )
+        )
+        if deleted == 0:
             raise KeyError(pk)
-        _conn.commit()
 
     def __iter__(self) -> Generator[str]:
-        _conn = self._conns[threading.get_ident()]
-        cursor = _conn.execute("SELECT resource_id FROM resource_meta")
-        for row in cursor:
+        with self._connection() as _conn:
+            rows = _conn.execute("SELECT resource_id FROM resource_meta").fetchall()
+        for row in rows:
             yield row[0]
 
     def __len__(self) -> int:
-        _conn = self._conns[threading.get_ident()]
-        cursor = _conn.execute("SELECT COUNT(*) FROM resource_meta")
-        return cursor.fetchone()[0]
+        with self._connection() as _conn:
+            cursor = _conn.execute("SELECT COUNT(*) FROM resource_meta")
+            return cursor.fetchone()[0]
 
-    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+    def _build_search(self, query: ResourceMetaSearchQuery) -> tuple[str, list, str]:
+        """構建搜尋用的 WHERE 子句、參數與 ORDER BY 子句"""
         conditions = []
         params = []
 
@@ -277,45 +702,117 @@ class SqliteMetaStore(ISlowMetaStore):
                     conditions.append(json_condition)
                     params.extend(json_params)
 
+        # 構建排序子句（cursor 分頁時附加 resource_id 作為 tie-breaker）
+        keyset_sorts = get_search_sorts(query)
+        keyset_columns: list[tuple[str, str, bool, bool]] = []
+        for sort in keyset_sorts:
+            descending = sort.direction == ResourceMetaSortDirection.descending
+            if isinstance(sort, ResourceMetaSearchSort):
+                keyset_columns.append((sort.key.value, "?", descending, False))
+            else:
+                # 使用 JSON 提取語法對 indexed_data 中的欄位進行排序
+                json_extract = f"json_extract(indexed_data, '$.\"{sort.field_path}\"')"
+                indexed = self._indexed_columns.get(sort.field_path)
+                if indexed is not None:
+                    json_extract = indexed.value
+                keyset_columns.append((json_extract, "?", descending, True))
+        order_clause = ""
+        if keyset_columns:
+            order_clause = "ORDER BY " + ", ".join(
+                f"{expr} {'DESC' if descending else 'ASC'}"
+                for expr, _, descending, _ in keyset_columns
+            )
+
+        # Keyset 分頁：只取 cursor 之後的資料
+        if query.after is not UNSET:
+            values = decode_search_cursor(query.after, query.sorts)
+            values = [
+                v.timestamp() if isinstance(v, dt.datetime) else v for v in values
+            ]
+            seek_condition, seek_params = build_keyset_sql(keyset_columns, values)
+            conditions.append(seek_condition)
+            params.extend(seek_params)
+
         # 構建 WHERE 子句
         where_clause = ""
         if conditions:
             where_clause = "WHERE " + " AND ".join(conditions)
+        return where_clause, params, order_clause
 
-        # 構建排序子句
-        order_clause = ""
-        if query.sorts is not UNSET and query.sorts:
-            order_parts = []
-            for sort in query.sorts:
-                if isinstance(sort, ResourceMetaSearchSort):
-                    direction = (
-                        "ASC"
-                        if sort.direction == ResourceMetaSortDirection.ascending
-                        else "DESC"
-                    )
-                    order_parts.append(f"{sort.key} {direction}")
-                else:
-                    # ResourceDataSearchSort - 處理 indexed_data 欄位排序
-                    direction = (
-                        "ASC"
-                        if sort.direction == ResourceMetaSortDirection.ascending
-                        else "DESC"
-                    )
-                    # 使用 JSON 提取語法對 indexed_data 中的欄位進行排序
-                    json_extract = (
-                        f"json_extract(indexed_data, '$.\"{sort.field_path}\"')"
-                    )
-                    order_parts.append(f"{json_extract} {direction}")
-            order_clause = "ORDER BY " + ", ".join(order_parts)
+    def iter_search(self, query: ResourceMetaSearchQuery) -> Generator[ResourceMeta]:
+        return self._search(query, self._select())
+
+    def iter_search_fields(
+        self, query: ResourceMetaSearchQuery, fields: Collection[str]
+    ) -> Generator[ResourceMeta]:
+        return self._search(query, self._select("indexed_data" in fields))
+
+    def _search(
+        self, query: ResourceMetaSearchQuery, select: str
+    ) -> Generator[ResourceMeta]:
+        where_clause, params, order_clause = self._build_search(query)
 
         # 在 SQL 層面應用分頁
-        sql = f"SELECT data FROM resource_meta {where_clause} {order_clause} LIMIT ? OFFSET ?"
+        sql = f"SELECT {select} FROM resource_meta {where_clause} {order_clause} LIMIT ? OFFSET ?"
         params.extend([query.limit, query.offset])
 
-        cursor = self._conns[threading.get_ident()].execute(sql, params)
+        with self._connection() as _conn:
+            rows = _conn.execute(sql, params).fetchall()
+
+        for row in rows:
+            yield self._meta_from_row(row)
+
+    def count(self, query: ResourceMetaSearchQuery) -> int:
+        where_clause, params, _ = self._build_search(query)
+        with self._connection() as _conn:
+            cursor = _conn.execute(
+                f"SELECT COUNT(*) FROM resource_meta {where_clause}", params
+            )
+            return clamp_count(cursor.fetchone()[0], query)
+
+    def ensure_indexes(self, indexed_fields: Iterable[IndexableField]) -> None:
+        """Index every indexed data field through virtual generated columns.
+
+        Only done in tuned mode.  Each path gets a ``json_extract`` column,
+        and ``int`` / ``float`` fields also a ``CAST(... AS REAL)`` column for
+        range comparisons; equality / range searches and sorts on the path
+        use the columns so SQLite can use their indexes instead of evaluating
+        ``json_extract`` per row.  Columns of fields no longer indexed are left in place.
+        """
+        if not self.tuned:
+            return
+        wanted: dict[str, _IndexedColumns] = {}
+        for field in indexed_fields:
+            digest = hashlib.sha1(field.field_path.encode()).hexdigest()[:12]
+            wanted[field.field_path] = _IndexedColumns(
+                f"ix_{digest}",
+                f"ixn_{digest}" if _is_numeric_field(field) else None,
+            )
+
+        def _create(_conn: sqlite3.Connection) -> None:
+            existing = {
+                row[1] for row in _conn.execute("PRAGMA table_xinfo(resource_meta)")
+            }
+            for field_path, indexed in wanted.items():
+                json_extract = f"json_extract(indexed_data, '$.\"{field_path}\"')"
+                columns = [(indexed.value, json_extract)]
+                if indexed.number is not None:
+                    columns.append((indexed.number, f"CAST({json_extract} AS REAL)"))
+                for column, expression in columns:
+                    if column not in existing:
+                        _conn.execute(
+                            f"ALTER TABLE resource_meta ADD COLUMN {column} "
+                            f"GENERATED ALWAYS AS ({expression}) VIRTUAL"
+                        )
+                    _conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{column} "
+                        f"ON resource_meta({column})"
+                    )
+            # 為新索引收集統計，低選擇性的欄位才不會蓋過 LIMIT 的主鍵掃描
+            _conn.execute("PRAGMA optimize")
 
-        for row in cursor:
-            yield self._serializer.decode(row[0])
+        self._write(_create)
+        self._indexed_columns = wanted
 
     def _build_condition(self, condition: DataSearchFilter) -> tuple[str, list]:
         """構建 SQLite 查詢條件 (支援 Meta 欄位與 JSON 欄位)"""
@@ -442,6 +939,15 @@ class SqliteMetaStore(ISlowMetaStore):
 
         # SQLite JSON 提取語法: json_extract(indexed_data, '$.field_path')
         json_extract = f"json_extract(indexed_data, '$.\"{field_path}\"')"
+        indexed = None
+        # 只有等值與範圍條件走 generated column 的索引；IN / LIKE / REGEXP 等
+        # 低選擇性條件保留 json_extract，否則 SQLite 會捨棄 LIMIT 的主鍵掃描，
+        # 改為走索引後逐筆回表排序
+        if condition.transform is None and operator in _INDEXED_OPERATORS:
+            indexed = self._indexed_columns.get(field_path)
+        if indexed is not None:
+            # 有索引的 generated column，值與 json_extract 相同
+            json_extract = indexed.value
 
         # Apply field transformation if specified
         if condition.transform is not None:
@@ -461,6 +967,10 @@ class SqliteMetaStore(ISlowMetaStore):
                     ELSE NULL
                 END"""
 
+        number = f"CAST({json_extract} AS REAL)"
+        if indexed is not None and indexed.number is not None:
+            number = indexed.number
+
         if operator == DataSearchOperator.equals:
             # Handle list/dict comparison for JSON fields
             if isinstance(value, (list, dict)):
@@ -483,13 +993,13 @@ class SqliteMetaStore(ISlowMetaStore):
                 ]
             return f"{json_extract} != ?", [value]
         if operator == DataSearchOperator.greater_than:
-            return f"CAST({json_extract} AS REAL) > ?", [value]
+            return f"{number} > ?", [value]
         if operator == DataSearchOperator.greater_than_or_equal:
-            return f"CAST({json_extract} AS REAL) >= ?", [value]
+            return f"{number} >= ?", [value]
         if operator == DataSearchOperator.less_than:
-            return f"CAST({json_extract} AS REAL) < ?", [value]
+            return f"{number} < ?", [value]
         if operator == DataSearchOperator.less_than_or_equal:
-            return f"CAST({json_extract} AS REAL) <= ?", [value]
+            return f"{number} <= ?", [value]
         if operator == DataSearchOperator.contains:
             return f"{json_extract} LIKE ?", [f"%{value}%"]
         if operator == DataSearchOperator.starts_with:
@@ -536,15 +1046,38 @@ class SqliteMetaStore(ISlowMetaStore):
 
 
 class FileSqliteMetaStore(SqliteMetaStore):
-    def __init__(self, *, db_filepath: Path, encoding=Encoding.json):
-        get_conn = functools.partial(sqlite3.connect, db_filepath)
-        super().__init__(get_conn=get_conn, encoding=encoding)
+    def __init__(
+        self,
+        *,
+        db_filepath: Path,
+        encoding=Encoding.json,
+        layout: MetaLayout = MetaLayout.blob,
+        tuned: bool = False,
+        pool_size: int = 4,
+        pool_timeout: float = 30.0,
+        commit_window: float = 0.0,
+        commit_batch_size: int = 1000,
+    ):
+        # tuned mode 的連線在執行緒間共用
+        get_conn = functools.partial(
+            sqlite3.connect, db_filepath, check_same_thread=not tuned
+        )
+        super().__init__(
+            get_conn=get_conn,
+            encoding=encoding,
+            layout=layout,
+            tuned=tuned,
+            pool_size=pool_size,
+            pool_timeout=pool_timeout,
+            commit_window=commit_window,
+            commit_batch_size=commit_batch_size,
+        )
 
 
 class MemorySqliteMetaStore(SqliteMetaStore):
-    def __init__(self, *, encoding=Encoding.json):
+    def __init__(self, *, encoding=Encoding.json, layout: MetaLayout = MetaLayout.blob):
         get_conn = functools.partial(sqlite3.connect, ":memory:")
-        super().__init__(get_conn=get_conn, encoding=encoding)
+        super().__init__(get_conn=get_conn, encoding=encoding, layout=layout)
 
 
 class S3ConflictError(Exception):
@@ -818,6 +1351,11 @@ class S3SqliteMetaStore(SqliteMetaStore):
         self._check_and_reload_if_needed()
         return super().__getitem__(pk)
 
+    def get_many(self, pks):
+        """Get many resource metadata, checking S3 for updates first if enabled"""
+        self._check_and_reload_if_needed()
+        return super().get_many(pks)
+
     def __setitem__(self, pk: str, meta: ResourceMeta) -> None:
         super().__setitem__(pk, meta)
         self._maybe_sync()
@@ -836,6 +1374,16 @@ class S3SqliteMetaStore(SqliteMetaStore):
         self._check_and_reload_if_needed()
         return super().iter_search(query)
 
+    def iter_search_fields(self, query, fields):
+        """Search with only *fields* loaded, checking S3 for updates first if enabled"""
+        self._check_and_reload_if_needed()
+        return super().iter_search_fields(query, fields)
+
+    def count(self, query):
+        """Count resources, checking S3 for updates first if enabled"""
+        self._check_and_reload_if_needed()
+        return super().count(query)
+
     def save_many(self, metas):
         super().save_many(metas)
         self._maybe_sync()
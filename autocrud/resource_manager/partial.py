@@ -1,9 +1,12 @@
+import threading
+from collections import OrderedDict
 from typing import Any, Iterable, NamedTuple, TypeVar, Union
 
 import msgspec
 from jsonpointer import JsonPointer
 from msgspec import UNSET, Struct, UnsetType, defstruct
 
+from autocrud.resource_manager.basic import Encoding
 from autocrud.util.type_utils import (
     get_list_item_type,
     get_union_args,
@@ -133,6 +136,123 @@ def _build_type(current_type: Any, paths: list[list[str]], prefix: str) -> Any:
     return current_type
 
 
+class PartialPlan(NamedTuple):
+    """Everything needed to decode a partial view of a resource.
+
+    Built once per ``(base_type, paths, encoding)`` by :class:`PartialTypeCache`
+    and reused by every subsequent partial read.
+    """
+
+    partial_type: Any
+    decoder: msgspec.json.Decoder | msgspec.msgpack.Decoder
+    paths: tuple[tuple[str, ...], ...]
+    needs_pruning: bool
+
+    def decode(self, b: bytes) -> Any:
+        """Decode raw resource bytes into the pruned partial struct."""
+        obj = self.decoder.decode(b)
+        if self.needs_pruning:
+            return _prune(obj, self.paths)
+        return obj
+
+
+class PartialCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PartialTypeCache:
+    """Bounded, thread-safe LRU cache of :class:`PartialPlan` objects.
+
+    ``create_partial_type`` builds a brand-new struct with ``defstruct`` and
+    every new struct needs its own decoder, so building them per row makes a
+    partial listing slower than a full decode.  The cache is keyed by
+    ``(base_type, normalized path tuple, encoding)``.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[tuple, PartialPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        base_type: Any,
+        partial: Iterable[str | JsonPointer],
+        encoding: Encoding = Encoding.json,
+    ) -> PartialPlan:
+        paths = tuple(tuple(p) for p in _normalize_paths(partial))
+        key = (base_type, paths, Encoding(encoding))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable type annotations cannot be cached
+            return self._build(base_type, paths, encoding)
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        # Build outside the lock; a concurrent duplicate build is harmless.
+        plan = self._build(base_type, paths, encoding)
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def cache_info(self) -> PartialCacheInfo:
+        with self._lock:
+            return PartialCacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._plans)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _build(
+        base_type: Any,
+        paths: tuple[tuple[str, ...], ...],
+        encoding: Encoding,
+    ) -> PartialPlan:
+        partial_type = _build_type(base_type, [list(p) for p in paths], "Partial")
+        if encoding == Encoding.msgpack:
+            decoder = msgspec.msgpack.Decoder(partial_type)
+        else:
+            decoder = msgspec.json.Decoder(partial_type)
+        return PartialPlan(
+            partial_type=partial_type,
+            decoder=decoder,
+            paths=paths,
+            needs_pruning=_needs_pruning(paths),
+        )
+
+
+partial_type_cache = PartialTypeCache()
+
+
+def get_partial_plan(
+    base_type: Any,
+    partial: Iterable[str | JsonPointer],
+    encoding: Encoding = Encoding.json,
+) -> PartialPlan:
+    """Return the cached :class:`PartialPlan` for *base_type* and *partial*."""
+    return partial_type_cache.get(base_type, partial, encoding)
+
+
 def prune_object(obj: Any, partial: Iterable[str | JsonPointer]) -> Any:
     paths = _normalize_paths(partial)
     if not _needs_pruning(paths):
@@ -140,7 +260,7 @@ def prune_object(obj: Any, partial: Iterable[str | JsonPointer]) -> Any:
     return _prune(obj, paths)
 
 
-def _needs_pruning(paths: list[list[str]]) -> bool:
+def _needs_pruning(paths: Iterable[Iterable[str]]) -> bool:
     for path in paths:
         for part in path:
             # Check if part is a specific index (digit)
@@ -362,9 +482,9 @@ def filter_struct_partial(
 ) -> Struct:
     """Return a copy of *struct* keeping only the requested fields.
 
-    Uses ``create_partial_type`` to build a lightweight Struct type that
+    Uses the cached partial type (see :func:`get_partial_plan`) that
     contains only the selected fields, then round-trips through msgspec
     JSON encode/decode for the actual filtering.
     """
-    partial_type = create_partial_type(type(struct), fields)
-    return msgspec.json.decode(msgspec.json.encode(struct), type=partial_type)
+    plan = get_partial_plan(type(struct), fields, Encoding.json)
+    return plan.decoder.decode(msgspec.json.encode(struct))
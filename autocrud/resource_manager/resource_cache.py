@@ -0,0 +1,120 @@
+"""Decoded-resource cache for stable revisions.
+
+A ``stable`` revision never changes its bytes, so once its ``RevisionInfo``
+and data have been decoded the result can be served again without touching
+the storage or the decoder.  :class:`ResourceCache` sits in front of any
+``IStorage`` and is consulted by ``ResourceManager.get`` /
+``get_resource_revision`` / ``get_many``.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Generic, NamedTuple, TypeVar
+
+from autocrud.types import Resource
+
+T = TypeVar("T")
+
+RevisionKey = tuple[str, str, str | None]
+
+
+class ResourceCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    maxbytes: int | None
+    currsize: int
+    currbytes: int
+
+
+class ResourceCache(Generic[T]):
+    """Bounded, thread-safe LRU cache of decoded :class:`Resource` objects.
+
+    Entries are keyed by ``(resource_id, revision_id, schema_version)`` and
+    evicted least-recently-used first once either budget is exceeded:
+
+    Arguments:
+        maxsize: Maximum number of entries (``None`` for no limit).
+        maxbytes: Maximum total size of the encoded data of the cached
+            revisions (``None`` for no limit).
+
+    Cached objects are shared between callers, so they must be treated as
+    read-only.  Use one cache per ``ResourceManager``.
+    """
+
+    def __init__(self, maxsize: int | None = 1024, maxbytes: int | None = None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[RevisionKey, tuple[Resource[T], int]] = OrderedDict()
+        self._by_resource: dict[str, set[RevisionKey]] = {}
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: RevisionKey) -> Resource[T] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: RevisionKey, resource: Resource[T], nbytes: int) -> None:
+        """Cache *resource*; *nbytes* is the size of its encoded data."""
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (resource, nbytes)
+            self._by_resource.setdefault(key[0], set()).add(key)
+            self._nbytes += nbytes
+            while self._entries and (
+                (self.maxsize is not None and len(self._entries) > self.maxsize)
+                or (self.maxbytes is not None and self._nbytes > self.maxbytes)
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(
+        self, resource_id: str, revision_id: str, schema_version: str | None
+    ) -> None:
+        with self._lock:
+            self._pop((resource_id, revision_id, schema_version))
+
+    def invalidate_resource(self, resource_id: str) -> None:
+        """Drop every cached revision of *resource_id*."""
+        with self._lock:
+            for key in list(self._by_resource.get(resource_id, ())):
+                self._pop(key)
+
+    def cache_info(self) -> ResourceCacheInfo:
+        with self._lock:
+            return ResourceCacheInfo(
+                self.hits,
+                self.misses,
+                self.maxsize,
+                self.maxbytes,
+                len(self._entries),
+                self._nbytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_resource.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _pop(self, key: RevisionKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._nbytes -= entry[1]
+        keys = self._by_resource.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_resource[key[0]]
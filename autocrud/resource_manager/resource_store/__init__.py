@@ -3,6 +3,7 @@ Resource Store implementations for AutoCRUD
 """
 
 from autocrud.resource_manager.resource_store.cached_s3 import CachedS3ResourceStore
+from autocrud.resource_manager.resource_store.delta import DeltaResourceStore
 from autocrud.resource_manager.resource_store.etag_cached_s3 import (
     ETagCachedS3ResourceStore,
 )
@@ -22,4 +23,5 @@ __all__ = [
     "CachedS3ResourceStore",
     "MQCachedS3ResourceStore",
     "ETagCachedS3ResourceStore",
+    "DeltaResourceStore",
 ]
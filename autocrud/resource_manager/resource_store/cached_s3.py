@@ -92,6 +92,15 @@ class CachedS3ResourceStore(S3ResourceStore):
 
             yield io.BytesIO(data)
 
+    def _fetch_revision(
+        self, key: tuple[str, str, str | None], with_info: bool
+    ) -> tuple[RevisionInfo | None, bytes]:
+        # Go through the cache-aware single-item getters so that get_many
+        # still hits (and populates) the caches.
+        info = self.get_revision_info(*key) if with_info else None
+        with self.get_data_bytes(*key) as stream:
+            return info, stream.read()
+
     def save(self, info: RevisionInfo, data: IO[bytes]) -> None:
         # We need to read data to save to S3 AND cache.
         # But stream can be read only once.
@@ -0,0 +1,472 @@
+"""Pack-file disk resource store.
+
+:class:`PackDiskResourceStore` appends each revision (encoded info followed by
+the raw data) to a size-capped pack file instead of creating a directory, two
+files and a symlink chain per revision.  An embedded SQLite database maps
+``(resource_id, revision_id, schema_version)`` to the pack, offset and sizes
+of the revision, and reads are slices of a read-only ``mmap`` of the pack.
+
+Writes use group commit: every writer appends its bytes right away, and the
+first one to reach the commit step syncs the packs and inserts the index rows
+of every writer that appended before it in one transaction.  A revision is
+visible to readers once its index row is committed.
+
+:meth:`PackDiskResourceStore.purge_resource` only removes index rows; the
+space is reclaimed by :meth:`PackDiskResourceStore.compact`.
+"""
+
+import io
+import mmap
+import os
+import sqlite3
+import threading
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+
+from autocrud.resource_manager.basic import (
+    Encoding,
+    IResourceStore,
+    MsgspecSerializer,
+)
+from autocrud.types import RevisionInfo
+
+ResourceID = str
+RevisionID = str
+SchemaVersion = str
+DataBytes = bytes
+DataIO = IO[bytes]
+
+_PACK_SUFFIX = ".pack"
+# SQLite 預設最多 999 個參數，每個 key 佔 3 個
+_GET_MANY_CHUNK_SIZE = 300
+# (resource_id, revision_id, schema_key, pack, offset, info_size, data_size)
+_Row = tuple[str, str, str, int, int, int, int]
+
+
+def _schema_key(schema_version: SchemaVersion | None) -> str:
+    # 與 DiskResourceStore 的目錄命名相同
+    return "no_ver" if schema_version is None else f"v_{schema_version}"
+
+
+def _schema_version(schema_key: str) -> SchemaVersion | None:
+    return None if schema_key == "no_ver" else schema_key[2:]
+
+
+class PackDiskResourceStore(IResourceStore):
+    """Disk resource store keeping revisions in append-only pack files.
+
+    Arguments:
+        encoding: Encoding of the stored revision infos.
+        rootdir: Directory holding the pack files and ``index.sqlite3``.
+        pack_size: Bytes after which the active pack is sealed and a new one
+            is started.
+        fsync: Sync the packs and the index on every commit.  Without it a
+            crash may lose the latest commits (but never corrupts the index).
+    """
+
+    def __init__(
+        self,
+        *,
+        encoding: Encoding = Encoding.json,
+        rootdir: Path | str,
+        pack_size: int = 256 * 2**20,
+        fsync: bool = True,
+    ):
+        self._info_serializer = MsgspecSerializer(
+            encoding=encoding,
+            resource_type=RevisionInfo,
+        )
+        self._rootdir = Path(rootdir)
+        self._rootdir.mkdir(parents=True, exist_ok=True)
+        self.pack_size = pack_size
+        self.fsync = fsync
+
+        # 追加 pack 與待提交列表
+        self._write_lock = threading.Lock()
+        # 同一時間只有一個 group commit
+        self._commit_lock = threading.Lock()
+        # SQLite 連線與 mmap
+        self._db_lock = threading.RLock()
+        self._fds: dict[int, int] = {}
+        self._sizes: dict[int, int] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._pending: list[_Row] = []
+        self._dirty: set[int] = set()
+        self._appended = 0
+        self._committed = 0
+
+        self._conn = sqlite3.connect(
+            self._rootdir / "index.sqlite3", check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={'FULL' if fsync else 'OFF'}")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS revisions (
+                resource_id TEXT NOT NULL,
+                revision_id TEXT NOT NULL,
+                schema_key TEXT NOT NULL,
+                pack INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                info_size INTEGER NOT NULL,
+                data_size INTEGER NOT NULL,
+                UNIQUE (resource_id, revision_id, schema_key)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_revisions_pack ON revisions(pack)"
+        )
+        self._conn.commit()
+
+        packs = sorted(
+            int(path.stem) for path in self._rootdir.glob(f"*{_PACK_SUFFIX}")
+        )
+        for pack in packs:
+            self._open(pack)
+        self._active = packs[-1] if packs else 0
+        if not packs:
+            self._open(self._active)
+
+    # ------------------------------------------------------------------
+    # packs
+    # ------------------------------------------------------------------
+
+    def _pack_path(self, pack: int) -> Path:
+        return self._rootdir / f"{pack:08d}{_PACK_SUFFIX}"
+
+    def _open(self, pack: int) -> None:
+        fd = os.open(self._pack_path(pack), os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._fds[pack] = fd
+        self._sizes[pack] = os.fstat(fd).st_size
+
+    def _append(self, items: Iterable[tuple[RevisionInfo, bytes]]) -> int:
+        """Append revisions to the active pack; return the write sequence."""
+        encode = self._info_serializer.encode
+        with self._write_lock:
+            if self._sizes[self._active] >= self.pack_size:
+                self._active += 1
+                self._open(self._active)
+            pack = self._active
+            position = self._sizes[pack]
+            chunks: list[bytes] = []
+            rows: list[_Row] = []
+            for info, data in items:
+                info_b = encode(info)
+                chunks += (info_b, data)
+                rows.append(
+                    (
+                        info.resource_id,
+                        info.revision_id,
+                        _schema_key(info.schema_version),
+                        pack,
+                        position,
+                        len(info_b),
+                        len(data),
+                    )
+                )
+                position += len(info_b) + len(data)
+            buffer = memoryview(b"".join(chunks))
+            while buffer:
+                buffer = buffer[os.write(self._fds[pack], buffer) :]
+            self._sizes[pack] = position
+            self._pending += rows
+            self._dirty.add(pack)
+            self._appended += 1
+            return self._appended
+
+    def _commit(self, seq: int) -> None:
+        """Make every write up to *seq* durable and visible (group commit)."""
+        with self._commit_lock:
+            if self._committed < seq:
+                # 否則前一個 group commit 已經一併提交
+                self._flush()
+
+    def _flush(self) -> None:
+        """Commit every pending write (call with ``_commit_lock`` held)."""
+        with self._write_lock:
+            rows, self._pending = self._pending, []
+            dirty, self._dirty = self._dirty, set()
+            target = self._appended
+        try:
+            if self.fsync:
+                for pack in sorted(dirty):
+                    os.fsync(self._fds[pack])
+            with self._db_lock:
+                self._conn.executemany(
+                    """
+                    INSERT INTO revisions VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (resource_id, revision_id, schema_key)
+                    DO UPDATE SET pack = excluded.pack,
+                        offset = excluded.offset,
+                        info_size = excluded.info_size,
+                        data_size = excluded.data_size
+                    """,
+                    rows,
+                )
+                self._conn.commit()
+        except BaseException:
+            with self._write_lock:
+                self._pending[:0] = rows
+                self._dirty |= dirty
+            raise
+        self._committed = target
+
+    def _slice(self, pack: int, offset: int, size: int) -> bytes:
+        """Copy bytes out of the pack's mmap (call with ``_db_lock`` held)."""
+        if size == 0:
+            return b""
+        view = self._maps.get(pack)
+        if view is None or len(view) < offset + size:
+            # 追加中的 pack 會變長，重新映射到目前大小
+            if view is not None:
+                view.close()
+            view = mmap.mmap(self._fds[pack], 0, access=mmap.ACCESS_READ)
+            self._maps[pack] = view
+        return view[offset : offset + size]
+
+    def _locate(
+        self,
+        resource_id: ResourceID,
+        revision_id: RevisionID,
+        schema_version: SchemaVersion | None,
+    ) -> tuple[int, int, int, int]:
+        row = self._conn.execute(
+            """
+            SELECT pack, offset, info_size, data_size FROM revisions
+            WHERE resource_id = ? AND revision_id = ? AND schema_key = ?
+            """,
+            (resource_id, revision_id, _schema_key(schema_version)),
+        ).fetchone()
+        if row is None:
+            raise KeyError((resource_id, revision_id, schema_version))
+        return row
+
+    def _read(
+        self,
+        keys: list[tuple[ResourceID, RevisionID, SchemaVersion | None]],
+        *,
+        info: bool,
+        data: bool,
+    ) -> list[tuple[bytes, bytes]]:
+        """Info and data bytes of *keys*, in order (``b""`` for parts not asked)."""
+        result: list[tuple[bytes, bytes]] = []
+        for start in range(0, len(keys), _GET_MANY_CHUNK_SIZE):
+            chunk = keys[start : start + _GET_MANY_CHUNK_SIZE]
+            params = [
+                v
+                for resource_id, revision_id, schema_version in chunk
+                for v in (resource_id, revision_id, _schema_key(schema_version))
+            ]
+            values = ", ".join(["(?, ?, ?)"] * len(chunk))
+            with self._db_lock:
+                rows = self._conn.execute(
+                    f"""
+                    SELECT resource_id, revision_id, schema_key,
+                        pack, offset, info_size, data_size
+                    FROM revisions
+                    WHERE (resource_id, revision_id, schema_key) IN ({values})
+                    """,
+                    params,
+                ).fetchall()
+                found = {
+                    (resource_id, revision_id, _schema_version(schema_key)): (
+                        self._slice(pack, offset, info_size) if info else b"",
+                        self._slice(pack, offset + info_size, data_size)
+                        if data
+                        else b"",
+                    )
+                    for (
+                        resource_id,
+                        revision_id,
+                        schema_key,
+                        pack,
+                        offset,
+                        info_size,
+                        data_size,
+                    ) in rows
+                }
+            for key in chunk:
+                result.append(found[key])
+        return result
+
+    def compact(self, ratio: float = 0.5) -> int:
+        """Rewrite sealed packs whose live revisions take less than *ratio*.
+
+        Returns the number of pack files removed.
+        """
+        with self._commit_lock, self._db_lock:
+            # 待提交的列可能指向要刪除的 pack
+            self._flush()
+            live = dict(
+                self._conn.execute(
+                    "SELECT pack, SUM(info_size + data_size) FROM revisions "
+                    "GROUP BY pack"
+                ).fetchall()
+            )
+            with self._write_lock:
+                packs = [
+                    pack
+                    for pack, size in sorted(self._sizes.items())
+                    if pack != self._active and live.get(pack, 0) < ratio * size
+                ]
+            for pack in packs:
+                rows = self._conn.execute(
+                    """
+                    SELECT rowid, offset, info_size, data_size
+                    FROM revisions WHERE pack = ?
+                    """,
+                    (pack,),
+                ).fetchall()
+                with self._write_lock:
+                    if self._sizes[self._active] >= self.pack_size:
+                        self._active += 1
+                        self._open(self._active)
+                    target = self._active
+                    position = self._sizes[target]
+                    moved: list[tuple[int, int, int]] = []
+                    chunks: list[bytes] = []
+                    for rowid, offset, info_size, data_size in rows:
+                        chunks.append(self._slice(pack, offset, info_size + data_size))
+                        moved.append((target, position, rowid))
+                        position += info_size + data_size
+                    buffer = memoryview(b"".join(chunks))
+                    while buffer:
+                        buffer = buffer[os.write(self._fds[target], buffer) :]
+                    self._sizes[target] = position
+                if self.fsync:
+                    os.fsync(self._fds[target])
+                self._conn.executemany(
+                    "UPDATE revisions SET pack = ?, offset = ? WHERE rowid = ?",
+                    moved,
+                )
+                self._conn.commit()
+                # 索引已指向新位置，才刪除舊 pack
+                view = self._maps.pop(pack, None)
+                if view is not None:
+                    view.close()
+                with self._write_lock:
+                    os.close(self._fds.pop(pack))
+                    self._sizes.pop(pack)
+                self._pack_path(pack).unlink()
+            return len(packs)
+
+    def close(self) -> None:
+        """Close the pack files and the index database."""
+        with self._commit_lock, self._db_lock, self._write_lock:
+            for view in self._maps.values():
+                view.close()
+            self._maps.clear()
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # IResourceStore
+    # ------------------------------------------------------------------
+
+    def _column(self, sql: str, params: tuple = ()) -> list:
+        with self._db_lock:
+            return [row[0] for row in self._conn.execute(sql, params)]
+
+    def list_resources(self) -> Generator[ResourceID]:
+        yield from self._column("SELECT DISTINCT resource_id FROM revisions")
+
+    def list_revisions(self, resource_id: ResourceID) -> Generator[RevisionID]:
+        yield from self._column(
+            "SELECT DISTINCT revision_id FROM revisions WHERE resource_id = ?",
+            (resource_id,),
+        )
+
+    def list_schema_versions(
+        self, resource_id: ResourceID, revision_id: RevisionID
+    ) -> Generator[SchemaVersion | None]:
+        for schema_key in self._column(
+            "SELECT schema_key FROM revisions "
+            "WHERE resource_id = ? AND revision_id = ?",
+            (resource_id, revision_id),
+        ):
+            yield _schema_version(schema_key)
+
+    def exists(
+        self,
+        resource_id: ResourceID,
+        revision_id: RevisionID,
+        schema_version: SchemaVersion | None,
+    ) -> bool:
+        with self._db_lock:
+            try:
+                self._locate(resource_id, revision_id, schema_version)
+            except KeyError:
+                return False
+        return True
+
+    @contextmanager
+    def get_data_bytes(
+        self,
+        resource_id: ResourceID,
+        revision_id: RevisionID,
+        schema_version: SchemaVersion | None,
+    ) -> Generator[DataIO]:
+        with self._db_lock:
+            pack, offset, info_size, data_size = self._locate(
+                resource_id, revision_id, schema_version
+            )
+            data = self._slice(pack, offset + info_size, data_size)
+        yield io.BytesIO(data)
+
+    def get_revision_info(
+        self,
+        resource_id: ResourceID,
+        revision_id: RevisionID,
+        schema_version: SchemaVersion | None,
+    ) -> RevisionInfo:
+        with self._db_lock:
+            pack, offset, info_size, _ = self._locate(
+                resource_id, revision_id, schema_version
+            )
+            info_b = self._slice(pack, offset, info_size)
+        return self._info_serializer.decode(info_b)
+
+    def get_data_bytes_many(
+        self, keys: Iterable[tuple[ResourceID, RevisionID, SchemaVersion | None]]
+    ) -> list[DataBytes]:
+        return [data for _, data in self._read(list(keys), info=False, data=True)]
+
+    def get_many(
+        self, keys: Iterable[tuple[ResourceID, RevisionID, SchemaVersion | None]]
+    ) -> list[tuple[RevisionInfo, DataBytes]]:
+        decode = self._info_serializer.decode
+        return [
+            (decode(info_b), data)
+            for info_b, data in self._read(list(keys), info=True, data=True)
+        ]
+
+    def save(self, info: RevisionInfo, data: DataIO) -> None:
+        self._commit(self._append([(info, data.read())]))
+
+    def save_many(self, items: Iterable[tuple[RevisionInfo, bytes | DataIO]]) -> None:
+        """Bulk save multiple revisions in a single commit.
+
+        Each *item* is ``(info, data)`` where *data* is raw bytes **or** an
+        ``IO[bytes]`` file-like object (only ``read()`` is called).
+        """
+        revisions = [
+            (info, data.read() if hasattr(data, "read") else data)
+            for info, data in items
+        ]
+        if revisions:
+            self._commit(self._append(revisions))
+
+    def purge_resource(self, resource_id: str) -> None:
+        """Hard-delete all revision data for a resource.
+
+        The index rows are removed immediately; the bytes stay in their pack
+        until :meth:`compact` rewrites it.
+        """
+        with self._commit_lock, self._db_lock:
+            self._conn.execute(
+                "DELETE FROM revisions WHERE resource_id = ?", (resource_id,)
+            )
+            self._conn.commit()
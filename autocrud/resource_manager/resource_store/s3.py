@@ -27,6 +27,7 @@ class S3ResourceStore(IResourceStore):
         bucket: str = "autocrud",
         prefix: str = "",
         client_kwargs: dict | None = None,
+        max_workers: int = 16,
     ):
         self.bucket = bucket
         self.prefix = f"{prefix}resources/"
@@ -46,6 +47,10 @@ class S3ResourceStore(IResourceStore):
             encoding=encoding,
             resource_type=RevisionInfo,
         )
+        # 多筆讀取共用的 thread pool（threads 為 lazy 建立）
+        self._read_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="s3-resource-store"
+        )
 
         # 確保 bucket 存在
         try:
@@ -156,19 +161,14 @@ class S3ResourceStore(IResourceStore):
                 return False
             raise
 
-    @contextmanager
-    def get_data_bytes(
-        self,
-        resource_id: str,
-        revision_id: str,
-        schema_version: str | None,
-    ) -> Generator[IO[bytes]]:
-        """以位元組流的形式獲取指定資源修訂版本的資料"""
-        # 先獲取 UID
+    def _get_uid(
+        self, resource_id: str, revision_id: str, schema_version: str | None
+    ) -> str:
+        """從資源索引讀取實際的 UID"""
         resource_key = self._get_resource_key(resource_id, revision_id, schema_version)
         try:
             response = self.client.get_object(Bucket=self.bucket, Key=resource_key)
-            uid = response["Body"].read().decode("utf-8")
+            return response["Body"].read().decode("utf-8")
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code in ("NoSuchKey", "404"):
@@ -177,6 +177,17 @@ class S3ResourceStore(IResourceStore):
                 )
             raise
 
+    @contextmanager
+    def get_data_bytes(
+        self,
+        resource_id: str,
+        revision_id: str,
+        schema_version: str | None,
+    ) -> Generator[IO[bytes]]:
+        """以位元組流的形式獲取指定資源修訂版本的資料"""
+        # 先獲取 UID
+        uid = self._get_uid(resource_id, revision_id, schema_version)
+
         # 使用 UID 獲取實際數據
         data_key = self._get_raw_data_key(uid)
         try:
@@ -198,17 +209,7 @@ class S3ResourceStore(IResourceStore):
     ) -> RevisionInfo:
         """獲取指定修訂版本的資訊"""
         # 先獲取 UID
-        resource_key = self._get_resource_key(resource_id, revision_id, schema_version)
-        try:
-            response = self.client.get_object(Bucket=self.bucket, Key=resource_key)
-            uid = response["Body"].read().decode("utf-8")
-        except ClientError as e:
-            error_code = e.response["Error"]["Code"]
-            if error_code in ("NoSuchKey", "404"):
-                raise KeyError(
-                    f"Resource not found: {resource_id}/{revision_id}/{schema_version}"
-                )
-            raise
+        uid = self._get_uid(resource_id, revision_id, schema_version)
 
         # 使用 UID 獲取實際資訊
         info_key = self._get_raw_info_key(uid)
@@ -222,6 +223,55 @@ class S3ResourceStore(IResourceStore):
                 raise KeyError(f"Revision info not found: {uid}")
             raise
 
+    def _fetch_revision(
+        self, key: tuple[str, str, str | None], with_info: bool
+    ) -> tuple[RevisionInfo | None, bytes]:
+        """讀取單一 revision（UID 只解析一次），供 get_many 在 thread pool 中使用"""
+        uid = self._get_uid(*key)
+        info = None
+        if with_info:
+            try:
+                response = self.client.get_object(
+                    Bucket=self.bucket, Key=self._get_raw_info_key(uid)
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                    raise KeyError(f"Revision info not found: {uid}")
+                raise
+            info = self._info_serializer.decode(response["Body"].read())
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket, Key=self._get_raw_data_key(uid)
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                raise KeyError(f"Resource data not found: {uid}")
+            raise
+        return info, response["Body"].read()
+
+    def _fetch_revisions(
+        self, keys: Iterable[tuple[str, str, str | None]], with_info: bool
+    ) -> list[tuple[RevisionInfo | None, bytes]]:
+        keys = list(keys)
+        if len(keys) <= 1:
+            return [self._fetch_revision(key, with_info) for key in keys]
+        futs = [
+            self._read_pool.submit(self._fetch_revision, key, with_info) for key in keys
+        ]
+        return [f.result() for f in futs]
+
+    def get_data_bytes_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[bytes]:
+        """並行讀取多個 revision 的資料"""
+        return [data for _, data in self._fetch_revisions(keys, with_info=False)]
+
+    def get_many(
+        self, keys: Iterable[tuple[str, str, str | None]]
+    ) -> list[tuple[RevisionInfo, bytes]]:
+        """並行讀取多個 revision 的資訊與資料"""
+        return self._fetch_revisions(keys, with_info=True)
+
     def save(self, info: RevisionInfo, data: IO[bytes]) -> None:
         # 保存實際數據和資訊到 UID-based 位置
         self._save_raw_data(str(info.uid), data)
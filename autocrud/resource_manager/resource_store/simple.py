@@ -1,3 +1,4 @@
+import copy
 import io
 from collections.abc import Generator, Iterable
 from contextlib import contextmanager
@@ -21,12 +22,23 @@ DataIO = IO[bytes]
 
 
 class MemoryResourceStore(IResourceStore):
+    """In-memory resource store.
+
+    Arguments:
+        encoding: Encoding of the stored revision infos.
+        store_objects: Keep :class:`RevisionInfo` objects instead of encoded
+            bytes.  Infos are copied on the way in and out rather than
+            encoded and decoded.  Data is kept as bytes either way.
+    """
+
     def __init__(
         self,
         encoding: Encoding = Encoding.json,
+        *,
+        store_objects: bool = False,
     ):
         self._raw_data_store: dict[UID, DataBytes] = {}
-        self._raw_info_store: dict[UID, InfoBytes] = {}
+        self._raw_info_store: dict[UID, InfoBytes | RevisionInfo] = {}
         self._store: dict[
             ResourceID, dict[RevisionID, dict[SchemaVersion | None, UID]]
         ] = {}
@@ -34,6 +46,13 @@ class MemoryResourceStore(IResourceStore):
             encoding=encoding,
             resource_type=RevisionInfo,
         )
+        self.store_objects = store_objects
+        if store_objects:
+            # RevisionInfo 欄位皆為不可變值，淺複製即可
+            self._encode_info = self._decode_info = copy.copy
+        else:
+            self._encode_info = self._info_serializer.encode
+            self._decode_info = self._info_serializer.decode
 
     def list_resources(self) -> Generator[ResourceID]:
         yield from self._store.keys()
@@ -75,14 +94,35 @@ class MemoryResourceStore(IResourceStore):
         schema_version: SchemaVersion | None,
     ) -> RevisionInfo:
         uid = self._store[resource_id][revision_id][schema_version]
-        return self._info_serializer.decode(self._raw_info_store[uid])
+        return self._decode_info(self._raw_info_store[uid])
+
+    def get_data_bytes_many(
+        self, keys: Iterable[tuple[ResourceID, RevisionID, SchemaVersion | None]]
+    ) -> list[DataBytes]:
+        store = self._store
+        raw_data = self._raw_data_store
+        return [
+            raw_data[store[resource_id][revision_id][schema_version]]
+            for resource_id, revision_id, schema_version in keys
+        ]
+
+    def get_many(
+        self, keys: Iterable[tuple[ResourceID, RevisionID, SchemaVersion | None]]
+    ) -> list[tuple[RevisionInfo, DataBytes]]:
+        store = self._store
+        result: list[tuple[RevisionInfo, DataBytes]] = []
+        for resource_id, revision_id, schema_version in keys:
+            uid = store[resource_id][revision_id][schema_version]
+            info = self._decode_info(self._raw_info_store[uid])
+            result.append((info, self._raw_data_store[uid]))
+        return result
 
     def save(self, info: RevisionInfo, data: DataIO) -> None:
         self._store.setdefault(info.resource_id, {}).setdefault(info.revision_id, {})[
             info.schema_version
         ] = info.uid
         self._raw_data_store[info.uid] = data.read()
-        self._raw_info_store[info.uid] = self._info_serializer.encode(info)
+        self._raw_info_store[info.uid] = self._encode_info(info)
 
     def save_many(self, items: Iterable[tuple[RevisionInfo, bytes | DataIO]]) -> None:
         """Bulk save multiple revisions.
@@ -96,7 +136,7 @@ class MemoryResourceStore(IResourceStore):
                 info.revision_id, {}
             )[info.schema_version] = info.uid
             self._raw_data_store[info.uid] = raw
-            self._raw_info_store[info.uid] = self._info_serializer.encode(info)
+            self._raw_info_store[info.uid] = self._encode_info(info)
 
     def purge_resource(self, resource_id: str) -> None:
         """Hard-delete all revision data for a resource."""
@@ -209,6 +249,23 @@ class DiskResourceStore(IResourceStore):
         with info_path.open("rb") as f:
             return self._info_serializer.decode(f.read())
 
+    def get_data_bytes_many(
+        self, keys: Iterable[tuple[ResourceID, RevisionID, SchemaVersion | None]]
+    ) -> list[DataBytes]:
+        return [
+            (self._get_uid_store_symdir(*key) / "data").read_bytes() for key in keys
+        ]
+
+    def get_many(
+        self, keys: Iterable[tuple[ResourceID, RevisionID, SchemaVersion | None]]
+    ) -> list[tuple[RevisionInfo, DataBytes]]:
+        result: list[tuple[RevisionInfo, DataBytes]] = []
+        for key in keys:
+            d = self._get_uid_store_symdir(*key)
+            info = self._info_serializer.decode((d / "info").read_bytes())
+            result.append((info, (d / "data").read_bytes()))
+        return result
+
     def save(self, info: RevisionInfo, data: DataIO) -> None:
         symd = self._get_uid_store_symdir(
             info.resource_id, info.revision_id, info.schema_version
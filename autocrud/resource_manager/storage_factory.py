@@ -6,8 +6,10 @@ from autocrud.resource_manager.basic import Encoding, IBlobStore, IStorage
 from autocrud.resource_manager.blob_store.s3 import S3BlobStore
 from autocrud.resource_manager.core import SimpleStorage
 from autocrud.resource_manager.meta_store.postgres import PostgresMetaStore
+from autocrud.resource_manager.meta_store.segment import SegmentDiskMetaStore
 from autocrud.resource_manager.meta_store.simple import DiskMetaStore, MemoryMetaStore
 from autocrud.resource_manager.meta_store.sqlite3 import S3SqliteMetaStore
+from autocrud.resource_manager.resource_store.pack import PackDiskResourceStore
 from autocrud.resource_manager.resource_store.s3 import S3ResourceStore
 from autocrud.resource_manager.resource_store.simple import (
     DiskResourceStore,
@@ -24,28 +26,51 @@ class IStorageFactory(ABC):
 
 
 class MemoryStorageFactory(IStorageFactory):
+    def __init__(self, *, store_objects: bool = False):
+        self.store_objects = store_objects
+
     def build(
         self,
         model_name: str,
     ) -> IStorage:
-        meta_store = MemoryMetaStore()
+        meta_store = MemoryMetaStore(store_objects=self.store_objects)
 
-        resource_store = MemoryResourceStore()
+        resource_store = MemoryResourceStore(store_objects=self.store_objects)
 
         return SimpleStorage(meta_store, resource_store)
 
 
 class DiskStorageFactory(IStorageFactory):
+    """Disk storage under ``rootdir/<model_name>``.
+
+    Arguments:
+        rootdir: Root directory of all models.
+        log_structured: Keep metas in append-only segment files with an
+            in-memory index (:class:`SegmentDiskMetaStore`) and revisions in
+            pack files indexed by SQLite (:class:`PackDiskResourceStore`)
+            instead of files per resource / revision.  The two layouts do not
+            read each other's files.
+    """
+
     def __init__(
         self,
         rootdir: Path | str,
+        *,
+        log_structured: bool = False,
     ):
         self.rootdir = Path(rootdir)
+        self.log_structured = log_structured
 
     def build(
         self,
         model_name: str,
     ) -> IStorage:
+        if self.log_structured:
+            return SimpleStorage(
+                SegmentDiskMetaStore(rootdir=self.rootdir / model_name / "meta-log"),
+                PackDiskResourceStore(rootdir=self.rootdir / model_name / "data-pack"),
+            )
+
         meta_store = DiskMetaStore(rootdir=self.rootdir / model_name / "meta")
 
         # 對於其他類型（msgspec.Struct, dataclass, TypedDict），使用原生支持
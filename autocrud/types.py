@@ -19,7 +19,7 @@ from uuid import UUID
 
 from jsonpatch import JsonPatch
 from jsonpointer import JsonPointer
-from msgspec import UNSET, Struct, UnsetType, defstruct
+from msgspec import UNSET, Struct, UnsetType, defstruct, structs
 from typing_extensions import Literal
 from typing_extensions import TypeVar as TypeVarExt
 
@@ -513,13 +513,17 @@ class ResourceAction(Flag):
     load = auto()
     migrate = auto()
     modify = auto()
+    create_many = auto()
+    update_many = auto()
+    delete_many = auto()
+    get_many = auto()
 
     create_or_update = create | update | modify
 
-    read = get | get_meta | get_resource_revision | list_revisions
+    read = get | get_meta | get_resource_revision | list_revisions | get_many
     read_list = search_resources
-    write = create | update | modify | patch
-    lifecycle = switch | delete | permanently_delete | restore
+    write = create | update | modify | patch | create_many | update_many
+    lifecycle = switch | delete | permanently_delete | restore | delete_many
     backup = dump | load | migrate
     full = read | read_list | write | lifecycle | backup
     owner = read | patch | update | modify | lifecycle
@@ -623,6 +627,10 @@ class ResourceMetaSearchQuery(Struct, kw_only=True):
     sorts: list[ResourceMetaSearchSort | ResourceDataSearchSort] | UnsetType = UNSET
     """Sorting criteria for the search results."""
 
+    after: str | UnsetType = UNSET
+    """Opaque keyset cursor (``next_cursor`` of a previous page); only results
+    sorted after it are returned.  Must be used with the same ``sorts``."""
+
 
 # ============================================================================
 # Event Context Protocols
@@ -766,6 +774,54 @@ OnFailureCreate = defstruct(
 )
 
 
+# ============================================================================
+# CreateMany Context Classes
+# ============================================================================
+
+_create_many_context = [
+    ("action", Literal[ResourceAction.create_many], ResourceAction.create_many),
+    ("data", list[T]),
+    ("status", RevisionStatus | UnsetType, UNSET),
+]
+
+BeforeCreateMany = defstruct(
+    "BeforeCreateMany",
+    [
+        *_before_context,
+        *_create_many_context,
+    ],
+    **_type_setting,
+)
+
+AfterCreateMany = defstruct(
+    "AfterCreateMany",
+    [
+        *_after_context,
+        *_create_many_context,
+    ],
+    **_type_setting,
+)
+
+OnSuccessCreateMany = defstruct(
+    "OnSuccessCreateMany",
+    [
+        *_on_success_context,
+        *_create_many_context,
+        ("infos", list[RevisionInfo]),
+    ],
+    **_type_setting,
+)
+
+OnFailureCreateMany = defstruct(
+    "OnFailureCreateMany",
+    [
+        *_on_failure_context,
+        *_create_many_context,
+    ],
+    **_type_setting,
+)
+
+
 # ============================================================================
 # Get Context Classes
 # ============================================================================
@@ -815,6 +871,55 @@ OnFailureGet = defstruct(
 )
 
 
+# ============================================================================
+# GetMany Context Classes
+# ============================================================================
+
+_get_many_context = [
+    ("action", Literal[ResourceAction.get_many], ResourceAction.get_many),
+    ("resource_ids", list[str]),
+    ("revision_ids", list[str] | None, None),
+    ("partial", list[str | JsonPointer] | None, None),
+]
+
+BeforeGetMany = defstruct(
+    "BeforeGetMany",
+    [
+        *_before_context,
+        *_get_many_context,
+    ],
+    **_type_setting,
+)
+
+AfterGetMany = defstruct(
+    "AfterGetMany",
+    [
+        *_after_context,
+        *_get_many_context,
+    ],
+    **_type_setting,
+)
+
+OnSuccessGetMany = defstruct(
+    "OnSuccessGetMany",
+    [
+        *_on_success_context,
+        *_get_many_context,
+        ("resources", list[Any]),
+    ],
+    **_type_setting,
+)
+
+OnFailureGetMany = defstruct(
+    "OnFailureGetMany",
+    [
+        *_on_failure_context,
+        *_get_many_context,
+    ],
+    **_type_setting,
+)
+
+
 # ============================================================================
 # Get Resource Revision Context Classes
 # ============================================================================
@@ -1062,6 +1167,54 @@ OnFailureUpdate = defstruct(
 )
 
 
+# ============================================================================
+# UpdateMany Context Classes
+# ============================================================================
+
+_update_many_context = [
+    ("action", Literal[ResourceAction.update_many], ResourceAction.update_many),
+    ("items", list[tuple[str, T]]),
+    ("status", RevisionStatus | UnsetType, UNSET),
+]
+
+BeforeUpdateMany = defstruct(
+    "BeforeUpdateMany",
+    [
+        *_before_context,
+        *_update_many_context,
+    ],
+    **_type_setting,
+)
+
+AfterUpdateMany = defstruct(
+    "AfterUpdateMany",
+    [
+        *_after_context,
+        *_update_many_context,
+    ],
+    **_type_setting,
+)
+
+OnSuccessUpdateMany = defstruct(
+    "OnSuccessUpdateMany",
+    [
+        *_on_success_context,
+        *_update_many_context,
+        ("revision_infos", list[RevisionInfo]),
+    ],
+    **_type_setting,
+)
+
+OnFailureUpdateMany = defstruct(
+    "OnFailureUpdateMany",
+    [
+        *_on_failure_context,
+        *_update_many_context,
+    ],
+    **_type_setting,
+)
+
+
 # ============================================================================
 # Modify Context Classes
 # ============================================================================
@@ -1254,6 +1407,53 @@ OnFailureDelete = defstruct(
 )
 
 
+# ============================================================================
+# DeleteMany Context Classes
+# ============================================================================
+
+_delete_many_context = [
+    ("action", Literal[ResourceAction.delete_many], ResourceAction.delete_many),
+    ("resource_ids", list[str]),
+]
+
+BeforeDeleteMany = defstruct(
+    "BeforeDeleteMany",
+    [
+        *_before_context,
+        *_delete_many_context,
+    ],
+    **_type_setting,
+)
+
+AfterDeleteMany = defstruct(
+    "AfterDeleteMany",
+    [
+        *_after_context,
+        *_delete_many_context,
+    ],
+    **_type_setting,
+)
+
+OnSuccessDeleteMany = defstruct(
+    "OnSuccessDeleteMany",
+    [
+        *_on_success_context,
+        *_delete_many_context,
+        ("metas", list[ResourceMeta]),
+    ],
+    **_type_setting,
+)
+
+OnFailureDeleteMany = defstruct(
+    "OnFailureDeleteMany",
+    [
+        *_on_failure_context,
+        *_delete_many_context,
+    ],
+    **_type_setting,
+)
+
+
 # ============================================================================
 # PermanentlyDelete Context Classes
 # ============================================================================
@@ -1547,6 +1747,22 @@ EventContext = (
     | AfterLoad
     | OnSuccessLoad
     | OnFailureLoad
+    | BeforeCreateMany
+    | AfterCreateMany
+    | OnSuccessCreateMany
+    | OnFailureCreateMany
+    | BeforeUpdateMany
+    | AfterUpdateMany
+    | OnSuccessUpdateMany
+    | OnFailureUpdateMany
+    | BeforeDeleteMany
+    | AfterDeleteMany
+    | OnSuccessDeleteMany
+    | OnFailureDeleteMany
+    | BeforeGetMany
+    | AfterGetMany
+    | OnSuccessGetMany
+    | OnFailureGetMany
 )
 
 
@@ -1999,6 +2215,52 @@ class IResourceManager(ABC, Generic[T]):
                 narrowed by *partial* are partial ``Struct`` instances.
         """
 
+    def iter_list_resources(
+        self,
+        query: ResourceMetaSearchQuery,
+        *,
+        returns: list[str] | None = None,
+        partial: list[str] | None = None,
+    ) -> Generator["SearchedResource[T]"]:
+        """Streaming variant of ``list_resources``.
+
+        Yields the same items as ``list_resources`` in the same order,
+        without materialising the whole result list.  The default
+        implementation simply iterates over ``list_resources``.
+        """
+        yield from self.list_resources(query, returns=returns, partial=partial)
+
+    def list_resources_page(
+        self,
+        query: ResourceMetaSearchQuery,
+        *,
+        returns: list[str] | None = None,
+        partial: list[str] | None = None,
+    ) -> tuple[list["SearchedResource[T]"], str | None]:
+        """``list_resources`` plus the keyset cursor of the next page.
+
+        Returns:
+            tuple: the page, and the ``after`` cursor of the next page built
+                from the last searched meta (``None`` on the last page).
+
+        ---
+
+        The default implementation searches once for the metas and then
+        lists the resources again with the same query; managers that can
+        fetch the searched metas directly should override it.
+        """
+        from autocrud.resource_manager.basic import (
+            encode_search_cursor,
+            get_keyset_sorts,
+        )
+
+        query = structs.replace(query, sorts=get_keyset_sorts(query.sorts))
+        metas = self.search_resources(query)
+        next_cursor = None
+        if metas and len(metas) >= query.limit:
+            next_cursor = encode_search_cursor(metas[-1], query.sorts)
+        return self.list_resources(query, returns=returns, partial=partial), next_cursor
+
     @abstractmethod
     def update(self, resource_id: str, data: T) -> RevisionInfo:
         """Update the data of the resource by creating a new revision.
@@ -2549,6 +2811,15 @@ class IEventHandler(ABC):
     @abstractmethod
     def is_supported(self, context: EventContext) -> bool: ...
 
+    def supported_events(self) -> Iterable[tuple[ResourceAction, str]] | None:
+        """Static superset of the ``(action, phase)`` pairs this handler may support.
+
+        ``ResourceManager`` uses it to skip building event contexts nobody is
+        interested in; :meth:`is_supported` is still called for every event
+        that gets through.  ``None`` (the default) means any event.
+        """
+        return None
+
     @abstractmethod
     def handle_event(self, context: EventContext) -> None: ...
 
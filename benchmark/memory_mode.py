@@ -0,0 +1,168 @@
+"""Compare the memory stores keeping encoded bytes against decoded objects.
+
+Usage::
+
+    uv run python -m benchmark.memory_mode                 # 100k resources
+    uv run python -m benchmark.memory_mode --count 20000 --encoding msgpack
+
+Fills a :class:`MemoryMetaStore` and a :class:`MemoryResourceStore` in each
+mode and reports the memory they hold (via :mod:`tracemalloc`) together with
+the time taken by point gets and a filtered, sorted search.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import time
+import tracemalloc
+import uuid
+
+from rich.console import Console
+from rich.table import Table
+
+from autocrud.resource_manager.basic import Encoding
+from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
+from autocrud.resource_manager.resource_store.simple import MemoryResourceStore
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    ResourceDataSearchSort,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    RevisionInfo,
+    RevisionStatus,
+)
+
+BASE_TIME = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+STATUSES = ("pending", "running", "done", "failed")
+
+
+def _make(i: int) -> tuple[ResourceMeta, RevisionInfo]:
+    resource_id = f"res-{i:08d}"
+    revision_id = f"{resource_id}:1"
+    when = BASE_TIME + dt.timedelta(seconds=i)
+    meta = ResourceMeta(
+        current_revision_id=revision_id,
+        resource_id=resource_id,
+        total_revision_count=1,
+        created_time=when,
+        updated_time=when,
+        created_by="bench",
+        updated_by="bench",
+        indexed_data={"status": STATUSES[i % 4], "score": i % 1000},
+    )
+    info = RevisionInfo(
+        uid=uuid.UUID(int=i),
+        resource_id=resource_id,
+        revision_id=revision_id,
+        status=RevisionStatus.stable,
+        created_time=when,
+        updated_time=when,
+        created_by="bench",
+        updated_by="bench",
+    )
+    return meta, info
+
+
+def _fill(
+    count: int, encoding: Encoding, store_objects: bool
+) -> tuple[MemoryMetaStore, MemoryResourceStore, int]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    meta_store = MemoryMetaStore(encoding, store_objects=store_objects)
+    resource_store = MemoryResourceStore(encoding, store_objects=store_objects)
+    for i in range(count):
+        meta, info = _make(i)
+        meta_store[meta.resource_id] = meta
+        resource_store.save_many([(info, b"{}")])
+        del meta, info
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return meta_store, resource_store, used
+
+
+def _timed(fn, repeat: int) -> float:
+    """Best wall time of *repeat* runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _measure(
+    count: int,
+    encoding: Encoding,
+    store_objects: bool,
+    ids: list[str],
+    search: ResourceMetaSearchQuery,
+    repeat: int,
+) -> list[str]:
+    """One table row; the stores are freed when this returns."""
+    meta_store, resource_store, used = _fill(count, encoding, store_objects)
+
+    def get_metas():
+        for pk in ids:
+            meta_store[pk]
+
+    def get_infos():
+        for pk in ids:
+            resource_store.get_revision_info(pk, f"{pk}:1", None)
+
+    return [
+        "objects" if store_objects else "bytes",
+        f"{used / 2**20:.1f}",
+        f"{_timed(get_metas, repeat):.2f}",
+        f"{_timed(get_infos, repeat):.2f}",
+        f"{_timed(lambda: list(meta_store.iter_search(search)), repeat):.2f}",
+        f"{_timed(lambda: meta_store.count(search), repeat):.2f}",
+    ]
+
+
+def run(count: int, encoding: Encoding, repeat: int = 3) -> Table:
+    ids = [f"res-{i:08d}" for i in range(0, count, max(count // 1000, 1))]
+    search = ResourceMetaSearchQuery(
+        data_conditions=[
+            DataSearchCondition(
+                field_path="score",
+                operator=DataSearchOperator.less_than,
+                value=500,
+            )
+        ],
+        sorts=[ResourceDataSearchSort(field_path="status")],
+        limit=50,
+    )
+
+    table = Table(title=f"Memory stores: {count} resources, {encoding.value}")
+    table.add_column("mode")
+    table.add_column("memory (MiB)", justify="right")
+    table.add_column(f"{len(ids)} meta gets (ms)", justify="right")
+    table.add_column(f"{len(ids)} info gets (ms)", justify="right")
+    table.add_column("search (ms)", justify="right")
+    table.add_column("count (ms)", justify="right")
+    for store_objects in (False, True):
+        table.add_row(*_measure(count, encoding, store_objects, ids, search, repeat))
+    return table
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="benchmark.memory_mode",
+        description="Compare bytes and object modes of the memory stores.",
+    )
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument(
+        "--encoding", choices=[e.value for e in Encoding], default="json"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    Console().print(run(args.count, Encoding(args.encoding), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
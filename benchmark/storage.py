@@ -38,11 +38,13 @@ def build_storage_factory(
         ValueError: If *storage_name* is not recognised.
     """
     if storage_name == "memory":
-        return MemoryStorageFactory()
+        return MemoryStorageFactory(store_objects=params.get("store_objects", False))
 
     if storage_name == "disk":
         rootdir = params.get("rootdir", "/tmp/autocrud-benchmark")
-        return DiskStorageFactory(rootdir=rootdir)
+        return DiskStorageFactory(
+            rootdir=rootdir, log_structured=params.get("log_structured", False)
+        )
 
     if storage_name == "postgres":
         from autocrud.resource_manager.storage_factory import PostgreSQLStorageFactory
@@ -0,0 +1,202 @@
+"""Benchmark FileSqliteMetaStore: default settings vs. tuned mode.
+
+Compares, on a database file:
+    - bursty concurrent writes (one meta per ``__setitem__`` from many threads)
+    - sequential writes from a single thread
+    - searches on indexed data fields (equality / IN / regex)
+    - reads while a writer is busy
+
+Usage:
+    uv run python scripts/bench_sqlite_meta_store.py [N] [THREADS]
+    uv run python scripts/bench_sqlite_meta_store.py 4000 16
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from autocrud.resource_manager.meta_store.sqlite3 import FileSqliteMetaStore
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    IndexableField,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+)
+
+INDEXED_FIELDS = [
+    IndexableField("name", str),
+    IndexableField("status", str),
+    IndexableField("age", int),
+]
+STATUSES = ["open", "closed", "pending", "archived"]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+def make_meta(i: int) -> ResourceMeta:
+    now = dt.datetime(2025, 1, 1) + dt.timedelta(seconds=i)
+    return ResourceMeta(
+        current_revision_id=f"item:{i:08d}:1",
+        resource_id=f"item:{i:08d}",
+        total_revision_count=1,
+        created_time=now,
+        updated_time=now,
+        created_by="bench",
+        updated_by="bench",
+        indexed_data={
+            "name": f"item_{i:08d}",
+            "status": STATUSES[i % len(STATUSES)],
+            "age": i % 100,
+        },
+    )
+
+
+def make_store(path: Path, tuned: bool) -> FileSqliteMetaStore:
+    store = FileSqliteMetaStore(db_filepath=path, encoding="msgpack", tuned=tuned)
+    store.ensure_indexes(INDEXED_FIELDS)
+    return store
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:10.0f} ops/s  ({seconds:.3f}s)"
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+def bench_concurrent_writes(store, n: int, threads: int) -> tuple[float, int]:
+    """Every thread writes its share of *n* metas, one commit per call."""
+    errors = 0
+    lock = threading.Lock()
+
+    def writer(offset: int):
+        nonlocal errors
+        for i in range(offset, n, threads):
+            try:
+                store[f"item:{i:08d}"] = make_meta(i)
+            except Exception:
+                # 預設模式下多個連線同時寫入可能 database is locked
+                with lock:
+                    errors += 1
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(writer, range(threads)))
+    return time.perf_counter() - t0, errors
+
+
+def bench_sequential_writes(store, n: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(n, 2 * n):
+        store[f"item:{i:08d}"] = make_meta(i)
+    return time.perf_counter() - t0
+
+
+def bench_searches(store, rounds: int) -> dict[str, float]:
+    queries = {
+        "name equals": lambda i: DataSearchCondition(
+            field_path="name",
+            operator=DataSearchOperator.equals,
+            value=f"item_{i * 7:08d}",
+        ),
+        "status in_list": lambda i: DataSearchCondition(
+            field_path="status",
+            operator=DataSearchOperator.in_list,
+            value=STATUSES[i % 4 : i % 4 + 1],
+        ),
+        "name regex": lambda i: DataSearchCondition(
+            field_path="name",
+            operator=DataSearchOperator.regex,
+            value=r"^item_0+1\d{2}$",
+        ),
+    }
+    result = {}
+    for label, make in queries.items():
+        t0 = time.perf_counter()
+        for i in range(rounds):
+            list(
+                store.iter_search(
+                    ResourceMetaSearchQuery(conditions=[make(i)], limit=20)
+                )
+            )
+        result[label] = time.perf_counter() - t0
+    return result
+
+
+def bench_reads_during_writes(store, n: int, threads: int) -> float:
+    """Point reads from *threads* threads while one thread keeps writing."""
+    stop = threading.Event()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            store[f"item:{i % n:08d}"] = make_meta(i % n)
+            i += 1
+
+    def reader(offset: int):
+        for i in range(offset, n, threads):
+            store[f"item:{i:08d}"]
+
+    background = threading.Thread(target=writer)
+    background.start()
+    t0 = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(reader, range(threads)))
+        return time.perf_counter() - t0
+    finally:
+        stop.set()
+        background.join()
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+def run(n: int, threads: int, tuned: bool, tmpdir: Path) -> None:
+    label = "tuned" if tuned else "default"
+    path = tmpdir / f"{label}.db"
+    store = make_store(path, tuned)
+    print(f"\n  --- {label} ---")
+    try:
+        seconds, errors = bench_concurrent_writes(store, n, threads)
+        suffix = f"  [{errors} failed]" if errors else ""
+        print(f"  concurrent writes x{threads}: {_rate(n, seconds)}{suffix}")
+        print(f"  sequential writes:     {_rate(n, bench_sequential_writes(store, n))}")
+    finally:
+        store.close()
+
+    # 重新開啟，如同重新啟動的服務（tuned mode 關閉時會更新查詢統計）
+    store = make_store(path, tuned)
+    try:
+        rounds = 200
+        for name, seconds in bench_searches(store, rounds).items():
+            print(f"  search {name:15s}{_rate(rounds, seconds)}")
+        seconds = bench_reads_during_writes(store, n, threads)
+        print(f"  reads during writes:   {_rate(n, seconds)}")
+    finally:
+        store.close()
+
+
+def main():
+    args = sys.argv[1:]
+    n = int(args[0]) if args else 4000
+    threads = int(args[1]) if len(args) > 1 else 16
+
+    print(f"\n{'=' * 60}")
+    print(f"  SQLite Meta Store Benchmark  N={n}  threads={threads}")
+    print(f"{'=' * 60}")
+    with tempfile.TemporaryDirectory() as d:
+        for tuned in (False, True):
+            run(n, threads, tuned, Path(d))
+
+
+if __name__ == "__main__":
+    main()
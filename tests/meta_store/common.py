@@ -1,16 +1,47 @@
+import datetime as dt
 from pathlib import Path
+from typing import Any
 
 import pytest
 from faker import Faker
 
+from autocrud.types import ResourceMeta
+
 faker = Faker()
 
+BASE_TIME = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def make_meta(i: int, *, revision: int = 1, **fields: Any) -> ResourceMeta:
+    """Meta of resource ``r{i:03d}`` at *revision*.
+
+    Created and updated at :data:`BASE_TIME` by ``"user"``; *fields* override
+    any of the other :class:`ResourceMeta` fields.
+    """
+    fields.setdefault("created_time", BASE_TIME)
+    fields.setdefault("updated_time", BASE_TIME)
+    fields.setdefault("created_by", "user")
+    fields.setdefault("updated_by", "user")
+    return ResourceMeta(
+        current_revision_id=f"r{i:03d}:{revision}",
+        resource_id=f"r{i:03d}",
+        total_revision_count=revision,
+        **fields,
+    )
+
+
 ALL_META_STORE_TYPES = [
     "memory",
+    "memory-objects",
     # "df",
+    "columnar",
     "disk",
+    "segment",
     "postgres",
+    "postgres-columns",
     "sql3-mem",
+    "sql3-mem-columns",
+    "cached-sql3-mem",
     # "sql3-file",
     "sql3-s3",
     # "memory-pg",
@@ -20,12 +51,14 @@ ALL_META_STORE_TYPES = [
     # "sa-mariadb",
     # "sa-mysql",
     # "sa-sqlite",
+    "sa-sqlite-columns",
     # "sa-oracle",
 ]
 
 
 def get_meta_store(store_type: str, tmpdir: Path = None):
     """Get meta store instance."""
+    from autocrud.resource_manager.basic import MetaLayout
     from autocrud.resource_manager.meta_store.df import DFMemoryMetaStore
     from autocrud.resource_manager.meta_store.simple import (
         DiskMetaStore,
@@ -39,13 +72,27 @@ def get_meta_store(store_type: str, tmpdir: Path = None):
 
     if store_type == "memory":
         return MemoryMetaStore(encoding="msgpack")
+    if store_type == "memory-objects":
+        return MemoryMetaStore(store_objects=True)
     if store_type == "df":
         return DFMemoryMetaStore(encoding="msgpack")
+    if store_type == "columnar":
+        from autocrud.resource_manager.meta_store.columnar import (
+            ColumnarMemoryMetaStore,
+        )
+
+        return ColumnarMemoryMetaStore(encoding="msgpack")
     if store_type == "disk":
         d = tmpdir / faker.pystr()
         d.mkdir()
         return DiskMetaStore(encoding="msgpack", rootdir=d)
-    if store_type == "postgres":
+    if store_type == "segment":
+        from autocrud.resource_manager.meta_store.segment import SegmentDiskMetaStore
+
+        d = tmpdir / faker.pystr()
+        d.mkdir()
+        return SegmentDiskMetaStore(encoding="msgpack", rootdir=d)
+    if store_type in ("postgres", "postgres-columns"):
         import psycopg2
 
         from autocrud.resource_manager.meta_store.postgres import PostgresMetaStore
@@ -61,12 +108,23 @@ def get_meta_store(store_type: str, tmpdir: Path = None):
                 pg_conn.commit()
             pg_conn.close()
 
-            return PostgresMetaStore(pg_dsn=pg_dsn, encoding="msgpack")
+            layout = (
+                MetaLayout.columns
+                if store_type == "postgres-columns"
+                else MetaLayout.blob
+            )
+            return PostgresMetaStore(pg_dsn=pg_dsn, encoding="msgpack", layout=layout)
         except Exception as e:
             pytest.fail(f"PostgreSQL not available: {e}")
 
     if store_type == "sql3-mem":
         return MemorySqliteMetaStore(encoding="msgpack")
+    if store_type == "sql3-mem-columns":
+        return MemorySqliteMetaStore(encoding="msgpack", layout=MetaLayout.columns)
+    if store_type == "cached-sql3-mem":
+        from autocrud.resource_manager.meta_store.cached import CachedMetaStore
+
+        return CachedMetaStore(MemorySqliteMetaStore(encoding="msgpack"))
     if store_type == "sql3-file":
         return FileSqliteMetaStore(
             db_filepath=tmpdir / "test_data_search.db",
@@ -282,7 +340,7 @@ def get_meta_store(store_type: str, tmpdir: Path = None):
             )
         except Exception as e:
             pytest.fail(f"MySQL not available: {e}")
-    if store_type == "sa-sqlite":
+    if store_type in ("sa-sqlite", "sa-sqlite-columns"):
         from autocrud.resource_manager.meta_store.sqlalchemy import (
             SQLAlchemyMetaStore,
         )
@@ -291,7 +349,12 @@ def get_meta_store(store_type: str, tmpdir: Path = None):
         db_file = tmpdir / "test_sa_sqlite.db"
         sa_url = f"sqlite:///{db_file}"
         try:
-            return SQLAlchemyMetaStore(url=sa_url, encoding="msgpack")
+            layout = (
+                MetaLayout.columns
+                if store_type == "sa-sqlite-columns"
+                else MetaLayout.blob
+            )
+            return SQLAlchemyMetaStore(url=sa_url, encoding="msgpack", layout=layout)
         except Exception as e:
             pytest.fail(f"SQLite not available: {e}")
     if store_type == "sa-oracle":
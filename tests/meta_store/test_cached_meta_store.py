@@ -0,0 +1,116 @@
+"""Tests for CachedMetaStore (read-through ResourceMeta cache)."""
+
+import time
+
+import pytest
+
+from autocrud.resource_manager.meta_store.cached import CachedMetaStore
+from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
+from autocrud.types import ResourceMeta
+
+from .common import make_meta
+
+
+class CountingMetaStore(MemoryMetaStore):
+    def __init__(self):
+        super().__init__(encoding="msgpack")
+        self.reads = 0
+
+    def __getitem__(self, pk: str) -> ResourceMeta:
+        self.reads += 1
+        return super().__getitem__(pk)
+
+
+@pytest.fixture
+def inner() -> CountingMetaStore:
+    return CountingMetaStore()
+
+
+def test_read_through(inner):
+    inner["r001"] = make_meta(1)
+    store = CachedMetaStore(inner)
+    assert store["r001"].current_revision_id == "r001:1"
+    assert store["r001"].current_revision_id == "r001:1"
+    assert "r001" in store
+    assert inner.reads == 1
+    assert store.cache_info().hits == 2
+
+
+def test_returns_independent_copies(inner):
+    store = CachedMetaStore(inner)
+    store["r001"] = make_meta(1)
+    meta = store["r001"]
+    meta.is_deleted = True
+    assert store["r001"].is_deleted is False
+
+
+def test_negative_entries(inner):
+    store = CachedMetaStore(inner)
+    for _ in range(3):
+        assert "missing" not in store
+        with pytest.raises(KeyError):
+            store["missing"]
+    assert inner.reads == 1
+    store["missing"] = make_meta(9)
+    assert "missing" in store
+
+
+def test_writes_update_cache(inner):
+    store = CachedMetaStore(inner)
+    store["r001"] = make_meta(1)
+    store["r001"] = make_meta(1, revision=2)
+    assert store["r001"].current_revision_id == "r001:2"
+    store.save_many([make_meta(1, revision=3), make_meta(2)])
+    assert store["r001"].current_revision_id == "r001:3"
+    assert store["r002"].resource_id == "r002"
+    assert inner.reads == 0
+    del store["r001"]
+    assert "r001" not in store
+    assert "r001" not in inner
+    with pytest.raises(KeyError):
+        del store["r001"]
+
+
+def test_get_many_fetches_only_misses(inner):
+    for i in range(4):
+        inner[f"r{i:03d}"] = make_meta(i)
+    store = CachedMetaStore(inner)
+    store["r000"]
+    inner.reads = 0
+    result = store.get_many(["r000", "r001", "r002", "nope"])
+    assert sorted(result) == ["r000", "r001", "r002"]
+    assert inner.reads == 3
+    assert sorted(store.get_many(["r001", "r002", "nope"])) == ["r001", "r002"]
+    assert inner.reads == 3
+
+
+def test_lru_and_ttl(inner):
+    for i in range(3):
+        inner[f"r{i:03d}"] = make_meta(i)
+    store = CachedMetaStore(inner, maxsize=2, ttl=0.05)
+    store["r000"], store["r001"], store["r002"]
+    assert store.cache_info().currsize == 2
+    inner["r002"] = make_meta(2, revision=5)
+    assert store["r002"].current_revision_id == "r002:1"  # 仍在快取中
+    time.sleep(0.06)
+    assert store["r002"].current_revision_id == "r002:5"
+
+
+def test_cross_process_invalidation_hook():
+    shared = MemoryMetaStore(encoding="msgpack")
+    peers: list[CachedMetaStore] = []
+
+    def broadcast(pks: list[str]) -> None:
+        for peer in peers:
+            for pk in pks:
+                peer.invalidate(pk)
+
+    a = CachedMetaStore(shared, on_write=broadcast)
+    b = CachedMetaStore(shared, on_write=broadcast)
+    peers.extend([a, b])
+    a["r001"] = make_meta(1)
+    assert b["r001"].current_revision_id == "r001:1"
+    a["r001"] = make_meta(1, revision=2)
+    assert b["r001"].current_revision_id == "r001:2"
+    del a["r001"]
+    assert "r001" not in b
@@ -0,0 +1,85 @@
+"""IMetaStore.count must agree with len(iter_search(...)) for every store."""
+
+import datetime as dt
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from autocrud.query import QB
+from autocrud.resource_manager.basic import encode_search_cursor
+from autocrud.types import (
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
+    ResourceMetaSortKey,
+)
+
+from . import common
+from .common import BASE_TIME, get_meta_store
+
+
+def make_meta(i: int) -> ResourceMeta:
+    moment = BASE_TIME + dt.timedelta(minutes=i)
+    return common.make_meta(
+        i,
+        created_time=moment,
+        updated_time=moment,
+        created_by="alice" if i % 2 else "bob",
+        updated_by="alice",
+        is_deleted=i % 5 == 0,
+        indexed_data={"group": i % 3},
+    )
+
+
+SORTS = [ResourceMetaSearchSort(key=ResourceMetaSortKey.created_time)]
+
+QUERIES = {
+    "all": ResourceMetaSearchQuery(limit=1000),
+    "default_limit": ResourceMetaSearchQuery(),
+    "offset": ResourceMetaSearchQuery(limit=1000, offset=7),
+    "offset_past_end": ResourceMetaSearchQuery(limit=1000, offset=500),
+    "limit": ResourceMetaSearchQuery(limit=4, offset=3),
+    "is_deleted": ResourceMetaSearchQuery(is_deleted=False, limit=1000),
+    "created_by": ResourceMetaSearchQuery(created_bys=["bob"], limit=1000),
+    "time_range": ResourceMetaSearchQuery(
+        created_time_start=BASE_TIME + dt.timedelta(minutes=5),
+        created_time_end=BASE_TIME + dt.timedelta(minutes=20),
+        limit=1000,
+    ),
+    "data_condition": QB["group"].eq(1).limit(1000).build(),
+    "after": ResourceMetaSearchQuery(
+        limit=1000, sorts=SORTS, after=encode_search_cursor(make_meta(10), SORTS)
+    ),
+}
+
+
+@pytest.fixture
+def my_tmpdir():
+    with tempfile.TemporaryDirectory(dir="./") as d:
+        yield Path(d)
+
+
+@pytest.mark.parametrize(
+    "meta_store_type",
+    [
+        "memory",
+        "df",
+        "columnar",
+        "disk",
+        "segment",
+        "sql3-mem",
+        "sql3-mem-columns",
+        "cached-sql3-mem",
+        "sa-sqlite",
+    ],
+)
+@pytest.mark.parametrize("query_name", list(QUERIES))
+def test_count_matches_search(meta_store_type, query_name, my_tmpdir):
+    meta_store = get_meta_store(meta_store_type, tmpdir=my_tmpdir)
+    for i in range(30):
+        meta = make_meta(i)
+        meta_store[meta.resource_id] = meta
+    query = QUERIES[query_name]
+    expected = len(list(meta_store.iter_search(query)))
+    assert meta_store.count(query) == expected
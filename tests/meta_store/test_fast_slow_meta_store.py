@@ -0,0 +1,211 @@
+"""FastSlowMetaStore: merge-on-read search, batched sync, backpressure."""
+
+import datetime as dt
+
+import pytest
+
+from autocrud.resource_manager.meta_store import fast_slow
+from autocrud.resource_manager.meta_store.fast_slow import FastSlowMetaStore
+from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
+from autocrud.resource_manager.meta_store.sqlite3 import MemorySqliteMetaStore
+from autocrud.types import (
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
+    ResourceMetaSortDirection,
+    ResourceMetaSortKey,
+)
+
+from . import common
+
+
+def make_meta(i: int, updated_by: str = "user") -> ResourceMeta:
+    moment = common.BASE_TIME + dt.timedelta(seconds=i)
+    return common.make_meta(
+        i, created_time=moment, updated_time=moment, updated_by=updated_by
+    )
+
+
+@pytest.fixture
+def store() -> FastSlowMetaStore:
+    # 背景同步不會在測試期間觸發
+    store = FastSlowMetaStore(
+        MemoryMetaStore(encoding="msgpack"),
+        MemorySqliteMetaStore(encoding="msgpack"),
+        sync_interval=3600,
+        max_pending=None,
+    )
+    yield store
+    store._stop_sync.set()
+
+
+def by_id(limit=10, offset=0, **kwargs) -> ResourceMetaSearchQuery:
+    return ResourceMetaSearchQuery(
+        sorts=[
+            ResourceMetaSearchSort(
+                key=ResourceMetaSortKey.resource_id,
+                direction=ResourceMetaSortDirection.descending,
+            )
+        ],
+        limit=limit,
+        offset=offset,
+        **kwargs,
+    )
+
+
+def test_search_merges_unsynced_writes(store):
+    store.save_many(make_meta(i) for i in range(20))
+    store.force_sync()
+    # 覆蓋慢速存儲中的資源、新增資源，都還沒同步
+    store["r019"] = make_meta(19, "someone")
+    store["r005"] = make_meta(5, "someone")
+    store["r020"] = make_meta(20)
+    assert store.sync_info().pending == 3
+
+    page = list(store.iter_search(by_id(limit=3)))
+    assert [m.resource_id for m in page] == ["r020", "r019", "r018"]
+    assert page[1].updated_by == "someone"
+    page = list(store.iter_search(by_id(limit=3, offset=19)))
+    assert [m.resource_id for m in page] == ["r001", "r000"]
+
+    query = by_id(limit=100, updated_bys=["user"])
+    assert [m.resource_id for m in store.iter_search(query)] == [
+        f"r{i:03d}" for i in range(20, -1, -1) if i not in (5, 19)
+    ]
+    assert store.count(query) == 19
+    assert store.count(by_id(limit=5, offset=18, updated_bys=["user"])) == 1
+    assert store.count(by_id(limit=100, updated_bys=["someone"])) == 2
+    assert len(store) == 21
+    assert sorted(store) == [f"r{i:03d}" for i in range(21)]
+    # 查詢不會觸發同步
+    assert store.sync_info().syncs == 1
+
+
+def test_search_does_not_decode_whole_fast_tier(store, monkeypatch):
+    store.save_many(make_meta(i) for i in range(20))
+    store.force_sync()
+    store.save_many(make_meta(i, "someone") for i in range(10, 40))
+
+    def no_get_many(pks):
+        raise AssertionError("fast tier decoded")
+
+    monkeypatch.setattr(store._fast_store, "get_many", no_get_many)
+    limits = []
+    iter_search = store._slow_store.iter_search
+
+    def spy(query):
+        limits.append(query.limit)
+        return iter_search(query)
+
+    monkeypatch.setattr(store._slow_store, "iter_search", spy)
+    page = list(store.iter_search(by_id(limit=3, offset=30)))
+    assert [m.resource_id for m in page] == ["r009", "r008", "r007"]
+    # 慢速存儲多取 Fast 存儲的筆數，被覆蓋的資源在讀取後略過
+    assert limits == [63]
+    assert store.count(by_id(updated_bys=["user"])) == 10
+    assert len(store) == 40
+
+
+def test_slow_queries_keep_id_lists_bounded(store, monkeypatch):
+    monkeypatch.setattr(fast_slow, "_ID_CHUNK", 4)
+    store.save_many(make_meta(i) for i in range(20))
+    store.force_sync()
+    store.save_many(make_meta(i, "someone") for i in range(5, 15))
+    id_lists = []
+    for name in ("iter_search", "count"):
+        method = getattr(store._slow_store, name)
+
+        def spy(query, method=method):
+            for cond in query.conditions or ():
+                id_lists.append(cond.value)
+            return method(query)
+
+        monkeypatch.setattr(store._slow_store, name, spy)
+
+    query = by_id(limit=100, updated_bys=["user"])
+    assert [m.resource_id for m in store.iter_search(query)] == [
+        f"r{i:03d}" for i in range(19, -1, -1) if not 5 <= i < 15
+    ]
+    assert store.count(query) == 10
+    assert len(store) == 20
+    assert id_lists
+    assert max(map(len, id_lists)) <= 4
+
+
+def test_delete_removes_both_tiers(store):
+    store["r001"] = make_meta(1)
+    store.force_sync()
+    store["r001"] = make_meta(1, "someone")
+    del store["r001"]
+    with pytest.raises(KeyError):
+        store["r001"]
+    with pytest.raises(KeyError):
+        del store["r001"]
+    assert len(store) == 0
+
+
+def test_sync_coalesces_in_batches(store):
+    store.sync_batch_size = 4
+    batches = []
+    save_many = store._slow_store.save_many
+
+    def recording_save_many(metas):
+        metas = list(metas)
+        batches.append(len(metas))
+        save_many(metas)
+
+    store._slow_store.save_many = recording_save_many
+    for i in range(10):
+        store[f"r{i % 5:03d}"] = make_meta(i % 5, f"v{i}")
+    info = store.sync_info()
+    assert info.pending == 10
+    assert info.lag > 0
+
+    store.force_sync()
+    # Fast 存儲以 resource_id 為 key，重複寫入只同步最後一次
+    assert batches == [4, 1]
+    assert store._slow_store["r004"].updated_by == "v9"
+    info = store.sync_info()
+    assert (info.pending, info.lag, info.syncs, info.synced) == (0, 0.0, 1, 5)
+
+
+def test_backpressure_syncs_on_writer(store):
+    store.max_pending = 5
+    for i in range(12):
+        store[f"r{i:03d}"] = make_meta(i)
+    info = store.sync_info()
+    assert info.forced_syncs == 2
+    assert info.pending == 2
+    assert len(store._fast_store) == 2
+    assert len(store._slow_store) == 10
+
+
+def test_failed_sync_keeps_writes(store):
+    store.save_many(make_meta(i) for i in range(3))
+
+    def failing_save_many(metas):
+        raise RuntimeError("slow store down")
+
+    save_many = store._slow_store.save_many
+    store._slow_store.save_many = failing_save_many
+    with pytest.raises(RuntimeError):
+        store.force_sync()
+    assert store.sync_info().pending == 3
+    assert len(store._fast_store) == 3
+
+    store._slow_store.save_many = save_many
+    store.force_sync()
+    assert store.sync_info().pending == 0
+    assert len(store._slow_store) == 3
+
+
+def test_memory_drain_keeps_concurrent_writes():
+    fast = MemoryMetaStore(encoding="msgpack")
+    for i in range(3):
+        fast[f"r{i:03d}"] = make_meta(i)
+    with fast.get_then_delete() as metas:
+        assert sorted(m.resource_id for m in metas) == ["r000", "r001", "r002"]
+        fast["r001"] = make_meta(1, "someone")
+        fast["r009"] = make_meta(9)
+    assert sorted(fast) == ["r001", "r009"]
+    assert fast["r001"].updated_by == "someone"
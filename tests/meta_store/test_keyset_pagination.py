@@ -0,0 +1,200 @@
+"""Tests for keyset (cursor) pagination via ResourceMetaSearchQuery.after."""
+
+import datetime as dt
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from autocrud.query import QB
+from autocrud.resource_manager.basic import (
+    decode_search_cursor,
+    encode_search_cursor,
+    get_keyset_sort_fn,
+    get_keyset_sorts,
+)
+from autocrud.types import (
+    ResourceDataSearchSort,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
+    ResourceMetaSortDirection,
+    ResourceMetaSortKey,
+)
+
+from . import common
+from .common import BASE_TIME, get_meta_store
+
+
+def make_meta(i: int) -> ResourceMeta:
+    return common.make_meta(
+        i,
+        # 刻意製造相同的 created_time，確認 resource_id tie-break 生效
+        created_time=BASE_TIME + dt.timedelta(minutes=i // 3),
+        updated_time=BASE_TIME + dt.timedelta(minutes=50 - i),
+        indexed_data={
+            "group": i % 4,
+            "score": None if i % 5 == 0 else i % 7,
+        },
+    )
+
+
+SORTS = {
+    "default": [],
+    "created_asc": [ResourceMetaSearchSort(key=ResourceMetaSortKey.created_time)],
+    "updated_desc": [
+        ResourceMetaSearchSort(
+            key=ResourceMetaSortKey.updated_time,
+            direction=ResourceMetaSortDirection.descending,
+        )
+    ],
+    "group_then_created_desc": [
+        ResourceDataSearchSort(field_path="group"),
+        ResourceMetaSearchSort(
+            key=ResourceMetaSortKey.created_time,
+            direction=ResourceMetaSortDirection.descending,
+        ),
+    ],
+    "nullable_score_desc": [
+        ResourceDataSearchSort(
+            field_path="score",
+            direction=ResourceMetaSortDirection.descending,
+        )
+    ],
+    "nullable_score_asc": [ResourceDataSearchSort(field_path="score")],
+}
+
+
+@pytest.fixture
+def my_tmpdir():
+    with tempfile.TemporaryDirectory(dir="./") as d:
+        yield Path(d)
+
+
+@pytest.mark.parametrize(
+    "meta_store_type",
+    [
+        "memory",
+        "columnar",
+        "disk",
+        "segment",
+        "sql3-mem",
+        "sql3-mem-columns",
+        "sa-sqlite",
+        "sa-sqlite-columns",
+    ],
+)
+@pytest.mark.parametrize("sort_name", list(SORTS))
+@pytest.mark.parametrize("page_size", [1, 4, 7])
+def test_cursor_pages_match_full_order(
+    meta_store_type, sort_name, page_size, my_tmpdir
+):
+    meta_store = get_meta_store(meta_store_type, tmpdir=my_tmpdir)
+    metas = [make_meta(i) for i in range(23)]
+    for meta in metas:
+        meta_store[meta.resource_id] = meta
+    sorts = SORTS[sort_name]
+    # 第一頁需依完整的 keyset 順序搜尋（list_resources_page 也是如此）
+    keyset_sorts = get_keyset_sorts(sorts)
+
+    expected = [m.resource_id for m in sorted(metas, key=get_keyset_sort_fn(sorts))]
+    full = [
+        m.resource_id
+        for m in meta_store.iter_search(
+            ResourceMetaSearchQuery(limit=100, sorts=keyset_sorts)
+        )
+    ]
+    assert full == expected
+
+    paged: list[str] = []
+    after = None
+    while True:
+        query = ResourceMetaSearchQuery(limit=page_size, sorts=keyset_sorts)
+        if after is not None:
+            query.after = after
+        page = list(meta_store.iter_search(query))
+        paged.extend(m.resource_id for m in page)
+        if len(page) < page_size:
+            break
+        after = encode_search_cursor(page[-1], sorts)
+    assert paged == expected
+
+
+@pytest.mark.parametrize("meta_store_type", ["memory", "sql3-mem"])
+def test_cursor_combines_with_filters(meta_store_type, my_tmpdir):
+    meta_store = get_meta_store(meta_store_type, tmpdir=my_tmpdir)
+    metas = [make_meta(i) for i in range(20)]
+    metas[3].is_deleted = True
+    for meta in metas:
+        meta_store[meta.resource_id] = meta
+    sorts = SORTS["created_asc"]
+
+    first = list(
+        meta_store.iter_search(
+            ResourceMetaSearchQuery(is_deleted=False, limit=5, sorts=sorts)
+        )
+    )
+    rest = list(
+        meta_store.iter_search(
+            ResourceMetaSearchQuery(
+                is_deleted=False,
+                limit=100,
+                sorts=sorts,
+                after=encode_search_cursor(first[-1], sorts),
+            )
+        )
+    )
+    ids = [m.resource_id for m in first + rest]
+    assert "r003" not in ids
+    assert len(ids) == len(set(ids)) == 19
+
+
+def test_cursor_mismatched_sorts_rejected():
+    cursor = encode_search_cursor(make_meta(1), SORTS["created_asc"])
+    assert decode_search_cursor(cursor, SORTS["created_asc"])[-1] == "r001"
+    with pytest.raises(ValueError):
+        decode_search_cursor(cursor, SORTS["updated_desc"])
+    with pytest.raises(ValueError):
+        decode_search_cursor("not-a-cursor", SORTS["created_asc"])
+
+
+def test_keyset_sorts_append_resource_id_tiebreak():
+    sorts = get_keyset_sorts(SORTS["updated_desc"])
+    assert sorts[-1] == ResourceMetaSearchSort(
+        key=ResourceMetaSortKey.resource_id,
+        direction=ResourceMetaSortDirection.descending,
+    )
+    explicit = [ResourceMetaSearchSort(key=ResourceMetaSortKey.resource_id)]
+    assert get_keyset_sorts(explicit) == explicit
+
+
+@pytest.mark.parametrize("meta_store_type", ["memory", "columnar"])
+def test_plain_search_keeps_insertion_order_for_ties(meta_store_type, my_tmpdir):
+    meta_store = get_meta_store(meta_store_type, tmpdir=my_tmpdir)
+    for i in reversed(range(9)):
+        meta_store[f"r{i:03d}"] = make_meta(i)
+
+    # 沒有 after 時不附加 resource_id tie-break，相同排序值維持寫入順序
+    query = ResourceMetaSearchQuery(limit=100, sorts=SORTS["created_asc"])
+    assert [m.resource_id for m in meta_store.iter_search(query)] == [
+        *("r002", "r001", "r000"),
+        *("r005", "r004", "r003"),
+        *("r008", "r007", "r006"),
+    ]
+    query = ResourceMetaSearchQuery(
+        limit=3, sorts=[ResourceDataSearchSort(field_path="group")]
+    )
+    assert [m.resource_id for m in meta_store.iter_search(query)] == [
+        "r008",
+        "r004",
+        "r000",
+    ]
+
+
+def test_query_builder_after_meta():
+    meta = make_meta(4)
+    query = QB["group"].eq(0).sort(QB.created_time().desc()).page(1, size=3, after=meta)
+    built = query.build()
+    assert built.offset == 0
+    assert decode_search_cursor(built.after, built.sorts)[-1] == "r004"
+    assert QB["group"].eq(0).after("abc").build().after == "abc"
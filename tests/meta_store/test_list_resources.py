@@ -69,7 +69,7 @@ def my_tmpdir():
 
 
 @pytest.mark.flaky(retries=3, delay=1)
-@pytest.mark.parametrize("meta_store_type", ["memory", "sql3-mem"])
+@pytest.mark.parametrize("meta_store_type", ["memory", "sql3-mem", "sql3-mem-columns"])
 @pytest.mark.parametrize("res_store_type", ["memory"])
 class TestListResources:
     @pytest.fixture(autouse=True)
@@ -411,6 +411,31 @@ class TestListResources:
         assert call_args[0] is query
         assert len(results) == 1
 
+    def test_list_resources_reads_only_needed_meta_fields(self):
+        """沒有回傳完整 meta 時，搜尋不需要 indexed_data"""
+        creator, _, _, _ = self.create()
+        original = self.mgr.storage.search_fields
+        calls = []
+
+        def spy(query, fields):
+            calls.append(set(fields))
+            return original(query, fields)
+
+        self.mgr.storage.search_fields = spy
+        query = ResourceMetaSearchQuery()
+        user, now = faker.user_name(), faker.date_time()
+        with self.mgr.meta_provide(user, now):
+            results = self.mgr.list_resources(query, returns=["data", "info"])
+            with_meta = self.mgr.list_resources(
+                query, returns=["meta"], partial=["meta/updated_by"]
+            )
+
+        assert len(results) == 1
+        assert results[0].data is not UNSET
+        assert with_meta[0].meta.updated_by == creator
+        base = {"resource_id", "current_revision_id", "schema_version"}
+        assert calls == [base, base | {"updated_by"}]
+
     # ------------------------------------------------------------------
     # QB query support test
     # ------------------------------------------------------------------
@@ -429,3 +454,109 @@ class TestListResources:
         assert isinstance(results, list)
         assert len(results) == 1
         assert results[0].meta.resource_id == info.resource_id
+
+    # ------------------------------------------------------------------
+    # Streaming / shared pool tests
+    # ------------------------------------------------------------------
+
+    def test_iter_list_resources_keeps_order(self):
+        """iter_list_resources 依搜尋順序逐筆產出"""
+        for _ in range(30):
+            self.create()
+
+        query = ResourceMetaSearchQuery(limit=30)
+        user, now = faker.user_name(), faker.date_time()
+        with self.mgr.meta_provide(user, now):
+            metas = self.mgr.search_resources(query)
+            it = self.mgr.iter_list_resources(query)
+            assert isinstance(it, Generator)
+            results = list(it)
+
+        assert [r.meta.resource_id for r in results] == [m.resource_id for m in metas]
+
+    def test_iter_list_resources_reuses_pool(self):
+        """多次呼叫共用同一個 thread pool"""
+        for _ in range(15):
+            self.create()
+
+        query = ResourceMetaSearchQuery(limit=15)
+        user, now = faker.user_name(), faker.date_time()
+        with self.mgr.meta_provide(user, now):
+            assert len(self.mgr.list_resources(query)) == 15
+            pool = self.mgr._fetch_pool
+            assert pool is not None
+            assert len(self.mgr.list_resources(query)) == 15
+        assert self.mgr._fetch_pool is pool
+
+    def test_close_shuts_down_pool(self):
+        """close() 結束 thread pool，之後再使用會建立新的"""
+        for _ in range(15):
+            self.create()
+
+        query = ResourceMetaSearchQuery(limit=15)
+        user, now = faker.user_name(), faker.date_time()
+        with self.mgr.meta_provide(user, now):
+            assert len(self.mgr.list_resources(query)) == 15
+            pool = self.mgr._fetch_pool
+            self.mgr.close()
+            assert self.mgr._fetch_pool is None
+            with pytest.raises(RuntimeError):
+                pool.submit(int)
+            assert len(self.mgr.list_resources(query)) == 15
+        assert self.mgr._fetch_pool is not pool
+        self.mgr.close()
+
+    def test_iter_list_resources_bounded_in_flight(self):
+        """同一次呼叫中 in-flight 的 fetch 數量有上限"""
+        import threading
+
+        for _ in range(40):
+            self.create()
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        original_get = self.mgr.get
+
+        def tracking_get(resource_id, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            try:
+                return original_get(resource_id, **kwargs)
+            finally:
+                with lock:
+                    in_flight -= 1
+
+        self.mgr.get = tracking_get
+        query = ResourceMetaSearchQuery(limit=40)
+        user, now = faker.user_name(), faker.date_time()
+        with self.mgr.meta_provide(user, now):
+            it = self.mgr.iter_list_resources(query)
+            first = next(it)
+            it.close()
+
+        assert first is not None
+        assert peak <= self.mgr._default_worker_num(40)
+
+    def test_iter_list_resources_sees_caller_context(self):
+        """worker 執行緒可以讀到呼叫端的 meta_provide 值"""
+        for _ in range(15):
+            self.create()
+
+        seen = []
+        original_get = self.mgr.get
+
+        def get_with_user(resource_id, **kwargs):
+            seen.append(self.mgr.user_ctx.get())
+            return original_get(resource_id, **kwargs)
+
+        self.mgr.get = get_with_user
+        query = ResourceMetaSearchQuery(limit=15)
+        user, now = faker.user_name(), faker.date_time()
+        with self.mgr.meta_provide(user, now):
+            results = list(self.mgr.iter_list_resources(query))
+
+        assert len(results) == 15
+        assert set(seen) == {user}
@@ -0,0 +1,166 @@
+"""MemoryMetaStore secondary indexes must not change search results."""
+
+import datetime as dt
+import random
+from enum import Enum
+
+import pytest
+
+from autocrud.resource_manager.basic import compile_query, sort_and_paginate
+from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    ResourceDataSearchSort,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
+    ResourceMetaSortDirection,
+    ResourceMetaSortKey,
+)
+
+from . import common
+from .common import BASE_TIME
+
+Op = DataSearchOperator
+
+
+class Status(Enum):
+    pending = "pending"
+    done = "done"
+
+
+def cond(field_path, operator, value) -> DataSearchCondition:
+    return DataSearchCondition(field_path=field_path, operator=operator, value=value)
+
+
+def make_meta(i: int, rng: random.Random) -> ResourceMeta:
+    data = {
+        "status": rng.choice(["pending", "done", "failed"]),
+        "retries": rng.choice([None, 0, 1, 2, 3.5]),
+        "mixed": rng.choice([1, "1", ["x"], None]),
+        "when": BASE_TIME + dt.timedelta(days=rng.randrange(5)),
+    }
+    if rng.random() < 0.2:
+        del data["retries"]
+    return common.make_meta(
+        i,
+        created_time=BASE_TIME + dt.timedelta(minutes=rng.randrange(30)),
+        is_deleted=i % 6 == 0,
+        indexed_data=data if i % 9 else {},
+    )
+
+
+@pytest.fixture
+def store() -> MemoryMetaStore:
+    rng = random.Random(11)
+    store = MemoryMetaStore(encoding="json")
+    metas = [make_meta(i, rng) for i in range(120)]
+    for meta in metas:
+        store[meta.resource_id] = meta
+    # 更新與刪除都要維護索引
+    for meta in metas[::5]:
+        meta.indexed_data = {"status": "done", "retries": 7}
+        store[meta.resource_id] = meta
+    for meta in metas[::8]:
+        del store[meta.resource_id]
+    return store
+
+
+def scan(store: MemoryMetaStore, query: ResourceMetaSearchQuery) -> list:
+    metas = [store[pk] for pk in store]
+    return sort_and_paginate(filter(compile_query(query), metas), query)
+
+
+QUERIES = {
+    "enum_equals": dict(conditions=[cond("status", Op.equals, Status.pending)]),
+    "in_list": dict(data_conditions=[cond("status", Op.in_list, ["done", "failed"])]),
+    "range": dict(data_conditions=[cond("retries", Op.greater_than_or_equal, 1)]),
+    "range_and_equals": dict(
+        is_deleted=False,
+        data_conditions=[
+            cond("retries", Op.less_than, 3),
+            cond("status", Op.equals, "failed"),
+        ],
+    ),
+    "mixed_types": dict(data_conditions=[cond("mixed", Op.equals, 1)]),
+    "unhashable": dict(data_conditions=[cond("mixed", Op.equals, ["x"])]),
+    # JSON 解碼後 datetime 變成字串，索引必須看到相同的值
+    "datetime_as_string": dict(
+        data_conditions=[cond("when", Op.less_than, "2024-01-03")]
+    ),
+    "unknown_path": dict(data_conditions=[cond("nope", Op.equals, 1)]),
+}
+
+SORTS = {
+    "none": [],
+    "retries_asc": [
+        ResourceDataSearchSort(field_path="retries"),
+        ResourceMetaSearchSort(key=ResourceMetaSortKey.created_time),
+    ],
+    "status_desc": [
+        ResourceDataSearchSort(
+            field_path="status", direction=ResourceMetaSortDirection.descending
+        )
+    ],
+}
+
+
+@pytest.mark.parametrize("query_name", list(QUERIES))
+@pytest.mark.parametrize("sort_name", list(SORTS))
+@pytest.mark.parametrize("limit", [1, 4, 1000])
+def test_indexed_search_matches_scan(store, query_name, sort_name, limit):
+    query = ResourceMetaSearchQuery(
+        **QUERIES[query_name], sorts=SORTS[sort_name], limit=limit, offset=1
+    )
+    assert list(store.iter_search(query)) == scan(store, query)
+    query.limit = 1000
+    query.offset = 0
+    assert store.count(query) == len(scan(store, query))
+
+
+@pytest.mark.parametrize("sort_name", ["retries_asc", "status_desc"])
+def test_sorted_walk_matches_scan(store, sort_name):
+    for limit in (1, 3, 30):
+        query = ResourceMetaSearchQuery(
+            sorts=SORTS[sort_name], is_deleted=False, limit=limit, offset=2
+        )
+        assert list(store.iter_search(query)) == scan(store, query)
+
+
+class CountingStore(MemoryMetaStore):
+    def __init__(self):
+        super().__init__()
+        self.loaded = 0
+
+    def _load(self, pk):
+        self.loaded += 1
+        return super()._load(pk)
+
+
+def test_equality_index_decodes_only_candidates():
+    store = CountingStore()
+    rng = random.Random(3)
+    for i in range(500):
+        meta = make_meta(i, rng)
+        meta.indexed_data = {"status": "pending" if i < 5 else "done", "retries": i}
+        store[meta.resource_id] = meta
+    query = ResourceMetaSearchQuery(
+        conditions=[cond("status", Op.equals, Status.pending)],
+        sorts=[ResourceDataSearchSort(field_path="retries")],
+        limit=1,
+    )
+    assert [m.resource_id for m in store.iter_search(query)] == ["r000"]
+    assert store.loaded == 5
+
+    store.loaded = 0
+    query = ResourceMetaSearchQuery(
+        sorts=[
+            ResourceDataSearchSort(
+                field_path="retries", direction=ResourceMetaSortDirection.descending
+            )
+        ],
+        limit=2,
+    )
+    assert [m.resource_id for m in store.iter_search(query)] == ["r499", "r498"]
+    assert store.loaded == 2
@@ -0,0 +1,100 @@
+"""RedisMetaStore: hash layout, atomic drain and legacy key migration."""
+
+import pytest
+import redis
+
+from autocrud.resource_manager.meta_store.redis import RedisMetaStore
+from autocrud.types import (
+    ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
+    ResourceMetaSortKey,
+)
+
+from .common import make_meta
+
+REDIS_URL = "redis://localhost:6379/0"
+
+
+@pytest.fixture
+def client():
+    client = redis.Redis.from_url(REDIS_URL)
+    try:
+        client.flushall()
+    except redis.ConnectionError:
+        pytest.skip("Redis not available")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def store(client) -> RedisMetaStore:
+    return RedisMetaStore(redis_url=REDIS_URL, encoding="msgpack", prefix="t:")
+
+
+def test_bulk_operations(store):
+    store.save_many(make_meta(i) for i in range(5))
+    assert len(store) == 5
+    assert sorted(store.get_many(["r001", "r003", "nope"])) == ["r001", "r003"]
+    del store["r001"]
+    with pytest.raises(KeyError):
+        del store["r001"]
+    query = ResourceMetaSearchQuery(updated_bys=["user"], limit=10)
+    assert store.count(query) == len(list(store.iter_search(query))) == 4
+
+
+def test_writes_during_drain_are_kept(store):
+    store.save_many(make_meta(i) for i in range(3))
+    with store.get_then_delete() as metas:
+        assert sorted(m.resource_id for m in metas) == ["r000", "r001", "r002"]
+        # 同步期間的讀寫
+        assert store["r000"] == make_meta(0)
+        store["r001"] = make_meta(1, updated_by="someone")
+        store["r009"] = make_meta(9)
+        assert len(store) == 4
+    assert sorted(store) == ["r001", "r009"]
+    assert store["r001"].updated_by == "someone"
+
+
+def test_failed_drain_keeps_metas(store):
+    store.save_many(make_meta(i) for i in range(2))
+    with pytest.raises(RuntimeError), store.get_then_delete():
+        raise RuntimeError
+    assert sorted(store) == ["r000", "r001"]
+    store["r000"] = make_meta(0, updated_by="newer")
+    with store.get_then_delete() as metas:
+        assert {m.resource_id: m.updated_by for m in metas} == {
+            "r000": "newer",
+            "r001": "user",
+        }
+    assert len(store) == 0
+    with store.get_then_delete() as metas:
+        assert metas == []
+
+
+def test_legacy_keys_are_migrated(client):
+    legacy = RedisMetaStore(redis_url=REDIS_URL, encoding="msgpack", prefix="t:")
+    encoded = legacy._serializer.encode(make_meta(1))
+    client.set("t:resource_meta:r001", encoded)
+
+    store = RedisMetaStore(redis_url=REDIS_URL, encoding="msgpack", prefix="t:")
+    assert list(store) == ["r001"]
+    assert store["r001"] == make_meta(1)
+    assert client.get("t:resource_meta:r001") is None
+
+
+def test_paging_fetches_keys_in_batches(store, monkeypatch):
+    store.save_many(make_meta(i) for i in range(30))
+    calls = []
+    fetch = store._fetch
+    monkeypatch.setattr(store, "_fetch", lambda pks: calls.append(pks) or fetch(pks))
+
+    by_id = [ResourceMetaSearchSort(key=ResourceMetaSortKey.resource_id)]
+    query = ResourceMetaSearchQuery(offset=5, limit=10, sorts=by_id)
+    page = list(store.iter_search(query))
+    assert [m.resource_id for m in page] == [f"r{i:03d}" for i in range(5, 15)]
+    assert [len(pks) for pks in calls] == [15]
+
+    calls.clear()
+    query = ResourceMetaSearchQuery(updated_bys=["nobody"], limit=10, sorts=by_id)
+    assert list(store.iter_search(query)) == []
+    assert [len(pks) for pks in calls] == [10, 20]
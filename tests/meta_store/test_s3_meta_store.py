@@ -351,6 +351,56 @@ def test_s3_sqlite_meta_store_check_etag_on_read(s3_test_key, cleanup_s3_file):
     store2.close()
 
 
+def test_s3_sqlite_meta_store_search_fields_checks_etag(s3_test_key, cleanup_s3_file):
+    """測試只讀部分欄位的搜尋（list_resources 使用）也會檢查 ETag 並重載"""
+    cleanup_s3_file.append(s3_test_key)
+    import time
+
+    from autocrud.types import ResourceMetaSearchQuery
+
+    def make_store():
+        return S3SqliteMetaStore(
+            bucket=S3_BUCKET,
+            key=s3_test_key,
+            endpoint_url=S3_ENDPOINT,
+            access_key_id=S3_ACCESS_KEY,
+            secret_access_key=S3_SECRET_KEY,
+            auto_sync=True,
+            sync_interval=0,
+            enable_locking=True,
+            check_etag_on_read=True,
+        )
+
+    def make_meta(i: int) -> ResourceMeta:
+        now = dt.datetime.now(dt.timezone.utc)
+        return ResourceMeta(
+            current_revision_id=f"rev-{i:03d}",
+            resource_id=f"test-{i}",
+            total_revision_count=1,
+            created_time=now,
+            updated_time=now,
+            created_by="user",
+            updated_by="user",
+            is_deleted=False,
+            schema_version="1",
+        )
+
+    store1 = make_store()
+    store1["test-1"] = make_meta(1)
+    store2 = make_store()
+
+    # store1 添加新數據，store2 等待超過檢查間隔後搜尋
+    store1["test-2"] = make_meta(2)
+    time.sleep(1.1)
+
+    query = ResourceMetaSearchQuery(is_deleted=False)
+    results = list(store2.iter_search_fields(query, {"resource_id"}))
+    assert sorted(m.resource_id for m in results) == ["test-1", "test-2"]
+
+    store1.close()
+    store2.close()
+
+
 def test_s3_sqlite_meta_store_save_many(s3_test_key, cleanup_s3_file):
     """測試批量保存"""
     cleanup_s3_file.append(s3_test_key)
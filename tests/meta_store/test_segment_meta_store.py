@@ -0,0 +1,169 @@
+"""SegmentDiskMetaStore: recovery, compaction and draining."""
+
+import pytest
+
+from autocrud.resource_manager.meta_store.segment import SegmentDiskMetaStore
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+)
+
+from . import common
+
+
+def make_meta(i: int, status: str = "pending") -> ResourceMeta:
+    return common.make_meta(i, indexed_data={"status": status, "n": i})
+
+
+def open_store(rootdir, **kwargs) -> SegmentDiskMetaStore:
+    kwargs.setdefault("background", False)
+    return SegmentDiskMetaStore(encoding="msgpack", rootdir=rootdir, **kwargs)
+
+
+def snapshot(store: SegmentDiskMetaStore) -> dict[str, ResourceMeta]:
+    return {pk: store[pk] for pk in store}
+
+
+def segment_files(rootdir) -> list[str]:
+    return sorted(p.name for p in rootdir.glob("*.seg"))
+
+
+@pytest.mark.parametrize("close", [True, False])
+def test_reopen_restores_index(tmp_path, close):
+    store = open_store(tmp_path, segment_size=2048)
+    store.save_many(make_meta(i) for i in range(40))
+    store.checkpoint()
+    # checkpoint 之後的寫入要靠重播
+    store["r001"] = make_meta(1, "done")
+    del store["r002"]
+    expected = snapshot(store)
+    if close:
+        store.close()
+
+    reopened = open_store(tmp_path, segment_size=2048)
+    assert len(reopened) == 39
+    assert snapshot(reopened) == expected
+    assert "r002" not in reopened
+    reopened["r050"] = make_meta(50)
+    assert reopened["r050"] == make_meta(50)
+
+
+def test_torn_tail_is_truncated(tmp_path):
+    store = open_store(tmp_path)
+    store.save_many(make_meta(i) for i in range(3))
+    store.close()
+    [name] = segment_files(tmp_path)
+    with (tmp_path / name).open("ab") as f:
+        f.write(b"\x01\x02\x03partial record")
+    (tmp_path / "index").unlink()
+
+    reopened = open_store(tmp_path)
+    assert sorted(reopened) == ["r000", "r001", "r002"]
+    reopened["r003"] = make_meta(3)
+    reopened.close()
+    assert sorted(open_store(tmp_path)) == ["r000", "r001", "r002", "r003"]
+
+
+def test_compaction_drops_garbage_segments(tmp_path):
+    store = open_store(tmp_path, segment_size=1024)
+    for round in range(5):
+        store.save_many(make_meta(i, f"v{round}") for i in range(20))
+    del store["r000"]
+    expected = snapshot(store)
+    before = segment_files(tmp_path)
+
+    assert store.compact()
+    after = segment_files(tmp_path)
+    assert len(after) < len(before)
+    assert snapshot(store) == expected
+    assert not store.compact()
+
+    # 就算 index 遺失，重播剩下的 segment 也不會讓刪除的資源復活
+    store.close()
+    (tmp_path / "index").unlink()
+    assert snapshot(open_store(tmp_path, segment_size=1024)) == expected
+
+
+def test_search_and_count(tmp_path):
+    store = open_store(tmp_path, segment_size=1024)
+    store.save_many(make_meta(i, "done" if i % 3 else "pending") for i in range(30))
+    query = ResourceMetaSearchQuery(
+        data_conditions=[
+            DataSearchCondition(
+                field_path="status", operator=DataSearchOperator.equals, value="done"
+            )
+        ],
+        limit=100,
+    )
+    found = list(store.iter_search(query))
+    assert len(found) == store.count(query) == 20
+    assert {m.resource_id for m in found} == {f"r{i:03d}" for i in range(30) if i % 3}
+
+
+def test_get_then_delete_keeps_concurrent_updates(tmp_path):
+    store = open_store(tmp_path)
+    store.save_many(make_meta(i) for i in range(5))
+    with store.get_then_delete() as metas:
+        drained = [m.resource_id for m in metas]
+        store["r001"] = make_meta(1, "done")
+    assert drained == [f"r{i:03d}" for i in range(5)]
+    assert list(store) == ["r001"]
+    assert store["r001"].indexed_data["status"] == "done"
+
+    with store.get_then_delete() as metas:
+        assert [m.resource_id for m in metas] == ["r001"]
+    assert len(store) == 0
+    assert segment_files(tmp_path) != []
+    store.close()
+    assert len(open_store(tmp_path)) == 0
+
+
+def test_drain_crash_while_dropping_segments(tmp_path, monkeypatch):
+    store = open_store(tmp_path, segment_size=512)
+    for i in range(20):
+        store[f"r{i:03d}"] = make_meta(i)
+    assert len(segment_files(tmp_path)) > 1
+
+    drop = SegmentDiskMetaStore._drop
+
+    def crash_after_first(self, segment):
+        # 只刪掉第一個檔案就「當機」
+        drop(self, segment)
+        raise SystemExit
+
+    monkeypatch.setattr(SegmentDiskMetaStore, "_drop", crash_after_first)
+    with pytest.raises(SystemExit):
+        with store.get_then_delete() as metas:
+            list(metas)
+    monkeypatch.undo()
+
+    reopened = open_store(tmp_path)
+    assert len(reopened) == 0
+    assert list(reopened.iter_search(ResourceMetaSearchQuery(limit=100))) == []
+    reopened["r001"] = make_meta(1, "done")
+    assert snapshot(reopened) == {"r001": make_meta(1, "done")}
+
+
+def test_get_then_delete_failure_keeps_everything(tmp_path):
+    store = open_store(tmp_path)
+    store.save_many(make_meta(i) for i in range(3))
+    with pytest.raises(RuntimeError):
+        with store.get_then_delete() as metas:
+            list(metas)
+            raise RuntimeError
+    assert len(store) == 3
+
+
+def test_background_maintenance(tmp_path):
+    store = open_store(
+        tmp_path, segment_size=512, checkpoint_bytes=1, background=True, fsync="always"
+    )
+    for round in range(4):
+        for i in range(10):
+            store[f"r{i:03d}"] = make_meta(i, f"v{round}")
+    expected = snapshot(store)
+    store.close()
+    assert len(segment_files(tmp_path)) < 10
+    assert snapshot(open_store(tmp_path)) == expected
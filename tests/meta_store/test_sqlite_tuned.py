@@ -0,0 +1,205 @@
+"""FileSqliteMetaStore tuned mode: WAL, group commit, generated-column indexes."""
+
+import datetime as dt
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from autocrud.resource_manager.meta_store.sqlite3 import (
+    FileSqliteMetaStore,
+    _ConnectionPool,
+    _GroupCommitter,
+    _regexp,
+)
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    IndexableField,
+    ResourceDataSearchSort,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
+    ResourceMetaSortDirection,
+    ResourceMetaSortKey,
+)
+
+from . import common
+
+FIELDS = [IndexableField("status", str), IndexableField("age", int)]
+STATUSES = ["open", "closed", "pending"]
+
+
+def make_meta(i: int) -> ResourceMeta:
+    moment = common.BASE_TIME + dt.timedelta(minutes=i)
+    return common.make_meta(
+        i,
+        created_time=moment,
+        updated_time=moment,
+        indexed_data={"status": STATUSES[i % 3], "age": i % 50, "name": f"n{i}"},
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FileSqliteMetaStore(db_filepath=tmp_path / "meta.db", tuned=True)
+    yield store
+    store.close()
+
+
+def test_pragmas(store):
+    with store._connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL = 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+def test_concurrent_writes(store):
+    """
+    多個執行緒同時寫入不會 database is locked，且都已提交。
+    """
+    with ThreadPoolExecutor(8) as pool:
+        list(
+            pool.map(lambda i: store.__setitem__(f"r{i:03d}", make_meta(i)), range(200))
+        )
+    assert len(store) == 200
+    assert store["r123"] == make_meta(123)
+
+    del store["r123"]
+    with pytest.raises(KeyError):
+        del store["r123"]
+    assert len(store) == 199
+
+
+def test_indexed_search_matches_default_mode(store, tmp_path):
+    metas = [make_meta(i) for i in range(120)]
+    store.save_many(metas)
+    store.ensure_indexes(FIELDS)
+
+    with store._connection() as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(resource_meta)")}
+        assert {c.value for c in store._indexed_columns.values()} <= columns
+        where, params = store._build_condition(
+            DataSearchCondition(
+                field_path="status", operator=DataSearchOperator.equals, value="open"
+            )
+        )
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT resource_id FROM resource_meta WHERE {where}",
+                params,
+            )
+        )
+    assert "USING INDEX idx_ix_" in plan
+
+    # IN 條件不走 generated column 的索引，保留 LIMIT 的主鍵掃描
+    where, params = store._build_condition(
+        DataSearchCondition(
+            field_path="status", operator=DataSearchOperator.in_list, value=["open"]
+        )
+    )
+    assert "json_extract" in where
+
+    default = FileSqliteMetaStore(db_filepath=tmp_path / "default.db")
+    default.save_many(metas)
+    queries = [
+        ResourceMetaSearchQuery(
+            conditions=[
+                DataSearchCondition(
+                    field_path="status",
+                    operator=DataSearchOperator.in_list,
+                    value=["open", "pending"],
+                ),
+                DataSearchCondition(
+                    field_path="age",
+                    operator=DataSearchOperator.greater_than_or_equal,
+                    value=20,
+                ),
+            ],
+            sorts=[
+                ResourceDataSearchSort(
+                    field_path="age", direction=ResourceMetaSortDirection.descending
+                ),
+                # 相同 age 的順序取決於查詢計畫，明確指定 tie-break
+                ResourceMetaSearchSort(
+                    key=ResourceMetaSortKey.resource_id,
+                    direction=ResourceMetaSortDirection.descending,
+                ),
+            ],
+            limit=200,
+        ),
+        ResourceMetaSearchQuery(
+            conditions=[
+                DataSearchCondition(
+                    field_path="name",
+                    operator=DataSearchOperator.regex,
+                    value=r"^n1\d$",
+                )
+            ],
+            limit=200,
+        ),
+    ]
+    for query in queries:
+        expected = [m.resource_id for m in default.iter_search(query)]
+        assert expected
+        assert [m.resource_id for m in store.iter_search(query)] == expected
+        assert store.count(query) == default.count(query)
+    default.close()
+
+
+def test_reopen_in_default_mode(tmp_path):
+    path = tmp_path / "meta.db"
+    tuned = FileSqliteMetaStore(db_filepath=path, tuned=True)
+    tuned.ensure_indexes(FIELDS)
+    tuned.save_many(make_meta(i) for i in range(10))
+    tuned.close()
+
+    store = FileSqliteMetaStore(db_filepath=path)
+    assert len(store) == 10
+    store["r999"] = make_meta(999)
+    assert store["r999"] == make_meta(999)
+    store.close()
+
+
+def test_group_commit_error_only_reaches_failing_caller(tmp_path):
+    conn = sqlite3.connect(tmp_path / "g.db", check_same_thread=False)
+    conn.execute("CREATE TABLE t (k TEXT PRIMARY KEY)")
+    conn.commit()
+    committer = _GroupCommitter(conn, window=0.05, batch_size=100)
+    barrier = threading.Barrier(5)
+
+    def insert(key):
+        barrier.wait()
+        return committer.submit(
+            lambda c: c.execute("INSERT INTO t VALUES (?)", (key,)).rowcount
+        )
+
+    with ThreadPoolExecutor(5) as pool:
+        futures = [pool.submit(insert, k) for k in ["a", "b", "a", "c", "d"]]
+    results = [f.exception() or f.result() for f in futures]
+    assert sum(isinstance(r, sqlite3.IntegrityError) for r in results) == 1
+    assert results.count(1) == 4
+    assert committer.submit(
+        lambda c: sorted(r[0] for r in c.execute("SELECT k FROM t"))
+    ) == ["a", "b", "c", "d"]
+    committer.close()
+
+
+def test_exhausted_pool_times_out(tmp_path):
+    pool = _ConnectionPool(
+        lambda: sqlite3.connect(tmp_path / "p.db"), maxconn=1, timeout=0.05
+    )
+    conn = pool.getconn()
+    with pytest.raises(sqlite3.OperationalError):
+        pool.getconn()
+    pool.putconn(conn)
+    assert pool.getconn() is conn
+    pool.closeall()
+
+
+def test_regexp_invalid_pattern():
+    assert _regexp(r"^a\d", "a1")
+    assert not _regexp(r"^a\d", None)
+    assert not _regexp("(", "(")
@@ -0,0 +1,116 @@
+"""sort_and_paginate (heap top-k) and paginate_by_resource_id (early exit)."""
+
+import datetime as dt
+import random
+
+import pytest
+
+from autocrud.resource_manager.basic import (
+    encode_search_cursor,
+    get_keyset_sort_fn,
+    paginate_by_resource_id,
+    sort_and_paginate,
+)
+from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
+from autocrud.types import (
+    ResourceDataSearchSort,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+    ResourceMetaSearchSort,
+    ResourceMetaSortDirection,
+    ResourceMetaSortKey,
+)
+
+from . import common
+from .common import BASE_TIME
+
+ASC = ResourceMetaSortDirection.ascending
+DESC = ResourceMetaSortDirection.descending
+
+
+def make_meta(i: int, rng: random.Random) -> ResourceMeta:
+    return common.make_meta(
+        i,
+        created_time=BASE_TIME + dt.timedelta(minutes=rng.randrange(10)),
+        is_deleted=i % 4 == 0,
+        indexed_data={"score": rng.choice([None, 1, 2, 3])},
+    )
+
+
+SORTS = {
+    "none": [],
+    "created_desc": [
+        ResourceMetaSearchSort(key=ResourceMetaSortKey.created_time, direction=DESC)
+    ],
+    "score_asc": [ResourceDataSearchSort(field_path="score", direction=ASC)],
+    "mixed": [
+        ResourceDataSearchSort(field_path="score", direction=DESC),
+        ResourceMetaSearchSort(key=ResourceMetaSortKey.created_time, direction=ASC),
+    ],
+    "id_desc": [
+        ResourceMetaSearchSort(key=ResourceMetaSortKey.resource_id, direction=DESC)
+    ],
+}
+
+
+@pytest.mark.parametrize("sort_name", list(SORTS))
+@pytest.mark.parametrize("offset,limit", [(0, 1), (3, 5), (0, 1000), (40, 10)])
+def test_sort_and_paginate_matches_full_sort(sort_name, offset, limit):
+    rng = random.Random(sort_name)
+    metas = [make_meta(i, rng) for i in range(45)]
+    rng.shuffle(metas)
+    sorts = SORTS[sort_name]
+    key = get_keyset_sort_fn(sorts)
+    ordered = sorted(metas, key=key)
+    # 沒有 after 時不加 resource_id tie-break：相同排序值維持輸入順序
+    plain = sorted(metas, key=lambda m: key(m)[: len(sorts)])
+    query = ResourceMetaSearchQuery(sorts=sorts, offset=offset, limit=limit)
+    assert sort_and_paginate(metas, query) == plain[offset : offset + limit]
+
+    after = encode_search_cursor(ordered[10], sorts)
+    query = ResourceMetaSearchQuery(sorts=sorts, limit=limit, after=after)
+    assert sort_and_paginate(metas, query) == ordered[11 : 11 + limit]
+
+
+def test_paginate_by_resource_id_stops_early():
+    rng = random.Random(0)
+    metas = {m.resource_id: m for m in (make_meta(i, rng) for i in range(100))}
+    loaded: list[str] = []
+
+    def load(pk: str) -> ResourceMeta:
+        loaded.append(pk)
+        return metas[pk]
+
+    by_id = [ResourceMetaSearchSort(key=ResourceMetaSortKey.resource_id)]
+    query = ResourceMetaSearchQuery(is_deleted=False, offset=2, limit=3, sorts=by_id)
+    page = paginate_by_resource_id(reversed(list(metas)), load, query)
+    assert [m.resource_id for m in page] == ["r003", "r005", "r006"]
+    assert loaded == ["r000", "r001", "r002", "r003", "r004", "r005", "r006"]
+
+    sorts = SORTS["created_desc"]
+    assert (
+        paginate_by_resource_id(metas, load, ResourceMetaSearchQuery(sorts=sorts))
+        is None
+    )
+    # 沒有 sorts 的一般搜尋依寫入順序，不是 resource_id 順序
+    assert paginate_by_resource_id(metas, load, ResourceMetaSearchQuery()) is None
+
+
+def test_memory_store_without_sorts_decodes_only_the_page():
+    store = MemoryMetaStore(encoding="msgpack")
+    rng = random.Random(1)
+    for i in range(50):
+        meta = make_meta(i, rng)
+        store[meta.resource_id] = meta
+    decoded = 0
+    decode = store._serializer.decode
+
+    def counting_decode(b):
+        nonlocal decoded
+        decoded += 1
+        return decode(b)
+
+    store._serializer.decode = counting_decode
+    page = list(store.iter_search(ResourceMetaSearchQuery(limit=2)))
+    assert [m.resource_id for m in page] == ["r000", "r001"]
+    assert decoded == 2
@@ -27,7 +27,9 @@ from autocrud.resource_manager.resource_store.simple import MemoryResourceStore
 from autocrud.types import (
     BeforeCreate,
     BeforeDelete,
+    BeforeDeleteMany,
     BeforeGet,
+    BeforeGetMany,
     BeforeUpdate,
     PermissionContext,
     PermissionResult,
@@ -374,6 +376,32 @@ class TestResourceOwnershipChecker(TestCaseUtil):
         result = checker.check_permission(context)
         assert result == PermissionResult.deny
 
+    def test_batch_actions_check_every_resource(self):
+        """測試批次操作逐一檢查所有權"""
+        mock_rm = MockResourceManager()
+        checker = ResourceOwnershipChecker(mock_rm)
+
+        def context(resource_ids):
+            return BeforeDeleteMany(
+                user="alice",
+                now=dt.datetime.now(),
+                resource_name="documents",
+                resource_ids=resource_ids,
+            )
+
+        assert checker.check_permission(context(["doc123"])) == PermissionResult.allow
+        assert (
+            checker.check_permission(context(["doc123", "doc456"]))
+            == PermissionResult.deny
+        )
+        get_many = BeforeGetMany(
+            user="alice",
+            now=dt.datetime.now(),
+            resource_name="documents",
+            resource_ids=["doc456"],
+        )
+        assert checker.check_permission(get_many) == PermissionResult.deny
+
     def test_non_applicable_action(self):
         """測試不適用的操作"""
         mock_rm = MockResourceManager()
@@ -0,0 +1,120 @@
+"""
+測試 list endpoints 的 keyset cursor 分頁：
+回應帶 X-Next-Cursor header，下一頁以 `after` 參數接續。
+"""
+
+import json
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from msgspec import Struct
+
+from autocrud import AutoCRUD
+
+
+class Item(Struct):
+    name: str
+    rank: int
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app: FastAPI = FastAPI()
+    router: APIRouter = APIRouter()
+    crud: AutoCRUD = AutoCRUD()
+    crud.add_model(Item, indexed_fields=[("rank", int)])
+    crud.apply(router)
+    app.include_router(router)
+    app.state.crud = crud
+    client = TestClient(app)
+    for i in range(11):
+        response = client.post("/item", json={"name": f"item-{i}", "rank": i % 4})
+        assert response.status_code == 200
+    return client
+
+
+SORTS = json.dumps(
+    [
+        {"type": "data", "field_path": "rank", "direction": "-"},
+        {"type": "meta", "key": "created_time", "direction": "+"},
+    ]
+)
+
+
+def _walk(client: TestClient, path: str, **params) -> list:
+    items = []
+    after = None
+    while True:
+        query = {"limit": 4, "sorts": SORTS, **params}
+        if after is not None:
+            query["after"] = after
+        response = client.get(path, params=query)
+        assert response.status_code == 200
+        items.extend(response.json())
+        after = response.headers.get("X-Next-Cursor")
+        if after is None:
+            return items
+
+
+class TestKeysetCursorRoutes:
+    def test_data_route_walks_all_pages(self, client: TestClient) -> None:
+        expected = client.get("/item/data", params={"limit": 100, "sorts": SORTS})
+        assert "X-Next-Cursor" not in expected.headers
+        assert _walk(client, "/item/data") == expected.json()
+        assert len(expected.json()) == 11
+
+    def test_meta_route_with_partial(self, client: TestClient) -> None:
+        metas = _walk(client, "/item/meta", partial=["resource_id"])
+        assert len(metas) == 11
+        assert all(set(m) == {"resource_id"} for m in metas)
+        assert len({m["resource_id"] for m in metas}) == 11
+
+    def test_full_list_without_meta(self, client: TestClient) -> None:
+        items = _walk(client, "/item", returns="data")
+        assert [set(item) for item in items] == [{"data"}] * 11
+        ranks = [item["data"]["rank"] for item in items]
+        assert ranks == sorted(ranks, reverse=True)
+
+    def test_failed_item_does_not_end_pagination(
+        self, client: TestClient, monkeypatch
+    ) -> None:
+        rm = client.app.state.crud.resource_managers["item"]
+        expected = client.get("/item/meta", params={"limit": 100, "sorts": SORTS})
+        broken = expected.json()[1]["resource_id"]
+        get = rm.get
+
+        def flaky_get(resource_id, *args, **kwargs):
+            if resource_id == broken:
+                raise RuntimeError("decode failed")
+            return get(resource_id, *args, **kwargs)
+
+        monkeypatch.setattr(rm, "get", flaky_get)
+        # 第一頁少了一筆，仍要有下一頁
+        items = _walk(client, "/item/data")
+        assert len(items) == 10
+
+    def test_list_reads_only_needed_meta_fields(
+        self, client: TestClient, monkeypatch
+    ) -> None:
+        rm = client.app.state.crud.resource_managers["item"]
+        calls = []
+        search = rm.search_resources
+
+        def spy(query, **kwargs):
+            calls.append(kwargs.get("fields"))
+            return search(query, **kwargs)
+
+        monkeypatch.setattr(rm, "search_resources", spy)
+        assert len(_walk(client, "/item/data")) == 11
+        assert calls
+        for fields in calls:
+            assert fields is not None and "created_time" in fields
+            assert "indexed_data" in fields  # data sort 需要
+            assert "updated_by" not in fields
+
+    def test_invalid_cursor(self, client: TestClient) -> None:
+        response = client.get(
+            "/item/data", params={"sorts": SORTS, "after": "not-a-cursor"}
+        )
+        assert response.status_code == 400
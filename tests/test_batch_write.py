@@ -0,0 +1,187 @@
+"""Tests for the batched write API.
+
+Covers:
+- ResourceManager.create_many / update_many / delete_many
+- Bulk storage paths (save_revisions_bulk / save_metas_bulk)
+- One event context per batch
+- Unique constraints across a batch
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Annotated
+from unittest.mock import Mock
+
+import pytest
+from msgspec import Struct
+
+from autocrud.resource_manager.core import ResourceManager
+from autocrud.resource_manager.events import do
+from autocrud.resource_manager.storage_factory import MemoryStorageFactory
+from autocrud.types import (
+    ResourceAction,
+    ResourceIDNotFoundError,
+    ResourceIsDeletedError,
+    ResourceMetaSearchQuery,
+    Unique,
+    UniqueConstraintError,
+)
+
+
+class Item(Struct):
+    name: str
+    value: int = 0
+
+
+class UniqueItem(Struct):
+    name: Annotated[str, Unique()]
+    value: int = 0
+
+
+def make_rm(resource_type=Item, **kw) -> ResourceManager:
+    return ResourceManager(
+        resource_type,
+        storage=MemoryStorageFactory().build("test"),
+        default_user="system",
+        default_now=dt.datetime.now,
+        **kw,
+    )
+
+
+class TestCreateMany:
+    def test_create_many_returns_infos_in_order(self):
+        rm = make_rm()
+        infos = rm.create_many([Item("a", 1), Item("b", 2), Item("c", 3)])
+        assert [rm.get(i.resource_id).data.name for i in infos] == ["a", "b", "c"]
+        assert len({i.resource_id for i in infos}) == 3
+        assert rm.count_resources(ResourceMetaSearchQuery()) == 3
+
+    def test_create_many_accepts_dicts_and_generators(self):
+        rm = make_rm()
+        infos = rm.create_many({"name": n, "value": i} for i, n in enumerate("xy"))
+        assert rm.get(infos[1].resource_id).data == Item("y", 1)
+
+    def test_create_many_empty(self):
+        rm = make_rm()
+        assert rm.create_many([]) == []
+
+    def test_create_many_uses_bulk_storage(self):
+        rm = make_rm()
+        rm.storage.save_revisions_bulk = Mock(wraps=rm.storage.save_revisions_bulk)
+        rm.storage.save_metas_bulk = Mock(wraps=rm.storage.save_metas_bulk)
+        rm.storage.save_revision = Mock(wraps=rm.storage.save_revision)
+        rm.create_many([Item("a"), Item("b")])
+        rm.storage.save_revisions_bulk.assert_called_once()
+        rm.storage.save_metas_bulk.assert_called_once()
+        rm.storage.save_revision.assert_not_called()
+
+    def test_create_many_fires_one_event_per_phase(self):
+        handler = Mock()
+        rm = make_rm(
+            event_handlers=do(handler)
+            .before(ResourceAction.create_many)
+            .do(handler)
+            .on_success(ResourceAction.create_many)
+            .do(handler)
+            .after(ResourceAction.create_many)
+            .do(handler)
+            .before(ResourceAction.create)
+        )
+        rm.create_many([Item("a"), Item("b"), Item("c")])
+        phases = [c.args[0].phase for c in handler.call_args_list]
+        assert phases == ["before", "on_success", "after"]
+        assert len(handler.call_args_list[1].args[0].infos) == 3
+
+    def test_create_many_rejects_fixed_resource_id(self):
+        rm = make_rm()
+        with rm.meta_provide(resource_id="fixed"), pytest.raises(ValueError):
+            rm.create_many([Item("a"), Item("b")])
+
+
+class TestUpdateMany:
+    def test_update_many(self):
+        rm = make_rm()
+        a, b = rm.create_many([Item("a", 1), Item("b", 2)])
+        infos = rm.update_many(
+            {a.resource_id: Item("a", 10), b.resource_id: Item("b", 20)}
+        )
+        assert [i.parent_revision_id for i in infos] == [a.revision_id, b.revision_id]
+        assert rm.get(a.resource_id).data.value == 10
+        assert rm.get(b.resource_id).data.value == 20
+        assert rm.get_meta(b.resource_id).total_revision_count == 2
+
+    def test_update_many_unchanged_item_is_not_written(self):
+        rm = make_rm()
+        a, b = rm.create_many([Item("a", 1), Item("b", 2)])
+        infos = rm.update_many(
+            [(a.resource_id, Item("a", 1)), (b.resource_id, Item("b", 3))]
+        )
+        assert infos[0].revision_id == a.revision_id
+        assert rm.get_meta(a.resource_id).total_revision_count == 1
+        assert rm.get_meta(b.resource_id).total_revision_count == 2
+
+    def test_update_many_missing_id_writes_nothing(self):
+        rm = make_rm()
+        (a,) = rm.create_many([Item("a", 1)])
+        with pytest.raises(ResourceIDNotFoundError):
+            rm.update_many([(a.resource_id, Item("a", 2)), ("missing", Item("x"))])
+        assert rm.get(a.resource_id).data.value == 1
+
+    def test_update_many_loads_metas_in_one_call(self, monkeypatch):
+        rm = make_rm()
+        a, b = rm.create_many([Item("a", 1), Item("b", 2)])
+        get_meta = Mock(side_effect=rm.storage.get_meta)
+        get_meta_many = Mock(side_effect=rm.storage.get_meta_many)
+        monkeypatch.setattr(rm.storage, "get_meta", get_meta)
+        monkeypatch.setattr(rm.storage, "get_meta_many", get_meta_many)
+        rm.update_many({a.resource_id: Item("a", 10), b.resource_id: Item("b", 20)})
+        rm.delete_many([a.resource_id, b.resource_id])
+        assert get_meta.call_count == 0
+        assert get_meta_many.call_count == 2
+
+    def test_update_many_duplicate_ids(self):
+        rm = make_rm()
+        (a,) = rm.create_many([Item("a", 1)])
+        with pytest.raises(ValueError):
+            rm.update_many(
+                [(a.resource_id, Item("a", 2)), (a.resource_id, Item("a", 3))]
+            )
+
+
+class TestDeleteMany:
+    def test_delete_many(self):
+        rm = make_rm()
+        infos = rm.create_many([Item("a"), Item("b"), Item("c")])
+        metas = rm.delete_many(i.resource_id for i in infos[:2])
+        assert all(m.is_deleted for m in metas)
+        assert rm.count_resources(ResourceMetaSearchQuery(is_deleted=False)) == 1
+
+    def test_delete_many_already_deleted(self):
+        rm = make_rm()
+        (a,) = rm.create_many([Item("a")])
+        rm.delete(a.resource_id)
+        with pytest.raises(ResourceIsDeletedError):
+            rm.delete_many([a.resource_id])
+
+
+class TestBatchUniqueConstraint:
+    def test_create_many_conflicts_with_existing(self):
+        rm = make_rm(UniqueItem)
+        rm.create(UniqueItem("taken"))
+        with pytest.raises(UniqueConstraintError):
+            rm.create_many([UniqueItem("free"), UniqueItem("taken")])
+        assert rm.count_resources(ResourceMetaSearchQuery(is_deleted=False)) == 1
+
+    def test_create_many_conflicts_within_batch(self):
+        rm = make_rm(UniqueItem)
+        with pytest.raises(UniqueConstraintError):
+            rm.create_many([UniqueItem("dup"), UniqueItem("ok"), UniqueItem("dup")])
+        assert rm.count_resources(ResourceMetaSearchQuery(is_deleted=False)) == 0
+
+    def test_update_many_conflict(self):
+        rm = make_rm(UniqueItem)
+        _, b = rm.create_many([UniqueItem("a"), UniqueItem("b")])
+        with pytest.raises(UniqueConstraintError):
+            rm.update_many({b.resource_id: UniqueItem("a")})
+        assert rm.get(b.resource_id).data.name == "b"
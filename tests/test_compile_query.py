@@ -0,0 +1,168 @@
+from enum import Enum, Flag
+
+import pytest
+from msgspec import UNSET
+
+from autocrud.resource_manager.basic import compile_query, is_match_query
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchGroup,
+    DataSearchLogicOperator,
+    DataSearchOperator,
+    FieldTransform,
+    ResourceMeta,
+    ResourceMetaSearchQuery,
+)
+
+from .meta_store import common
+from .meta_store.common import BASE_TIME
+
+Op = DataSearchOperator
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Perm(Flag):
+    read = 1
+    write = 2
+
+
+def make_meta(indexed_data=UNSET, **kwargs) -> ResourceMeta:
+    kwargs.setdefault("created_by", "alice")
+    kwargs.setdefault("updated_by", "bob")
+    return common.make_meta(0, indexed_data=indexed_data, **kwargs)
+
+
+def cond(field_path, operator, value, **kwargs) -> DataSearchCondition:
+    return DataSearchCondition(
+        field_path=field_path, operator=operator, value=value, **kwargs
+    )
+
+
+def match_data(data: dict, condition) -> bool:
+    query = ResourceMetaSearchQuery(data_conditions=[condition])
+    return compile_query(query)(make_meta(indexed_data=data))
+
+
+DATA = {
+    "name": "Alpha Beta",
+    "age": 30,
+    "tags": ["x", "y"],
+    "color": "red",
+    "perm": 3,
+    "nothing": None,
+    "nested": [[1, 2]],
+}
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        (cond("age", Op.equals, 30), True),
+        (cond("age", Op.not_equals, 30), False),
+        (cond("age", Op.greater_than, 29), True),
+        (cond("age", Op.less_than_or_equal, 29), False),
+        (cond("name", Op.contains, "pha"), True),
+        (cond("tags", Op.contains, "y"), True),
+        (cond("perm", Op.contains, Perm.write), True),
+        (cond("name", Op.starts_with, "Alpha"), True),
+        (cond("name", Op.ends_with, "Alpha"), False),
+        (cond("name", Op.regex, r"^A\w+ B"), True),
+        (cond("color", Op.equals, Color.red), True),
+        (cond("color", Op.in_list, [Color.blue, Color.red]), True),
+        (cond("color", Op.not_in_list, {"red"}), False),
+        (cond("age", Op.in_list, "not-a-list"), False),
+        (cond("age", Op.not_in_list, "not-a-list"), True),
+        # 不可 hash 的欄位值仍可比對
+        (cond("tags", Op.in_list, [["x", "y"]]), True),
+        (cond("nothing", Op.is_null, True), True),
+        (cond("age", Op.is_null, True), False),
+        (cond("nothing", Op.equals, None), False),
+        (cond("missing", Op.exists, False), True),
+        (cond("missing", Op.isna, True), True),
+        (cond("nothing", Op.isna, True), True),
+        (cond("missing", Op.not_equals, 1), False),
+        (cond("tags", Op.equals, 2, transform=FieldTransform.length), True),
+        (cond("age", Op.equals, 2, transform=FieldTransform.length), False),
+        # len() 不適用時整個條件為 Unknown，NOT 也不會翻轉
+        (
+            DataSearchGroup(
+                operator=DataSearchLogicOperator.not_op,
+                conditions=[
+                    cond("age", Op.exists, True, transform=FieldTransform.length)
+                ],
+            ),
+            False,
+        ),
+    ],
+)
+def test_leaf_operators(condition, expected):
+    assert match_data(DATA, condition) is expected
+
+
+def test_groups_short_circuit_with_trivalent_logic():
+    true = cond("age", Op.equals, 30)
+    false = cond("age", Op.equals, 31)
+    unknown = cond("missing", Op.equals, 1)
+
+    def group(op, *conditions):
+        return DataSearchGroup(operator=op, conditions=list(conditions))
+
+    AND, OR, NOT = (
+        DataSearchLogicOperator.and_op,
+        DataSearchLogicOperator.or_op,
+        DataSearchLogicOperator.not_op,
+    )
+    assert match_data(DATA, group(AND, true, unknown)) is False
+    assert match_data(DATA, group(OR, unknown, true)) is True
+    assert match_data(DATA, group(NOT, group(OR, false, unknown))) is False
+    assert match_data(DATA, group(NOT, group(AND, false, unknown))) is True
+    # 短路：後面的條件即使比較失敗也不會被求值
+    assert match_data(DATA, group(AND, false, cond("name", Op.greater_than, 1))) is (
+        False
+    )
+
+
+def test_meta_fields_and_conditions():
+    meta = make_meta(indexed_data={"resource_id": "shadowed"}, is_deleted=True)
+    query = ResourceMetaSearchQuery(
+        is_deleted=True,
+        created_bys=["alice", "carol"],
+        updated_time_start=BASE_TIME,
+        conditions=[cond("resource_id", Op.equals, "r000")],
+    )
+    assert compile_query(query)(meta) is True
+    assert is_match_query(meta, query) is True
+    query.updated_bys = ["alice"]
+    assert compile_query(query)(meta) is False
+
+
+def test_data_conditions_require_indexed_data():
+    query = ResourceMetaSearchQuery(data_conditions=[cond("x", Op.exists, False)])
+    assert compile_query(query)(make_meta()) is False
+    assert compile_query(query)(make_meta(indexed_data={})) is True
+
+
+def test_compiled_predicates_are_cached_by_filter_shape():
+    def query(value, **kwargs):
+        return ResourceMetaSearchQuery(
+            data_conditions=[cond("color", Op.equals, value)], **kwargs
+        )
+
+    predicate = compile_query(query("red"))
+    # limit / offset / sorts 不影響過濾條件
+    assert compile_query(query("red", limit=3, offset=5)) is predicate
+    assert compile_query(query("blue")) is not predicate
+    # Enum 與其 value 不共用快取項目
+    assert compile_query(query(Color.red)) is not predicate
+
+    unhashable = query({"k": ["v"]})
+    assert compile_query(unhashable)(make_meta(indexed_data={"color": {"k": ["v"]}}))
+
+    # LRU：常用的條件不會因為大量一次性查詢被擠出快取
+    for i in range(300):
+        compile_query(query(f"once-{i}"))
+        assert compile_query(query("red")) is predicate
@@ -0,0 +1,173 @@
+"""Tests for DeltaResourceStore (delta-encoded revisions with keyframes)."""
+
+import datetime as dt
+
+import msgspec
+import pytest
+from msgspec import Struct
+
+from autocrud.resource_manager.basic import Encoding
+from autocrud.resource_manager.core import ResourceManager, SimpleStorage
+from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
+from autocrud.resource_manager.resource_store.delta import (
+    DELTA_MAGIC,
+    DeltaResourceStore,
+    apply,
+    diff,
+)
+from autocrud.resource_manager.resource_store.simple import MemoryResourceStore
+from autocrud.types import RevisionStatus
+
+
+class Section(Struct):
+    title: str
+    body: str
+
+
+class Doc(Struct, omit_defaults=True):
+    name: str
+    version: int
+    sections: list[Section]
+    tags: list[str] = []
+    note: str | None = None
+
+
+def make_doc(n_sections: int = 50) -> Doc:
+    return Doc(
+        name="doc",
+        version=0,
+        sections=[Section(title=f"t{i}", body="x" * 200) for i in range(n_sections)],
+    )
+
+
+def make_rm(inner, encoding: Encoding, **kwargs):
+    store = DeltaResourceStore(inner, encoding=encoding, **kwargs)
+    rm = ResourceManager(
+        Doc,
+        storage=SimpleStorage(MemoryMetaStore(encoding=encoding), store),
+        encoding=encoding,
+        default_user="u",
+        default_now=dt.datetime.now,
+    )
+    return rm, store
+
+
+def raw_payload(inner, resource_id: str, revision_id: str) -> bytes:
+    with inner.get_data_bytes(resource_id, revision_id, None) as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    "old,new",
+    [
+        ({"a": 1, "b": [1, 2, 3]}, {"a": 1, "b": [1, 5]}),
+        ({"a": 1, "b": 2}, {"c": 3, "b": 2, "a": 1}),
+        ({"a": {"x": 1}}, {"a": [1]}),
+        ([1, True, 1.0], [True, 1, 1.0, None]),
+        ({"a": 1}, {}),
+        ("x", "y"),
+    ],
+)
+def test_diff_apply_roundtrip(old, new):
+    snapshot = msgspec.json.encode(old)
+    result = apply(old, diff(old, new))
+    assert msgspec.json.encode(result) == msgspec.json.encode(new)
+    # base must stay untouched (it lives in the cache)
+    assert msgspec.json.encode(old) == snapshot
+
+
+@pytest.mark.parametrize("encoding", [Encoding.json, Encoding.msgpack])
+def test_revisions_roundtrip_and_keyframes(encoding):
+    inner = MemoryResourceStore()
+    rm, store = make_rm(inner, encoding, keyframe_interval=4)
+    doc = make_doc()
+    info = rm.create(doc)
+    revisions = [(info.revision_id, msgspec.json.encode(doc))]
+    for i in range(1, 10):
+        doc = msgspec.structs.replace(
+            doc,
+            version=i,
+            sections=[*doc.sections[:-1], Section(title=f"new{i}", body="y")],
+            note=f"note{i}" if i % 2 else None,
+        )
+        info = rm.update(info.resource_id, doc)
+        revisions.append((info.revision_id, msgspec.json.encode(doc)))
+
+    payloads = [raw_payload(inner, info.resource_id, rev) for rev, _ in revisions]
+    is_delta = [p.startswith(DELTA_MAGIC) for p in payloads]
+    assert is_delta == [False, True, True, True] * 2 + [False, True]
+    full_size = len(payloads[0])
+    assert all(len(p) < full_size / 4 for p, d in zip(payloads, is_delta) if d)
+
+    # 清掉 cache，確保真的從 keyframe 重建
+    store.clear_cache()
+    for rev, expected in revisions:
+        res = rm.get_resource_revision(info.resource_id, rev)
+        assert msgspec.json.encode(res.data) == expected
+
+    keys = [(info.resource_id, rev, None) for rev, _ in revisions]
+    store.clear_cache()
+    assert store.get_data_bytes_many(keys) == [
+        raw_payload(store, info.resource_id, rev) for rev, _ in revisions
+    ]
+
+
+def test_encoding_mismatch_falls_back_to_keyframes():
+    inner = MemoryResourceStore()
+    store = DeltaResourceStore(inner, encoding=Encoding.json)
+    rm = ResourceManager(
+        Doc,
+        storage=SimpleStorage(MemoryMetaStore(), store),
+        encoding=Encoding.msgpack,
+        default_user="u",
+        default_now=dt.datetime.now,
+    )
+    info = rm.create(make_doc())
+    info = rm.update(info.resource_id, make_doc(3))
+    assert not raw_payload(inner, info.resource_id, info.revision_id).startswith(
+        DELTA_MAGIC
+    )
+    assert len(rm.get(info.resource_id).data.sections) == 3
+
+
+def test_draft_parent_is_not_a_base():
+    inner = MemoryResourceStore()
+    rm, _ = make_rm(inner, Encoding.json)
+    info = rm.create(make_doc(), status=RevisionStatus.draft)
+    info = rm.update(info.resource_id, make_doc(51))
+    assert not raw_payload(inner, info.resource_id, info.revision_id).startswith(
+        DELTA_MAGIC
+    )
+
+
+def test_rewriting_stable_base_detaches_children():
+    inner = MemoryResourceStore()
+    rm, store = make_rm(inner, Encoding.json)
+    info1 = rm.create(make_doc())
+    doc2 = msgspec.structs.replace(make_doc(), version=2)
+    info2 = rm.update(info1.resource_id, doc2)
+    assert raw_payload(inner, info2.resource_id, info2.revision_id).startswith(
+        DELTA_MAGIC
+    )
+
+    rm.switch(info1.resource_id, info1.revision_id)
+    rm.modify(info1.resource_id, make_doc(1), status=RevisionStatus.draft)
+
+    assert not raw_payload(inner, info2.resource_id, info2.revision_id).startswith(
+        DELTA_MAGIC
+    )
+    store.clear_cache()
+    assert rm.get_resource_revision(info2.resource_id, info2.revision_id).data == doc2
+    assert len(rm.get(info1.resource_id).data.sections) == 1
+
+
+def test_purge_resource_drops_cache():
+    inner = MemoryResourceStore()
+    rm, store = make_rm(inner, Encoding.json)
+    info = rm.create(make_doc())
+    rm.update(info.resource_id, make_doc(49))
+    store.purge_resource(info.resource_id)
+    assert not store.exists(info.resource_id, info.revision_id, None)
+    with pytest.raises(KeyError):
+        with store.get_data_bytes(info.resource_id, info.revision_id, None):
+            pass
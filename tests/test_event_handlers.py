@@ -17,6 +17,7 @@ from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
 from autocrud.resource_manager.resource_store.simple import MemoryResourceStore
 from autocrud.types import (
     EventContext,
+    IEventHandler,
     OnSuccessCreate,
     ResourceAction,
     ResourceMetaSearchQuery,
@@ -377,3 +378,94 @@ class TestResourceManagerEventHandlers:
 
         # 檢查上下文類型
         assert isinstance(call_args, EventContext)
+
+
+class _RecordingHandler(IEventHandler):
+    """沒有宣告 supported_events 的 handler，應收到所有事件"""
+
+    def __init__(self):
+        self.contexts = []
+
+    def is_supported(self, context: EventContext) -> bool:
+        return True
+
+    def handle_event(self, context: EventContext) -> None:
+        self.contexts.append(context)
+
+
+class TestEventDispatchTable:
+    """測試預先計算的 (action, phase) handler table"""
+
+    @pytest.fixture
+    def manager(self) -> ResourceManager:
+        return ResourceManager(
+            SampleData,
+            storage=SimpleStorage(MemoryMetaStore(), MemoryResourceStore()),
+            default_user="user",
+            default_now=dt.datetime.now,
+        )
+
+    def test_uninterested_phases_have_no_candidates(self, manager):
+        info = manager.create(SampleData(name="a", value=1))
+        handler = Mock()
+        manager.event_handlers.extend(do(handler).on_success(ResourceAction.create))
+
+        manager.get(info.resource_id)
+        assert handler.call_count == 0
+        assert manager._event_candidates((ResourceAction.get, "before")) == ()
+        assert (
+            len(manager._event_candidates((ResourceAction.create, "on_success"))) == 1
+        )
+
+    def test_handlers_registered_later_are_dispatched(self, manager):
+        before = Mock()
+        manager.create(SampleData(name="a", value=1))
+        manager.event_handlers.append(do(before).before(ResourceAction.create)[0])
+        manager.create(SampleData(name="b", value=2))
+        assert before.call_count == 1
+
+        manager.event_handlers.clear()
+        manager.create(SampleData(name="c", value=3))
+        assert before.call_count == 1
+
+        manager.event_handlers = list(do(before).before(ResourceAction.create))
+        manager.create(SampleData(name="d", value=4))
+        assert before.call_count == 2
+
+    def test_undeclared_handler_receives_every_phase(self, manager):
+        recorder = _RecordingHandler()
+        manager.event_handlers.append(recorder)
+        info = manager.create(SampleData(name="a", value=1))
+        manager.get(info.resource_id)
+        assert [
+            (c.action, c.phase)
+            for c in recorder.contexts
+            if c.action in ResourceAction.create | ResourceAction.get
+        ] == [
+            (ResourceAction.create, "before"),
+            (ResourceAction.create, "on_success"),
+            (ResourceAction.create, "after"),
+            (ResourceAction.get, "before"),
+            (ResourceAction.get, "on_success"),
+            (ResourceAction.get, "after"),
+        ]
+
+    def test_bound_arguments_match_signature(self, manager):
+        recorder = _RecordingHandler()
+        manager.event_handlers.append(recorder)
+        info = manager.create(SampleData(name="a", value=1))
+
+        manager.get(info.resource_id)
+        manager.get(resource_id=info.resource_id, revision_id=info.revision_id)
+        gets = [
+            c
+            for c in recorder.contexts
+            if c.action == ResourceAction.get and c.phase == "before"
+        ]
+        assert gets[0].resource_id == info.resource_id
+        assert gets[1].revision_id == info.revision_id
+
+        with pytest.raises(TypeError):
+            manager.get(info.resource_id, bogus=1)
+        with pytest.raises(TypeError):
+            manager.get()
@@ -0,0 +1,337 @@
+"""Tests for the multi-get read API.
+
+Covers:
+- ResourceManager.get_many (full / partial / explicit revisions / errors)
+- IMetaStore.get_many on the bundled meta stores
+- IResourceStore.get_many / get_data_bytes_many on memory, disk and S3
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+import sys
+import threading
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from msgspec import Struct
+
+from autocrud.resource_manager.core import ResourceManager
+from autocrud.resource_manager.events import do
+from autocrud.resource_manager.meta_store.fast_slow import FastSlowMetaStore
+from autocrud.resource_manager.meta_store.simple import DiskMetaStore, MemoryMetaStore
+from autocrud.resource_manager.meta_store.sqlalchemy import SQLAlchemyMetaStore
+from autocrud.resource_manager.meta_store.sqlite3 import MemorySqliteMetaStore
+from autocrud.resource_manager.resource_store.cache import MemoryCache
+from autocrud.resource_manager.resource_store.cached_s3 import CachedS3ResourceStore
+from autocrud.resource_manager.resource_store.pack import PackDiskResourceStore
+from autocrud.resource_manager.resource_store.s3 import S3ResourceStore
+from autocrud.resource_manager.resource_store.simple import (
+    DiskResourceStore,
+    MemoryResourceStore,
+)
+from autocrud.resource_manager.storage_factory import (
+    DiskStorageFactory,
+    MemoryStorageFactory,
+)
+from autocrud.types import (
+    ResourceAction,
+    ResourceIDNotFoundError,
+    ResourceIsDeletedError,
+    ResourceMeta,
+    RevisionIDNotFoundError,
+    RevisionInfo,
+    RevisionStatus,
+)
+
+# DiskResourceStore relies on Path.relative_to(walk_up=True) (Python 3.12+)
+_needs_py312 = pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="DiskResourceStore requires Python 3.12+"
+)
+
+
+class Item(Struct):
+    name: str
+    value: int = 0
+    note: str = ""
+
+
+@pytest.fixture(params=["memory", pytest.param("disk", marks=_needs_py312)])
+def rm(request, tmp_path) -> ResourceManager:
+    if request.param == "memory":
+        storage = MemoryStorageFactory().build("item")
+    else:
+        storage = DiskStorageFactory(tmp_path).build("item")
+    return ResourceManager(
+        Item,
+        storage=storage,
+        default_user="system",
+        default_now=dt.datetime.now,
+    )
+
+
+class TestResourceManagerGetMany:
+    def test_returns_resources_in_request_order(self, rm: ResourceManager):
+        infos = [rm.create(Item(n, i)) for i, n in enumerate("abc")]
+        ids = [infos[2].resource_id, infos[0].resource_id, infos[1].resource_id]
+        resources = rm.get_many(ids)
+        assert [r.data.name for r in resources] == ["c", "a", "b"]
+        assert [r.info.resource_id for r in resources] == ids
+
+    def test_returns_current_revision(self, rm: ResourceManager):
+        info = rm.create(Item("a", 1))
+        rm.update(info.resource_id, Item("a", 2))
+        (resource,) = rm.get_many([info.resource_id])
+        assert resource.data.value == 2
+
+    def test_explicit_revision_ids(self, rm: ResourceManager):
+        a = rm.create(Item("a", 1))
+        b = rm.create(Item("b", 1))
+        rm.update(a.resource_id, Item("a", 2))
+        resources = rm.get_many(
+            (rid for rid in [a.resource_id, b.resource_id]),
+            [a.revision_id, b.revision_id],
+        )
+        assert [r.data.value for r in resources] == [1, 1]
+        assert resources[0].info.revision_id == a.revision_id
+
+    def test_explicit_revision_uses_its_own_schema_version(self, rm: ResourceManager):
+        old = rm.create(Item("a", 1))
+        current = rm.update(old.resource_id, Item("a", 2))
+        # 目前版本遷移到 v2，舊版本仍只存在 schema_version=None 之下
+        info = rm.storage.get_resource_revision_info(
+            current.resource_id, current.revision_id, None
+        )
+        info.schema_version = "v2"
+        with rm.storage.get_data_bytes(
+            current.resource_id, current.revision_id, None
+        ) as data:
+            rm.storage.save_revision(info, io.BytesIO(data.read()))
+        meta = rm.storage.get_meta(current.resource_id)
+        meta.schema_version = "v2"
+        rm.storage.save_meta(meta)
+
+        resources = rm.get_many(
+            [old.resource_id, old.resource_id], [old.revision_id, current.revision_id]
+        )
+        assert [r.data.value for r in resources] == [1, 2]
+        assert [r.info.schema_version for r in resources] == [None, "v2"]
+        with pytest.raises(RevisionIDNotFoundError):
+            rm.get_many([old.resource_id], ["missing"])
+
+    def test_partial(self, rm: ResourceManager):
+        infos = [rm.create(Item(n, i, note="x")) for i, n in enumerate("ab")]
+        parts = rm.get_many([i.resource_id for i in infos], partial=["name"])
+        assert [p.name for p in parts] == ["a", "b"]
+        assert not hasattr(parts[0], "note")
+
+    def test_empty(self, rm: ResourceManager):
+        assert rm.get_many([]) == []
+
+    def test_missing_id(self, rm: ResourceManager):
+        info = rm.create(Item("a"))
+        with pytest.raises(ResourceIDNotFoundError):
+            rm.get_many([info.resource_id, "missing"])
+
+    def test_deleted_id(self, rm: ResourceManager):
+        info = rm.create(Item("a"))
+        rm.delete(info.resource_id)
+        with pytest.raises(ResourceIsDeletedError):
+            rm.get_many([info.resource_id])
+
+    def test_revision_ids_length_mismatch(self, rm: ResourceManager):
+        info = rm.create(Item("a"))
+        with pytest.raises(ValueError):
+            rm.get_many([info.resource_id], [])
+
+    def test_uses_batched_storage_calls(self, rm: ResourceManager):
+        ids = [rm.create(Item(n)).resource_id for n in "abc"]
+        rm.storage.get_meta_many = Mock(wraps=rm.storage.get_meta_many)
+        rm.storage.get_many = Mock(wraps=rm.storage.get_many)
+        rm.storage.get_meta = Mock(wraps=rm.storage.get_meta)
+        rm.get_many(ids)
+        rm.storage.get_meta_many.assert_called_once()
+        rm.storage.get_many.assert_called_once()
+        rm.storage.get_meta.assert_not_called()
+
+    def test_fires_one_event_per_phase(self, rm: ResourceManager):
+        handler = Mock()
+        rm.event_handlers.extend(
+            do(handler)
+            .before(ResourceAction.get_many)
+            .do(handler)
+            .on_success(ResourceAction.get_many)
+            .do(handler)
+            .after(ResourceAction.get_many)
+        )
+        ids = [rm.create(Item(n)).resource_id for n in "ab"]
+        rm.get_many(iter(ids))
+        phases = [c.args[0].phase for c in handler.call_args_list]
+        assert phases == ["before", "on_success", "after"]
+        assert handler.call_args_list[0].args[0].resource_ids == ids
+        assert len(handler.call_args_list[1].args[0].resources) == 2
+
+
+def _meta(resource_id: str) -> ResourceMeta:
+    now = dt.datetime.now(dt.UTC)
+    return ResourceMeta(
+        current_revision_id=f"{resource_id}:1",
+        resource_id=resource_id,
+        total_revision_count=1,
+        created_time=now,
+        updated_time=now,
+        created_by="u",
+        updated_by="u",
+    )
+
+
+@pytest.fixture(params=["memory", "disk", "sqlite", "sqlalchemy", "fast_slow"])
+def meta_store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryMetaStore()
+    elif request.param == "disk":
+        yield DiskMetaStore(rootdir=tmp_path)
+    elif request.param == "sqlite":
+        yield MemorySqliteMetaStore()
+    elif request.param == "sqlalchemy":
+        yield SQLAlchemyMetaStore(url=f"sqlite:///{tmp_path / 'meta.db'}")
+    else:
+        store = FastSlowMetaStore(MemoryMetaStore(), MemorySqliteMetaStore())
+        yield store
+        store._stop_sync.set()
+
+
+class TestMetaStoreGetMany:
+    def test_get_many(self, meta_store):
+        for rid in ["a", "b", "c"]:
+            meta_store[rid] = _meta(rid)
+        result = meta_store.get_many(["c", "missing", "a", "a"])
+        assert set(result) == {"a", "c"}
+        assert result["c"].current_revision_id == "c:1"
+
+    def test_get_many_empty(self, meta_store):
+        assert meta_store.get_many([]) == {}
+
+    def test_sqlite_chunks_large_requests(self):
+        store = MemorySqliteMetaStore()
+        store.save_many([_meta(f"r{i}") for i in range(1200)])
+        result = store.get_many(f"r{i}" for i in range(1200))
+        assert len(result) == 1200
+
+
+def _info(resource_id: str, revision_id: str) -> RevisionInfo:
+    now = dt.datetime.now(dt.UTC)
+    return RevisionInfo(
+        uid=uuid.uuid4(),
+        resource_id=resource_id,
+        revision_id=revision_id,
+        status=RevisionStatus.stable,
+        data_hash="h",
+        created_time=now,
+        updated_time=now,
+        created_by="u",
+        updated_by="u",
+    )
+
+
+class _FakeS3Client:
+    """Minimal in-memory stand-in for the boto3 S3 client."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.get_threads: set[str] = set()
+
+    def head_bucket(self, Bucket):
+        return {}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body if isinstance(Body, bytes) else Body.read()
+
+    def get_object(self, Bucket, Key):
+        self.get_threads.add(threading.current_thread().name)
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+
+@pytest.fixture(
+    params=[
+        "memory",
+        pytest.param("disk", marks=_needs_py312),
+        "pack",
+        "s3",
+        "cached_s3",
+    ]
+)
+def resource_store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryResourceStore()
+    elif request.param == "disk":
+        yield DiskResourceStore(rootdir=tmp_path)
+    elif request.param == "pack":
+        yield PackDiskResourceStore(rootdir=tmp_path)
+    else:
+        cls = S3ResourceStore if request.param == "s3" else CachedS3ResourceStore
+        with patch("boto3.client", return_value=_FakeS3Client()):
+            yield cls()
+
+
+class TestResourceStoreGetMany:
+    def _fill(self, store) -> list[tuple[str, str, None]]:
+        keys = []
+        for i in range(5):
+            info = _info(f"r{i}", f"r{i}:1")
+            store.save(info, io.BytesIO(f"data-{i}".encode()))
+            keys.append((info.resource_id, info.revision_id, None))
+        return keys
+
+    def test_get_many(self, resource_store):
+        keys = self._fill(resource_store)[::-1]
+        result = resource_store.get_many(keys)
+        assert [info.resource_id for info, _ in result] == [k[0] for k in keys]
+        assert [raw for _, raw in result] == [b"data-4", b"data-3", b"data-2"] + [
+            b"data-1",
+            b"data-0",
+        ]
+
+    def test_get_data_bytes_many(self, resource_store):
+        keys = self._fill(resource_store)
+        assert resource_store.get_data_bytes_many(keys[:2]) == [b"data-0", b"data-1"]
+
+    def test_get_many_empty(self, resource_store):
+        assert resource_store.get_many([]) == []
+
+    def test_get_many_missing(self, resource_store):
+        self._fill(resource_store)
+        with pytest.raises((KeyError, FileNotFoundError)):
+            resource_store.get_many([("missing", "missing:1", None)])
+
+
+class TestS3GetMany:
+    def test_fetches_on_shared_pool(self):
+        client = _FakeS3Client()
+        with patch("boto3.client", return_value=client):
+            store = S3ResourceStore()
+        for i in range(4):
+            store.save(_info(f"r{i}", "v1"), io.BytesIO(b"x"))
+        keys = [(f"r{i}", "v1", None) for i in range(4)]
+        store.get_many(keys)
+        store.get_data_bytes_many(keys)
+        assert client.get_threads
+        assert all(n.startswith("s3-resource-store") for n in client.get_threads)
+
+    def test_cached_store_get_many_uses_cache(self):
+        client = _FakeS3Client()
+        cache = MemoryCache()
+        with patch("boto3.client", return_value=client):
+            store = CachedS3ResourceStore(caches=[cache])
+        info = _info("r0", "v1")
+        store.save(info, io.BytesIO(b"cached"))
+        client.objects.clear()  # only the cache can serve the request now
+        assert store.get_many([("r0", "v1", None), ("r0", "v1", None)]) == [
+            (info, b"cached"),
+            (info, b"cached"),
+        ]
@@ -495,6 +495,11 @@ class MockListResourceManager:
     def get_partial(self, rid, rev, fields):
         return [SimpleStruct(name="partial")]
 
+    def get_many(self, resource_ids, partial=None):
+        if partial is not None:
+            return [self.get_partial(rid, "rev1", partial) for rid in resource_ids]
+        return [self.get_resource_revision(rid, "rev1") for rid in resource_ids]
+
     def search_resources(self, query):
         return [
             ResourceMeta(
@@ -550,6 +555,9 @@ class MockDictResourceManager:
         )
         return Resource(info=info, data={"a": 1})
 
+    def get_many(self, resource_ids, partial=None):
+        return [self.get_resource_revision(rid, "rev1") for rid in resource_ids]
+
     def search_resources(self, query):
         return [
             ResourceMeta(
@@ -0,0 +1,82 @@
+"""Memory stores keeping decoded objects must still isolate callers."""
+
+import io
+import uuid
+
+from autocrud.resource_manager.meta_store.simple import MemoryMetaStore
+from autocrud.resource_manager.resource_store.simple import MemoryResourceStore
+from autocrud.resource_manager.storage_factory import MemoryStorageFactory
+from autocrud.types import (
+    DataSearchCondition,
+    DataSearchOperator,
+    ResourceMetaSearchQuery,
+    RevisionInfo,
+    RevisionStatus,
+)
+
+from .meta_store.common import BASE_TIME, make_meta
+
+
+def make_info(resource_id: str) -> RevisionInfo:
+    return RevisionInfo(
+        uid=uuid.uuid4(),
+        resource_id=resource_id,
+        revision_id=f"{resource_id}:1",
+        status=RevisionStatus.stable,
+        created_time=BASE_TIME,
+        updated_time=BASE_TIME,
+        created_by="user",
+        updated_by="user",
+    )
+
+
+def test_meta_store_copies_on_write_and_read():
+    store = MemoryMetaStore(store_objects=True)
+    meta = make_meta(1, indexed_data={"status": "pending", "when": BASE_TIME})
+    store[meta.resource_id] = meta
+    meta.indexed_data["status"] = "done"
+    meta.updated_by = "someone"
+
+    got = store["r001"]
+    assert got.indexed_data == {"status": "pending", "when": BASE_TIME}
+    assert got.updated_by == "user"
+    got.indexed_data["status"] = "failed"
+    got.total_revision_count = 9
+
+    query = ResourceMetaSearchQuery(
+        data_conditions=[
+            DataSearchCondition(
+                field_path="status", operator=DataSearchOperator.equals, value="pending"
+            )
+        ]
+    )
+    [found] = store.iter_search(query)
+    assert found.total_revision_count == 1
+    # 值不經編碼，datetime 仍是 datetime
+    assert found.indexed_data["when"] == BASE_TIME
+    found.indexed_data.clear()
+    assert store.count(query) == 1
+
+    with store.get_then_delete() as metas:
+        assert [m.indexed_data["status"] for m in metas] == ["pending"]
+    assert len(store) == 0
+
+
+def test_resource_store_copies_revision_info():
+    store = MemoryResourceStore(store_objects=True)
+    info = make_info("r1")
+    store.save(info, io.BytesIO(b"data"))
+    info.updated_by = "someone"
+
+    got = store.get_revision_info("r1", "r1:1", None)
+    assert got.updated_by == "user"
+    got.status = RevisionStatus.draft
+    [(again, data)] = store.get_many([("r1", "r1:1", None)])
+    assert again.status == RevisionStatus.stable
+    assert data == b"data"
+
+
+def test_storage_factory_passes_mode():
+    storage = MemoryStorageFactory(store_objects=True).build("model")
+    assert storage._meta_store.store_objects
+    assert storage._resource_store.store_objects
@@ -0,0 +1,122 @@
+"""PackDiskResourceStore: pack rotation, reopening, purge/compact, group commit."""
+
+import datetime as dt
+import io
+import threading
+import time
+import uuid
+
+import pytest
+
+from autocrud.resource_manager.resource_store.pack import PackDiskResourceStore
+from autocrud.types import RevisionInfo, RevisionStatus
+
+NOW = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def make_info(resource_id: str, revision: int, schema_version=None) -> RevisionInfo:
+    return RevisionInfo(
+        uid=uuid.uuid4(),
+        resource_id=resource_id,
+        revision_id=f"{resource_id}:{revision}",
+        schema_version=schema_version,
+        status=RevisionStatus.stable,
+        created_time=NOW,
+        updated_time=NOW,
+        created_by="user",
+        updated_by="user",
+    )
+
+
+def data_of(info: RevisionInfo) -> bytes:
+    return f"data of {info.revision_id} {info.schema_version}".encode() * 10
+
+
+def fill(store: PackDiskResourceStore, n: int) -> list[RevisionInfo]:
+    infos = [make_info(f"r{i % 7}", i) for i in range(n)]
+    for info in infos:
+        store.save(info, io.BytesIO(data_of(info)))
+    return infos
+
+
+def packs(rootdir) -> list[str]:
+    return sorted(p.name for p in rootdir.glob("*.pack"))
+
+
+def test_rotation_and_reopen(tmp_path):
+    store = PackDiskResourceStore(rootdir=tmp_path, pack_size=1024)
+    infos = fill(store, 40)
+    assert len(packs(tmp_path)) > 1
+    # 追加後仍可讀到同一 pack 的新資料（mmap 重新映射）
+    for info in infos:
+        key = (info.resource_id, info.revision_id, None)
+        assert store.get_revision_info(*key) == info
+    store.close()
+
+    reopened = PackDiskResourceStore(rootdir=tmp_path, pack_size=1024)
+    keys = [(info.resource_id, info.revision_id, None) for info in infos]
+    assert reopened.get_many(keys) == [(info, data_of(info)) for info in infos]
+    assert sorted(reopened.list_resources()) == [f"r{i}" for i in range(7)]
+    extra = make_info("r0", 99, "v2")
+    reopened.save(extra, io.BytesIO(b"x"))
+    assert sorted(reopened.list_schema_versions("r0", "r0:99")) == ["v2"]
+
+
+def test_missing_keys_raise(tmp_path):
+    store = PackDiskResourceStore(rootdir=tmp_path)
+    fill(store, 2)
+    assert not store.exists("r0", "r0:1", None)
+    with pytest.raises(KeyError):
+        store.get_revision_info("r0", "r0:1", None)
+    with pytest.raises(KeyError):
+        store.get_data_bytes_many([("r0", "r0:0", None), ("r0", "r0:1", None)])
+
+
+def test_purge_and_compact(tmp_path):
+    store = PackDiskResourceStore(rootdir=tmp_path, pack_size=2048)
+    infos = fill(store, 60)
+    for resource_id in ("r0", "r1", "r2", "r3", "r4"):
+        store.purge_resource(resource_id)
+    assert sorted(store.list_resources()) == ["r5", "r6"]
+    before = packs(tmp_path)
+
+    assert store.compact() > 0
+    assert len(packs(tmp_path)) < len(before)
+    kept = [info for info in infos if info.resource_id in ("r5", "r6")]
+    keys = [(info.resource_id, info.revision_id, None) for info in kept]
+    assert store.get_many(keys) == [(info, data_of(info)) for info in kept]
+    store.close()
+    reopened = PackDiskResourceStore(rootdir=tmp_path, pack_size=2048)
+    assert reopened.get_data_bytes_many(keys) == [data_of(info) for info in kept]
+
+
+def test_concurrent_saves_share_commits(tmp_path):
+    store = PackDiskResourceStore(rootdir=tmp_path)
+    flushes = 0
+    flush = store._flush
+
+    def counting_flush():
+        nonlocal flushes
+        flushes += 1
+        # 慢一點的 fsync 讓其他 writer 排隊，等下一次一起提交
+        time.sleep(0.005)
+        flush()
+
+    store._flush = counting_flush
+    barrier = threading.Barrier(8)
+
+    def writer(w: int):
+        barrier.wait()
+        for i in range(25):
+            info = make_info(f"w{w}", i)
+            store.save(info, io.BytesIO(data_of(info)))
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(store.list_resources()) == [f"w{w}" for w in range(8)]
+    assert all(len(list(store.list_revisions(f"w{w}"))) == 25 for w in range(8))
+    assert flushes < 200
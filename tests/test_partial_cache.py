@@ -0,0 +1,120 @@
+import datetime as dt
+import threading
+
+import msgspec
+import pytest
+from msgspec import Struct
+
+from autocrud.resource_manager.basic import Encoding
+from autocrud.resource_manager.core import ResourceManager
+from autocrud.resource_manager.partial import (
+    PartialTypeCache,
+    filter_struct_partial,
+    partial_type_cache,
+)
+from autocrud.resource_manager.storage_factory import MemoryStorageFactory
+
+
+class Inner(Struct):
+    x: int
+    y: int = 0
+
+
+class Item(Struct):
+    name: str
+    tags: list[str]
+    inner: Inner
+
+
+def test_same_key_returns_same_plan():
+    cache = PartialTypeCache()
+    p1 = cache.get(Item, ["name", "inner/x"])
+    p2 = cache.get(Item, ["/name", "/inner/x"])
+    assert p1 is p2
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+
+
+def test_encoding_is_part_of_key():
+    cache = PartialTypeCache()
+    p_json = cache.get(Item, ["name"], Encoding.json)
+    p_msgpack = cache.get(Item, ["name"], Encoding.msgpack)
+    assert p_json is not p_msgpack
+    data = Item(name="a", tags=[], inner=Inner(x=1))
+    assert p_json.decode(msgspec.json.encode(data)).name == "a"
+    assert p_msgpack.decode(msgspec.msgpack.encode(data)).name == "a"
+
+
+def test_lru_eviction():
+    cache = PartialTypeCache(maxsize=2)
+    a = cache.get(Item, ["name"])
+    cache.get(Item, ["tags"])
+    cache.get(Item, ["name"])  # refresh "name"
+    cache.get(Item, ["inner"])  # evicts "tags"
+    assert cache.cache_info().currsize == 2
+    assert cache.get(Item, ["name"]) is a
+    misses = cache.cache_info().misses
+    cache.get(Item, ["tags"])
+    assert cache.cache_info().misses == misses + 1
+
+
+def test_plan_prunes_indices():
+    cache = PartialTypeCache()
+    plan = cache.get(Item, ["tags/1"])
+    assert plan.needs_pruning
+    data = Item(name="a", tags=["t0", "t1", "t2"], inner=Inner(x=1))
+    assert plan.decode(msgspec.json.encode(data)).tags == ["t1"]
+
+
+def test_concurrent_access():
+    cache = PartialTypeCache(maxsize=4)
+    errors = []
+
+    def worker(i: int):
+        try:
+            for j in range(50):
+                plan = cache.get(Item, [["name", "tags", "inner/x"][(i + j) % 3]])
+                assert plan.partial_type is not None
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    info = cache.cache_info()
+    assert info.hits + info.misses == 8 * 50
+    assert info.currsize == 3
+
+
+def test_filter_struct_partial_uses_cache():
+    data = Item(name="a", tags=["t"], inner=Inner(x=1, y=2))
+    before = partial_type_cache.cache_info()
+    filter_struct_partial(data, ["inner/x"])
+    filtered = filter_struct_partial(data, ["inner/x"])
+    after = partial_type_cache.cache_info()
+    assert filtered.inner.x == 1
+    assert after.hits > before.hits
+
+
+@pytest.mark.parametrize("encoding", [Encoding.json, Encoding.msgpack])
+def test_resource_manager_partial_list_reuses_plan(encoding):
+    rm = ResourceManager(
+        Item,
+        storage=MemoryStorageFactory().build("item"),
+        encoding=encoding,
+        default_user="u",
+        default_now=dt.datetime.now,
+    )
+    infos = [rm.create(Item(name=f"n{i}", tags=[], inner=Inner(x=i))) for i in range(5)]
+    before = partial_type_cache.cache_info()
+    parts = [
+        rm.get_partial(info.resource_id, info.revision_id, ["/name"]) for info in infos
+    ]
+    after = partial_type_cache.cache_info()
+    assert [p.name for p in parts] == [f"n{i}" for i in range(5)]
+    assert type(parts[0]) is type(parts[-1])
+    assert after.misses - before.misses <= 1
+    assert after.hits - before.hits >= 4
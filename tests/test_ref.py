@@ -684,6 +684,27 @@ class TestRefIntegrityCascade:
         assert m2_meta.is_deleted is True
         assert m3_meta.is_deleted is False
 
+    def test_delete_many_cascades_each_target(self):
+        crud = self._setup_crud()
+        character_rm = crud.resource_managers["character"]
+        monster_rm = crud.resource_managers["monster"]
+
+        heroes = [character_rm.create(Character(name=n)) for n in ("A", "B", "C")]
+        monsters = [
+            monster_rm.create(
+                Monster(zone_id="z1", owner_id=hero.resource_id, zone_revision_id="zr1")
+            )
+            for hero in heroes
+        ]
+
+        # 批次刪除 A、B → 只有它們的 monster 被 cascade 刪除
+        character_rm.delete_many([h.resource_id for h in heroes[:2]])
+
+        assert [
+            monster_rm._get_meta_no_check_is_deleted(m.resource_id).is_deleted
+            for m in monsters
+        ] == [True, True, False]
+
 
 class TestRefIntegritySetNull:
     """Test set_null: deleting a target sets referencing field to null."""
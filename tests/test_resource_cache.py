@@ -0,0 +1,177 @@
+import datetime as dt
+import threading
+
+import pytest
+from msgspec import Struct
+
+from autocrud.resource_manager.core import ResourceManager
+from autocrud.resource_manager.resource_cache import ResourceCache
+from autocrud.resource_manager.storage_factory import MemoryStorageFactory
+from autocrud.types import Resource, RevisionInfo, RevisionStatus
+
+
+class Item(Struct):
+    name: str
+    tags: list[str] = []
+
+
+def make_rm(cache: ResourceCache | None, **kwargs) -> ResourceManager:
+    return ResourceManager(
+        Item,
+        storage=MemoryStorageFactory().build("item"),
+        default_user="u",
+        default_now=dt.datetime.now,
+        resource_cache=cache,
+        **kwargs,
+    )
+
+
+def make_resource(i: int) -> Resource[Item]:
+    info = RevisionInfo(
+        uid=f"uid-{i}",
+        resource_id=f"r{i}",
+        revision_id=f"r{i}:1",
+        status=RevisionStatus.stable,
+        created_time=dt.datetime.now(),
+        updated_time=dt.datetime.now(),
+        created_by="u",
+        updated_by="u",
+    )
+    return Resource(info=info, data=Item(name=f"n{i}"))
+
+
+def test_lru_eviction_by_entries():
+    cache = ResourceCache(maxsize=2)
+    for i in range(2):
+        cache.put((f"r{i}", f"r{i}:1", None), make_resource(i), 10)
+    assert cache.get(("r0", "r0:1", None)) is not None  # refresh r0
+    cache.put(("r2", "r2:1", None), make_resource(2), 10)  # evicts r1
+    assert cache.get(("r1", "r1:1", None)) is None
+    assert cache.get(("r0", "r0:1", None)) is not None
+    info = cache.cache_info()
+    assert (info.currsize, info.currbytes) == (2, 20)
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResourceCache(maxsize=None, maxbytes=100)
+    for i in range(5):
+        cache.put((f"r{i}", f"r{i}:1", None), make_resource(i), 30)
+    assert cache.cache_info().currsize == 3
+    assert cache.cache_info().currbytes == 90
+    # 單一項目大於預算時直接略過
+    cache.put(("big", "big:1", None), make_resource(9), 101)
+    assert cache.get(("big", "big:1", None)) is None
+    assert cache.cache_info().currsize == 3
+
+
+def test_invalidate_resource_drops_all_revisions():
+    cache = ResourceCache()
+    cache.put(("r0", "r0:1", None), make_resource(0), 1)
+    cache.put(("r0", "r0:2", "v2"), make_resource(0), 1)
+    cache.put(("r1", "r1:1", None), make_resource(1), 1)
+    cache.invalidate_resource("r0")
+    assert cache.cache_info().currsize == 1
+    assert cache.get(("r1", "r1:1", None)) is not None
+
+
+def test_get_serves_stable_revision_from_cache():
+    cache = ResourceCache()
+    rm = make_rm(cache)
+    info = rm.create(Item(name="a"))
+    first = rm.get(info.resource_id)
+    second = rm.get(info.resource_id)
+    assert first is second
+    assert first.data == Item(name="a")
+    assert cache.cache_info().hits == 1
+
+
+def test_update_creates_new_cache_entry():
+    cache = ResourceCache()
+    rm = make_rm(cache)
+    info = rm.create(Item(name="a"))
+    rm.get(info.resource_id)
+    rm.update(info.resource_id, Item(name="b"))
+    assert rm.get(info.resource_id).data.name == "b"
+    # 舊 revision 仍可從快取取得
+    old = rm.get(info.resource_id, revision_id=info.revision_id)
+    assert old.data.name == "a"
+
+
+def test_draft_revisions_are_not_cached():
+    cache = ResourceCache()
+    rm = make_rm(cache, default_status=RevisionStatus.draft)
+    info = rm.create(Item(name="a"))
+    assert rm.get(info.resource_id).data.name == "a"
+    rm.modify(info.resource_id, Item(name="b"))
+    assert rm.get(info.resource_id).data.name == "b"
+    assert cache.cache_info().currsize == 0
+
+
+def test_switching_stable_to_draft_invalidates():
+    cache = ResourceCache()
+    rm = make_rm(cache)
+    info = rm.create(Item(name="a"))
+    rm.get(info.resource_id)
+    assert cache.cache_info().currsize == 1
+    rm.modify(info.resource_id, status=RevisionStatus.draft)
+    assert cache.cache_info().currsize == 0
+    rm.modify(info.resource_id, Item(name="b"))
+    assert rm.get(info.resource_id).data.name == "b"
+    assert rm.get(info.resource_id).info.status == RevisionStatus.draft
+
+
+def test_permanently_delete_invalidates():
+    cache = ResourceCache()
+    rm = make_rm(cache)
+    info = rm.create(Item(name="a"))
+    rm.get(info.resource_id)
+    rm.permanently_delete(info.resource_id)
+    assert cache.cache_info().currsize == 0
+
+
+def test_get_many_mixes_hits_and_misses():
+    cache = ResourceCache()
+    rm = make_rm(cache)
+    infos = [rm.create(Item(name=f"n{i}")) for i in range(4)]
+    warm = rm.get(infos[1].resource_id)
+    resources = rm.get_many([info.resource_id for info in infos])
+    assert [r.data.name for r in resources] == ["n0", "n1", "n2", "n3"]
+    assert resources[1] is warm
+    assert cache.cache_info().currsize == 4
+    again = rm.get_many([info.resource_id for info in infos])
+    assert all(a is b for a, b in zip(resources, again))
+
+
+def test_rejects_message_queue():
+    from autocrud.message_queue.simple import SimpleMessageQueueFactory
+
+    with pytest.raises(ValueError):
+        make_rm(
+            ResourceCache(),
+            message_queue=SimpleMessageQueueFactory().build(lambda job: None),
+        )
+
+
+def test_concurrent_reads():
+    cache = ResourceCache(maxsize=3)
+    rm = make_rm(cache)
+    infos = [rm.create(Item(name=f"n{i}")) for i in range(5)]
+    errors = []
+
+    def worker(i: int):
+        try:
+            for j in range(40):
+                info = infos[(i + j) % 5]
+                assert rm.get(info.resource_id).data.name == f"n{(i + j) % 5}"
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    info = cache.cache_info()
+    assert info.hits + info.misses == 8 * 40
+    assert info.currsize == 3
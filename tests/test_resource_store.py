@@ -5,6 +5,7 @@ from uuid import uuid4
 import pytest
 
 from autocrud.resource_manager.basic import Encoding
+from autocrud.resource_manager.resource_store.pack import PackDiskResourceStore
 from autocrud.resource_manager.resource_store.simple import (
     DiskResourceStore,
     MemoryResourceStore,
@@ -26,7 +27,8 @@ class TestIResourceStore:
     """Test suite for IResourceStore interface implementations."""
 
     @pytest.fixture(
-        params=["memory", "disk"] + (["s3", "cached_s3"] if S3_AVAILABLE else [])
+        params=["memory", "disk", "pack"]
+        + (["s3", "cached_s3"] if S3_AVAILABLE else [])
     )
     def resource_store(self, request, tmp_path):
         """Parametrized fixture that creates different resource store implementations."""
@@ -34,6 +36,10 @@ class TestIResourceStore:
             yield MemoryResourceStore(encoding=Encoding.json)
         elif request.param == "disk":
             yield DiskResourceStore(encoding=Encoding.json, rootdir=tmp_path)
+        elif request.param == "pack":
+            store = PackDiskResourceStore(encoding=Encoding.json, rootdir=tmp_path)
+            yield store
+            store.close()
         elif request.param == "s3" and S3_AVAILABLE:
             # Use tmp_path for unique prefix to avoid conflicts between tests
             prefix = f"test-{tmp_path.name}/"
@@ -0,0 +1,110 @@
+"""Tests for the single-encode write pipeline.
+
+Covers:
+- create / update / modify encode the data exactly once
+- the saved bytes are the hashed bytes
+- unchanged updates short-circuit before the decode round-trip
+- ``trust_struct_input`` skips the decode round-trip
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from unittest.mock import patch
+
+import msgspec
+import pytest
+from msgspec import Struct
+from xxhash import xxh3_128_hexdigest
+
+from autocrud.resource_manager.basic import MsgspecSerializer
+from autocrud.resource_manager.core import ResourceManager
+from autocrud.resource_manager.storage_factory import MemoryStorageFactory
+from autocrud.types import RevisionStatus
+
+
+class Item(Struct):
+    name: str
+    value: int = 0
+
+
+def make_rm(**kw) -> ResourceManager:
+    return ResourceManager(
+        Item,
+        storage=MemoryStorageFactory().build("test"),
+        default_user="system",
+        default_now=dt.datetime.now,
+        **kw,
+    )
+
+
+def test_create_encodes_once_and_saves_hashed_bytes():
+    rm = make_rm()
+    with patch.object(
+        MsgspecSerializer, "encode", autospec=True, side_effect=MsgspecSerializer.encode
+    ) as encode:
+        info = rm.create(Item("a", 1))
+    data_calls = [c for c in encode.call_args_list if c.args[0] is rm._data_serializer]
+    assert len(data_calls) == 1
+    with rm.storage.get_data_bytes(info.resource_id, info.revision_id) as f:
+        raw = f.read()
+    assert info.data_hash == f"xxh3_128:{xxh3_128_hexdigest(raw)}"
+
+
+def test_update_encodes_once():
+    rm = make_rm()
+    info = rm.create(Item("a", 1))
+    with patch.object(
+        rm._data_serializer, "encode", wraps=rm._data_serializer.encode
+    ) as encode:
+        rm.update(info.resource_id, Item("a", 2))
+    assert encode.call_count == 1
+
+
+def test_modify_encodes_once():
+    rm = make_rm()
+    info = rm.create(Item("a", 1), status=RevisionStatus.draft)
+    with patch.object(
+        rm._data_serializer, "encode", wraps=rm._data_serializer.encode
+    ) as encode:
+        rm.modify(info.resource_id, Item("a", 2))
+    assert encode.call_count == 1
+    assert rm.get(info.resource_id).data.value == 2
+
+
+def test_unchanged_update_skips_decode():
+    rm = make_rm()
+    info = rm.create(Item("a", 1))
+    with patch.object(rm._data_serializer, "decode_and_validate") as validate:
+        result = rm.update(info.resource_id, Item("a", 1))
+    validate.assert_not_called()
+    assert result.revision_id == info.revision_id
+
+
+def test_invalid_struct_is_rejected_by_default():
+    rm = make_rm()
+    with pytest.raises(msgspec.ValidationError):
+        rm.create(Item("a", "not-an-int"))
+
+
+def test_trust_struct_input_skips_decode_round_trip():
+    rm = make_rm(trust_struct_input=True)
+    with patch.object(rm._data_serializer, "decode_and_validate") as validate:
+        rm.create(Item("a", 1))
+    validate.assert_not_called()
+
+
+def test_trust_struct_input_still_validates_dict_input():
+    rm = make_rm(trust_struct_input=True)
+    with pytest.raises(msgspec.ValidationError):
+        rm.create({"name": "a", "value": "not-an-int"})
+
+
+def test_trust_struct_input_still_runs_custom_validator():
+    def _validator(data: Item) -> None:
+        if data.value < 0:
+            raise ValueError("negative")
+
+    rm = make_rm(trust_struct_input=True, validator=_validator)
+    with pytest.raises(ValueError, match="negative"):
+        rm.create(Item("a", -1))